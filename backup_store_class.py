@@ -0,0 +1,696 @@
+from baron_builder_compression import compress_member, decompress_member
+from baron_builder_imports import STORE_DIR, MANIFEST_EXT, KEYFRAME_INTERVAL
+from collections import OrderedDict
+from difflib import SequenceMatcher
+from raw_zip_file_class import RawZipFile
+from zks_file_class import ZksFile
+import binascii
+import hashlib
+import json
+import lzma
+import os
+import struct
+import zipfile
+
+
+class BackupStore():
+    '''
+        PURPOSE - Store backed up save games as manifests of content-addressed files so identical
+            compressed files are only stored once
+        USAGE
+            USE CASE #1 - Backup a save game
+                1. backupStore = BackupStore(os.path.join("Baron_Builder", "Backup"))
+                2. backupStore.store_backup("save_game_42.zks", "save_game_42.bbm")
+            USE CASE #2 - Restore a backed up save game
+                1. backupStore = BackupStore(os.path.join("Baron_Builder", "Backup"))
+                2. backupStore.restore_backup("save_game_42.bbm", "save_game_42.zks")
+            USE CASE #3 - Backup a save game as a delta against an earlier backup
+                1. backupStore = BackupStore(os.path.join("Baron_Builder", "Backup"))
+                2. baseManifest = backupStore.find_base("save_game_43.zks")
+                3. backupStore.store_backup("save_game_43.zks", "save_game_43.bbm", baseManifest=baseManifest)
+            USE CASE #4 - Delete a backed up save game
+                1. backupStore = BackupStore(os.path.join("Baron_Builder", "Backup"))
+                2. backupStore.remove_backup("save_game_42.bbm")
+        NOTES
+            [X] backupStore = BackupStore(backupDir)            # Instantiates a BackupStore object
+            [X] backupStore.store_backup(srcFile, manifest)     # Stores new files and writes a manifest
+            [X] backupStore.restore_backup(manifest, dstFile)   # Reassembles a save game from a manifest
+            [X] backupStore.remove_backup(manifest)             # Deletes a manifest and any unused files
+            [X] backupStore.read_manifest(manifest)             # Parses a manifest
+            [X] backupStore.find_base(srcFile)                  # Chooses a manifest to store a delta against
+            [X] backupStore.read_manifests()                    # Parses every manifest in the backup directory
+            [X] backupStore.read_bases()                        # Manifests used as a base by another manifest
+            [X] backupStore.read_member_data(manifest, member)  # Uncompressed contents of a backed up file
+            [X] backupStore.make_delta(baseData, newData)       # Compressed delta between two json files
+            [X] backupStore.find_compress_level(data, ...)      # Compression level that reproduces a stored file
+            [X] backupStore.apply_delta(baseData, delta)        # Applies a delta made by make_delta()
+            [X] backupStore.split_chunks(data)                  # Splits a json file on each "$id" object
+            [X] backupStore.collect_garbage()                   # Deletes stored files no manifest uses
+            [X] backupStore.blob_path(hashHex)                  # Filename of a stored file
+            Files are stored compressed, exactly as they were in the save game, in
+                backupDir/STORE_DIR named for the SHA-256 of their compressed bytes
+            Manifests (see: MANIFEST_EXT) live in backupDir
+            DELTAS
+                A file that changed since the base manifest is stored as a delta of its uncompressed
+                    contents against the base's copy of the same file
+                Deltas chain, so every KEYFRAME_INTERVAL backups in a chain is stored in full
+                A delta is only kept if it's smaller than deltaMaxRatio of the compressed file
+                A delta is only kept if recompressing the rebuilt file reproduces the original compressed
+                    bytes, so a restored save game is byte-identical to the one that was backed up
+                A manifest can't be removed while another manifest uses it as a base
+    '''
+    # CLASS ATTRIBUTES
+    manifestVersion = 1         # Version of the manifest format written by store_backup()
+    chunkSep = b'{"$id":'       # Json files are split into chunks that start with this
+    deltaCopy = b"C"            # Delta op: copy (first chunk, number of chunks) from the base
+    deltaInsert = b"I"          # Delta op: insert (length) new bytes
+    deltaMaxRatio = 0.5         # Largest delta size, as a fraction of the compressed file, worth keeping
+    # ZipFile compress_type macro : compression levels find_compress_level() tries, most likely first
+    levelDict = { zipfile.ZIP_STORED : [ None ],
+                  zipfile.ZIP_DEFLATED : [ None, 9, 1, 8, 7, 5, 4, 3, 2, 0 ],
+                  zipfile.ZIP_BZIP2 : [ None, 1, 2, 3, 4, 5, 6, 7, 8 ],
+                  zipfile.ZIP_LZMA : [ None, 9, 0, 1, 2, 3, 4, 5, 7, 8 ] }
+
+
+    def __init__(self, backupDir):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                backupDir - Relative or absolute path of the Baron Builder backup directory
+            OUTPUT - None
+        '''
+        # CLASS ATTRIBUTES
+        self.sBackupDir = None  # Directory holding the manifests
+        self.sStoreDir = None   # Directory holding the stored files
+        self.sSuccess = False   # Set this to False if anything fails
+
+        # INPUT VALIDATION
+        if not isinstance(backupDir, str):
+            # print("BackupStore ctor:\tbackupDir is not a string")  # DEBUGGING
+            pass
+        elif len(backupDir) <= 0:
+            # print("BackupStore ctor:\tbackupDir is empty")  # DEBUGGING
+            pass
+        elif not os.path.isdir(backupDir):
+            # print("BackupStore ctor:\t{} is not a directory".format(backupDir))  # DEBUGGING
+            pass
+        else:
+            self.sBackupDir = backupDir
+            self.sStoreDir = os.path.join(backupDir, STORE_DIR)
+            self.sSuccess = True
+
+
+    def store_backup(self, srcFile, manifestFile, overwrite=False, baseManifest=None):
+        '''
+            PURPOSE - Backup a save game by storing its new files and writing a manifest
+            INPUT
+                srcFile - Relative or absolute filename of the save game
+                manifestFile - Relative or absolute filename of the new manifest
+                overwrite - Will replace manifestFile if it exists
+                baseManifest - Optional filename of a manifest, in the backup directory, to store
+                    changed files as deltas against (see: find_base())
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Without a baseManifest, nothing is decompressed except header.json
+                Files already in the store are not written again
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        rawReader = RawZipFile(srcFile)  # Only used to read compressed files from srcFile
+        manifestDict = OrderedDict()     # Contents of the new manifest
+        memberList = []                  # Manifest entry for each file in srcFile
+        rawData = b""                    # Compressed bytes of a file in srcFile
+        hashHex = ""                     # SHA-256 of rawData
+        baseDict = None                  # Parsed baseManifest
+        baseMemberDict = {}              # { filename : manifest entry } of baseManifest
+        deltaData = None                 # Delta of a file against baseManifest
+        newData = b""                    # Uncompressed bytes of a file in srcFile
+        compressLevel = None             # Compression level that reproduces rawData from newData
+        member = None                    # Manifest entry for a file in srcFile
+        chainLength = 0                  # Number of deltas between this manifest and a full backup
+
+        # INPUT VALIDATION
+        if not self.sSuccess:
+            pass
+        elif not isinstance(manifestFile, str) or 0 >= len(manifestFile):
+            pass
+        elif os.path.exists(manifestFile) and overwrite is not True:
+            print("Manifest {} already exists".format(manifestFile))  # DEBUGGING
+        elif os.path.exists(manifestFile) and os.path.basename(manifestFile) in (self.read_bases() or set()):
+            print("Manifest {} is the base of another backup".format(manifestFile))  # DEBUGGING
+        else:
+            # READ THE BASE
+            if baseManifest is not None and os.path.basename(baseManifest) != os.path.basename(manifestFile):
+                baseDict = self.read_manifest(baseManifest)
+                if baseDict is not None and baseDict["Chain"] + 1 < KEYFRAME_INTERVAL:
+                    for member in baseDict["Members"]:
+                        baseMemberDict[member["Filename"]] = member
+                    chainLength = baseDict["Chain"] + 1
+
+            try:
+                # 1. Store the files
+                with zipfile.ZipFile(srcFile, "r") as inZipFile, open(srcFile, "rb") as inFile:
+                    for zFileInfo in inZipFile.infolist():
+                        rawData = rawReader.read_raw_member(inFile, zFileInfo)
+                        hashHex = hashlib.sha256(rawData).hexdigest()
+                        member = OrderedDict([
+                            ("Filename", zFileInfo.filename),
+                            ("Hash", hashHex),
+                            ("Delta", None),
+                            ("DateTime", list(zFileInfo.date_time)),
+                            ("CompressType", zFileInfo.compress_type),
+                            ("FlagBits", zFileInfo.flag_bits & rawReader.flagLzmaEos),
+                            ("CRC", zFileInfo.CRC),
+                            ("FileSize", zFileInfo.file_size),
+                            ("ExternalAttr", zFileInfo.external_attr),
+                            ("Comment", binascii.hexlify(zFileInfo.comment).decode("ascii")),
+                        ])
+                        # Try a delta against the base's copy of this file
+                        deltaData = None
+                        if zFileInfo.filename in baseMemberDict.keys() and hashHex != baseMemberDict[zFileInfo.filename]["Hash"]:
+                            newData = inZipFile.read(zFileInfo)
+                            deltaData = self.make_delta(self.read_member_data(baseDict, baseMemberDict[zFileInfo.filename]),
+                                                        newData)
+                            if len(deltaData) > len(rawData) * self.deltaMaxRatio:
+                                deltaData = None
+                            else:
+                                # Only keep the delta if restore_backup() can recompress it byte for byte
+                                compressLevel = self.find_compress_level(newData, zFileInfo.compress_type, hashHex)
+                                if compressLevel is False:
+                                    deltaData = None
+                        if deltaData is None:
+                            self.write_blob(hashHex, rawData)
+                        else:
+                            member["Hash"] = None
+                            member["Delta"] = OrderedDict([ ("Base", baseDict["Filename"]),
+                                                            ("Hash", hashlib.sha256(deltaData).hexdigest()),
+                                                            ("Level", compressLevel),
+                                                            ("RawHash", hashHex) ])
+                            self.write_blob(member["Delta"]["Hash"], deltaData)
+                        memberList.append(member)
+
+                # 2. Write the manifest
+                if 0 == len([ member for member in memberList if member["Delta"] is not None ]):
+                    chainLength = 0
+                manifestDict["Version"] = self.manifestVersion
+                manifestDict["Filename"] = os.path.basename(manifestFile)
+                manifestDict["Source"] = os.path.basename(srcFile)
+                manifestDict["Chain"] = chainLength
+                manifestDict["Header"] = ZksFile(srcFile).read_header()
+                manifestDict["Members"] = memberList
+                with open(manifestFile + ".tmp", "w") as outFile:
+                    json.dump(manifestDict, outFile, separators=(',', ':'))
+                os.replace(manifestFile + ".tmp", manifestFile)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                if os.path.exists(manifestFile + ".tmp"):
+                    os.remove(manifestFile + ".tmp")
+            else:
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def restore_backup(self, manifestFile, dstFile, overwrite=False):
+        '''
+            PURPOSE - Reassemble a backed up save game from its manifest
+            INPUT
+                manifestFile - Relative or absolute filename of the manifest
+                dstFile - Relative or absolute filename of the save game to write
+                overwrite - Will replace dstFile if it exists
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Each stored file's SHA-256 is verified before it is written
+                Files stored as deltas are rebuilt, one file at a time, and recompressed with
+                    their original compression type and level.  The SHA-256 of the recompressed bytes
+                    (or the CRC32, for manifests that predate it) is verified before they are written.
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        manifestDict = None   # Parsed manifestFile
+        rawZipFile = None     # RawZipFile object of the restored save game
+        zFileInfo = None      # ZipInfo object of a file being restored
+        rawData = b""         # Compressed bytes of a file being restored
+        crc = 0               # CRC32 of a file being restored
+        tmpFile = ""          # Temporary filename of the restored save game
+
+        # INPUT VALIDATION
+        if not self.sSuccess:
+            pass
+        elif not isinstance(dstFile, str) or 0 >= len(dstFile):
+            pass
+        elif os.path.exists(dstFile) and overwrite is not True:
+            print("Restore file {} already exists".format(dstFile))  # DEBUGGING
+        else:
+            manifestDict = self.read_manifest(manifestFile)
+            tmpFile = dstFile + ".tmp"
+
+        # RESTORE
+        if manifestDict is not None:
+            rawZipFile = RawZipFile(tmpFile)
+            retVal = rawZipFile.open_zip_file()
+            try:
+                for member in manifestDict["Members"]:
+                    if retVal is not True:
+                        break
+                    zFileInfo = zipfile.ZipInfo(member["Filename"], tuple(member["DateTime"]))
+                    zFileInfo.compress_type = member["CompressType"]
+                    zFileInfo.external_attr = member["ExternalAttr"]
+                    zFileInfo.comment = binascii.unhexlify(member["Comment"])
+                    if member["Delta"] is None:
+                        rawData = self.read_blob(member["Hash"])
+                        retVal = rawZipFile.add_raw_member(zFileInfo, rawData, member["CRC"], member["FileSize"],
+                                                           flagBits=member["FlagBits"])
+                    else:
+                        crc, rawData = compress_member(self.read_member_data(manifestDict, member), member["CompressType"],
+                                                       member["Delta"].get("Level"))
+                        if crc != member["CRC"]:
+                            raise ValueError("Delta for {} failed to rebuild the file".format(member["Filename"]))
+                        elif "RawHash" in member["Delta"] and hashlib.sha256(rawData).hexdigest() != member["Delta"]["RawHash"]:
+                            raise ValueError("Delta for {} failed to recompress the file".format(member["Filename"]))
+                        retVal = rawZipFile.add_raw_member(zFileInfo, rawData, member["CRC"], member["FileSize"],
+                                                           flagBits=member["FlagBits"])
+                if rawZipFile.close_zip_file() is not True:
+                    retVal = False
+                if retVal is True:
+                    os.replace(tmpFile, dstFile)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = False
+            finally:
+                if rawZipFile.rFile is not None:
+                    rawZipFile.close_zip_file()
+                if os.path.exists(tmpFile):
+                    os.remove(tmpFile)
+
+        # DONE
+        return retVal
+
+
+    def remove_backup(self, manifestFile):
+        '''
+            PURPOSE - Delete a backed up save game
+            INPUT
+                manifestFile - Relative or absolute filename of the manifest
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Stored files are only deleted if no other manifest uses them
+                A manifest used as a base by another manifest will not be removed
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        baseSet = self.read_bases()  # Filenames of the manifests used as a base
+
+        # INPUT VALIDATION
+        if baseSet is None:
+            print("Unable to read the manifests in {}".format(self.sBackupDir))  # DEBUGGING
+        elif os.path.basename(str(manifestFile)) in baseSet:
+            print("Manifest {} is the base of another backup".format(manifestFile))  # DEBUGGING
+        elif self.sSuccess and isinstance(manifestFile, str) and os.path.isfile(manifestFile):
+            try:
+                os.remove(manifestFile)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+            else:
+                retVal = self.collect_garbage()
+
+        # DONE
+        return retVal
+
+
+    def read_manifest(self, manifestFile):
+        '''
+            PURPOSE - Parse a manifest
+            INPUT
+                manifestFile - Relative or absolute filename of the manifest
+            OUTPUT
+                On success, OrderedDict of the manifest contents
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if not isinstance(manifestFile, str) or not os.path.isfile(manifestFile):
+            pass
+        else:
+            try:
+                with open(manifestFile, "r") as inFile:
+                    retVal = json.load(inFile, object_pairs_hook=OrderedDict)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = None
+            else:
+                if not isinstance(retVal, dict) or self.manifestVersion != retVal.get("Version"):
+                    print("Unsupported manifest {}".format(manifestFile))  # DEBUGGING
+                    retVal = None
+
+        # DONE
+        return retVal
+
+
+    def read_manifests(self):
+        '''
+            PURPOSE - Parse every manifest in the backup directory
+            OUTPUT
+                On success, list of OrderedDicts of manifest contents
+                If any manifest can not be read, None
+        '''
+        # LOCAL VARIABLES
+        retVal = []
+        manifestDict = None  # Parsed manifest
+
+        # READ
+        for fileName in sorted(os.listdir(self.sBackupDir)):
+            if fileName.endswith(MANIFEST_EXT):
+                manifestDict = self.read_manifest(os.path.join(self.sBackupDir, fileName))
+                if manifestDict is None:
+                    retVal = None
+                    break
+                retVal.append(manifestDict)
+
+        # DONE
+        return retVal
+
+
+    def read_bases(self):
+        '''
+            PURPOSE - Find every manifest that another manifest uses as a base
+            OUTPUT
+                On success, set of manifest filenames
+                If any manifest can not be read, None
+        '''
+        # LOCAL VARIABLES
+        retVal = set()
+        manifestList = self.read_manifests() if self.sSuccess else []  # Parsed manifests
+
+        # FIND THE BASES
+        if manifestList is None:
+            retVal = None
+        else:
+            for manifestDict in manifestList:
+                retVal.update([ member["Delta"]["Base"] for member in manifestDict["Members"] if member["Delta"] is not None ])
+
+        # DONE
+        return retVal
+
+
+    def find_base(self, srcFile):
+        '''
+            PURPOSE - Choose the manifest a new backup of srcFile should be stored as a delta against
+            INPUT
+                srcFile - Relative or absolute filename of the save game being backed up
+            OUTPUT
+                On success, filename of the most recently written manifest for the same character
+                If there is no such manifest, None
+            NOTES
+                Characters are matched by header.json GameName
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        headerDict = ZksFile(srcFile).read_header()  # header.json of srcFile
+        manifestFile = ""                             # Filename of a manifest
+        manifestDict = None                           # Parsed manifest
+        newestTime = None                             # Modification time of retVal
+
+        # SEARCH
+        if self.sSuccess and headerDict is not None:
+            for fileName in os.listdir(self.sBackupDir):
+                if not fileName.endswith(MANIFEST_EXT):
+                    continue
+                manifestFile = os.path.join(self.sBackupDir, fileName)
+                if newestTime is not None and os.path.getmtime(manifestFile) <= newestTime:
+                    continue
+                manifestDict = self.read_manifest(manifestFile)
+                if manifestDict is not None and manifestDict["Header"] is not None \
+                   and headerDict["GameName"] == manifestDict["Header"]["GameName"]:
+                    retVal = manifestFile
+                    newestTime = os.path.getmtime(manifestFile)
+
+        # DONE
+        return retVal
+
+
+    def read_member_data(self, manifestDict, member):
+        '''
+            PURPOSE - Rebuild the uncompressed contents of a backed up file
+            INPUT
+                manifestDict - Parsed manifest holding member
+                member - Manifest entry of the file
+            OUTPUT
+                On success, the uncompressed bytes
+                On error, Exception
+            NOTES
+                The delta chain is followed back to the full copy of the file and then each delta
+                    is applied in order, oldest first
+        '''
+        # LOCAL VARIABLES
+        retVal = b""
+        deltaList = []  # Hashes of the deltas to apply, newest first
+        baseDict = None  # Parsed base manifest
+
+        # FOLLOW THE CHAIN
+        while member["Delta"] is not None:
+            deltaList.append(member["Delta"]["Hash"])
+            baseDict = self.read_manifest(os.path.join(self.sBackupDir, member["Delta"]["Base"]))
+            if baseDict is None:
+                raise OSError("Base manifest {} is missing".format(member["Delta"]["Base"]))
+            member = [ baseMember for baseMember in baseDict["Members"] if baseMember["Filename"] == member["Filename"] ][0]
+
+        # REBUILD
+        retVal = decompress_member(self.read_blob(member["Hash"]), member["CompressType"])
+        for hashHex in reversed(deltaList):
+            retVal = self.apply_delta(retVal, self.read_blob(hashHex))
+
+        # DONE
+        return retVal
+
+
+    def find_compress_level(self, data, compressType, hashHex):
+        '''
+            PURPOSE - Find the compression level that turns data back into a stored file
+            INPUT
+                data - Uncompressed contents of the file
+                compressType - ZipFile compress_type macro the file was stored with
+                hashHex - SHA-256 of the file's compressed bytes
+            OUTPUT
+                On success, the compression level (None for compress_member()'s default)
+                On failure, False
+            NOTES
+                Files compressed by something other than zlib/bz2/lzma (or with settings other
+                    than compress_member()'s) won't match any level
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # TRY EACH LEVEL
+        for compressLevel in self.levelDict.get(compressType, []):
+            try:
+                if hashlib.sha256(compress_member(data, compressType, compressLevel)[1]).hexdigest() == hashHex:
+                    retVal = compressLevel
+                    break
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                break
+
+        # DONE
+        return retVal
+
+
+    def make_delta(self, baseData, newData):
+        '''
+            PURPOSE - Describe newData as the chunks it shares with baseData plus new bytes
+            INPUT
+                baseData - Uncompressed contents of the base file
+                newData - Uncompressed contents of the new file
+            OUTPUT
+                On success, LZMA compressed delta
+                On error, Exception
+            NOTES
+                See: split_chunks() and apply_delta()
+        '''
+        # LOCAL VARIABLES
+        retVal = b""
+        baseList = self.split_chunks(baseData)  # Chunks of baseData
+        newList = self.split_chunks(newData)    # Chunks of newData
+        deltaList = []                          # Delta ops
+
+        # DIFF
+        for tag, base1, base2, new1, new2 in SequenceMatcher(None, baseList, newList, autojunk=False).get_opcodes():
+            if "equal" == tag:
+                deltaList.append(self.deltaCopy + struct.pack("<II", base1, base2 - base1))
+            elif new2 > new1:
+                deltaList.append(self.deltaInsert + struct.pack("<I", sum([ len(chunk) for chunk in newList[new1:new2] ])))
+                deltaList.extend(newList[new1:new2])
+        retVal = lzma.compress(b"".join(deltaList))
+
+        # DONE
+        return retVal
+
+
+    def apply_delta(self, baseData, deltaData):
+        '''
+            PURPOSE - Rebuild a file from its base and a delta made by make_delta()
+            INPUT
+                baseData - Uncompressed contents of the base file
+                deltaData - LZMA compressed delta
+            OUTPUT
+                On success, the uncompressed contents of the new file
+                On error, Exception
+        '''
+        # LOCAL VARIABLES
+        retVal = []
+        baseList = self.split_chunks(baseData)  # Chunks of baseData
+        deltaData = lzma.decompress(deltaData)  # Delta ops
+        index = 0                               # Current index into deltaData
+        first = 0                               # First chunk to copy
+        count = 0                               # Number of chunks to copy, or bytes to insert
+
+        # APPLY
+        while index < len(deltaData):
+            if self.deltaCopy == deltaData[index:index + 1]:
+                first, count = struct.unpack("<II", deltaData[index + 1:index + 9])
+                retVal.extend(baseList[first:first + count])
+                index += 9
+            elif self.deltaInsert == deltaData[index:index + 1]:
+                count = struct.unpack("<I", deltaData[index + 1:index + 5])[0]
+                retVal.append(deltaData[index + 5:index + 5 + count])
+                index += 5 + count
+            else:
+                raise ValueError("Corrupt delta")
+
+        # DONE
+        return b"".join(retVal)
+
+
+    def split_chunks(self, data):
+        '''
+            PURPOSE - Split a json file into chunks that each start at a "$id" object
+            INPUT
+                data - Uncompressed contents of a json file
+            OUTPUT
+                List of chunks that join back into data
+            NOTES
+                Pathfinder Kingmaker json files give almost every object a "$id", so an edit only
+                    changes the chunks of the objects it touches
+        '''
+        # LOCAL VARIABLES
+        retVal = data.split(self.chunkSep)
+
+        # RESTORE THE SEPARATORS
+        retVal = retVal[:1] + [ self.chunkSep + chunk for chunk in retVal[1:] ]
+
+        # DONE
+        return retVal
+
+
+    def read_blob(self, hashHex):
+        '''
+            PURPOSE - Read a stored file and verify its SHA-256
+            INPUT
+                hashHex - SHA-256 of the stored file
+            OUTPUT
+                On success, the stored bytes
+                On error, Exception
+        '''
+        # LOCAL VARIABLES
+        retVal = b""
+
+        # READ
+        with open(self.blob_path(hashHex), "rb") as inFile:
+            retVal = inFile.read()
+        if hashlib.sha256(retVal).hexdigest() != hashHex:
+            raise ValueError("Stored file {} is corrupt".format(hashHex))
+
+        # DONE
+        return retVal
+
+
+    def collect_garbage(self):
+        '''
+            PURPOSE - Delete every stored file that no manifest in the backup directory uses
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Nothing is deleted if any manifest can not be read
+        '''
+        # LOCAL VARIABLES
+        retVal = self.sSuccess
+        usedSet = set()        # Hashes used by the manifests
+        manifestList = None    # Parsed manifests
+
+        # FIND THE USED FILES
+        if retVal is True:
+            manifestList = self.read_manifests()
+            if manifestList is None:
+                retVal = False
+            else:
+                for manifestDict in manifestList:
+                    for member in manifestDict["Members"]:
+                        if member["Delta"] is None:
+                            usedSet.add(member["Hash"])
+                        else:
+                            usedSet.add(member["Delta"]["Hash"])
+
+        # DELETE THE UNUSED FILES
+        if retVal is True and os.path.isdir(self.sStoreDir):
+            try:
+                for dirName in os.listdir(self.sStoreDir):
+                    for hashHex in os.listdir(os.path.join(self.sStoreDir, dirName)):
+                        if hashHex not in usedSet:
+                            os.remove(os.path.join(self.sStoreDir, dirName, hashHex))
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = False
+
+        # DONE
+        return retVal
+
+
+    def write_blob(self, hashHex, rawData):
+        '''
+            PURPOSE - Store a compressed file unless it's already stored
+            INPUT
+                hashHex - SHA-256 of rawData
+                rawData - Compressed bytes of a file
+            OUTPUT
+                True if rawData was written
+                False if rawData was already stored
+                On error, Exception
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        blobFile = self.blob_path(hashHex)  # Filename of the stored file
+
+        # WRITE
+        if not os.path.exists(blobFile):
+            if not os.path.isdir(os.path.dirname(blobFile)):
+                os.makedirs(os.path.dirname(blobFile))
+            with open(blobFile + ".tmp", "wb") as outFile:
+                outFile.write(rawData)
+            os.replace(blobFile + ".tmp", blobFile)
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def blob_path(self, hashHex):
+        '''
+            PURPOSE - Translate a stored file's SHA-256 into its filename
+            INPUT
+                hashHex - SHA-256, as a hex string, of a stored file
+            OUTPUT
+                Filename of the stored file
+            NOTES
+                Stored files are spread across subdirectories named for the first two hex digits
+        '''
+        return os.path.join(self.sStoreDir, hashHex[:2], hashHex)
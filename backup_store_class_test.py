@@ -0,0 +1,152 @@
+from backup_store_class import BackupStore
+from raw_zip_file_class import RawZipFile
+import os
+import tempfile
+import unittest
+import zipfile
+import zlib
+
+
+class Backup_Store_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.backupDir = os.path.join(self.tempDir.name, "Backup")
+        os.mkdir(self.backupDir)
+        self.test = BackupStore(self.backupDir)
+
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+
+    def make_save(self, filename, playerSuffix=b"", compressLevel=None):
+        absFilename = os.path.join(self.tempDir.name, filename)
+        with zipfile.ZipFile(absFilename, "w", zipfile.ZIP_DEFLATED, compresslevel=compressLevel) as outZipFile:
+            outZipFile.write(os.path.join("Test_Files", "Linux", "header.json"), "header.json")
+            with open(os.path.join("Test_Files", "Linux", "player.json"), "rb") as inFile:
+                outZipFile.writestr("player.json", inFile.read() + playerSuffix)
+        return absFilename
+
+
+    def assert_same_file(self, srcFile, dstFile):
+        with open(srcFile, "rb") as srcIn, open(dstFile, "rb") as dstIn:
+            self.assertEqual(srcIn.read(), dstIn.read())
+
+
+    def count_blobs(self):
+        return sum([ len(fileList) for _, _, fileList in os.walk(self.test.sStoreDir) ])
+
+
+class Backup_Store_Class_Test_Normal(Backup_Store_Class_Tests):
+
+
+    def test_Normal_01_Round_Trip(self):
+        srcFile = self.make_save("Manual_1.zks")
+        manifestFile = os.path.join(self.backupDir, "Manual_1.bbm")
+        dstFile = os.path.join(self.tempDir.name, "Restored.zks")
+        self.assertTrue(self.test.store_backup(srcFile, manifestFile))
+        self.assertEqual(self.test.read_manifest(manifestFile)["Header"]["GameName"], "Yuhra Thorne")
+        self.assertTrue(self.test.restore_backup(manifestFile, dstFile))
+        self.assert_same_file(srcFile, dstFile)
+
+
+    def test_Normal_02_Dedup(self):
+        self.test.store_backup(self.make_save("Manual_1.zks"), os.path.join(self.backupDir, "Manual_1.bbm"))
+        self.assertEqual(self.count_blobs(), 2)
+        self.test.store_backup(self.make_save("Manual_2.zks", b" "), os.path.join(self.backupDir, "Manual_2.bbm"))
+        self.assertEqual(self.count_blobs(), 3)
+        self.assertTrue(self.test.remove_backup(os.path.join(self.backupDir, "Manual_2.bbm")))
+        self.assertEqual(self.count_blobs(), 2)
+
+
+    def test_Normal_03_Delta_Chain(self):
+        baseManifest = None
+        for backupNum in range(3):
+            srcFile = self.make_save("Auto_{}.zks".format(backupNum), b" " * backupNum)
+            manifestFile = os.path.join(self.backupDir, "Auto_{}.bbm".format(backupNum))
+            self.assertEqual(self.test.find_base(srcFile), baseManifest)
+            self.assertTrue(self.test.store_backup(srcFile, manifestFile, baseManifest=baseManifest))
+            self.assertEqual(self.test.read_manifest(manifestFile)["Chain"], backupNum)
+            baseManifest = manifestFile
+        dstFile = os.path.join(self.tempDir.name, "Restored.zks")
+        self.assertTrue(self.test.restore_backup(baseManifest, dstFile))
+        with zipfile.ZipFile(dstFile, "r") as inZipFile:
+            self.assertIsNone(inZipFile.testzip())
+            with open(os.path.join("Test_Files", "Linux", "player.json"), "rb") as inFile:
+                self.assertEqual(inZipFile.read("player.json"), inFile.read() + b"  ")
+        self.assertFalse(self.test.remove_backup(os.path.join(self.backupDir, "Auto_1.bbm")))
+        self.assertTrue(self.test.remove_backup(os.path.join(self.backupDir, "Auto_2.bbm")))
+
+
+    def test_Normal_04_Delta_Round_Trip(self):
+        with open(os.path.join("Test_Files", "Linux", "party.json"), "rb") as inFile:
+            baseData = inFile.read()
+        newData = baseData.replace(b'"$id":"2"', b'"$id":"2","Edited":true', 1)
+        self.assertEqual(self.test.apply_delta(baseData, self.test.make_delta(baseData, newData)), newData)
+        self.assertLess(len(self.test.make_delta(baseData, newData)), 1024)
+
+
+    def test_Normal_05_Delta_Byte_Identical(self):
+        baseManifest = os.path.join(self.backupDir, "Manual_1.bbm")
+        manifestFile = os.path.join(self.backupDir, "Manual_2.bbm")
+        dstFile = os.path.join(self.tempDir.name, "Restored.zks")
+        srcFile = self.make_save("Manual_2.zks", b" ", compressLevel=9)
+        self.assertTrue(self.test.store_backup(self.make_save("Manual_1.zks", compressLevel=9), baseManifest))
+        self.assertTrue(self.test.store_backup(srcFile, manifestFile, baseManifest=baseManifest))
+        member = self.test.read_manifest(manifestFile)["Members"][1]
+        self.assertEqual(member["Delta"]["Level"], 9)
+        self.assertTrue(self.test.restore_backup(manifestFile, dstFile))
+        self.assert_same_file(srcFile, dstFile)
+
+
+class Backup_Store_Class_Test_Error(Backup_Store_Class_Tests):
+
+
+    def test_Error_01_Bad_Backup_Dir(self):
+        self.assertFalse(BackupStore(None).sSuccess)
+        self.assertFalse(BackupStore(os.path.join(self.backupDir, "missing")).sSuccess)
+
+
+    def test_Error_02_Corrupt_Store(self):
+        manifestFile = os.path.join(self.backupDir, "Manual_1.bbm")
+        dstFile = os.path.join(self.tempDir.name, "Restored.zks")
+        self.test.store_backup(self.make_save("Manual_1.zks"), manifestFile)
+        for member in self.test.read_manifest(manifestFile)["Members"]:
+            with open(self.test.blob_path(member["Hash"]), "ab") as outFile:
+                outFile.write(b"\x00")
+        self.assertFalse(self.test.restore_backup(manifestFile, dstFile))
+        self.assertFalse(os.path.exists(dstFile))
+
+
+    def test_Error_03_Unmatched_Compression(self):
+        baseManifest = os.path.join(self.backupDir, "Manual_1.bbm")
+        manifestFile = os.path.join(self.backupDir, "Manual_2.bbm")
+        dstFile = os.path.join(self.tempDir.name, "Restored.zks")
+        srcFile = os.path.join(self.tempDir.name, "Manual_2.zks")
+        with open(os.path.join("Test_Files", "Linux", "player.json"), "rb") as inFile:
+            newData = inFile.read() + b" "
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15, 9, zlib.Z_FILTERED)
+        rawZipFile = RawZipFile(srcFile)
+        self.assertTrue(rawZipFile.open_zip_file())
+        self.assertTrue(rawZipFile.add_raw_member(zipfile.ZipInfo("player.json"), compressor.compress(newData) + compressor.flush(),
+                                                  zlib.crc32(newData), len(newData), zipfile.ZIP_DEFLATED))
+        self.assertTrue(rawZipFile.close_zip_file())
+        self.assertTrue(self.test.store_backup(self.make_save("Manual_1.zks"), baseManifest))
+        self.assertTrue(self.test.store_backup(srcFile, manifestFile, baseManifest=baseManifest))
+        self.assertIsNone(self.test.read_manifest(manifestFile)["Members"][0]["Delta"])
+        self.assertTrue(self.test.restore_backup(manifestFile, dstFile))
+        self.assert_same_file(srcFile, dstFile)
+
+
+    def test_Error_04_No_Overwrite(self):
+        srcFile = self.make_save("Manual_1.zks")
+        manifestFile = os.path.join(self.backupDir, "Manual_1.bbm")
+        self.assertTrue(self.test.store_backup(srcFile, manifestFile))
+        self.assertFalse(self.test.store_backup(srcFile, manifestFile))
+        self.assertTrue(self.test.store_backup(srcFile, manifestFile, overwrite=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,9 +9,10 @@ from baron_builder_features import bbf06_GOLD_sub_menu, bbf06_GOLD_available
 from baron_builder_imports import OS_UNKNOWS
 from baron_builder_imports import supportedOSGlobal
 from baron_builder_imports import minMajNum, minMinNum, minMicNum
-from baron_builder_imports import TOP_DIR, WORKING_DIR
+from baron_builder_imports import TOP_DIR, WORKING_DIR, CACHE_DIR
 from baron_builder_file_mgmt import list_save_games, locate_save_games, user_file_menu
 from baron_builder_utilities import check_py_ver, clear_screen, determine_os
+from parse_cache_class import ParseCache        # ParseCache class
 from zks_file_class import ZksFile              # ZksFile class
 import os                                       # environ, path.join, getuid, path.isdir, system
 
@@ -116,6 +117,8 @@ def main():
     # Instantiate Save File Object
     if retVal:
         try:
+            # Reopening an unchanged save game reuses json files that were parsed in full
+            ZksFile.parseCache = ParseCache(os.path.join(saveGamePath, TOP_DIR, CACHE_DIR))
             saveGameObj = ZksFile(absSaveGameFile)
         except Exception as err:
             print('ZksFile() raised "{}" exception'.format(str(err)))  # DEBUGGING
@@ -126,9 +129,9 @@ def main():
     # Unarchive Save File
     if retVal:
         try:
-            saveGameObj.unpack_file(os.path.join(saveGamePath, TOP_DIR, WORKING_DIR))
+            saveGameObj.unpack_to_memory()
         except Exception as err:
-            print('ZksFile.unpack_file() raised "{}" exception'.format(str(err)))  # DEBUGGING
+            print('ZksFile.unpack_to_memory() raised "{}" exception'.format(str(err)))  # DEBUGGING
             retVal = False
         else:
             pass
@@ -0,0 +1,363 @@
+'''
+    PURPOSE - Organize all of the compression functionality implemented for Baron Builder
+'''
+
+
+#################################################
+#################### IMPORTS ####################
+#################################################
+
+# ZipFile compress_type macros
+from zipfile import ZIP_STORED    # (no compression)
+from zipfile import ZIP_DEFLATED  # (requires zlib)
+from zipfile import ZIP_BZIP2     # (requires bz2)
+from zipfile import ZIP_LZMA      # (requires lzma)
+from concurrent.futures import ProcessPoolExecutor
+import bz2
+import lzma
+import os
+import struct
+import time
+import zlib
+
+
+#################################################
+#################### MACROS #####################
+#################################################
+
+LZMA_ZIP_VERSION = (9, 4)  # LZMA SDK version zipfile records in front of LZMA zip members
+LZMA_LC = 3                # LZMA1 literal context bits used by every preset
+LZMA_LP = 0                # LZMA1 literal position bits used by every preset
+LZMA_PB = 2                # LZMA1 position bits used by every preset
+# COMPRESSION PROFILES
+PROFILE_FAST = "fast"          # Favor speed over compression ratio
+PROFILE_BALANCED = "balanced"  # Good compression ratio without the slowest settings
+PROFILE_MAX = "max"            # Favor compression ratio over speed
+PROFILE_AUTO = "auto"          # Trial compress a sample of each file and choose (see: AUTO_TIME_BUDGET)
+AUTO_SAMPLE_SIZE = 256 * 1024  # Bytes of each file to trial compress in PROFILE_AUTO
+AUTO_TIME_BUDGET = 0.5         # Seconds per MiB of uncompressed data PROFILE_AUTO may spend compressing
+
+
+#################################################
+#################### GLOBALS ####################
+#################################################
+
+# LZMA PRESET DICTIONARY SIZES
+# Index is the preset (0-9), value is the dictionary size liblzma uses for that preset
+lzmaDictSizeGlobal = [ 1 << 18, 1 << 20, 1 << 21, 1 << 22, 1 << 22, 1 << 23, 1 << 23, 1 << 24, 1 << 25, 1 << 26 ]
+# COMPRESSION PROFILES
+# Key is the profile, value is a list of (maximum file size, compress_type, compression level) rules
+# The first rule whose maximum file size (None for no maximum) fits the file is used
+compressProfileGlobal = {
+    PROFILE_FAST : [ (None, ZIP_DEFLATED, 1) ],
+    PROFILE_BALANCED : [ (64 * 1024, ZIP_DEFLATED, 9), (None, ZIP_LZMA, 2) ],
+    PROFILE_MAX : [ (4 * 1024, ZIP_DEFLATED, 9), (None, ZIP_LZMA, 9) ],
+}
+# (compress_type, compression level) candidates PROFILE_AUTO trial compresses, roughly fastest first
+autoCandidateGlobal = [ (ZIP_DEFLATED, 1), (ZIP_DEFLATED, 6), (ZIP_LZMA, 0), (ZIP_DEFLATED, 9), (ZIP_LZMA, 2),
+                        (ZIP_BZIP2, 9), (ZIP_LZMA, 6), (ZIP_LZMA, 9) ]
+# File extensions of formats that are already compressed and will always be ZIP_STORED
+storedExtsGlobal = [ ".png", ".jpg", ".jpeg", ".gz", ".zip", ".zks", ".bba", ".bbb" ]
+
+
+#################################################
+################### FUNCTIONS ###################
+#################################################
+
+
+def compress_member(data, compressType, compressLevel=None):
+    '''
+        PURPOSE - Compress the contents of one zip member the same way zipfile would
+        INPUT
+            data - Bytes holding the uncompressed contents of the zip member
+            compressType - ZipFile compress_type macro (e.g., ZIP_DEFLATED)
+            compressLevel - Optional compression level (zlib/bz2 level or LZMA preset)
+        OUTPUT
+            On success, tuple of (CRC32 of data, compressed bytes)
+            On error, Exception
+        NOTES
+            ZIP_LZMA data is prefixed with the LZMA properties header zipfile expects
+            With compressLevel of None the output matches zipfile's default for compressType
+    '''
+    # LOCAL VARIABLES
+    retVal = None
+    crc = 0           # CRC32 of the uncompressed data
+    header = b""      # Bytes that start the compressed data
+    compressor = None  # zlib/bz2/lzma compressor object
+
+    # INPUT VALIDATION
+    if not isinstance(data, (bytes, bytearray)):
+        raise TypeError('Data is of type "{}" instead of bytes'.format(type(data)))
+    elif compressLevel is not None and not isinstance(compressLevel, int):
+        raise TypeError('Compression level is of type "{}" instead of integer'.format(type(compressLevel)))
+
+    # COMPRESS
+    crc = zlib.crc32(data) & 0xffffffff
+    if ZIP_STORED == compressType:
+        retVal = (crc, bytes(data))
+    else:
+        header, compressor = member_compressor(compressType, compressLevel)
+        retVal = (crc, header + compressor.compress(data) + compressor.flush())
+
+    # DONE
+    return retVal
+
+
+def member_compressor(compressType, compressLevel=None):
+    '''
+        PURPOSE - Create a compressor for streaming the contents of one zip member
+        INPUT
+            compressType - ZipFile compress_type macro (e.g., ZIP_DEFLATED)
+            compressLevel - Optional compression level (zlib/bz2 level or LZMA preset)
+        OUTPUT
+            On success, tuple of (bytes that start the compressed data, compressor object with
+                compress() and flush() methods).  ZIP_STORED has no compressor (None).
+            On error, Exception
+        NOTES
+            The header followed by the compressor's output matches compress_member()
+    '''
+    # LOCAL VARIABLES
+    retVal = None
+    props = b""  # Encoded LZMA1 properties
+
+    # INPUT VALIDATION
+    if compressLevel is not None and not isinstance(compressLevel, int):
+        raise TypeError('Compression level is of type "{}" instead of integer'.format(type(compressLevel)))
+
+    # CREATE THE COMPRESSOR
+    if ZIP_STORED == compressType:
+        retVal = (b"", None)
+    elif ZIP_DEFLATED == compressType:
+        if compressLevel is None:
+            compressLevel = zlib.Z_DEFAULT_COMPRESSION
+        retVal = (b"", zlib.compressobj(compressLevel, zlib.DEFLATED, -15))
+    elif ZIP_BZIP2 == compressType:
+        if compressLevel is None:
+            compressLevel = 9
+        retVal = (b"", bz2.BZ2Compressor(compressLevel))
+    elif ZIP_LZMA == compressType:
+        if compressLevel is None:
+            compressLevel = lzma.PRESET_DEFAULT
+        if compressLevel < 0 or compressLevel >= len(lzmaDictSizeGlobal):
+            raise ValueError("Invalid LZMA preset {}".format(compressLevel))
+        props = struct.pack("<BI", (LZMA_PB * 5 + LZMA_LP) * 9 + LZMA_LC, lzmaDictSizeGlobal[compressLevel])
+        retVal = (struct.pack("<BBH", LZMA_ZIP_VERSION[0], LZMA_ZIP_VERSION[1], len(props)) + props,
+                  lzma.LZMACompressor(lzma.FORMAT_RAW,
+                                      filters=[ { "id" : lzma.FILTER_LZMA1, "preset" : compressLevel } ]))
+    else:
+        raise ValueError("Unsupported compress_type {}".format(compressType))
+
+    # DONE
+    return retVal
+
+
+def compress_lzma_member(data, preset=None):
+    '''
+        PURPOSE - Compress the contents of one zip member into the ZIP_LZMA member format
+        INPUT
+            data - Bytes holding the uncompressed contents of the zip member
+            preset - Optional LZMA preset (0-9), defaults to lzma.PRESET_DEFAULT
+        OUTPUT
+            On success, compressed bytes (LZMA properties header followed by a raw LZMA1 stream)
+            On error, Exception
+    '''
+    # LOCAL VARIABLES
+    retVal = b""
+    header = b""       # LZMA properties header
+    compressor = None  # lzma.LZMACompressor object
+
+    # INPUT VALIDATION
+    if preset is None:
+        preset = lzma.PRESET_DEFAULT
+    if not isinstance(preset, int):
+        raise TypeError('Preset is of type "{}" instead of integer'.format(type(preset)))
+    elif preset < 0 or preset >= len(lzmaDictSizeGlobal):
+        raise ValueError("Invalid LZMA preset {}".format(preset))
+
+    # COMPRESS
+    header, compressor = member_compressor(ZIP_LZMA, preset)
+    retVal = header + compressor.compress(data) + compressor.flush()
+
+    # DONE
+    return retVal
+
+
+def compress_members(dataList, compressTypeList, compressLevel=None, numWorkers=None):
+    '''
+        PURPOSE - Compress the contents of many zip members, in parallel, the same way zipfile would
+        INPUT
+            dataList - List of bytes holding the uncompressed contents of each zip member
+            compressTypeList - List of ZipFile compress_type macros, one per entry in dataList
+            compressLevel - Optional compression level (see: compress_member()), or a list of
+                compression levels with one per entry in dataList
+            numWorkers - Optional number of worker processes, defaults to os.cpu_count()
+        OUTPUT
+            On success, list of (CRC32, compressed bytes) tuples in the same order as dataList
+            On error, Exception
+        NOTES
+            Each member is compressed by compress_member() so the output is identical to
+                compressing the members one after another
+            Fewer than two workers, or fewer than two members, compresses in this process
+    '''
+    # LOCAL VARIABLES
+    retVal = []
+    levelList = compressLevel  # Compression level of each member
+
+    # INPUT VALIDATION
+    if not isinstance(levelList, list):
+        levelList = [ compressLevel ] * len(dataList)
+    if not isinstance(dataList, list):
+        raise TypeError('Data list is of type "{}" instead of list'.format(type(dataList)))
+    elif not isinstance(compressTypeList, list):
+        raise TypeError('Compress type list is of type "{}" instead of list'.format(type(compressTypeList)))
+    elif len(dataList) != len(compressTypeList):
+        raise ValueError("Data list and compress type list are different lengths")
+    elif len(dataList) != len(levelList):
+        raise ValueError("Data list and compression level list are different lengths")
+    elif numWorkers is not None and not isinstance(numWorkers, int):
+        raise TypeError('Number of workers is of type "{}" instead of integer'.format(type(numWorkers)))
+    elif numWorkers is not None and numWorkers < 1:
+        raise ValueError("Invalid number of workers {}".format(numWorkers))
+
+    # COMPRESS
+    if (numWorkers is not None and numWorkers < 2) or len(dataList) < 2:
+        retVal = list(map(compress_member, dataList, compressTypeList, levelList))
+    else:
+        if numWorkers is not None:
+            numWorkers = min(numWorkers, len(dataList))
+        with ProcessPoolExecutor(max_workers=numWorkers) as executor:
+            retVal = list(executor.map(compress_member, dataList, compressTypeList, levelList))
+
+    # DONE
+    return retVal
+
+
+def select_compression(memberName, data, profile=PROFILE_BALANCED, timeBudget=AUTO_TIME_BUDGET):
+    '''
+        PURPOSE - Choose the compression type and level for one zip member using a compression profile
+        INPUT
+            memberName - Filename of the zip member
+            data - Bytes holding the uncompressed contents of the zip member
+            profile - Compression profile (e.g., PROFILE_FAST, PROFILE_AUTO)
+            timeBudget - Seconds per MiB of uncompressed data PROFILE_AUTO may spend compressing
+        OUTPUT
+            On success, tuple of (ZipFile compress_type macro, compression level)
+            On error, Exception
+        NOTES
+            Files with an extension in storedExtsGlobal are always ZIP_STORED
+    '''
+    # LOCAL VARIABLES
+    retVal = None
+
+    # INPUT VALIDATION
+    if not isinstance(memberName, str):
+        raise TypeError('Member name is of type "{}" instead of string'.format(type(memberName)))
+    elif not isinstance(data, (bytes, bytearray)):
+        raise TypeError('Data is of type "{}" instead of bytes'.format(type(data)))
+    elif PROFILE_AUTO != profile and profile not in compressProfileGlobal.keys():
+        raise ValueError("Unknown compression profile {}".format(profile))
+
+    # SELECT
+    if os.path.splitext(memberName)[1].lower() in storedExtsGlobal:
+        retVal = (ZIP_STORED, None)
+    elif PROFILE_AUTO == profile:
+        retVal = trial_compression(data, timeBudget)
+    else:
+        for maxSize, compressType, compressLevel in compressProfileGlobal[profile]:
+            if maxSize is None or len(data) <= maxSize:
+                retVal = (compressType, compressLevel)
+                break
+
+    # DONE
+    return retVal
+
+
+def trial_compression(data, timeBudget=AUTO_TIME_BUDGET):
+    '''
+        PURPOSE - Trial compress a sample of data with each of autoCandidateGlobal and choose the
+            best compression ratio that fits the time budget
+        INPUT
+            data - Bytes holding the uncompressed contents of the zip member
+            timeBudget - Seconds per MiB of uncompressed data that may be spent compressing
+        OUTPUT
+            On success, tuple of (ZipFile compress_type macro, compression level)
+            On error, Exception
+        NOTES
+            Only the first AUTO_SAMPLE_SIZE bytes are trial compressed
+            The fastest candidate is used if no candidate fits the time budget
+            Every candidate is tried since autoCandidateGlobal is only roughly ordered by cost (e.g.,
+                ZIP_BZIP2 can be slower than a later ZIP_LZMA candidate), so a candidate that exceeds
+                the time budget is skipped instead of ending the trial
+    '''
+    # LOCAL VARIABLES
+    retVal = autoCandidateGlobal[0]
+    sample = data[:AUTO_SAMPLE_SIZE]  # Portion of data to trial compress
+    bestSize = None                   # Smallest compressed sample size that fits the time budget
+    sampleBudget = 0                  # Seconds that may be spent compressing the sample
+    startTime = 0                     # Time the current trial started
+    trialTime = 0                     # Seconds the current trial took
+    trialSize = 0                     # Compressed sample size of the current trial
+
+    # INPUT VALIDATION
+    if not isinstance(timeBudget, (int, float)):
+        raise TypeError('Time budget is of type "{}" instead of a number'.format(type(timeBudget)))
+    elif timeBudget <= 0:
+        raise ValueError("Invalid time budget {}".format(timeBudget))
+
+    # TRIAL COMPRESS
+    sampleBudget = timeBudget * len(sample) / (1024 * 1024)
+    for compressType, compressLevel in autoCandidateGlobal:
+        startTime = time.perf_counter()
+        trialSize = len(compress_member(sample, compressType, compressLevel)[1])
+        trialTime = time.perf_counter() - startTime
+        if trialTime > sampleBudget:
+            continue
+        elif bestSize is None or trialSize < bestSize:
+            bestSize = trialSize
+            retVal = (compressType, compressLevel)
+
+    # DONE
+    return retVal
+
+
+def decompress_member(rawData, compressType):
+    '''
+        PURPOSE - Decompress the raw contents of one zip member
+        INPUT
+            rawData - Bytes holding the compressed contents of the zip member
+            compressType - ZipFile compress_type macro (e.g., ZIP_DEFLATED)
+        OUTPUT
+            On success, the uncompressed bytes
+            On error, Exception
+        NOTES
+            This is the inverse of compress_member()
+    '''
+    # LOCAL VARIABLES
+    retVal = b""
+    propsLen = 0       # Length of the LZMA properties
+    props = 0          # First byte of the LZMA properties (pb, lp, and lc)
+    dictSize = 0       # LZMA dictionary size
+    decompressor = None  # lzma.LZMADecompressor object
+
+    # INPUT VALIDATION
+    if not isinstance(rawData, (bytes, bytearray)):
+        raise TypeError('Raw data is of type "{}" instead of bytes'.format(type(rawData)))
+
+    # DECOMPRESS
+    if ZIP_STORED == compressType:
+        retVal = bytes(rawData)
+    elif ZIP_DEFLATED == compressType:
+        retVal = zlib.decompress(rawData, -15)
+    elif ZIP_BZIP2 == compressType:
+        retVal = bz2.decompress(rawData)
+    elif ZIP_LZMA == compressType:
+        propsLen = struct.unpack("<H", rawData[2:4])[0]
+        props, dictSize = struct.unpack("<BI", rawData[4:4 + propsLen])
+        decompressor = lzma.LZMADecompressor(lzma.FORMAT_RAW, filters=[ { "id" : lzma.FILTER_LZMA1,
+            "dict_size" : dictSize, "lc" : props % 9, "lp" : (props // 9) % 5, "pb" : props // 45 } ])
+        retVal = decompressor.decompress(rawData[4 + propsLen:])
+    else:
+        raise ValueError("Unsupported compress_type {}".format(compressType))
+
+    # DONE
+    return retVal
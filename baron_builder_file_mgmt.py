@@ -12,12 +12,15 @@ from baron_builder_imports import nixSaveGamePath, winSaveGamePath, macSaveGameP
 from baron_builder_imports import saveGameJson, backGameJson, archGameJson
 from baron_builder_imports import OS_UNKNOWS, OS_LINUX, OS_WINDOWS, OS_APPLE
 from baron_builder_imports import TOP_DIR, ARCHIVE_DIR, BACKUP_DIR, WORKING_DIR
-from baron_builder_imports import ARCHIVE_EXT, BACKUP_EXT, MISC_BACKUP_EXT, SAVE_GAME_EXT
-from baron_builder_imports import supportedOSGlobal
+from baron_builder_imports import ARCHIVE_EXT, BACKUP_EXT, MISC_BACKUP_EXT, SAVE_GAME_EXT, MANIFEST_EXT
+from baron_builder_imports import supportedOSGlobal, numArchiveWorkers, archiveProfile, deltaBackups
 from baron_builder_utilities import clear_screen
+from backup_store_class import BackupStore
 from collections import OrderedDict
 # from copy import deepcopy
 from json_file_class import JsonFile
+from save_catalog_class import SaveCatalog
+from save_list_index_class import SaveListIndex
 from stat import S_ISREG, ST_CTIME, ST_MODE, ST_MTIME
 from zks_file_class import ZksFile
 import os
@@ -78,6 +81,7 @@ def user_file_menu(operSys, saveGamePath, oldSaveGameFileList, curNumBadAns):
     backJsonFile = ""                       # Full path to the Baron Builder backup save game list json file
     archJsonFile = ""                       # Full path to the Baron Builder archive save game list json file
     backupGamePath = ""                     # Full path to the Baron Builder backup directory
+    saveCatalog = None                      # SaveCatalog object used to describe, sort, and filter save games
 
 
     # GLOBAL VARIABLES
@@ -111,169 +115,183 @@ def user_file_menu(operSys, saveGamePath, oldSaveGameFileList, curNumBadAns):
     # PREPARE BACKUP DIRECTORY
     start_storage_dir(backupGamePath, backGameJson)
 
-    # PRINT MENU
-    while numBadAnswers <= MAX_ERRS:
-        print("")  # Blank line
-        # PRINT MENU
-        # Print options
-        print("SAVE GAME FILE MANAGEMENT")
-        print("(a) Edit a save game")
-        print("(b) Backup save game(s)")
-        print("(c) Archive save game(s)")
-        print("(d) Restore save game(s)")
-        print("(e) Clean working directory")
-        print("(f) Help")
-        print("")
-        print('Type "clear" to clear the screen')
-        print('Type "quit" to exit this program')
-
-        # Take input
-        selection = input("Make your selection [a]:  ")
-        clear_screen(operSys)
+    # OPEN THE CATALOG
+    saveCatalog = SaveCatalog(saveGamePath)
+    if saveCatalog.open_catalog() is False:
+        saveCatalog = None
 
-        # Modify input
-        if len(selection) == 0:
-            selection = "a"
-        else:
-            selection = selection.lower()
+    try:
+        # PRINT MENU
+        while numBadAnswers <= MAX_ERRS:
+            print("")  # Blank line
+            # PRINT MENU
+            # Print options
+            print("SAVE GAME FILE MANAGEMENT")
+            print("(a) Edit a save game")
+            print("(b) Backup save game(s)")
+            print("(c) Archive save game(s)")
+            print("(d) Restore save game(s)")
+            print("(e) Clean working directory")
+            print("(f) Help")
+            print("")
+            print('Type "clear" to clear the screen')
+            print('Type "quit" to exit this program')
 
-        # Execute selection
-        if "clear" == selection:
-            numBadAnswers = 0
+            # Take input
+            selection = input("Make your selection [a]:  ")
             clear_screen(operSys)
-        elif "quit" == selection:
-            numBadAnswers = 0
-            userQuit = True
-        elif "a" == selection:
-            try:
-                fileNum = user_file_selection_menu(operSys, saveGamePath, saveGameFileList, numBadAnswers)
-            except RuntimeError as err:
-                if str(err) == "Quit":
-                    userQuit = True
-            except Exception as err:
-                print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                retVal = False
-            else:
-                retVal = fileNum
-                break
-        elif "b" == selection:
-            numBadAnswers = 0
-            # Choose file to backup
-            try:
-                fileNum = user_file_selection_menu(operSys, saveGamePath, saveGameFileList, numBadAnswers)
-            except RuntimeError as err:
-                if str(err) == "Quit":
-                    userQuit = True
-            except Exception as err:
-                print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                retVal = False
-                break
+
+            # Modify input
+            if len(selection) == 0:
+                selection = "a"
             else:
-                if 0 > fileNum or fileNum >= len(saveGameFileList):
-                    print("user_file_selection_menu() failed to return a proper file index")  # DEBUGGING
+                selection = selection.lower()
+
+            # Execute selection
+            if "clear" == selection:
+                numBadAnswers = 0
+                clear_screen(operSys)
+            elif "quit" == selection:
+                numBadAnswers = 0
+                userQuit = True
+            elif "a" == selection:
+                try:
+                    fileNum = user_file_selection_menu(operSys, saveGamePath, saveGameFileList, numBadAnswers, saveCatalog)
+                except RuntimeError as err:
+                    if str(err) == "Quit":
+                        userQuit = True
+                except Exception as err:
+                    print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
+                    retVal = False
+                else:
+                    retVal = fileNum
+                    break
+            elif "b" == selection:
+                numBadAnswers = 0
+                # Choose file to backup
+                try:
+                    fileNum = user_file_selection_menu(operSys, saveGamePath, saveGameFileList, numBadAnswers, saveCatalog)
+                except RuntimeError as err:
+                    if str(err) == "Quit":
+                        userQuit = True
+                except Exception as err:
+                    print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
                     retVal = False
                     break
                 else:
-                    clear_screen(operSys)
-                    print("\nBacking up file:\t{}".format(saveGameFileList[fileNum]))
-                    numBadAnswers = 0
-
-            # Backup file
-            try:
-                retVal = backup_a_file(os.path.join(saveGamePath, saveGameFileList[fileNum]),
-                                       backupGamePath, BACKUP_EXT, srcJson=gameJsonFile, dstJson=backJsonFile)
-            except Exception as err:
-                print('backup_a_file() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                retVal = False
-                break
-            else:
-                if retVal is False:
-                    print("backup_a_file() failed to backup the file")  # DEBUGGING
+                    if 0 > fileNum or fileNum >= len(saveGameFileList):
+                        print("user_file_selection_menu() failed to return a proper file index")  # DEBUGGING
+                        retVal = False
+                        break
+                    else:
+                        clear_screen(operSys)
+                        print("\nBacking up file:\t{}".format(saveGameFileList[fileNum]))
+                        numBadAnswers = 0
+
+                # Backup file
+                try:
+                    retVal = backup_a_file(os.path.join(saveGamePath, saveGameFileList[fileNum]),
+                                           backupGamePath, MANIFEST_EXT, srcJson=gameJsonFile, dstJson=backJsonFile)
+                except Exception as err:
+                    print('backup_a_file() raised "{}" exception'.format(str(err)))  # DEBUGGING
+                    retVal = False
                     break
                 else:
-                    print("Successfully backed up file")
-        elif "c" == selection:
-            numBadAnswers = 0
-            # Choose file to archive
-            try:
-                fileNum = user_file_selection_menu(operSys, saveGamePath, saveGameFileList, numBadAnswers)
-            except RuntimeError as err:
-                if str(err) == "Quit":
-                    userQuit = True
-            except Exception as err:
-                print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                retVal = False
-                break
-            else:
-                if 0 > fileNum or fileNum >= len(saveGameFileList):
-                    print("user_file_selection_menu() failed to return a proper file index")  # DEBUGGING
+                    if retVal is False:
+                        print("backup_a_file() failed to backup the file")  # DEBUGGING
+                        break
+                    else:
+                        print("Successfully backed up file")
+            elif "c" == selection:
+                numBadAnswers = 0
+                # Choose files to archive
+                try:
+                    fileNumList = user_file_selection_menu(operSys, saveGamePath, saveGameFileList, numBadAnswers, saveCatalog,
+                                                           multiSelect=True)
+                except RuntimeError as err:
+                    if str(err) == "Quit":
+                        userQuit = True
+                except Exception as err:
+                    print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
                     retVal = False
                     break
                 else:
-                    clear_screen(operSys)
-                    print("\nArchiving file:\t{}".format(saveGameFileList[fileNum]))
-                    numBadAnswers = 0
-                    # Archive file
-                    try:
-                        retVal = archive_a_file(saveGamePath,
-                                                os.path.join(saveGamePath, saveGameFileList[fileNum]),
-                                                os.path.join(saveGamePath, TOP_DIR, ARCHIVE_DIR),
-                                                srcJson=gameJsonFile, dstJson=archJsonFile)
-                    except Exception as err:
-                        print('archive_a_file() raised "{}" exception'.format(str(err)))  # DEBUGGING
+                    if not isinstance(fileNumList, list) or 0 == len(fileNumList) \
+                       or [ fileNum for fileNum in fileNumList if 0 > fileNum or fileNum >= len(saveGameFileList) ]:
+                        print("user_file_selection_menu() failed to return proper file indices")  # DEBUGGING
                         retVal = False
                         break
                     else:
-                        if retVal is False:
-                            print("archive_a_file() failed to archive the file")  # DEBUGGING
+                        clear_screen(operSys)
+                        for fileNum in fileNumList:
+                            print("\nArchiving file:\t{}".format(saveGameFileList[fileNum]))
+                        numBadAnswers = 0
+                        # Archive files
+                        try:
+                            retVal = archive_files(saveGamePath,
+                                                   [ os.path.join(saveGamePath, saveGameFileList[fileNum])
+                                                     for fileNum in fileNumList ],
+                                                   os.path.join(saveGamePath, TOP_DIR, ARCHIVE_DIR),
+                                                   srcJson=gameJsonFile, dstJson=archJsonFile)
+                        except Exception as err:
+                            print('archive_files() raised "{}" exception'.format(str(err)))  # DEBUGGING
+                            retVal = False
                             break
                         else:
-                            print("Successfully archived file")
+                            # Archived files are gone, whether or not they all succeeded
                             saveGamesChanged = True
-        elif "d" == selection:
-            numBadAnswers = 0
-            try:
-                user_restore_menu(operSys, saveGamePath, numBadAnswers)
-            except RuntimeError as err:
-                if "Quit" == str(err):
-                    userQuit = True
-                elif "Exit" == str(err):
-                    clear_screen(operSys)
-                    continue
-                else:
-                    raise err
-            except Exception as err:
-                print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                retVal = False
-                break
-        elif "e" == selection:
-            empty_a_dir(os.path.join(saveGamePath, TOP_DIR, WORKING_DIR))
-        elif "f" == selection:
-            print("A - 'Editing a save game' will allow you to modify certain aspects of that save file.")
-            print("B - 'Backing up a save' will copy a save game file into a back up directory.\n    High speed but no compression.")
-            print("C - 'Archiving a save' will move a save game into an archive directory.\n    Slow speed, some compression but this may speed up game load times.")
-            print("D - 'Restore save games' will allow you to recover backup and archive save games, overwriting your current save.")
-            print("E - 'Clean working directory' will manually clear the temporary files created during file manipulation.")
-            print("F - I just wanted to give the user some insight into what is happening without lengthy documentation.")
-            print("")
-        else:
-            print("\nInvalid selection.")
-            numBadAnswers += 1
-            if numBadAnswers <= MAX_ERRS:
-                print("Try again.")
+                            if retVal is False:
+                                print("archive_files() failed to archive the files")  # DEBUGGING
+                                break
+                            else:
+                                print("Successfully archived files")
+            elif "d" == selection:
+                numBadAnswers = 0
+                try:
+                    user_restore_menu(operSys, saveGamePath, numBadAnswers, saveCatalog)
+                except RuntimeError as err:
+                    if "Quit" == str(err):
+                        userQuit = True
+                    elif "Exit" == str(err):
+                        clear_screen(operSys)
+                        continue
+                    else:
+                        raise err
+                except Exception as err:
+                    print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
+                    retVal = False
+                    break
+            elif "e" == selection:
+                empty_a_dir(os.path.join(saveGamePath, TOP_DIR, WORKING_DIR))
+            elif "f" == selection:
+                print("A - 'Editing a save game' will allow you to modify certain aspects of that save file.")
+                print("B - 'Backing up a save' will copy a save game file into a back up directory.\n    High speed but no compression.")
+                print("C - 'Archiving a save' will move one or more save games into an archive directory.\n    Slow speed, some compression but this may speed up game load times.")
+                print("D - 'Restore save games' will allow you to recover backup and archive save games, overwriting your current save.")
+                print("E - 'Clean working directory' will manually clear the temporary files created during file manipulation.")
+                print("F - I just wanted to give the user some insight into what is happening without lengthy documentation.")
+                print("")
+            else:
+                print("\nInvalid selection.")
+                numBadAnswers += 1
+                if numBadAnswers <= MAX_ERRS:
+                    print("Try again.")
 
-        if userQuit is True:
-            raise RuntimeError("Quit")
+            if userQuit is True:
+                raise RuntimeError("Quit")
 
-        if saveGamesChanged is True:
-            # Update save game file list in case save games were deleted
-            saveGameFileList = list_save_games(operSys, saveGamePath)
-            saveGamesChanged = False
+            if saveGamesChanged is True:
+                # Update save game file list in case save games were deleted
+                saveGameFileList = list_save_games(operSys, saveGamePath)
+                saveGamesChanged = False
 
-        if backGamesChanged is True:
-            # Update save game file list in case save games were deleted
-            backGameFileList = list_save_games(operSys, backupGamePath, fileExt=BACKUP_EXT)
-            backGamesChanged = False
+            if backGamesChanged is True:
+                # Update save game file list in case save games were deleted
+                backGameFileList = list_save_games(operSys, backupGamePath, fileExt=BACKUP_EXT)
+                backGamesChanged = False
+    finally:
+        if saveCatalog is not None:
+            saveCatalog.close_catalog()
 
     # DONE
     if numBadAnswers > MAX_ERRS:
@@ -282,7 +300,8 @@ def user_file_menu(operSys, saveGamePath, oldSaveGameFileList, curNumBadAns):
     return retVal
 
 
-def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadAns):
+def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadAns, saveCatalog=None,
+                             fileExt=SAVE_GAME_EXT, multiSelect=False):
     '''
         PURPOSE - Allow the user to choose a save game file to edit
         INPUT
@@ -290,19 +309,34 @@ def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadA
             saveGamePath - Relative or absolute path to check for save games
             saveGameFileList - Sorted list of save games found in saveGamePath
             curNumBadAns - Current number of incorrect answers to track error tolerance
+            saveCatalog - Optional open SaveCatalog object used to describe, sort, and filter the save games
+            fileExt - File extension, or list of file extensions, of saveGameFileList in saveCatalog
+            multiSelect - If True, the user may choose several save games (e.g., 1,3,5-7)
         OUTPUT
             On success, index of file selected from saveGameFileList
+            On success with multiSelect, list of indices of files selected from saveGameFileList
             On error, Exception
         EXCEPTIONS
             Runtime("Quit") - User selects quit from menu without selecting a save game
+        NOTES
+            Without a saveCatalog, save games are listed in saveGameFileList order and each header.json
+                is read as its page is printed
     '''
     # LOCAL VARIABLES
     retVal = -1
     supportedOS = supportedOSGlobal
     selection = 0  # Index into saveGameFileList
+    rawSelection = ""  # User selection before it was lowercased
     page = 1  # Set of 10 save game files to display
     numFiles = 0  # Number of save games in list
     numBadAnswers = curNumBadAns  # Current number of bad answers
+    headerDict = {}  # Cache the { fileNum : save game description } here as pages are printed
+    viewList = []  # Indices into saveGameFileList, in the order they are displayed
+    viewNumList = []  # Positions in viewList chosen by a multiSelect user
+    sortBy = "game_time"  # SaveCatalog.list_saves() sort key
+    gameName = None  # SaveCatalog.list_saves() character filter
+    area = None  # SaveCatalog.list_saves() area filter
+    viewDict = None  # Return value from sort_save_games()
 
     # INPUT VALIDATION
     if not isinstance(operSys, int):
@@ -322,22 +356,39 @@ def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadA
     elif curNumBadAns > MAX_ERRS:
         raise RuntimeError("Exceeded maximum bad answers")
     else:
-        numFiles = len(saveGameFileList)
+        viewList = list(range(len(saveGameFileList)))
+        numFiles = len(viewList)
 
     # CLEAR SCREEN
     clear_screen(operSys)
 
+    # READ NEW OR MODIFIED SAVE GAMES INTO THE CATALOG
+    if saveCatalog is not None and saveCatalog.refresh_catalog() is False:
+        saveCatalog = None
+
     while numBadAnswers <= MAX_ERRS:
 
+        # SORT AND FILTER
+        if saveCatalog is not None and viewDict is None:
+            viewDict = sort_save_games(saveCatalog, saveGameFileList, fileExt, gameName, area, sortBy)
+            viewList = list(viewDict.keys())
+            numFiles = len(viewList)
+            for fileNum, description in viewDict.items():
+                if description is not None:
+                    headerDict[fileNum] = description
+
         print("")  # Blank line
 
         # PRINT SAVE FILES
         # Verify files exist
         if numFiles > ((page - 1) * 10):
             # There's files
-            for fileNum in range((page - 1) * 10, page * 10):
-                if fileNum < numFiles:
-                    print("#{}:\t{}".format(fileNum + 1, saveGameFileList[fileNum]))
+            for viewNum in range((page - 1) * 10, page * 10):
+                if viewNum < numFiles:
+                    fileNum = viewList[viewNum]
+                    if fileNum not in headerDict.keys():
+                        headerDict[fileNum] = describe_save_game(os.path.join(saveGamePath, saveGameFileList[fileNum]))
+                    print("#{}:\t{}\t{}".format(viewNum + 1, saveGameFileList[fileNum], headerDict[fileNum]))
                 else:
                     print("")  # Print a blank line as a placeholder for missing files
             # break  # DEBUGGING
@@ -358,22 +409,30 @@ def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadA
 
         # Print options
         print("SAVE GAME SELECTION")
-        print("Enter the number of the save game you want")
+        if multiSelect is True:
+            print("Enter the numbers of the save games you want (e.g., 1,3,5-7)")
+        else:
+            print("Enter the number of the save game you want")
         print("-or-")
         print('Type "top" to see the first page of files')
         print('Type "up" to see the previous page of files')
         print('Type "down" to see the next page of files')
         print('Type "bottom" to see the last page of files')
+        if saveCatalog is not None:
+            print('Type "sort" and one of {} to sort the files'.format(", ".join(sorted(saveCatalog.sortDict.keys()))))
+            print('Type "character" and a character name to only see that character\'s files')
+            print('Type "area" and an area name to only see files saved in that area')
+            print('Type "all" to see every file again')
         print('Type "quit" to exit this program')
 
         # Take input
-        selection = input("Make your selection [Down]:  ")
+        rawSelection = input("Make your selection [Down]:  ").strip()
 
         # Modify input
-        if len(selection) == 0:
+        if len(rawSelection) == 0:
             selection = "down"
         else:
-            selection = selection.lower()
+            selection = rawSelection.lower()
 
         # Execute selection
         if "top" == selection:
@@ -400,14 +459,40 @@ def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadA
                 clear_screen(operSys)
         elif "bottom" == selection:
             if 0 == numFiles % 10:
-                page = int(((numFiles - (numFiles % 10)) / 10))
+                page = max(1, int(((numFiles - (numFiles % 10)) / 10)))
             else:
                 page = int(((numFiles - (numFiles % 10)) / 10) + 1)
             numBadAnswers = 0
             clear_screen(operSys)
+        elif saveCatalog is not None and selection.split(" ")[0] in [ "sort", "character", "area", "all" ]:
+            if selection.startswith("sort") and selection[len("sort"):].strip() not in saveCatalog.sortDict.keys():
+                print("\nInvalid sort.  Try again.")
+                numBadAnswers += 1
+                continue
+            elif selection.startswith("sort"):
+                sortBy = selection[len("sort"):].strip()
+            elif selection.startswith("character"):
+                gameName = rawSelection[len("character"):].strip()
+            elif selection.startswith("area"):
+                area = rawSelection[len("area"):].strip()
+            else:
+                gameName = None
+                area = None
+            page = 1
+            viewDict = None
+            numBadAnswers = 0
+            clear_screen(operSys)
         elif "quit" == selection:
             numBadAnswers = 0
             raise RuntimeError("Quit")
+        elif multiSelect is True:
+            viewNumList = parse_selection_list(selection, numFiles)
+            if viewNumList is None:
+                print("\nInvalid selection.  Try again.")
+                numBadAnswers += 1
+            else:
+                retVal = [ viewList[viewNum] for viewNum in viewNumList ]
+                break
         else:
             try:
                 retVal = int(selection)
@@ -419,8 +504,10 @@ def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadA
             else:
                 if retVal < 0 or retVal >= numFiles:
                     print("\nInvalid selection.  Try again.")
+                    retVal = -1
                     numBadAnswers += 1
                 else:
+                    retVal = viewList[retVal]
                     break
 
     # DONE
@@ -432,18 +519,138 @@ def user_file_selection_menu(operSys, saveGamePath, saveGameFileList, curNumBadA
     return retVal
 
 
-def user_restore_menu(operSys, saveGamePath, curNumBadAns):
+def parse_selection_list(selection, numFiles):
+    '''
+        PURPOSE - Translate a user's list of save game numbers into indices
+        INPUT
+            selection - Comma and/or space separated numbers and ranges (e.g., "1,3,5-7")
+            numFiles - Number of save games the user chose from
+        OUTPUT
+            On success, list of unique zero-based indices in the order they were entered
+            On failure, None
+    '''
+    # LOCAL VARIABLES
+    retVal = []
+    firstNum = 0  # First number of a range
+    lastNum = 0  # Last number of a range
+
+    # PARSE
+    try:
+        for entry in selection.replace(",", " ").split():
+            if "-" in entry:
+                firstNum, lastNum = [ int(num) for num in entry.split("-", 1) ]
+            else:
+                firstNum = lastNum = int(entry)
+            if firstNum < 1 or lastNum < firstNum or lastNum > numFiles:
+                raise ValueError("{} is out of range".format(entry))
+            for viewNum in range(firstNum - 1, lastNum):
+                if viewNum not in retVal:
+                    retVal.append(viewNum)
+    except Exception as err:
+        print(repr(err))  # DEBUGGING
+        retVal = None
+    else:
+        if 0 == len(retVal):
+            retVal = None
+
+    # DONE
+    return retVal
+
+
+def sort_save_games(saveCatalog, saveGameFileList, fileExt=SAVE_GAME_EXT, gameName=None, area=None,
+                    sortBy="game_time"):
+    '''
+        PURPOSE - Sort and filter a list of save games with a SaveCatalog
+        INPUT
+            saveCatalog - Open SaveCatalog object
+            saveGameFileList - List of save game filenames
+            fileExt - File extension, or list of file extensions, of saveGameFileList in saveCatalog
+            gameName - Optional character name to filter by (see: SaveCatalog.list_saves())
+            area - Optional area to filter by (see: SaveCatalog.list_saves())
+            sortBy - SaveCatalog.list_saves() sort key
+        OUTPUT
+            OrderedDict of { index into saveGameFileList : save game description } in sorted order
+        NOTES
+            Save games missing from the catalog are listed last, without a description, unless
+                a filter is used
+    '''
+    # LOCAL VARIABLES
+    retVal = OrderedDict()
+    indexDict = {}     # { filename : index into saveGameFileList }
+    entryList = None   # Return value from SaveCatalog.list_saves()
+
+    # SORT AND FILTER
+    for fileNum, filename in enumerate(saveGameFileList):
+        indexDict[filename] = fileNum
+    entryList = saveCatalog.list_saves(fileExt, gameName=gameName, area=area, sortBy=sortBy)
+    for entry in entryList if entryList is not None else []:
+        if entry["fileName"] in indexDict and indexDict[entry["fileName"]] not in retVal:
+            retVal[indexDict[entry["fileName"]]] = describe_header(entry) if entry["GameName"] is not None else None
+    if gameName is None and area is None:
+        for fileNum in range(len(saveGameFileList)):
+            if fileNum not in retVal:
+                retVal[fileNum] = None
+
+    # DONE
+    return retVal
+
+
+def describe_header(headerDict):
+    '''
+        PURPOSE - Summarize a save game for a menu
+        INPUT
+            headerDict - Dictionary of header.json fields (see: ZksFile.read_header() and SaveCatalog.list_saves())
+        OUTPUT
+            String describing the save game
+    '''
+    # DONE
+    return "{} - {} ({}, played {})".format(headerDict["GameName"], headerDict["Name"],
+                                           headerDict["Type"], headerDict["GameTotalTime"])
+
+
+def describe_save_game(saveGameFile):
+    '''
+        PURPOSE - Summarize a save game for a menu using only its header.json
+        INPUT
+            saveGameFile - Relative or absolute filename of a save game
+        OUTPUT
+            On success, string describing the save game
+            On failure, empty string
+        NOTES
+            See: ZksFile.read_header()
+    '''
+    # LOCAL VARIABLES
+    retVal = ""
+    headerDict = None  # Return value from ZksFile.read_header()
+
+    # READ THE HEADER
+    try:
+        headerDict = ZksFile(saveGameFile).read_header()
+    except Exception as err:
+        print(repr(err))  # DEBUGGING
+    else:
+        if headerDict is not None:
+            retVal = describe_header(headerDict)
+
+    # DONE
+    return retVal
+
+
+def user_restore_menu(operSys, saveGamePath, curNumBadAns, saveCatalog=None):
     '''
         PURPOSE - Extricate restore functionality into a restore sub-menu
         INPUT
             operSys - See OPERATAING SYSTEM macros
             saveGamePath - Relative or absolute path to check for save games
             curNumBadAns - Current number of incorrect answers to track error tolerance
+            saveCatalog - Optional open SaveCatalog object to list the backed up and archived save games with
         OUTPUT
             On error, Exception
         EXCEPTIONS
             Runtime("Exit") - User selected exit from menu
             Runtime("Quit") - User selected quit from menu
+        NOTES
+            Without a saveCatalog, one is opened for the life of this menu
     '''
     # LOCAL VARIABLES
     numBadAnswers = curNumBadAns  # Current number of bad answers
@@ -457,14 +664,15 @@ def user_restore_menu(operSys, saveGamePath, curNumBadAns):
     archJsonFile = ""             # Full path to the Baron Builder archive save game list json file
     archGamePath = ""             # Path to the archived save games
     backGamePath = ""             # Path to the backed up save games
-    workGamePath = ""             # Path to the Baron Builder working directory
     archZksFileObj = None         # ZksFile object of archived save game
+    ownCatalog = False            # Set this to True if this function opened saveCatalog
     # Dynamic Variables
     # These variables could be updated each while loop
     fileNum = None                # Index of the user-selected file
     restoreGamePath = ""          # Path to backed up or archived save games
     restoreGameList = []          # List of save games found in restoreGamePath
     restoreJsonFile = ""          # Full path to the Baron Builder save game list json file to restore from
+    restoreFileExt = None         # File extension(s) of restoreGameList
     archGameList = []             # List of available archived games to restore
     backGameList = []             # List of available backed up games to restore
     numArchGames = 0              # Number of available archive games
@@ -479,186 +687,201 @@ def user_restore_menu(operSys, saveGamePath, curNumBadAns):
     # Baron Builder Save Game Directories
     archGamePath = os.path.join(saveGamePath, TOP_DIR, ARCHIVE_DIR)
     backGamePath = os.path.join(saveGamePath, TOP_DIR, BACKUP_DIR)
-    workGamePath = os.path.join(saveGamePath, TOP_DIR, WORKING_DIR)
 
     # CLEAR SCREEN
     clear_screen(operSys)
 
-    while numBadAnswers <= MAX_ERRS:
-        # UPDATE DYNAMIC VARIABLES
-        try:
-            archGameList = list_save_games(operSys, archGamePath, fileExt=ARCHIVE_EXT)
-        except OSError:
-            archGameList = []
-        try:
-            backGameList = list_save_games(operSys, backGamePath, fileExt=BACKUP_EXT)
-        except OSError:
-            backGameList = []
-        numArchGames = len(archGameList)
-        numBackGames = len(backGameList)
-
-        # PRINT MENU
-        print("")  # Blank line
-
-        # Print options
-        print("RESTORE SAVE GAME SELECTION")
-        print("What type of save game do you want to restore?")
-        print("(a) Backup [{} files]".format(numBackGames))
-        print("(b) Archive [{} files]".format(numArchGames))
-        print("-or-")
-        print('Type "clear" to clear the screen')
-        print('Type "exit" to return to the previous menu')
-        print('Type "quit" to exit this program')
-
-        # Take input
-        selection = input("Make your selection [Backup]:  ")
-
-        # Modify input
-        if len(selection) == 0:
-            selection = "a"
-        else:
-            selection = selection.lower()
+    # OPEN THE CATALOG
+    if saveCatalog is None:
+        saveCatalog = SaveCatalog(saveGamePath)
+        ownCatalog = saveCatalog.open_catalog()
+        if ownCatalog is False:
+            saveCatalog = None
 
-            # Translate human answers into scantron answers
-            if "backup" == selection:
+    try:
+        while numBadAnswers <= MAX_ERRS:
+            # UPDATE DYNAMIC VARIABLES
+            # Use the catalog to sort by in-game time, most recent first
+            if saveCatalog is not None and saveCatalog.refresh_catalog() is not False:
+                archGameList = [ entry["fileName"] for entry in saveCatalog.list_saves(ARCHIVE_EXT) ]
+                backGameList = [ entry["fileName"] for entry in saveCatalog.list_saves([ BACKUP_EXT, MANIFEST_EXT ]) ]
+            else:
+                try:
+                    archGameList = list_save_games(operSys, archGamePath, fileExt=ARCHIVE_EXT)
+                except OSError:
+                    archGameList = []
+                try:
+                    backGameList = list_save_games(operSys, backGamePath, fileExt=MANIFEST_EXT)
+                    backGameList = backGameList + list_save_games(operSys, backGamePath, fileExt=BACKUP_EXT)
+                except OSError:
+                    backGameList = []
+            numArchGames = len(archGameList)
+            numBackGames = len(backGameList)
+
+            # PRINT MENU
+            print("")  # Blank line
+
+            # Print options
+            print("RESTORE SAVE GAME SELECTION")
+            print("What type of save game do you want to restore?")
+            print("(a) Backup [{} files]".format(numBackGames))
+            print("(b) Archive [{} files]".format(numArchGames))
+            print("-or-")
+            print('Type "clear" to clear the screen')
+            print('Type "exit" to return to the previous menu')
+            print('Type "quit" to exit this program')
+
+            # Take input
+            selection = input("Make your selection [Backup]:  ")
+
+            # Modify input
+            if len(selection) == 0:
                 selection = "a"
-            elif "archive" == selection:
-                selection = "b"
+            else:
+                selection = selection.lower()
 
-        # Execute selection
-        if "clear" == selection:
-            numBadAnswers = 0
-            clear_screen(operSys)
-            readFiles = False
-        elif "exit" == selection:
-            numBadAnswers = 0
-            userExit = True
-            readFiles = False
-        elif "quit" == selection:
-            numBadAnswers = 0
-            userQuit = True
-            readFiles = False
-        elif "a" == selection:
-            numBadAnswers = 0
-            restoreGamePath = backGamePath
-            restoreGameList = backGameList
-            restoreJsonFile = backJsonFile
-            typeFile = "backup"
-            readFiles = True
-        elif "b" == selection:
-            numBadAnswers = 0
-            restoreGamePath = archGamePath
-            restoreGameList = archGameList
-            restoreJsonFile = archJsonFile
-            typeFile = "archive"
-            readFiles = True
-        else:
-            print("\nInvalid selection.")
-            numBadAnswers += 1
-            if numBadAnswers <= MAX_ERRS:
-                print("Try again.")
-
-        if readFiles is True and userExit is False and userQuit is False:
-            # Validate selection
-            if 0 >= len(restoreGameList):
-                print("\nThere are no {} files to restore.".format(typeFile))
+                # Translate human answers into scantron answers
+                if "backup" == selection:
+                    selection = "a"
+                elif "archive" == selection:
+                    selection = "b"
+
+            # Execute selection
+            if "clear" == selection:
+                numBadAnswers = 0
+                clear_screen(operSys)
+                readFiles = False
+            elif "exit" == selection:
+                numBadAnswers = 0
+                userExit = True
+                readFiles = False
+            elif "quit" == selection:
+                numBadAnswers = 0
+                userQuit = True
+                readFiles = False
+            elif "a" == selection:
+                numBadAnswers = 0
+                restoreGamePath = backGamePath
+                restoreGameList = backGameList
+                restoreJsonFile = backJsonFile
+                restoreFileExt = [ BACKUP_EXT, MANIFEST_EXT ]
+                typeFile = "backup"
+                readFiles = True
+            elif "b" == selection:
+                numBadAnswers = 0
+                restoreGamePath = archGamePath
+                restoreGameList = archGameList
+                restoreJsonFile = archJsonFile
+                restoreFileExt = ARCHIVE_EXT
+                typeFile = "archive"
+                readFiles = True
+            else:
+                print("\nInvalid selection.")
                 numBadAnswers += 1
                 if numBadAnswers <= MAX_ERRS:
                     print("Try again.")
-                continue
 
-            # Allow user to choose a save game to restore
-            try:
-                fileNum = user_file_selection_menu(operSys, restoreGamePath, restoreGameList, numBadAnswers)
-            except RuntimeError as err:
-                if "Quit" == str(err):
-                    userQuit = True
-                elif "Exit" == str(err):
-                    clear_screen(operSys)
+            if readFiles is True and userExit is False and userQuit is False:
+                # Validate selection
+                if 0 >= len(restoreGameList):
+                    print("\nThere are no {} files to restore.".format(typeFile))
+                    numBadAnswers += 1
+                    if numBadAnswers <= MAX_ERRS:
+                        print("Try again.")
                     continue
-                else:
-                    raise err
-            except Exception as err:
-                print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                break
-            else:
-                if 0 > fileNum or fileNum >= len(restoreGameList):
-                    print("user_file_selection_menu() failed to return a proper file index")  # DEBUGGING
+
+                # Allow user to choose a save game to restore
+                try:
+                    fileNum = user_file_selection_menu(operSys, restoreGamePath, restoreGameList, numBadAnswers,
+                                                       saveCatalog, restoreFileExt)
+                except RuntimeError as err:
+                    if "Quit" == str(err):
+                        userQuit = True
+                    elif "Exit" == str(err):
+                        clear_screen(operSys)
+                        continue
+                    else:
+                        raise err
+                except Exception as err:
+                    print('user_file_selection_menu() raised "{}" exception'.format(str(err)))  # DEBUGGING
                     break
                 else:
-                    # Restore the backed up file
-                    clear_screen(operSys)
-                    print("\nRestoring {} file:\t{}".format(typeFile, restoreGameList[fileNum]))
-                    numBadAnswers = 0
-                    if backup_a_file(gameJsonFile, backGamePath, MISC_BACKUP_EXT, overwrite=True) is False:
-                        print("backup_a_file() failed to backup {}".format(backJsonFile))  # DEBUGGING
-                        pass
-                    # Restore file
-                    # Backup
-                    if "a" == selection:
-                        try:
-                            retVal = backup_a_file(os.path.join(restoreGamePath, restoreGameList[fileNum]),
-                                                   saveGamePath, SAVE_GAME_EXT, srcJson=restoreJsonFile, dstJson=gameJsonFile,
-                                                   overwrite=True)
-                        except Exception as err:
-                            print('backup_a_file() raised "{}" exception'.format(str(err)))  # DEBUGGING
-                            retVal = False
-                            break
-                        else:
-                            if retVal is False:
-                                print("backup_a_file() failed to restore the {} file".format(typeFile))  # DEBUGGING
-                                break
-                            else:
-                                print("Successfully restored {} file".format(typeFile))
-                    elif "b" == selection:
-                        try:
-                            archZksFileObj = ZksFile(os.path.join(restoreGamePath, restoreGameList[fileNum]))
-                            if archZksFileObj.unpack_file(workGamePath) is not True:
-                                print("ZksFile.unpack_file() failed on the {} file".format(typeFile))  # DEBUGGING
-                                retVal = False
-                                break
-                            if archZksFileObj.unarchive_file(saveGamePath) is not True:
-                                print("ZksFile.unarchive_file() failed on the {} file".format(typeFile))  # DEBUGGING
-                                retVal = False
-                                break
-                            if archZksFileObj.close_zks() is not True:
-                                print("ZksFile.close_zks() failed")  # DEBUGGING
+                    if 0 > fileNum or fileNum >= len(restoreGameList):
+                        print("user_file_selection_menu() failed to return a proper file index")  # DEBUGGING
+                        break
+                    else:
+                        # Restore the backed up file
+                        clear_screen(operSys)
+                        print("\nRestoring {} file:\t{}".format(typeFile, restoreGameList[fileNum]))
+                        numBadAnswers = 0
+                        if backup_a_file(gameJsonFile, backGamePath, MISC_BACKUP_EXT, overwrite=True) is False:
+                            print("backup_a_file() failed to backup {}".format(backJsonFile))  # DEBUGGING
+                            pass
+                        # Restore file
+                        # Backup
+                        if "a" == selection:
+                            try:
+                                retVal = backup_a_file(os.path.join(restoreGamePath, restoreGameList[fileNum]),
+                                                       saveGamePath, SAVE_GAME_EXT, srcJson=restoreJsonFile, dstJson=gameJsonFile,
+                                                       overwrite=True)
+                            except Exception as err:
+                                print('backup_a_file() raised "{}" exception'.format(str(err)))  # DEBUGGING
                                 retVal = False
                                 break
-                        except Exception as err:
-                            print('ZksFile object raised "{}" exception'.format(str(err)))  # DEBUGGING
-                            retVal = False
-                            break
-                        else:
-                            # GET ITEM FROM OLD JSON FILE
+                            else:
+                                if retVal is False:
+                                    print("backup_a_file() failed to restore the {} file".format(typeFile))  # DEBUGGING
+                                    break
+                                else:
+                                    print("Successfully restored {} file".format(typeFile))
+                        elif "b" == selection:
                             try:
-                                copiedList = copy_save_game_from_list(archJsonFile, os.path.basename(restoreGameList[fileNum]))
+                                archZksFileObj = ZksFile(os.path.join(restoreGamePath, restoreGameList[fileNum]))
+                                if archZksFileObj.unarchive_file(saveGamePath) is not True:
+                                    print("ZksFile.unarchive_file() failed on the {} file".format(typeFile))  # DEBUGGING
+                                    retVal = False
+                                    break
+                                if archZksFileObj.close_zks() is not True:
+                                    print("ZksFile.close_zks() failed")  # DEBUGGING
+                                    retVal = False
+                                    break
                             except Exception as err:
-                                print("copy_save_game_from_list() failed to copy {} from {}".format(os.path.basename(restoreGameList[fileNum]), archJsonFile))  # DEBUGGING
-                                print(repr(err))
+                                print('ZksFile object raised "{}" exception'.format(str(err)))  # DEBUGGING
                                 retVal = False
                                 break
                             else:
-                                # print("Copied List:\t{}".format(copiedList))  # DEBUGGING
-                                pass
-
-                            # ADD TO NEW JSON FILE
-                            if isinstance(copiedList, list) and 0 < len(copiedList):
+                                # GET ITEM FROM OLD JSON FILE
                                 try:
-                                    add_save_game_to_list(gameJsonFile, copiedList)
+                                    copiedList = copy_save_game_from_list(archJsonFile, os.path.basename(restoreGameList[fileNum]))
                                 except Exception as err:
-                                    print("add_save_game_to_list() failed to add {} to {}".format(copiedList, os.path.basename(gameJsonFile)))  # DEBUGGING
+                                    print("copy_save_game_from_list() failed to copy {} from {}".format(os.path.basename(restoreGameList[fileNum]), archJsonFile))  # DEBUGGING
                                     print(repr(err))
                                     retVal = False
                                     break
+                                else:
+                                    # print("Copied List:\t{}".format(copiedList))  # DEBUGGING
+                                    pass
+
+                                # ADD TO NEW JSON FILE
+                                if isinstance(copiedList, list) and 0 < len(copiedList):
+                                    try:
+                                        add_save_game_to_list(gameJsonFile, copiedList)
+                                    except Exception as err:
+                                        print("add_save_game_to_list() failed to add {} to {}".format(copiedList, os.path.basename(gameJsonFile)))  # DEBUGGING
+                                        print(repr(err))
+                                        retVal = False
+                                        break
 
-                            print("Successfully restored {} file".format(typeFile))
+                                print("Successfully restored {} file".format(typeFile))
 
-        if userExit is True:
-            raise RuntimeError("Exit")
+            if userExit is True:
+                raise RuntimeError("Exit")
 
-        if userQuit is True:
-            raise RuntimeError("Quit")
+            if userQuit is True:
+                raise RuntimeError("Quit")
+    finally:
+        if ownCatalog is True:
+            saveCatalog.close_catalog()
 
     # DONE
     return retVal
@@ -942,13 +1165,17 @@ def backup_a_file(srcFile, dstDir, newFileExt, srcJson=None, dstJson=None, overw
             srcFile - Relative or absolute filename original file
             dstDir - Relative or absolute directory to copy the file into
             newFileExt - New file extension to replace the old file extension
-            srcJson - Source save game list json file to remove the entry from
-            dstJson - Destination save game list json file to add the entry to
+            srcJson - Source save game list json file, or SaveListIndex object, to copy the entry from
+            dstJson - Destination save game list json file, or SaveListIndex object, to add the entry to
             overwrite - Will delete destination file if it exists
         OUTPUT
             On success, True
             on failure, False
             on error, Exception
+        NOTES
+            A newFileExt of MANIFEST_EXT backs srcFile up into a BackupStore in dstDir, as a delta
+                if deltaBackups is True
+            A srcFile with a MANIFEST_EXT file extension is restored from its BackupStore
     '''
     # LOCAL VARIABLES
     retVal = False
@@ -957,6 +1184,8 @@ def backup_a_file(srcFile, dstDir, newFileExt, srcJson=None, dstJson=None, overw
     dstFilename = ""      # Construct the destination file name, complete with new file extension, here
     destinationJson = ""  # os.path.basename(dstJson) or backGameJson... whichever is not None first
     copiedList = []       # List of copied entries; Return value from copy_save_game_from_list()
+    backupStore = None    # BackupStore object for MANIFEST_EXT backups
+    baseManifest = None   # Manifest to store a delta backup against
     
     # INPUT VALIDATION
     if not isinstance(srcFile, str):
@@ -980,6 +1209,8 @@ def backup_a_file(srcFile, dstDir, newFileExt, srcJson=None, dstJson=None, overw
     else:
         if dstJson is None:
             destinationJson = backGameJson
+        elif isinstance(dstJson, SaveListIndex):
+            destinationJson = os.path.basename(dstJson.lPath)
         else:
             destinationJson = os.path.basename(dstJson)
     
@@ -997,7 +1228,15 @@ def backup_a_file(srcFile, dstDir, newFileExt, srcJson=None, dstJson=None, overw
         
     # COPY
     try:
-        retVal = copy_a_file(srcFile, os.path.join(dstDir, dstFilename), overwrite)
+        if MANIFEST_EXT == newFileExt:
+            backupStore = BackupStore(dstDir)
+            if deltaBackups is True:
+                baseManifest = backupStore.find_base(srcFile)
+            retVal = backupStore.store_backup(srcFile, os.path.join(dstDir, dstFilename), overwrite, baseManifest)
+        elif MANIFEST_EXT == curFileExt:
+            retVal = BackupStore(os.path.dirname(srcFile)).restore_backup(srcFile, os.path.join(dstDir, dstFilename), overwrite)
+        else:
+            retVal = copy_a_file(srcFile, os.path.join(dstDir, dstFilename), overwrite)
     except Exception as err:
         print("copy_a_file() raised an exception")  # DEBUGGING
         print(repr(err))  # DEBUGGING
@@ -1024,7 +1263,7 @@ def backup_a_file(srcFile, dstDir, newFileExt, srcJson=None, dstJson=None, overw
         try:
             add_save_game_to_list(dstJson, copiedList)
         except Exception as err:
-            print("add_save_game_to_list() failed to add {} to {}".format(copiedList, os.path.basename(dstJson)))  # DEBUGGING
+            print("add_save_game_to_list() failed to add {} to {}".format(copiedList, destinationJson))  # DEBUGGING
             print(repr(err))
             retVal = False
 
@@ -1032,7 +1271,8 @@ def backup_a_file(srcFile, dstDir, newFileExt, srcJson=None, dstJson=None, overw
     return retVal
 
 
-def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
+def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None, numWorkers=numArchiveWorkers,
+                   profile=archiveProfile):
     '''
         PURPOSE - Archive a file to a new destination directory while also modifying its file extension
             and deleting the original
@@ -1040,8 +1280,10 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
             saveGamePath - Relative or absolute path to check for save games
             srcFile - Relative or absolute filename original file
             dstDir - Relative or absolute directory to archive the file into
-            srcJson - Source save game list json file to remove the entry from
-            dstJson - Destination save game list json file to add the entry to
+            srcJson - Source save game list json file, or SaveListIndex object, to remove the entry from
+            dstJson - Destination save game list json file, or SaveListIndex object, to add the entry to
+            numWorkers - Number of processes used to compress the archive
+            profile - Compression profile used to compress the archive (see: baron_builder_compression)
         OUTPUT
             On success, True
             On failure, False
@@ -1049,6 +1291,8 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
         NOTES
             The orginal steam-saves-release.json will be backed up, changing .json to .bak.  Any
                 existing backed up copies will be overwritten.
+            If srcJson is a SaveListIndex object the caller is responsible for the backup and for
+                calling flush_list() (see: archive_files())
     '''
     # LOCAL VARIABLES
     retVal = True          # Set this to False if anything fails
@@ -1056,12 +1300,9 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
     splitFile = ()         # Split the srcFile here
     archiveZksFile = None  # ZksFile object to archive remove archived save game from
     saveGameJsonPath = os.path.join(saveGamePath, "..", saveGameJson)
-    workDir = os.path.join(saveGamePath, TOP_DIR, WORKING_DIR)
     backDir = os.path.join(saveGamePath, TOP_DIR, BACKUP_DIR)
     archDir = os.path.join(saveGamePath, TOP_DIR, ARCHIVE_DIR)
     archGameJsonPath = os.path.join(archDir, archGameJson)
-    thisWorkDir = None     # Store the source file's full working directory here
-    workDirExists = False  # Determine if the working directory existed before ZksFile.unpack_file()
     removedList = []       # List of removed entries; Return value from remove_save_game_from_list()
 
     # INPUT VALIDATION
@@ -1079,39 +1320,30 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
         raise OSError("Source file is not a file")
 
     # MANAGE BACKUP DIRECTORY
-    start_storage_dir(archDir, archGameJson)
+    if not isinstance(dstJson, SaveListIndex):
+        start_storage_dir(archDir, archGameJson)
 
     # ARCHIVE FILE
     try:
         # 1. OPEN SAVE GAME AS ZksFile object
         archiveZksFile = ZksFile(srcFile)
-        thisWorkDir = os.path.join(TOP_DIR, WORKING_DIR, archiveZksFile.zModDir)
-        # 2. DETERMINE WORKING DIRECTORY STATUS
-        if os.path.exists(thisWorkDir) is True:
-            if os.path.isdir(thisWorkDir) is True:
-                workDirExists = True
-            else:
-                raise OSError("Working directory is actually a file?!")
-        # 3. REPACK THE FILE
-        tempRetVal = archiveZksFile.unpack_file(os.path.join(saveGamePath, TOP_DIR, WORKING_DIR))
-        if tempRetVal:
-            tempRetVal = archiveZksFile.archive_file(dstDir)
-            if tempRetVal is False:
-                raise OSError("ZksFile object failed to archive the source file")
-            else:
-                archiveZksFile.close_zks()
+        # 2. REPACK THE FILE
+        tempRetVal = archiveZksFile.archive_file(dstDir, numWorkers, profile)
+        if tempRetVal is not True:
+            raise OSError("ZksFile object failed to archive the source file")
         else:
-            raise OSError("ZksFile object failed to unpack file being archived")
+            archiveZksFile.close_zks()
     except Exception as err:
         print(repr(err))  # DEBUGGING
         raise err
 
     try:
-        # 4. REMOVE FROM SAVE GAME LIST
+        # 3. REMOVE FROM SAVE GAME LIST
         # Backup save game file
-        tempRetVal = backup_a_file(saveGameJsonPath, backDir, MISC_BACKUP_EXT, overwrite=True)
-        if tempRetVal is False:
-            raise OSError("Failed to backup {}".format(saveGameJson))
+        if not isinstance(srcJson, SaveListIndex):
+            tempRetVal = backup_a_file(saveGameJsonPath, backDir, MISC_BACKUP_EXT, overwrite=True)
+            if tempRetVal is False:
+                raise OSError("Failed to backup {}".format(saveGameJson))
     except Exception as err:
         print(repr(err))  # DEBUGGING
         raise err
@@ -1121,7 +1353,7 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
         try:
             removedList = remove_save_game_from_list(srcJson, os.path.basename(srcFile))
         except Exception as err:
-            print("remove_save_game_from_list() failed to copy {} from {}".format(os.path.basename(srcFile), srcJson))  # DEBUGGING
+            print("remove_save_game_from_list() failed to remove {} from {}".format(os.path.basename(srcFile), srcJson))  # DEBUGGING
             print(repr(err))
             retVal = False
         else:
@@ -1133,7 +1365,7 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
         try:
             add_save_game_to_list(dstJson, removedList)
         except Exception as err:
-            print("add_save_game_to_list() failed to add {} to {}".format(removedList, os.path.basename(dstJson)))  # DEBUGGING
+            print("add_save_game_to_list() failed to add {} to {}".format(removedList, dstJson))  # DEBUGGING
             print(repr(err))
             retVal = False
 
@@ -1145,17 +1377,70 @@ def archive_a_file(saveGamePath, srcFile, dstDir, srcJson=None, dstJson=None):
         print(repr(err))  # DEBUGGING
         raise err
 
-    # 7. DELETE WORKING DIRECTORY?
-    if workDirExists:
-        try:
-            print("ABOUT TO EMPTY {}".format(thisWorkDir))  # DEBUGGING
-            # empty_a_dir(thisWorkDir)
-            print("ABOUT TO DELETE {}".format(thisWorkDir))  # DEBUGGING
-            # remove_a_dir(thisWorkDir)
-        except Exception as err:
-            print("Failed to remove original save game file:\t{}".format(srcFile))  # DEBUGGING
-            print(repr(err))  # DEBUGGING
-            raise err
+    # DONE
+    return retVal
+
+
+def archive_files(saveGamePath, srcFileList, dstDir, srcJson=None, dstJson=None, numWorkers=numArchiveWorkers,
+                  profile=archiveProfile):
+    '''
+        PURPOSE - Archive a list of files with archive_a_file() while only reading and writing each
+            save game list json file once
+        INPUT
+            saveGamePath - Relative or absolute path to check for save games
+            srcFileList - List of relative or absolute filenames to archive
+            dstDir - Relative or absolute directory to archive the files into
+            srcJson - Source save game list json file to remove the entries from
+            dstJson - Destination save game list json file to add the entries to
+            numWorkers - Number of processes used to compress the archives
+            profile - Compression profile used to compress the archives (see: baron_builder_compression)
+        OUTPUT
+            On success, True
+            On failure, False
+            On error, Exception
+        NOTES
+            The orginal steam-saves-release.json will be backed up once, before any changes
+            Both save game lists are flushed once, even if a file fails to archive, so the lists
+                still match the files that were archived
+    '''
+    # LOCAL VARIABLES
+    retVal = True          # Set this to False if anything fails
+    tempRetVal = False     # Check return values
+    saveGameJsonPath = os.path.join(saveGamePath, "..", saveGameJson)
+    backDir = os.path.join(saveGamePath, TOP_DIR, BACKUP_DIR)
+    archDir = os.path.join(saveGamePath, TOP_DIR, ARCHIVE_DIR)
+    srcListIndex = None    # SaveListIndex object for srcJson
+    dstListIndex = None    # SaveListIndex object for dstJson
+
+    # INPUT VALIDATION
+    if not isinstance(srcFileList, list):
+        raise TypeError('Source file list is of type "{}" instead of list'.format(type(srcFileList)))
+
+    # MANAGE BACKUP DIRECTORY
+    start_storage_dir(archDir, archGameJson)
+
+    # BACKUP SAVE GAME FILE
+    tempRetVal = backup_a_file(saveGameJsonPath, backDir, MISC_BACKUP_EXT, overwrite=True)
+    if tempRetVal is False:
+        raise OSError("Failed to backup {}".format(saveGameJson))
+
+    # ARCHIVE FILES
+    try:
+        if srcJson is not None:
+            srcListIndex = open_save_game_list(srcJson)
+        if dstJson is not None:
+            dstListIndex = open_save_game_list(dstJson)
+        for srcFile in srcFileList:
+            if archive_a_file(saveGamePath, srcFile, dstDir, srcListIndex, dstListIndex, numWorkers, profile) is False:
+                retVal = False
+    finally:
+        # SAVE CHANGES
+        for saveListIndex in [ srcListIndex, dstListIndex ]:
+            if saveListIndex is not None:
+                if saveListIndex.flush_list() is False:
+                    print("Failed to write {}".format(saveListIndex.lPath))  # DEBUGGING
+                    retVal = False
+                saveListIndex.close_list_index()
 
     # DONE
     return retVal
@@ -1165,31 +1450,22 @@ def add_save_game_to_list(absSaveGameList, newSaveGame):
     '''
         PURPOSE - Add one save game, or list of save games, to the stored list of save games
         INPUT
-            absSaveGameList - Relative or absolute path to the json file storing the list of save games
+            absSaveGameList - Relative or absolute path to the json file storing the list of save games,
+                or an open SaveListIndex object
             newSaveGame - OrderedDict, or list of OrderedDicts, of save game(s) to add to the list
         OUTPUT
             On failure or error, Exception
+        NOTES
+            Changes to a SaveListIndex object are not written until the caller calls flush_list()
     '''
     # LOCAL VARIABLES
     saveGameList = []                          # List of save games to add to existing list
-    newGameFilenameList = []                   # List of new filenames parse from saveGameList
-    existFilenameList = []                     # List of existing filenames parsed from absSaveGameList
-    sgjJsonFileObj = None                      # Store the JsonFile object here
-    mandatoryKeys = [ "Filename", "Version" ]  # Mandatory keys for each save game list entry
-    sgjJsonDict = OrderedDict()                # Store the sgjJsonFileObj.jDict["Files"] here to modify
-    asglVersion = 0                            # Version of the absSaveGameList
-    highVersion = 0                            # Highest version from the newSaveGames
+    saveListIndex = None                       # SaveListIndex object for absSaveGameList
 
     # INPUT VALIDATION
     # absSaveGameList
-    if not isinstance(absSaveGameList, str):
-        raise TypeError('Save game list name is of type "{}" instead of string'.format(type(absSaveGameList)))
-    elif 0 >= len(absSaveGameList):
-        raise ValueError("Invalid save game list name length")
-    elif os.path.exists(absSaveGameList) is False:
-        raise OSError("Save game list json file does not exist")
-    elif os.path.isfile(absSaveGameList) is False:
-        raise OSError("Save game list json file is not a file")
+    if not isinstance(absSaveGameList, SaveListIndex):
+        validate_save_game_list(absSaveGameList)
 
     # newSaveGame
     if isinstance(newSaveGame, OrderedDict):
@@ -1217,75 +1493,24 @@ def add_save_game_to_list(absSaveGameList, newSaveGame):
                             raise TypeError("Save game list contains an OrderedDict with a non-string filename")
                         elif 0 >= len(oDict[entry]):
                             raise ValueError("Save game list contains an OrderedDict with an empty filename")
-                        else:
-                            if oDict[entry] != os.path.basename(oDict[entry]):
-                                raise ValueError("Save game list contains an OrderedDict with a path/filename")
-                            else:
-                                newGameFilenameList.append(oDict[entry])
+                        elif oDict[entry] != os.path.basename(oDict[entry]):
+                            raise ValueError("Save game list contains an OrderedDict with a path/filename")
                     elif entry == "Version":
                         if not isinstance(oDict[entry], int):
                             raise TypeError("Save game list contains an OrderedDict with a non-int version")
-                        else:
-                            if oDict[entry] > highVersion:
-                                highVersion = oDict[entry]
                     else:
                         raise TypeError("Save game list contains an OrderedDict with an errant/unexpected key:\t{}".format(entry))
 
-    # PARSE JSON FILE
-    # Load json file
-    try:
-        sgjJsonFileObj = JsonFile(absSaveGameList)
-        if sgjJsonFileObj.jSuccess:
-            if sgjJsonFileObj.read_json_file() is False:
-                raise RuntimeError("Failed to read json file")
-            if sgjJsonFileObj.parse_json_contents() is False:
-                raise RuntimeError("Failed to parse json file contents")
-        else:
-            raise RuntimeError("Failed to instantiate JsonFile object")
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-
     # Add save games
     try:
-        # Get existing list of OrderedDicts
-        sgjJsonDict = sgjJsonFileObj.get_data("Files")
-        # Parse list of OrderedDicts into list of filenames
-        for entry in sgjJsonDict:
-            existFilenameList.append(entry["Filename"])
-        # Update existing entries
-        for index, entry in enumerate(sgjJsonDict):
-            if entry["Filename"] in newGameFilenameList:
-                for newEntry in saveGameList:
-                    if entry["Filename"] == newEntry["Filename"]:
-                        # print("Updating:\t{} with {}".format(entry, newEntry))  # DEBUGGING
-                        sgjJsonDict[index]["Version"] = newEntry["Version"]
-                        # print("Updated:\t{}".format(sgjJsonDict[index]))  # DEBUGGING
-                        break
-        # Add new entries
-        for entry in saveGameList:
-            if entry["Filename"] not in existFilenameList:
-                # print("Adding:\t{}".format(entry))  # DEBUGGING
-                sgjJsonDict.append(entry)
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-    else:
-        sgjJsonFileObj.mod_data("Files", sgjJsonDict)
-
-    # Update version
-    try:
-        asglVersion = sgjJsonFileObj.get_data("Version")
-        if highVersion > asglVersion:
-            sgjJsonFileObj.mod_data("Version", highVersion)
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-
-    # Save changes
-    try:
-        sgjJsonFileObj.write_json_file()
-        sgjJsonFileObj.close_json_file()
+        saveListIndex = open_save_game_list(absSaveGameList)
+        if saveListIndex.add_entries(saveGameList) is False:
+            raise RuntimeError("Failed to add save games to the list")
+        # Save changes
+        if saveListIndex is not absSaveGameList:
+            if saveListIndex.flush_list() is False:
+                raise RuntimeError("Failed to write the save game list")
+            saveListIndex.close_list_index()
     except Exception as err:
         print(repr(err))  # DEBUGGING
         raise err
@@ -1297,7 +1522,8 @@ def copy_save_game_from_list(absSaveGameList, saveGameName):
     '''
         PURPOSE - Copy details about one save game (or a list) from the stored list of save games
         INPUT
-            absSaveGameList - Relative or absolute path to the json file storing the list of save games
+            absSaveGameList - Relative or absolute path to the json file storing the list of save games,
+                or an open SaveListIndex object
             saveGameName - Name, or list of names, of save game(s) to remove from the list
         OUTPUT
             On success, return the list of entries removed
@@ -1306,70 +1532,24 @@ def copy_save_game_from_list(absSaveGameList, saveGameName):
     # LOCAL VARIABLES
     retVal = []            # List of entries removed
     saveGameList = []      # List of save games to remove from
-    sgjJsonFileObj = None  # Store the JsonFile object here
-    sgjJsonFiles = None    # sgjJsonFileObj.jDict["Files"]
+    saveListIndex = None   # SaveListIndex object for absSaveGameList
 
     # INPUT VALIDATION
     # absSaveGameList
-    if not isinstance(absSaveGameList, str):
-        raise TypeError('Save game list name is of type "{}" instead of string'.format(type(absSaveGameList)))
-    elif 0 >= len(absSaveGameList):
-        raise ValueError("Invalid save game list name length")
-    elif os.path.exists(absSaveGameList) is False:
-        raise OSError("Save game list json file does not exist")
-    elif os.path.isfile(absSaveGameList) is False:
-        raise OSError("Save game list json file is not a file")
+    if not isinstance(absSaveGameList, SaveListIndex):
+        validate_save_game_list(absSaveGameList)
 
     # saveGameName
-    if isinstance(saveGameName, str):
-        saveGameList.append(saveGameName)
-    elif isinstance(saveGameName, list):
-        saveGameList = saveGameName
-    else:
-        raise TypeError('Save game name is of type "{}" instead of string or list'.format(type(saveGameName)))
-
-    # saveGameName entries
-    for filename in saveGameList:
-        if not isinstance(filename, str):
-            raise TypeError("Save game list contains non-string")
-        elif 0 >= len(filename):
-            raise ValueError("Save game list contains empty string")
-        elif filename != os.path.basename(filename):
-            raise ValueError("Detected a save game list entry that contains a path")
-
-    # PARSE JSON FILE
-    # Load json file
-    try:
-        sgjJsonFileObj = JsonFile(absSaveGameList)
-        if sgjJsonFileObj.jSuccess:
-            if sgjJsonFileObj.read_json_file() is False:
-                raise RuntimeError("Failed to read json file")
-            if sgjJsonFileObj.parse_json_contents() is False:
-                raise RuntimeError("Failed to parse json file contents")
-        else:
-            raise RuntimeError("Failed to instantiate JsonFile object")
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
+    saveGameList = validate_save_game_names(saveGameName)
 
     # Copy save games
-    # print("saveGameList:\t{}".format(saveGameList))  # DEBUGGING
     try:
-        sgjJsonFiles = sgjJsonFileObj.get_data("Files")
-        # sgjJsonFiles = deepcopy(sgjJsonFileObj.get_data("Files"))
-        for entry in sgjJsonFiles:
-            # print(entry["Filename"])  # DEBUGGING
-            # if entry["Filename"] in saveGameList:
-            if check_filename_no_ext(entry["Filename"], saveGameList) is True:
-                # print("Copying:\t{}".format(entry))  # DEBUGGING
-                retVal.append(entry)
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-
-    # Close JsonFile object
-    try:
-        sgjJsonFileObj.close_json_file()
+        saveListIndex = open_save_game_list(absSaveGameList)
+        retVal = saveListIndex.copy_entries(saveGameList)
+        if retVal is None:
+            raise RuntimeError("Failed to copy save games from the list")
+        if saveListIndex is not absSaveGameList:
+            saveListIndex.close_list_index()
     except Exception as err:
         print(repr(err))  # DEBUGGING
         raise err
@@ -1382,20 +1562,87 @@ def remove_save_game_from_list(absSaveGameList, saveGameName):
     '''
         PURPOSE - Remove one save game from the stored list of save games
         INPUT
-            absSaveGameList - Relative or absolute path to the json file storing the list of save games
+            absSaveGameList - Relative or absolute path to the json file storing the list of save games,
+                or an open SaveListIndex object
             saveGameName - Name, or list of names, of save game(s) to remove from the list
         OUTPUT
             On success, return the list of entries removed
             On failure or error, Exception
+        NOTES
+            Changes to a SaveListIndex object are not written until the caller calls flush_list()
     '''
     # LOCAL VARIABLES
     retVal = []            # List of entries removed
     saveGameList = []      # List of save games to remove from
-    sgjJsonFileObj = None  # Store the JsonFile object here
-    sgjJsonFiles = None    # sgjJsonFileObj.jDict["Files"]
+    saveListIndex = None   # SaveListIndex object for absSaveGameList
 
     # INPUT VALIDATION
     # absSaveGameList
+    if not isinstance(absSaveGameList, SaveListIndex):
+        validate_save_game_list(absSaveGameList)
+
+    # saveGameName
+    saveGameList = validate_save_game_names(saveGameName)
+
+    # Remove save games
+    try:
+        saveListIndex = open_save_game_list(absSaveGameList)
+        retVal = saveListIndex.remove_entries(saveGameList)
+        if retVal is None:
+            raise RuntimeError("Failed to remove save games from the list")
+        # Save changes
+        if saveListIndex is not absSaveGameList:
+            if saveListIndex.flush_list() is False:
+                raise RuntimeError("Failed to write the save game list")
+            saveListIndex.close_list_index()
+    except Exception as err:
+        print(repr(err))  # DEBUGGING
+        raise err
+
+    # DONE
+    return retVal
+
+
+def open_save_game_list(absSaveGameList):
+    '''
+        PURPOSE - Load a stored list of save games into a SaveListIndex object
+        INPUT
+            absSaveGameList - Relative or absolute path to the json file storing the list of save games,
+                or an open SaveListIndex object
+        OUTPUT
+            On success, SaveListIndex object
+            On failure or error, Exception
+        NOTES
+            An open SaveListIndex object is returned as-is
+            The caller is responsible for calling flush_list() and close_list_index() on new objects
+    '''
+    # LOCAL VARIABLES
+    retVal = None
+
+    # INPUT VALIDATION
+    if isinstance(absSaveGameList, SaveListIndex):
+        retVal = absSaveGameList
+    else:
+        validate_save_game_list(absSaveGameList)
+        retVal = SaveListIndex(absSaveGameList)
+        if retVal.lSuccess is False:
+            raise RuntimeError("Failed to instantiate SaveListIndex object")
+        elif retVal.load_list() is False:
+            raise RuntimeError("Failed to parse json file contents")
+
+    # DONE
+    return retVal
+
+
+def validate_save_game_list(absSaveGameList):
+    '''
+        PURPOSE - Validate the filename of a stored list of save games
+        INPUT
+            absSaveGameList - Relative or absolute path to the json file storing the list of save games
+        OUTPUT
+            On failure or error, Exception
+    '''
+    # INPUT VALIDATION
     if not isinstance(absSaveGameList, str):
         raise TypeError('Save game list name is of type "{}" instead of string'.format(type(absSaveGameList)))
     elif 0 >= len(absSaveGameList):
@@ -1405,16 +1652,32 @@ def remove_save_game_from_list(absSaveGameList, saveGameName):
     elif os.path.isfile(absSaveGameList) is False:
         raise OSError("Save game list json file is not a file")
 
-    # saveGameName
+    # DONE
+    return
+
+
+def validate_save_game_names(saveGameName):
+    '''
+        PURPOSE - Validate the name, or list of names, of save games to look up in a stored list of save games
+        INPUT
+            saveGameName - Name, or list of names, of save game(s)
+        OUTPUT
+            On success, list of names
+            On failure or error, Exception
+    '''
+    # LOCAL VARIABLES
+    retVal = []  # List of save game names
+
+    # INPUT VALIDATION
     if isinstance(saveGameName, str):
-        saveGameList.append(saveGameName)
+        retVal.append(saveGameName)
     elif isinstance(saveGameName, list):
-        saveGameList = saveGameName
+        retVal = saveGameName
     else:
         raise TypeError('Save game name is of type "{}" instead of string or list'.format(type(saveGameName)))
 
     # saveGameName entries
-    for filename in saveGameList:
+    for filename in retVal:
         if not isinstance(filename, str):
             raise TypeError("Save game list contains non-string")
         elif 0 >= len(filename):
@@ -1422,46 +1685,6 @@ def remove_save_game_from_list(absSaveGameList, saveGameName):
         elif filename != os.path.basename(filename):
             raise ValueError("Detected a save game list entry that contains a path")
 
-    # PARSE JSON FILE
-    # Load json file
-    try:
-        sgjJsonFileObj = JsonFile(absSaveGameList)
-        if sgjJsonFileObj.jSuccess:
-            if sgjJsonFileObj.read_json_file() is False:
-                raise RuntimeError("Failed to read json file")
-            if sgjJsonFileObj.parse_json_contents() is False:
-                raise RuntimeError("Failed to parse json file contents")
-        else:
-            raise RuntimeError("Failed to instantiate JsonFile object")
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-
-    # Remove save games
-    try:
-        sgjJsonFiles = sgjJsonFileObj.get_data("Files")
-        # for entry in sgjJsonFileObj.jDict["Files"]:
-        for entry in sgjJsonFiles:
-            if entry["Filename"] in saveGameList:
-                # print("Removing:\t{}".format(entry))  # DEBUGGING
-                # sgjJsonFileObj.jDict["Files"].remove(entry)
-                retVal.append(entry)
-                sgjJsonFiles.remove(entry)
-                # retVal.append(sgjJsonFiles.remove(entry))
-                # print("remove_save_game_from_list() retVal is currently:\t{}".format(retVal))  # DEBUGGING
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-
-    # Save changes
-    try:
-        sgjJsonFileObj.mod_data("Files", sgjJsonFiles)
-        sgjJsonFileObj.write_json_file()
-        sgjJsonFileObj.close_json_file()
-    except Exception as err:
-        print(repr(err))  # DEBUGGING
-        raise err
-
     # DONE
     return retVal
 
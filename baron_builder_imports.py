@@ -20,6 +20,8 @@ OS_UNKNOWS = 0  # Unknows OS
 OS_LINUX = 1    # All *nix
 OS_WINDOWS = 2  # All Windows
 OS_APPLE = 3    # All OS/?
+# BACKUPS
+KEYFRAME_INTERVAL = 10     # Store every Nth backup in a delta chain in full (see: BackupStore)
 # USER TOLERANCE
 MAX_ERRS = 3    # Maximum number of bad user answers tolerated before giving up
 # DIRECTORY NAMES
@@ -27,11 +29,14 @@ TOP_DIR = "Baron_Builder"  # Store everything in there
 ARCHIVE_DIR = "Archive"    # Move archived save files here
 BACKUP_DIR = "Backup"      # Backup save files here
 WORKING_DIR = "Working"    # Use this directory to unarchive and modify save games
+STORE_DIR = "Store"        # Backup directory subdirectory storing each unique backed up file once
+CACHE_DIR = "Cache"        # Store parsed json files here to speed up reopening save games (see: ParseCache)
 # FILE EXTENSIONS
 SAVE_GAME_EXT = ".zks"     # Pathfinder Kingmaker save game file extension
 BACKUP_EXT = ".bbb"        # Backed up save game file extension
 ARCHIVE_EXT = ".bba"       # Archived save game file extension
 MISC_BACKUP_EXT = ".bak"   # File extension for non-save games being backed up
+MANIFEST_EXT = ".bbm"      # Backed up save game manifest file extension (see: BackupStore)
 
 
 #################################################
@@ -57,3 +62,14 @@ saveGameJson = "steam-saves-release.json"
 backGameJson = "baron-builder-backup.json"
 # File name of the baron_builder archive json file storing filenames and version of archived save games
 archGameJson = "baron-builder-archive.json"
+# File name of the baron_builder catalog database indexing every save game, backup, and archive
+catalogDb = "baron-builder-catalog.db"
+# Store backups as deltas against the most recent backup of the same character (see: BackupStore)
+deltaBackups = True
+# Largest total size, in bytes, of the parsed json files kept in CACHE_DIR (see: ParseCache)
+parseCacheBytes = 64 * 1024 * 1024
+# Number of processes used to compress save games being archived
+numArchiveWorkers = os.cpu_count() or 1
+# Compression profile used to archive save games (e.g., "fast", "balanced", "max", "auto")
+# None compresses every file with ZIP_LZMA (see: baron_builder_compression)
+archiveProfile = None
@@ -0,0 +1,457 @@
+from collections import OrderedDict
+from functools import partial
+from json_file_class import JsonFile
+import json
+import zipfile
+
+
+class JsonDiff():
+    '''
+        PURPOSE - List what changed between two parsed json files, path by path
+        USAGE
+            1. jsonDiff = JsonDiff()
+            2. recordList = jsonDiff.diff_values(oldJsonDict, newJsonDict)
+            3. print(jsonDiff.report_text(recordList))
+            4. jsonDiff.close_json_diff()
+        NOTES
+            [X] jsonDiff = JsonDiff(alignKeys)              # Instantiates a JsonDiff object
+            [X] jsonDiff.diff_values(oldValue, newValue)    # Lists the changes between two json values
+            [X] jsonDiff.diff_json_files(oldFile, newFile)  # Lists the changes between two JsonFile objects
+            [X] jsonDiff.diff_saves(oldPath, newPath)       # Lists the changes between two save games
+            [X] jsonDiff.align_elements(oldList, newList)   # Pairs up array elements by self.dAlignKeys
+            [X] jsonDiff.element_key(element)               # Alignment key of an array element
+            [X] jsonDiff.format_path(path)                  # Translates a path into text
+            [X] jsonDiff.report_json(recordList)            # Translates records into json
+            [X] jsonDiff.report_text(recordList)            # Translates records into one line per change
+            [X] jsonDiff.close_json_diff()                  # Zeroizes all data
+            RECORDS
+                Each change is an OrderedDict of { "path" : path, "change" : "added", "removed", or
+                    "changed", "old" : old value, "new" : new value } in document order
+                "old" is missing from added records and "new" is missing from removed records
+                Records hold references to the compared values, not copies
+            PATHS
+                A path is a tuple of keys, array indices, and (align key, value) tuples
+                Array elements holding one of self.dAlignKeys (e.g., m_EntityData entities) are paired up
+                    by that key, so an inserted entity doesn't change every entity after it.  The rest
+                    are paired up by position.
+            SPEED
+                Equal subtrees are skipped with a single == so only the changed branches are walked
+                Nothing is copied or hashed, so memory is bounded by the number of changes
+                == treats 1, 1.0, and true alike below the top of a skipped subtree
+    '''
+    # CLASS ATTRIBUTES
+    defaultAlignKeys = ("UniqueId", "$id")              # Array elements are paired up by the first key found
+    saveJsonList = [ "header.json", "player.json", "party.json" ]  # Json files compared by diff_saves()
+    textValueWidth = 60                                 # Longest value printed by report_text()
+    textEncoder = json.JSONEncoder(separators=(",", ":"))  # Compact json for report_text()
+
+
+    def __init__(self, alignKeys=None):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                alignKeys - Optional tuple of keys to pair up array elements by (see: PATHS)
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_json_diff()
+        '''
+        # CLASS ATTRIBUTES
+        self.dAlignKeys = self.defaultAlignKeys  # Array elements are paired up by the first key found
+
+        # INPUT VALIDATION
+        if isinstance(alignKeys, (tuple, list)):
+            self.dAlignKeys = tuple(alignKeys)
+
+
+    def diff_values(self, oldValue, newValue, path=()):
+        '''
+            PURPOSE - List the changes between two json values
+            INPUT
+                oldValue - Older json value
+                newValue - Newer json value
+                path - Optional path to prefix every record's path with
+            OUTPUT
+                List of records (see: RECORDS)
+            NOTES
+                Iterative so deeply nested saves can't exhaust the recursion limit
+        '''
+        # LOCAL VARIABLES
+        retVal = []
+        stackList = [ (path, oldValue, newValue, None) ]  # (path, old, new, change) left, last in first out
+        pendingList = []     # Children of the current values, in document order
+        entry = None         # Current (path, old, new, change)
+        oldEntry = None      # Current old value
+        newEntry = None      # Current new value
+        change = None        # Current change, or None to compare old and new
+
+        # COMPARE
+        while stackList:
+            entry = stackList.pop()
+            path, oldEntry, newEntry, change = entry
+            if change is not None:
+                retVal.append(self.make_record(path, change, oldEntry, newEntry))
+                continue
+            if type(oldEntry) is type(newEntry) and oldEntry == newEntry:
+                continue
+            pendingList = []
+            if isinstance(oldEntry, dict) and isinstance(newEntry, dict):
+                for key, child in oldEntry.items():
+                    if key in newEntry:
+                        pendingList.append((path + (key,), child, newEntry[key], None))
+                    else:
+                        pendingList.append((path + (key,), child, None, "removed"))
+                for key, child in newEntry.items():
+                    if key not in oldEntry:
+                        pendingList.append((path + (key,), None, child, "added"))
+            elif isinstance(oldEntry, list) and isinstance(newEntry, list):
+                for step, oldIndex, newIndex in self.align_elements(oldEntry, newEntry):
+                    if newIndex is None:
+                        pendingList.append((path + (step,), oldEntry[oldIndex], None, "removed"))
+                    elif oldIndex is None:
+                        pendingList.append((path + (step,), None, newEntry[newIndex], "added"))
+                    else:
+                        pendingList.append((path + (step,), oldEntry[oldIndex], newEntry[newIndex], None))
+            else:
+                retVal.append(self.make_record(path, "changed", oldEntry, newEntry))
+            stackList.extend(reversed(pendingList))
+
+        # DONE
+        return retVal
+
+
+    def make_record(self, path, change, oldValue, newValue):
+        '''
+            PURPOSE - Build one change record
+            INPUT
+                path - Path of the change
+                change - "added", "removed", or "changed"
+                oldValue - Older json value (ignored if change is "added")
+                newValue - Newer json value (ignored if change is "removed")
+            OUTPUT
+                Record (see: RECORDS)
+        '''
+        # LOCAL VARIABLES
+        retVal = OrderedDict([ ("path", path), ("change", change) ])
+
+        # BUILD
+        if "added" != change:
+            retVal["old"] = oldValue
+        if "removed" != change:
+            retVal["new"] = newValue
+
+        # DONE
+        return retVal
+
+
+    def element_key(self, element):
+        '''
+            PURPOSE - Find the key to pair up an array element by
+            INPUT
+                element - Json array element
+            OUTPUT
+                On success, (align key, value) tuple
+                If the element has none of self.dAlignKeys, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if isinstance(element, dict):
+            for alignKey in self.dAlignKeys:
+                if isinstance(element.get(alignKey), (str, int)) and not isinstance(element.get(alignKey), bool):
+                    retVal = (alignKey, element[alignKey])
+                    break
+
+        # DONE
+        return retVal
+
+
+    def align_elements(self, oldList, newList):
+        '''
+            PURPOSE - Pair up the elements of two json arrays
+            INPUT
+                oldList - Older json array
+                newList - Newer json array
+            OUTPUT
+                List of (path step, old index or None, new index or None) in document order
+            NOTES
+                Elements with a unique alignment key (see: element_key()) are paired by key and their
+                    path step is the key.  The rest are paired by position and their path step is their
+                    index (the old index if they were removed).
+        '''
+        # LOCAL VARIABLES
+        retVal = []
+        oldKeyList = [ self.element_key(element) for element in oldList ]  # Alignment key of each old element
+        newKeyList = [ self.element_key(element) for element in newList ]  # Alignment key of each new element
+        countDict = {}     # { alignment key : number of elements in either array holding it }
+        dupSet = set()     # Alignment keys held by more than one element of an array
+        oldKeyDict = {}    # { unique alignment key : old index }
+        newKeyDict = {}    # { unique alignment key : new index }
+        oldPosList = []    # Old indices paired by position
+        newPosList = []    # New indices paired by position
+
+        # INPUT VALIDATION
+        if not any(oldKeyList) and not any(newKeyList):
+            # PAIR BY POSITION
+            retVal = [ (index, index, index) for index in range(min(len(oldList), len(newList))) ]
+            retVal.extend([ (index, index, None) for index in range(len(newList), len(oldList)) ])
+            retVal.extend([ (index, None, index) for index in range(len(oldList), len(newList)) ])
+        else:
+            # FIND THE UNIQUE KEYS
+            for keyList in (oldKeyList, newKeyList):
+                countDict = {}
+                for key in keyList:
+                    if key is not None:
+                        countDict[key] = countDict.get(key, 0) + 1
+                dupSet.update([ key for key, count in countDict.items() if 1 < count ])
+            oldKeyDict = { key : index for index, key in enumerate(oldKeyList) if key is not None and key not in dupSet }
+            newKeyDict = { key : index for index, key in enumerate(newKeyList) if key is not None and key not in dupSet }
+
+            # PAIR BY KEY
+            for index, key in enumerate(oldKeyList):
+                if key in oldKeyDict:
+                    retVal.append((key, index, newKeyDict.get(key)))
+                else:
+                    oldPosList.append(index)
+            for index, key in enumerate(newKeyList):
+                if key in newKeyDict:
+                    if key not in oldKeyDict:
+                        retVal.append((key, None, index))
+                else:
+                    newPosList.append(index)
+
+            # PAIR THE REST BY POSITION
+            for oldIndex, newIndex in zip(oldPosList, newPosList):
+                retVal.append((newIndex, oldIndex, newIndex))
+            retVal.extend([ (oldIndex, oldIndex, None) for oldIndex in oldPosList[len(newPosList):] ])
+            retVal.extend([ (newIndex, None, newIndex) for newIndex in newPosList[len(oldPosList):] ])
+
+        # DONE
+        return retVal
+
+
+    def diff_json_files(self, oldJsonFile, newJsonFile):
+        '''
+            PURPOSE - List the changes between two JsonFile objects
+            INPUT
+                oldJsonFile - Older JsonFile object
+                newJsonFile - Newer JsonFile object
+            OUTPUT
+                On success, list of records (see: RECORDS)
+                On failure, None
+            NOTES
+                Both JsonFile objects are parsed if they haven't been parsed yet
+                Values are read in place, so JsonInternPool values stay shared (see: JsonFile.view_data())
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if isinstance(oldJsonFile, JsonFile) and isinstance(newJsonFile, JsonFile):
+            if oldJsonFile.jDict is None:
+                oldJsonFile.parse_json_contents()
+            if newJsonFile.jDict is None:
+                newJsonFile.parse_json_contents()
+            if oldJsonFile.jSuccess and newJsonFile.jSuccess \
+               and oldJsonFile.jDict is not None and newJsonFile.jDict is not None:
+                retVal = self.diff_values(oldJsonFile.jDict, newJsonFile.jDict)
+
+        # DONE
+        return retVal
+
+
+    def diff_saves(self, oldPath, newPath):
+        '''
+            PURPOSE - List the changes between two save games
+            INPUT
+                oldPath - Filename of the older save game
+                newPath - Filename of the newer save game
+            OUTPUT
+                On success, OrderedDict of { json filename : list of records } for each of
+                    self.saveJsonList found in either save game
+                On failure, None
+            NOTES
+                A json file missing from one save game is a single "added" or "removed" record
+                    with an empty path
+                Json files with the same CRC32 and size aren't decompressed (see: ZksFile.compare_zks())
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        oldJsonFile = None  # JsonFile of the older json file
+        newJsonFile = None  # JsonFile of the newer json file
+        jsonFileObj = None  # JsonFile to close
+        recordList = None   # Return value from diff_json_files()
+
+        # READ THE SAVE GAMES
+        try:
+            with zipfile.ZipFile(oldPath, "r") as oldZipFile, zipfile.ZipFile(newPath, "r") as newZipFile:
+                retVal = OrderedDict()
+                for jsonName in self.saveJsonList:
+                    oldJsonFile = None
+                    newJsonFile = None
+                    if jsonName in oldZipFile.namelist():
+                        oldJsonFile = JsonFile(jsonName, partial(oldZipFile.read, jsonName))
+                    if jsonName in newZipFile.namelist():
+                        newJsonFile = JsonFile(jsonName, partial(newZipFile.read, jsonName))
+
+                    # COMPARE
+                    if oldJsonFile is not None and newJsonFile is not None \
+                       and (oldZipFile.getinfo(jsonName).CRC, oldZipFile.getinfo(jsonName).file_size) \
+                       == (newZipFile.getinfo(jsonName).CRC, newZipFile.getinfo(jsonName).file_size):
+                        retVal[jsonName] = []  # Identical contents
+                    elif oldJsonFile is not None and newJsonFile is not None:
+                        recordList = self.diff_json_files(oldJsonFile, newJsonFile)
+                        if recordList is None:
+                            raise ValueError("Unable to parse {}".format(jsonName))
+                        retVal[jsonName] = recordList
+                    elif oldJsonFile is not None and oldJsonFile.parse_json_contents() is True:
+                        retVal[jsonName] = [ self.make_record((), "removed", oldJsonFile.jDict, None) ]
+                    elif newJsonFile is not None and newJsonFile.parse_json_contents() is True:
+                        retVal[jsonName] = [ self.make_record((), "added", None, newJsonFile.jDict) ]
+                    for jsonFileObj in (oldJsonFile, newJsonFile):
+                        if jsonFileObj is not None:
+                            jsonFileObj.close_json_file()
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = None
+
+        # DONE
+        return retVal
+
+
+    def format_path(self, path):
+        '''
+            PURPOSE - Translate a path into text
+            INPUT
+                path - Tuple of keys, array indices, and (align key, value) tuples
+            OUTPUT
+                String formatted as Kingdom.BP or m_EntityData[UniqueId=159c...].m_GroupId
+        '''
+        # LOCAL VARIABLES
+        retVal = ""
+
+        # TRANSLATE
+        for step in path:
+            if isinstance(step, tuple):
+                retVal = retVal + "[{}={}]".format(step[0], step[1])
+            elif isinstance(step, int):
+                retVal = retVal + "[{}]".format(step)
+            elif 0 == len(retVal):
+                retVal = step
+            else:
+                retVal = retVal + "." + step
+
+        # DONE
+        return retVal if retVal else "."
+
+
+    def report_json(self, recordList):
+        '''
+            PURPOSE - Translate records into json
+            INPUT
+                recordList - List of records (see: RECORDS), or an OrderedDict of { name : list of records }
+            OUTPUT
+                On success, json string
+                On failure, None
+            NOTES
+                Paths become arrays and (align key, value) steps become [ align key, value ]
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # TRANSLATE
+        try:
+            retVal = json.dumps(recordList, indent=2)
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = None
+
+        # DONE
+        return retVal
+
+
+    def report_text(self, recordList):
+        '''
+            PURPOSE - Translate records into one line per change
+            INPUT
+                recordList - List of records (see: RECORDS), or an OrderedDict of { name : list of records }
+            OUTPUT
+                String formatted as "CHANGED  Kingdom.BP:  1204 -> 777" lines
+            NOTES
+                Values longer than self.textValueWidth are truncated
+        '''
+        # LOCAL VARIABLES
+        retVal = ""
+        lineList = []  # Lines of text
+
+        # TRANSLATE
+        if isinstance(recordList, dict):
+            for name, nameRecordList in recordList.items():
+                lineList.append("{}:".format(name))
+                lineList.extend([ "    " + line for line in self.report_text(nameRecordList).splitlines() ])
+        else:
+            for record in recordList:
+                if "added" == record["change"]:
+                    lineList.append("ADDED    {}:  {}".format(self.format_path(record["path"]),
+                                                              self.format_value(record["new"])))
+                elif "removed" == record["change"]:
+                    lineList.append("REMOVED  {}:  {}".format(self.format_path(record["path"]),
+                                                              self.format_value(record["old"])))
+                else:
+                    lineList.append("CHANGED  {}:  {} -> {}".format(self.format_path(record["path"]),
+                                                                    self.format_value(record["old"]),
+                                                                    self.format_value(record["new"])))
+        retVal = "\n".join(lineList)
+
+        # DONE
+        return retVal
+
+
+    def format_value(self, value):
+        '''
+            PURPOSE - Translate a json value into text for report_text()
+            INPUT
+                value - Json value
+            OUTPUT
+                Compact json, truncated to self.textValueWidth characters
+            NOTES
+                Only the beginning of large values is serialized
+        '''
+        # LOCAL VARIABLES
+        retVal = ""
+        chunkList = []  # Pieces of compact json
+
+        # TRANSLATE
+        for chunk in self.textEncoder.iterencode(value):
+            chunkList.append(chunk)
+            if sum([ len(piece) for piece in chunkList ]) > self.textValueWidth:
+                break  # Don't serialize the rest of an entity
+        retVal = "".join(chunkList)
+        if len(retVal) > self.textValueWidth:
+            retVal = retVal[:self.textValueWidth - 3] + "..."
+
+        # DONE
+        return retVal
+
+
+    def close_json_diff(self):
+        '''
+            PURPOSE - Clear out all class attributes
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        try:
+            self.dAlignKeys = self.defaultAlignKeys
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = False
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
@@ -0,0 +1,100 @@
+from collections import OrderedDict
+from json_diff_class import JsonDiff
+import copy
+import json
+import os
+import tempfile
+import unittest
+import zipfile
+
+
+class Json_Diff_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        with open(os.path.join("Test_Files", "Linux", "party.json"), "rb") as inFile:
+            self.rawParty = inFile.read()
+        self.oldDict = json.loads(self.rawParty.decode("utf-8-sig"), object_pairs_hook=OrderedDict)
+        self.newDict = copy.deepcopy(self.oldDict)
+        self.test = JsonDiff()
+
+
+    def tearDown(self):
+        self.test.close_json_diff()
+        self.tempDir.cleanup()
+
+
+    def make_save(self, filename, rawParty):
+        absFilename = os.path.join(self.tempDir.name, filename)
+        with zipfile.ZipFile(absFilename, "w", zipfile.ZIP_DEFLATED) as outZipFile:
+            outZipFile.write(os.path.join("Test_Files", "Linux", "header.json"), "header.json")
+            outZipFile.writestr("party.json", rawParty)
+        return absFilename
+
+
+class Json_Diff_Class_Test_Normal(Json_Diff_Class_Tests):
+
+
+    def test_Normal_01_Identical(self):
+        self.assertEqual(self.test.diff_values(self.oldDict, self.newDict), [])
+
+
+    def test_Normal_02_Align_Entities(self):
+        entityList = self.newDict["m_EntityData"]
+        entityKey = ("UniqueId", entityList[0]["UniqueId"])
+        entityList[0]["m_GroupId"] = "Edited"
+        entityList.insert(0, OrderedDict([ ("UniqueId", "New"), ("Gold", 1) ]))
+        recordList = self.test.diff_values(self.oldDict, self.newDict)
+        self.assertEqual([ (record["path"], record["change"]) for record in recordList ],
+                         [ (("m_EntityData", entityKey, "m_GroupId"), "changed"),
+                           (("m_EntityData", ("UniqueId", "New")), "added") ])
+        self.assertEqual(recordList[0]["new"], "Edited")
+        self.assertNotIn("old", recordList[1])
+
+
+    def test_Normal_03_Reports(self):
+        self.newDict["m_EntityData"].pop()
+        self.newDict["Edited"] = [ 1, 2 ]
+        recordList = self.test.diff_values(self.oldDict, self.newDict)
+        self.assertEqual(json.loads(self.test.report_json(recordList))[1],
+                         { "path" : [ "Edited" ], "change" : "added", "new" : [ 1, 2 ] })
+        lineList = self.test.report_text(recordList).splitlines()
+        self.assertTrue(lineList[0].startswith("REMOVED  m_EntityData[UniqueId="))
+        self.assertLessEqual(len(lineList[0]), 200)
+        self.assertEqual(lineList[1], "ADDED    Edited:  [1,2]")
+
+
+    def test_Normal_04_Diff_Saves(self):
+        oldPath = self.make_save("Manual_1.zks", self.rawParty)
+        newPath = self.make_save("Manual_2.zks", self.rawParty.replace(b'"m_GroupId":', b'"m_GroupId":"Edited","Old":', 1))
+        recordDict = self.test.diff_saves(oldPath, newPath)
+        self.assertEqual(list(recordDict.keys()), [ "header.json", "party.json" ])
+        self.assertEqual(recordDict["header.json"], [])
+        self.assertEqual([ record["change"] for record in recordDict["party.json"] ], [ "changed", "added" ])
+        self.assertTrue(self.test.report_text(recordDict).startswith("header.json:\nparty.json:\n    CHANGED  "))
+
+
+class Json_Diff_Class_Test_Error(Json_Diff_Class_Tests):
+
+
+    def test_Error_01_Type_Changes(self):
+        recordList = self.test.diff_values({ "a" : 1, "b" : [], "c" : None }, { "a" : True, "b" : {}, "c" : 0 })
+        self.assertEqual([ record["path"] for record in recordList ], [ ("a",), ("b",), ("c",) ])
+
+
+    def test_Error_02_Duplicate_Keys(self):
+        oldList = [ { "$id" : "1", "v" : 1 }, { "$id" : "1", "v" : 2 }, { "v" : 3 } ]
+        newList = [ { "$id" : "1", "v" : 1 }, { "$id" : "1", "v" : 4 } ]
+        self.assertEqual([ (record["path"], record["change"]) for record in self.test.diff_values(oldList, newList) ],
+                         [ ((1, "v"), "changed"), ((2,), "removed") ])
+
+
+    def test_Error_03_Bad_Saves(self):
+        self.assertIsNone(self.test.diff_saves(os.path.join(self.tempDir.name, "missing.zks"),
+                                               os.path.join(self.tempDir.name, "missing.zks")))
+        self.assertIsNone(self.test.diff_json_files(None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,502 @@
+from json.decoder import scanstring
+import codecs
+import json
+import re
+
+
+class JsonEventReader():
+    '''
+        PURPOSE - Read a json file as a stream of events without parsing it into a dictionary
+        USAGE
+            USE CASE #1 - Iterate the events
+                1. jsonEvents = JsonEventReader(inZipFile.open("party.json"))
+                2. for event, path, value in jsonEvents.read_events():
+                3.     [inspect the event]
+            USE CASE #2 - Callbacks
+                1. jsonEvents = JsonEventReader(inZipFile.open("party.json"))
+                2. jsonEvents.add_callback("m_EntityData.*.$id", callback)
+                3. jsonEvents.run_callbacks()
+                4. jsonEvents.close_event_reader()
+            USE CASE #3 - Copy the json to another stream, replacing some values
+                1. jsonEvents = JsonEventReader(inZipFile.open("player.json"))
+                2. jsonEvents.rewrite_events(outStream, { "Money" : 1337, "Kingdom.BP" : 42 })
+                3. jsonEvents.close_event_reader()
+        NOTES
+            [X] jsonEvents = JsonEventReader(inStream)         # Instantiates a JsonEventReader object
+            [X] jsonEvents.read_events()                       # Generates (event, path, value) tuples
+            [X] jsonEvents.read_events(raw=True)               # Also generates the raw text of each event
+            [X] jsonEvents.add_callback(path, callback)        # Calls callback(event, path, value) for path
+            [X] jsonEvents.run_callbacks()                     # Reads every event, calling the callbacks
+            [X] jsonEvents.rewrite_events(outStream, editDict)  # Copies the json, replacing the values at paths
+            [X] jsonEvents.next_token()                        # Reads the next json token from the stream
+            [X] jsonEvents.close_event_reader()                # Zeroizes all data (does not close inStream)
+            EVENTS
+                "start_object", "end_object", "start_array", "end_array" - value is None
+                "key" - value is the key
+                "value" - value is the string, number, boolean, or None
+            PATHS
+                A path is a tuple of the object keys and array indices leading to the event (e.g.,
+                    ("m_EntityData", 0, "$id")).  The path of a "key" event includes the key.
+                Callback paths may be a tuple or a "."-separated string and "*" matches any key or index
+            Only self.eBufSize characters, plus the current token, are held in memory at a time
+    '''
+    # CLASS ATTRIBUTES
+    whitespaceRegex = re.compile(r'[ \t\n\r]*')  # Json insignificant whitespace
+    numberRegex = re.compile(r'-?(?:0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?')  # Json numbers
+    # Json literals, including the constants Python's json module accepts
+    literalDict = { "true" : True, "false" : False, "null" : None,
+                    "NaN" : float("nan"), "Infinity" : float("inf"), "-Infinity" : float("-inf") }
+    structuralChars = "{}[],:"                     # Single-character json tokens
+
+
+    def __init__(self, inStream, bufSize=64 * 1024):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                inStream - Binary file-like object holding UTF-8 json (e.g., ZipFile.open())
+                bufSize - Number of bytes to read from inStream at a time
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_event_reader()
+        '''
+        # CLASS ATTRIBUTES
+        self.eStream = None     # Binary stream being read
+        self.eBufSize = None    # Number of bytes to read at a time
+        self.eDecoder = None    # Incremental UTF-8 decoder (strips the BOM)
+        self.eBuffer = ""       # Decoded text not yet consumed
+        self.ePos = 0           # Index of the next unread character in self.eBuffer
+        self.eKeep = 0          # Index in self.eBuffer of the first character that must be kept
+        self.eOffset = 0        # Number of characters discarded from the front of self.eBuffer
+        self.eEOF = False       # Set this to True once inStream is exhausted
+        self.eBOM = None        # Set this to True if inStream starts with a UTF-8 BOM
+        self.eCallbackList = []  # List of (path tuple, callback) pairs
+        self.eSuccess = False   # Set this to False if anything fails
+
+        # INPUT VALIDATION
+        if not hasattr(inStream, "read"):
+            # print("JsonEventReader ctor:\tinStream is not a stream")  # DEBUGGING
+            pass
+        elif not isinstance(bufSize, int) or 0 >= bufSize:
+            # print("JsonEventReader ctor:\tInvalid buffer size")  # DEBUGGING
+            pass
+        else:
+            self.eStream = inStream
+            self.eBufSize = bufSize
+            self.eDecoder = codecs.getincrementaldecoder("utf-8-sig")()
+            self.eSuccess = True
+
+
+    def read_text(self):
+        '''
+            PURPOSE - Read and decode the next block of inStream into the buffer
+            OUTPUT
+                True if text was read
+                False at the end of inStream
+            NOTES
+                Consumed text before self.eKeep is discarded and the buffer indices are shifted to match
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        rawData = None  # Bytes read from inStream
+        newText = ""    # Decoded text
+
+        # READ
+        if not self.eEOF:
+            rawData = self.eStream.read(self.eBufSize)
+            if self.eBOM is None:
+                self.eBOM = rawData.startswith(codecs.BOM_UTF8)
+            if rawData:
+                newText = self.eDecoder.decode(rawData)
+            else:
+                newText = self.eDecoder.decode(b"", True)
+                self.eEOF = True
+            self.eBuffer = self.eBuffer[self.eKeep:] + newText
+            self.eOffset += self.eKeep
+            self.ePos -= self.eKeep
+            self.eKeep = 0
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def next_token(self):
+        '''
+            PURPOSE - Read the next json token from the stream
+            OUTPUT
+                On success, a tuple of (kind, value, start, end) where kind is one of
+                    self.structuralChars, "string", or "scalar", and start/end index the token's
+                    text in self.eBuffer
+                At the end of the stream, (None, None, start, start)
+                On error, Exception
+            NOTES
+                Strings and numbers that straddle a block boundary are re-read after the next block
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        start = 0      # Index of the token in self.eBuffer
+        char = ""      # First character of the token
+        match = None   # Regex match object
+        text = ""      # Token text
+
+        while retVal is None:
+            start = self.whitespaceRegex.match(self.eBuffer, self.ePos).end()
+            if start >= len(self.eBuffer):
+                self.ePos = start
+                if not self.read_text():
+                    retVal = (None, None, start, start)
+                continue
+            char = self.eBuffer[start]
+            # Structural character
+            if char in self.structuralChars:
+                self.ePos = start + 1
+                retVal = (char, None, start, start + 1)
+            # String
+            elif "\"" == char:
+                try:
+                    text, self.ePos = scanstring(self.eBuffer, start + 1)
+                except ValueError as err:
+                    self.ePos = start
+                    if not self.read_text():
+                        raise err
+                else:
+                    retVal = ("string", text, start, self.ePos)
+            # Number or literal
+            else:
+                match = self.numberRegex.match(self.eBuffer, start)
+                # A fraction or exponent may be cut off by the end of the block
+                if match is not None and match.end() + 3 > len(self.eBuffer) and not self.eEOF:
+                    self.ePos = start
+                    self.read_text()
+                elif match is not None:
+                    text = match.group(0)
+                    if match.group(1) or match.group(2):
+                        retVal = ("scalar", float(text), start, match.end())
+                    else:
+                        retVal = ("scalar", int(text), start, match.end())
+                    self.ePos = match.end()
+                else:
+                    for text in self.literalDict.keys():
+                        if self.eBuffer.startswith(text, start):
+                            retVal = ("scalar", self.literalDict[text], start, start + len(text))
+                            self.ePos = start + len(text)
+                            break
+                    if retVal is None:
+                        self.ePos = start
+                        if len(self.eBuffer) - start > 9 or not self.read_text():
+                            raise ValueError("Invalid json at character {}".format(self.eOffset + start))
+
+        # DONE
+        return retVal
+
+
+    def read_events(self, raw=False):
+        '''
+            PURPOSE - Generate the events of the json stream
+            INPUT
+                raw - If True, also generate the raw text consumed for each event
+            OUTPUT
+                On success, generates (event, path, value) tuples
+                    If raw is True, generates (event, path, value, gapText, tokenText) tuples where
+                    gapText is the whitespace and separators preceding the event's token and tokenText
+                    is the token itself.  A final ("end_document", (), None, gapText, "") event
+                    holds any text trailing the json document.
+                On error, Exception
+        '''
+        # LOCAL VARIABLES
+        path = []          # Keys and indices leading to the current value
+        stateList = []     # "object" or "array" for each open container
+        expect = "value"   # Next token expected: value, key, colon, or next
+        kind = None        # Token kind
+        value = None       # Token value
+        start = 0          # Token start index
+        end = 0            # Token end index
+        event = None       # Event to generate
+        gapText = ""       # Raw text between the previous token and this one
+
+        # INPUT VALIDATION
+        if not self.eSuccess:
+            raise RuntimeError("JsonEventReader failed to initialize")
+
+        # READ
+        self.eKeep = self.ePos
+        while True:
+            # Raw text is kept from the end of the previous event's token
+            if not raw:
+                self.eKeep = self.ePos
+            kind, value, start, end = self.next_token()
+            if raw:
+                gapText = self.eBuffer[self.eKeep:start]
+            event = None
+
+            # End of stream
+            if kind is None:
+                if stateList or "value" == expect:
+                    raise ValueError("Unexpected end of json data")
+                if raw:
+                    yield ("end_document", (), None, gapText, "")
+                break
+            # After the root value only whitespace is allowed
+            elif "done" == expect:
+                raise ValueError("Extra data at character {}".format(self.eOffset + start))
+            # Value
+            elif "value" == expect or ("first" == expect and "]" != kind):
+                if "{" == kind:
+                    event = "start_object"
+                    stateList.append("object")
+                    expect = "key"
+                elif "[" == kind:
+                    event = "start_array"
+                    stateList.append("array")
+                    path.append(0)
+                    expect = "first"
+                elif kind in ("string", "scalar"):
+                    event = "value"
+                    expect = "next"
+                else:
+                    raise ValueError("Expected a value at character {}".format(self.eOffset + start))
+                if "start_array" == event:
+                    # The array's own path excludes the index appended above
+                    if raw:
+                        self.eKeep = end
+                        yield (event, tuple(path[:-1]), None, gapText, self.eBuffer[start:end])
+                    else:
+                        yield (event, tuple(path[:-1]), None)
+                    continue
+            # Key
+            elif "key" == expect or "nextkey" == expect:
+                if "string" == kind:
+                    path.append(value)
+                    event = "key"
+                    expect = "colon"
+                elif "}" == kind and "key" == expect:
+                    stateList.pop()
+                    event = "end_object"
+                    expect = "next"
+                else:
+                    raise ValueError("Expected a key at character {}".format(self.eOffset + start))
+            elif "colon" == expect:
+                if ":" != kind:
+                    raise ValueError("Expected a colon at character {}".format(self.eOffset + start))
+                expect = "value"
+            # Separator or end of container
+            elif "next" == expect or "first" == expect:
+                if not stateList:
+                    raise ValueError("Extra data at character {}".format(self.eOffset + start))
+                elif "object" == stateList[-1] and "," == kind:
+                    path.pop()
+                    expect = "nextkey"
+                elif "object" == stateList[-1] and "}" == kind:
+                    path.pop()
+                    stateList.pop()
+                    event = "end_object"
+                    expect = "next"
+                elif "array" == stateList[-1] and "," == kind and "next" == expect:
+                    path[-1] += 1
+                    expect = "value"
+                elif "array" == stateList[-1] and "]" == kind:
+                    path.pop()
+                    stateList.pop()
+                    event = "end_array"
+                    expect = "next"
+                else:
+                    raise ValueError("Unexpected token at character {}".format(self.eOffset + start))
+
+            # GENERATE EVENT
+            if event is not None:
+                if "next" == expect and not stateList:
+                    expect = "done"
+                if raw:
+                    self.eKeep = end
+                    yield (event, tuple(path), value, gapText, self.eBuffer[start:end])
+                else:
+                    yield (event, tuple(path), value)
+        return
+
+
+    def add_callback(self, path, callback):
+        '''
+            PURPOSE - Call a function for every event at a given path
+            INPUT
+                path - Tuple of keys/indices or a "."-separated string; "*" matches anything
+                callback - Function called as callback(event, path, value).  Returning False
+                    stops run_callbacks().
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INPUT VALIDATION
+        if not self.eSuccess:
+            pass
+        elif not callable(callback):
+            # print("JsonEventReader.add_callback():\tcallback is not callable")  # DEBUGGING
+            pass
+        elif isinstance(path, str):
+            self.eCallbackList.append((tuple(path.split(".")) if path else (), callback))
+            retVal = True
+        elif isinstance(path, (tuple, list)):
+            self.eCallbackList.append((tuple(path), callback))
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def run_callbacks(self):
+        '''
+            PURPOSE - Read every event, calling any callback whose path matches
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Array indices in an event's path match callback path components of the same
+                    number (e.g., "m_EntityData.0.$id")
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        cbPath = None    # Callback's path
+        callback = None  # Callback function
+        keepGoing = True  # Set this to False when a callback asks to stop
+
+        # INPUT VALIDATION
+        if self.eSuccess:
+            try:
+                for event, path, value in self.read_events():
+                    for cbPath, callback in self.eCallbackList:
+                        if len(cbPath) != len(path):
+                            continue
+                        for cbEntry, entry in zip(cbPath, path):
+                            if "*" != cbEntry and cbEntry != entry and cbEntry != str(entry):
+                                break
+                        else:
+                            if callback(event, path, value) is False:
+                                keepGoing = False
+                    if not keepGoing:
+                        break
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.eSuccess = False
+            else:
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def rewrite_events(self, outStream, editDict):
+        '''
+            PURPOSE - Copy the json stream to another stream, replacing the values at given paths
+            INPUT
+                outStream - Writable binary stream (e.g., RawZipFile, ZipFile.open(name, "w"))
+                editDict - Dictionary of { path : new value } where path is a tuple of keys/indices or
+                    a "."-separated string (e.g., "Kingdom.BP")
+            OUTPUT
+                On success, True
+                On failure, False (e.g., a path was not found)
+            NOTES
+                Everything other than the replaced values is copied through exactly as it was read
+                New values are serialized the same way JsonFile writes them
+                The UTF-8 BOM is copied if inStream had one
+                Digits in "."-separated paths are treated as array indices
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        pathDict = {}     # editDict with tuple paths
+        foundSet = set()  # Paths that were replaced
+        pieceList = []    # Output text not yet written
+        pieceLen = 0      # Number of characters in pieceList
+        skipPath = None   # Path of a replaced container whose contents are being skipped
+        newText = ""      # Serialized new value
+        bomDone = False   # Set this to True once the BOM, if any, has been written
+
+        # INPUT VALIDATION
+        if not self.eSuccess:
+            pass
+        elif not hasattr(outStream, "write"):
+            # print("JsonEventReader.rewrite_events():	outStream is not a stream")  # DEBUGGING
+            pass
+        elif not isinstance(editDict, dict):
+            # print("JsonEventReader.rewrite_events():	editDict is not a dictionary")  # DEBUGGING
+            pass
+        else:
+            try:
+                # NORMALIZE PATHS
+                for path, value in editDict.items():
+                    if isinstance(path, str):
+                        path = tuple([ int(entry) if entry.isdigit() else entry for entry in path.split(".") ])
+                    pathDict[tuple(path)] = value
+
+                # COPY
+                for event, path, value, gapText, tokenText in self.read_events(raw=True):
+                    if skipPath is not None:
+                        if path == skipPath and event in ("end_object", "end_array"):
+                            skipPath = None
+                        continue
+                    pieceList.append(gapText)
+                    if path in pathDict and event in ("value", "start_object", "start_array"):
+                        newText = json.dumps(pathDict[path], separators=(',', ':'))
+                        pieceList.append(newText)
+                        pieceLen += len(gapText) + len(newText)
+                        foundSet.add(path)
+                        if "value" != event:
+                            skipPath = path
+                    else:
+                        pieceList.append(tokenText)
+                        pieceLen += len(gapText) + len(tokenText)
+                    # Write a block at a time
+                    if pieceLen >= self.eBufSize or "end_document" == event:
+                        if not bomDone and self.eBOM:
+                            outStream.write(codecs.BOM_UTF8)
+                        bomDone = True
+                        outStream.write("".join(pieceList).encode("utf-8"))
+                        pieceList = []
+                        pieceLen = 0
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.eSuccess = False
+            else:
+                if len(foundSet) == len(pathDict):
+                    retVal = True
+                else:
+                    print("Unable to find {}".format([ path for path in pathDict.keys() if path not in foundSet ]))  # DEBUGGING
+
+        # DONE
+        return retVal
+
+
+    def close_event_reader(self):
+        '''
+            PURPOSE - Clear out all class attributes
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                The stream is not closed since the caller opened it
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        try:
+            self.eStream = None
+            self.eBufSize = None
+            self.eDecoder = None
+            self.eBuffer = ""
+            self.ePos = 0
+            self.eKeep = 0
+            self.eOffset = 0
+            self.eEOF = False
+            self.eBOM = None
+            self.eCallbackList = []
+            self.eSuccess = True
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = False
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
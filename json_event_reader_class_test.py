@@ -0,0 +1,93 @@
+from json_event_reader_class import JsonEventReader
+import io
+import json
+import os
+import unittest
+
+
+class Json_Event_Reader_Class_Tests(unittest.TestCase):
+
+
+    def read_file(self, filename):
+        with open(os.path.join("Test_Files", "Linux", filename), "rb") as inFile:
+            return inFile.read()
+
+
+    def read_all(self, rawData, bufSize=64 * 1024, raw=False):
+        return list(JsonEventReader(io.BytesIO(rawData), bufSize).read_events(raw=raw))
+
+
+class Json_Event_Reader_Class_Test_Normal(Json_Event_Reader_Class_Tests):
+
+
+    def test_Normal_01_Events(self):
+        events = self.read_all(b'{"a":[1,2.5,"x"],"b":{"c":null}}')
+        self.assertEqual(events, [ ("start_object", (), None),
+                                   ("key", ("a",), "a"),
+                                   ("start_array", ("a",), None),
+                                   ("value", ("a", 0), 1),
+                                   ("value", ("a", 1), 2.5),
+                                   ("value", ("a", 2), "x"),
+                                   ("end_array", ("a",), None),
+                                   ("key", ("b",), "b"),
+                                   ("start_object", ("b",), None),
+                                   ("key", ("b", "c"), "c"),
+                                   ("value", ("b", "c"), None),
+                                   ("end_object", ("b",), None),
+                                   ("end_object", (), None) ])
+
+
+    def test_Normal_02_Small_Blocks(self):
+        rawData = self.read_file("player.json")
+        # Raw text round trips even when tokens straddle block boundaries
+        rawText = "".join([ event[3] + event[4] for event in self.read_all(rawData, 7, raw=True) ])
+        self.assertEqual(rawText, rawData.decode("utf-8-sig"))
+
+
+    def test_Normal_03_Callbacks(self):
+        rawData = self.read_file("party.json")
+        idList = []
+        test = JsonEventReader(io.BytesIO(rawData), 4096)
+        self.assertTrue(test.add_callback("m_EntityData.*.$id",
+                                          lambda event, path, value: idList.append(value) if "value" == event else None))
+        self.assertTrue(test.run_callbacks())
+        self.assertEqual(idList, [ entity["$id"] for entity in json.loads(rawData.decode("utf-8-sig"))["m_EntityData"]
+                                   if "$id" in entity ])
+        self.assertTrue(test.close_event_reader())
+
+
+
+    def test_Normal_04_Rewrite(self):
+        rawData = self.read_file("player.json")
+        outStream = io.BytesIO()
+        test = JsonEventReader(io.BytesIO(rawData), 4096)
+        self.assertTrue(test.rewrite_events(outStream, { "Money" : 1337, "Kingdom.BP" : 42 }))
+        expectDict = json.loads(rawData.decode("utf-8-sig"))
+        expectDict["Money"] = 1337
+        expectDict["Kingdom"]["BP"] = 42
+        self.assertTrue(outStream.getvalue().startswith(rawData[:3]))
+        self.assertEqual(json.loads(outStream.getvalue().decode("utf-8-sig")), expectDict)
+
+
+class Json_Event_Reader_Class_Test_Error(Json_Event_Reader_Class_Tests):
+
+
+    def test_Error_01_Bad_Input(self):
+        self.assertFalse(JsonEventReader(None).eSuccess)
+        self.assertFalse(JsonEventReader(io.BytesIO(b"{}"), 0).eSuccess)
+        self.assertFalse(JsonEventReader(io.BytesIO(b"{}")).add_callback("a", None))
+
+
+    def test_Error_02_Malformed(self):
+        for rawData in [ b'{"a":1,}', b'[1,]', b'{"a" 1}', b'{} x', b'[', b'', b'{"a":tru}' ]:
+            with self.assertRaises(ValueError):
+                self.read_all(rawData, 2)
+            self.assertFalse(JsonEventReader(io.BytesIO(rawData)).run_callbacks())
+
+
+    def test_Error_03_Rewrite_Missing_Path(self):
+        self.assertFalse(JsonEventReader(io.BytesIO(b'{"a":1}')).rewrite_events(io.BytesIO(), { "b" : 2 }))
+
+
+if __name__ == "__main__":
+    unittest.main()
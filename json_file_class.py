@@ -1,9 +1,30 @@
 # from codecs import BOM_UTF8
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from json.decoder import scanstring
+from json_event_reader_class import JsonEventReader
+from json_ref_index_class import JsonRefIndex
 import codecs
 import json
 import io
+import mmap
 import os
+import re
+import sys
+
+
+def parse_json_chunk(chunkText):
+    '''
+        PURPOSE - Parse a run of json array elements (see: JsonFile.parse_json_array())
+        INPUT
+            chunkText - Comma-separated json array elements, without the brackets
+        OUTPUT
+            On success, a list of the parsed elements
+            On failure, Exception
+        NOTES
+            Module-level so a process pool can run it
+    '''
+    return json.loads("[" + chunkText + "]", object_pairs_hook = OrderedDict)
 
 
 class JsonFile():
@@ -19,6 +40,7 @@ class JsonFile():
         NOTES
             [X] jsonSave = JsonFile("player.json")       # Instantiates a JsonFile object
             [X] jsonSave.read_json_file()                # Read the raw file contents
+            [X] jsonSave.decode_json_bytes(rawBytes)     # Decodes raw bytes without a stream reader or BOM copy
             [X] jsonSave.parse_json_contents()           # Translate the raw json-format a dictionary
             [X] value1 = jsonSave.get_data(key1)         # Get the value of an existing key
             [X] jsonSave.key_present(key1)               # Determine if a key exists
@@ -27,17 +49,74 @@ class JsonFile():
             [X] jsonSave.del_data(key2)                  # Delete a key from the dictionary
             [X] jsonSave.write_json_file()               # Overwrites existing file with changes
             [X] jsonSave.close_json_file()               # Zeroizes all data (file is technically already closed)
+            [X] jsonSave = JsonFile("player.json", rawBytes)  # Instantiates an in-memory JsonFile object
+                                                         #   (e.g., a zip member read into a buffer, a
+                                                         #   memoryview or mmap of one, or a callable that
+                                                         #   reads it on demand)
+                                                         #   write_json_file() updates jBuffer instead of the disk
+            [X] jsonSave = JsonFile("player.json", selective=True)  # get_data() only parses the requested key
+            [X] jsonSave.scan_json_contents([key1])      # Finds the span of top-level values in self.jCont
+            [X] jsonSave.extract_data(key1)              # Parses one top-level value without a full parse
+            [X] jsonSave.mod_element(key1, index, value)  # Modify one element of a top-level array
+            [X] jsonSave.splice_json_contents()          # Re-serializes only modified values into self.jCont
+            [X] jsonSave.rewrite_json_file()             # Streams deferred edits into the file without a parse
+            [X] jsonSave.reset_json_contents()           # Discards raw contents and edits written elsewhere
+            [X] jsonSave = JsonFile("party.json", refIndex=True)  # Indexes "$id"/"$ref" nodes while parsing
+            [X] jsonSave.resolve_ref(ref)                # Resolves a "$ref" to its "$id" node (see: JsonRefIndex)
+            [X] jsonSave.find_referrers(refId)           # Lists the "$id" of every node referencing refId
+            [X] jsonSave.renumber_ids()                  # Compacts "$id"s and rewrites every "$ref"
+            [X] jsonSave = JsonFile("party.json", lean=True)  # Parses into compact dicts (see: lean_node())
+            [X] jsonSave = JsonFile("party.json", numWorkers=4)  # Parses m_EntityData in a process pool
+            [X] jsonSave.scan_json_elements(start)       # Finds array element spans without parsing them
+            [X] jsonSave = JsonFile("party.json", internPool=pool)  # Shares identical values with other
+                                                         #   JsonFile objects (see: JsonInternPool)
+            [X] jsonSave.own_data(key1)                  # Replaces a shared value with a private copy
+            [X] jsonSave.view_data(key1)                 # Read-only get_data() that keeps shared values shared
+            [X] jsonSave = JsonFile("party.json", rawBytes, parseCache=cache, cacheKey=(name, crc, size))
+                                                         # Reuses the parsed dictionary of unchanged contents
+                                                         #   (see: ParseCache)
+            Selective JsonFile objects defer mod_data() edits (see: self.jEditDict) until something
+                requires a full parse.  write_json_file() streams deferred edits (see: JsonEventReader).
     '''
+    # CLASS ATTRIBUTES
+    whitespaceRegex = re.compile(r'[ \t\n\r]*')  # Json insignificant whitespace
+    skipDecoder = json.JSONDecoder()               # Decodes values being skipped into plain objects
+    parseDecoder = json.JSONDecoder(object_pairs_hook = OrderedDict)  # Decodes values into the dictionary
+    spanArrays = [ "m_EntityData" ]                # Top-level arrays whose elements are spliced individually
+    guidRegex = re.compile(r'[0-9a-f]{32}\Z')      # Blueprint GUIDs repeated throughout the save games
+    leanDict = dict if sys.version_info >= (3, 7) else OrderedDict  # Smallest insertion-ordered mapping
+    bytesTypes = (bytes, bytearray, memoryview, mmap.mmap)  # Raw contents accepted in memory
+    # Skips everything but brackets, including brackets inside strings
+    skipRegex = re.compile(r'(?:[^"\[\]{}]+|"(?:[^"\\]|\\.)*")*')
+    parallelMinChars = 8 * 1024 * 1024  # Smallest json file worth parsing in a process pool
+    parallelChunksPerWorker = 4         # Number of chunks of array elements handed to each worker
     
     
-    def __init__(self, filename):
+    def __init__(self, filename, contents=None, selective=False, refIndex=False, lean=False,
+                 parseCache=None, cacheKey=None, numWorkers=None, internPool=None):
         '''
             PURPOSE - Class ctor
             INPUT
                 filename - String representation of a relative or absolute filename
+                contents - Optional bytes-like object (bytes, bytearray, memoryview, or mmap) holding
+                    the raw file contents (e.g., an unpacked zip member) or a callable that returns
+                    those bytes the first time they're read
+                selective - If True, get_data() parses only the requested top-level key until
+                    something requires a full parse (see: extract_data())
+                refIndex - If True, index the "$id"/"$ref" nodes while parsing (see: JsonRefIndex)
+                lean - If True, parse into compact dicts and drop the raw contents once parsed
+                    (see: lean_node())
+                parseCache - Optional ParseCache holding parsed json files
+                cacheKey - The (member name, CRC32, uncompressed size) of contents, required by parseCache
+                numWorkers - Optional number of processes to parse large spanArrays with
+                    (see: parse_json_array())
+                internPool - Optional JsonInternPool to share identical values with other JsonFile
+                    objects.  Ignored if refIndex is True.
             OUTPUT - None
             NOTES
                 New class attributes must be zeroed in close_json_file()
+                If contents are provided, filename doesn't need to exist on disk and all reads/writes
+                    take place in memory
         '''
         # CLASS ATTRIBUTES
         self.jPath = None      # Path to the filename
@@ -46,6 +125,33 @@ class JsonFile():
         self.jDict = None      # Dictionary parsed from self.jCont
         self.jSuccess = False  # Set this to False if anything fails
         self.jChanged = False  # Set this to True contents are modified
+        self.jInMemory = False  # Set this to True if the raw contents live in self.jBuffer instead of on disk
+        self.jBuffer = None     # Raw (encoded) file contents for in-memory JsonFile objects
+        self.jLoader = None     # Callable that returns self.jBuffer for lazy in-memory JsonFile objects
+        self.jSelective = selective is True  # Set this to True to parse top-level keys on demand
+        self.jSpanDict = None   # Store the { top-level key : (start, end) } of values in self.jCont here
+        self.jScanPos = None    # Index in self.jCont to resume scan_json_contents(), None when finished
+        self.jPartDict = None   # Store the { top-level key : value } parsed by extract_data() here
+        self.jElemSpanDict = None  # Store the { spanArrays key : [(start, end), ...] } of array elements here
+        self.jDirtyDict = None  # Store the { key : None (entire value) or set of element indices } to re-serialize
+                                #   here.  None means the entire file must be re-serialized.
+        self.jEditDict = None   # Store the { top-level key : new value } of deferred edits here
+        self.jLean = lean is True  # Set this to True to trade splicing for a smaller parsed tree
+        self.jRefIndex = None      # "$id"/"$ref" index, if any
+        self.jParseCache = None    # ParseCache holding parsed json files, if any
+        self.jCacheKey = None      # (member name, CRC32, uncompressed size) of the raw contents in self.jParseCache
+        self.jNumWorkers = None    # Number of processes to parse large spanArrays with, None for serial
+        if isinstance(numWorkers, int) and not isinstance(numWorkers, bool) and 1 < numWorkers:
+            self.jNumWorkers = numWorkers
+        self.jInternPool = None    # JsonInternPool shared with other JsonFile objects, if any
+        self.jSharedSet = set()    # Top-level keys whose values belong to self.jInternPool
+        if internPool is not None and refIndex is not True:
+            self.jInternPool = internPool
+        if parseCache is not None and isinstance(cacheKey, tuple) and 3 == len(cacheKey):
+            self.jParseCache = parseCache
+            self.jCacheKey = cacheKey
+        if refIndex is True:
+            self.jRefIndex = JsonRefIndex(self.lean_node) if self.jLean else JsonRefIndex()
            
         # INPUT VALIDATION
         if not isinstance(filename, str):
@@ -54,6 +160,19 @@ class JsonFile():
         elif len(filename) <= 0:
             # print("JsonFile ctor:\tfilename is empty")  # DEBUGGING
             pass
+        elif contents is not None:
+            if not isinstance(contents, self.bytesTypes) and not callable(contents):
+                # print("JsonFile ctor:\tcontents are not bytes")  # DEBUGGING
+                pass
+            else:
+                self.jPath = os.path.dirname(filename)
+                self.jName = os.path.basename(filename)
+                if callable(contents):
+                    self.jLoader = contents
+                else:
+                    self.jBuffer = contents
+                self.jInMemory = True
+                self.jSuccess = True
         elif not os.path.exists(filename):
             # print("JsonFile ctor:\t{} does not exist".format(filename))  # DEBUGGING
             pass
@@ -89,14 +208,33 @@ class JsonFile():
             # READ FILE CONTENTS
             # Is the file already open?
             if not self.jCont:
+                # Is it already in memory?
+                if self.jInMemory:
+                    try:
+                        if self.jBuffer is None and self.jLoader is not None:
+                            self.jBuffer = self.jLoader()
+                        self.jCont = self.decode_json_bytes(self.jBuffer)
+                    except Exception as err:
+                        print(repr(err))  # DEBUGGING
+                        self.jSuccess = False
+                    else:
+                        # Verify the read
+                        if self.jCont:
+                            retVal = True
                 # Is there a path and filename?
-                if self.jPath and self.jName:
+                elif self.jPath and self.jName:
                     # Open the file and read the contents
                     try:
                         # with codecs.open(os.path.join(self.jPath, self.jName), "r", "utf-8") as inFile:
-                        with codecs.open(os.path.join(self.jPath, self.jName), "r", "utf-8-sig") as inFile:
+                        # with codecs.open(os.path.join(self.jPath, self.jName), "r", "utf-8-sig") as inFile:
                         # with open(os.path.join(self.jPath, self.jName), "r") as inFile:
-                            self.jCont = inFile.read()
+                        with open(os.path.join(self.jPath, self.jName), "rb") as inFile:
+                            # Decode straight from the page cache (mmap can't map an empty file)
+                            if 0 < os.fstat(inFile.fileno()).st_size:
+                                with mmap.mmap(inFile.fileno(), 0, access=mmap.ACCESS_READ) as inMap:
+                                    self.jCont = self.decode_json_bytes(inMap)
+                            else:
+                                self.jCont = ""
                             # print("\n{}".format(self.jCont))  # DEBUGGING
                             # Strip off the UTF-8 header
                             # if self.jCont.startswith(str(BOM_UTF8)):
@@ -114,6 +252,36 @@ class JsonFile():
         return retVal
         
         
+    def decode_json_bytes(self, rawData):
+        '''
+            PURPOSE - Decode raw json bytes into a string
+            INPUT
+                rawData - Bytes-like object (bytes, bytearray, memoryview, or mmap)
+            OUTPUT
+                On success, the decoded string
+                On failure, Exception
+            NOTES
+                The UTF-8 BOM is skipped by slicing a memoryview rather than copying the bytes, and
+                    the decode reads straight from rawData instead of going through a stream reader
+                The parser still needs a str since spans (see: self.jSpanDict) are string indices
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        rawView = memoryview(rawData)  # Zero-copy view of rawData
+
+        # DECODE
+        try:
+            if rawView[:len(codecs.BOM_UTF8)] == codecs.BOM_UTF8:
+                retVal = str(rawView[len(codecs.BOM_UTF8):], "utf-8")
+            else:
+                retVal = str(rawView, "utf-8")
+        finally:
+            rawView.release()  # An exported mmap can't be closed
+
+        # DONE
+        return retVal
+
+
     def parse_json_contents(self):
         '''
             PURPOSE - Parse the raw contents of a json file into a dictionary
@@ -122,18 +290,42 @@ class JsonFile():
                 On failure, False
             NOTES
                 This method reads the json file if it hasn't been parsed yet
+                Json objects are parsed one top-level value at a time to record the span of each
+                    value (see: scan_json_contents())
+                Lean JsonFile objects drop the raw contents afterwards, so writes re-serialize the
+                    entire file instead of splicing
+                A dictionary loaded from self.jParseCache has no raw contents until it's written
+                    (see: splice_json_contents()).  Freshly parsed dictionaries are stored there
+                    before any deferred edit is applied.
+                self.jParseCache is only consulted here, so selective JsonFile objects still parse
+                    single keys and stream deferred edits (see: extract_data())
         '''
         # LOCAL VARIABLES
         retVal = False
+        index = 0        # Index of the first non-whitespace character in self.jCont
+        cached = False   # Set this to True if the dictionary came from self.jParseCache
+
+        # CHECK THE PARSE CACHE
+        if self.jCont is None and self.jDict is None and self.jSuccess:
+            cached = self.load_cached_contents()
 
         # VERIFY FILE IS READ
-        if self.jCont is None:
+        if self.jCont is None and not cached:
             self.read_json_file()
         
         # INPUT VALIDATION
         if self.jSuccess:
             # PARSE RAW FILE CONTENTS
-            if self.jCont and len(self.jCont) > 0:
+            if self.jCont:
+                index = self.whitespaceRegex.match(self.jCont, 0).end()
+            if cached:
+                retVal = True
+            elif self.jCont and "{" == self.jCont[index:index + 1]:
+                if self.scan_json_contents(parse=True) is True:
+                    # The full parse replaces any selectively parsed values
+                    self.jPartDict = None
+                    retVal = True
+            elif self.jCont and len(self.jCont) > 0:
                 try:
                     # self.jDict = json.loads(self.jCont)
 
@@ -143,18 +335,538 @@ class JsonFile():
                     # self.jDict = json.loads(codecs.decode(self.jCont, "utf-8-sig", errors = "ignore"))
 
                     # Attempt #? - Ordered Dictionary
-                    self.jDict = json.loads(self.jCont, object_pairs_hook = OrderedDict)
+                    if self.jRefIndex is not None:
+                        self.jRefIndex.reset_ref_index()
+                    self.jDict = self.node_decoder().decode(self.jCont)
+                    if self.jRefIndex is not None:
+                        self.jRefIndex.claim_nodes(None, self.jDict)
+                    elif self.jInternPool is not None:
+                        # The top level is never shared
+                        self.jDict = self.jInternPool.intern_value(self.jDict)
+                        if isinstance(self.jDict, dict):
+                            self.jDict = type(self.jDict)(self.jDict.items())
+                            self.jSharedSet = set(self.jDict.keys())
+                        else:
+                            self.jDict = list(self.jDict)
 
                 except Exception as err:
                     print(repr(err))  # DEBUGGING
                     self.jSuccess = False
                 else:
+                    # The full parse replaces any selectively parsed values
+                    self.jPartDict = None
+                    self.jDirtyDict = None
                     retVal = True
+
+            # UPDATE THE PARSE CACHE
+            if retVal is True and not cached and self.jParseCache is not None:
+                self.jParseCache.store_tree(self.jCacheKey[0], self.jCacheKey[1], self.jCacheKey[2], self.jDict)
+
+            # APPLY DEFERRED EDITS
+            if retVal is True and self.jEditDict is not None:
+                for key, value in self.jEditDict.items():
+                    self.jDict[key] = value
+                    self.jSharedSet.discard(key)
+                    if self.jDirtyDict is not None:
+                        self.jDirtyDict[key] = None
+                    self.update_ref_index(key)
+                self.jEditDict = None
+
+            # DROP THE RAW CONTENTS
+            if retVal is True and self.jLean:
+                self.jCont = None
+                self.jSpanDict = None
+                self.jElemSpanDict = None
+                self.jScanPos = None
+                self.jDirtyDict = None  # Writes re-serialize the entire file
+                if self.jLoader is not None:
+                    self.jBuffer = None
         
         # DONE
         return retVal
 
 
+    def load_cached_contents(self):
+        '''
+            PURPOSE - Load the parsed dictionary from self.jParseCache instead of parsing
+            OUTPUT
+                On a hit, True
+                On a miss, False
+            NOTES
+                The cached dictionary has no raw contents.  They're only read, and scanned for spans,
+                    if the dictionary is written (see: splice_json_contents()).  Lean JsonFile
+                    objects re-serialize the entire file instead.
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        tree = None  # Cached dictionary
+
+        # INPUT VALIDATION
+        if self.jSuccess and self.jParseCache is not None:
+            tree = self.jParseCache.load_tree(self.jCacheKey[0], self.jCacheKey[1], self.jCacheKey[2])
+            if tree is not None:
+                self.jDict = tree
+                self.jPartDict = None
+                self.jSpanDict = None
+                self.jElemSpanDict = None
+                self.jScanPos = None
+                self.jDirtyDict = None if self.jLean else OrderedDict()
+                self.jSharedSet = set()  # Cached dictionaries are private
+                self.rebuild_ref_index()
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def rebuild_ref_index(self):
+        '''
+            PURPOSE - Rebuild self.jRefIndex from the entire dictionary
+            OUTPUT
+                On success, True
+                Without an index, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # REBUILD
+        if self.jRefIndex is not None and self.jDict is not None:
+            self.jRefIndex.reset_ref_index()
+            self.jRefIndex.add_root(self.jDict)
+            for key in self.jDict.keys():
+                self.jRefIndex.index_value(key, self.jDict[key], self.jRefIndex.iRootId, key in self.spanArrays)
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def node_decoder(self):
+        '''
+            PURPOSE - Choose the json decoder for a full parse
+            OUTPUT
+                A json.JSONDecoder
+        '''
+        # LOCAL VARIABLES
+        retVal = self.parseDecoder
+
+        # CHOOSE
+        if self.jRefIndex is not None:
+            retVal = json.JSONDecoder(object_pairs_hook = self.jRefIndex.build_node)
+        elif self.jInternPool is not None:
+            retVal = json.JSONDecoder(object_pairs_hook = self.jInternPool.build_node)
+        elif self.jLean:
+            retVal = json.JSONDecoder(object_pairs_hook = self.lean_node)
+
+        # DONE
+        return retVal
+
+
+    def lean_node(self, pairs):
+        '''
+            PURPOSE - Build a compact json object (use as the json object_pairs_hook)
+            INPUT
+                pairs - List of (key, value) pairs from the json decoder
+            OUTPUT
+                A self.leanDict of pairs
+            NOTES
+                Keys and blueprint GUIDs are interned so every parsed save shares one copy of each
+                Plain dicts are less than half the size of an OrderedDict and keep insertion order
+                    from Python 3.7 on.  Older versions fall back to OrderedDict.
+        '''
+        # LOCAL VARIABLES
+        retVal = self.leanDict()
+        intern = sys.intern
+        guidMatch = self.guidRegex.match
+
+        # BUILD
+        for key, value in pairs:
+            if value.__class__ is str and 32 == len(value) and guidMatch(value):
+                value = intern(value)
+            retVal[intern(key)] = value
+
+        # DONE
+        return retVal
+
+
+    def scan_json_contents(self, keyList=None, parse=False):
+        '''
+            PURPOSE - Find the span of top-level values in the raw contents without a full parse
+            INPUT
+                keyList - Optional list of top-level keys to stop scanning after.  If None, the
+                    entire file is scanned.
+                parse - If True, rescan the entire file and parse each value into self.jDict
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                This method reads the json file if it hasn't been read yet
+                Spans are stored in self.jSpanDict as { key : (start, end) } indices into self.jCont
+                The scan resumes where the last scan stopped (see: self.jScanPos)
+                Values being skipped are decoded into plain objects and immediately discarded
+                Parsing also records the span of each element of self.spanArrays in self.jElemSpanDict
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        index = 0        # Current index into self.jCont
+        key = None       # Current top-level key
+        start = 0        # Index of the current value
+        value = None     # Current top-level value
+        newDict = None   # Dictionary being parsed
+        spliceable = True  # Set this to False if duplicate keys prevent splicing
+        decoder = self.parseDecoder  # Decodes values into the dictionary
+        wsRegex = self.whitespaceRegex
+
+        # VERIFY FILE IS READ
+        if self.jCont is None:
+            self.read_json_file()
+
+        # INPUT VALIDATION
+        if self.jSuccess and self.jCont:
+            try:
+                # START THE SCAN
+                if self.jSpanDict is None or parse is True:
+                    self.jSpanDict = OrderedDict()
+                    index = wsRegex.match(self.jCont, 0).end()
+                    if "{" != self.jCont[index:index + 1]:
+                        raise ValueError("Json contents are not an object")
+                    self.jScanPos = index + 1
+                if parse is True:
+                    newDict = self.leanDict() if self.jLean else OrderedDict()
+                    self.jElemSpanDict = {}
+                    self.jSharedSet = set()
+                    keyList = None
+                    if self.jRefIndex is not None:
+                        self.jRefIndex.reset_ref_index()
+                    decoder = self.node_decoder()
+
+                # SCAN
+                index = self.jScanPos
+                while index is not None:
+                    if keyList is not None and 0 == len([ key for key in keyList if key not in self.jSpanDict.keys() ]):
+                        break
+                    index = wsRegex.match(self.jCont, index).end()
+                    if "}" == self.jCont[index:index + 1]:
+                        if newDict is not None and len(self.jCont) != wsRegex.match(self.jCont, index + 1).end():
+                            raise ValueError("Extra data at index {}".format(index + 1))
+                        index = None
+                        break
+                    elif "\"" != self.jCont[index:index + 1]:
+                        raise ValueError("Expected a key at index {}".format(index))
+                    key, index = scanstring(self.jCont, index + 1)
+                    index = wsRegex.match(self.jCont, index).end()
+                    if ":" != self.jCont[index:index + 1]:
+                        raise ValueError("Expected a colon at index {}".format(index))
+                    start = wsRegex.match(self.jCont, index + 1).end()
+                    if newDict is None:
+                        index = self.skipDecoder.raw_decode(self.jCont, start)[1]
+                    elif key in self.spanArrays and "[" == self.jCont[start:start + 1]:
+                        value, index = self.scan_json_array(key, start, decoder, newDict.get("$id"))
+                    else:
+                        value, index = decoder.raw_decode(self.jCont, start)
+                        if self.jRefIndex is not None:
+                            self.jRefIndex.claim_nodes(key, value, newDict.get("$id"))
+                    if self.jInternPool is not None and newDict is not None:
+                        value = self.jInternPool.intern_value(value)
+                        self.jSharedSet.add(key)
+                    if key in self.jSpanDict.keys():
+                        spliceable = False
+                    self.jSpanDict[key] = (start, index)
+                    if newDict is not None:
+                        newDict[key] = value
+                    index = wsRegex.match(self.jCont, index).end()
+                    if "," == self.jCont[index:index + 1]:
+                        index += 1
+                    elif "}" != self.jCont[index:index + 1]:
+                        raise ValueError("Expected a comma at index {}".format(index))
+                self.jScanPos = index
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.jSuccess = False
+            else:
+                if newDict is not None:
+                    self.jDict = newDict
+                    if self.jRefIndex is not None:
+                        self.jRefIndex.add_root(newDict)
+                    if spliceable:
+                        self.jDirtyDict = OrderedDict()
+                    else:
+                        self.jDirtyDict = None
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def scan_json_array(self, key, start, decoder=None, ownerId=None):
+        '''
+            PURPOSE - Parse a top-level array one element at a time, recording the span of each element
+            INPUT
+                key - Top-level key of the array
+                start - Index of the array's opening bracket in self.jCont
+                decoder - Optional json decoder, defaults to self.parseDecoder
+                ownerId - "$id" of the top-level object, for self.jRefIndex
+            OUTPUT
+                On success, a tuple containing the parsed list and the index following the array
+                On error, Exception
+            NOTES
+                Element spans are stored in self.jElemSpanDict[key] as a list of (start, end) indices
+                Large arrays are parsed in a process pool when self.jNumWorkers is set
+                    (see: parse_json_array())
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        index = start + 1  # Current index into self.jCont
+        element = None     # Current array element
+        elemStart = 0      # Index of the current element
+        elemList = []      # Parsed array
+        spanList = []      # Spans of the array elements
+        wsRegex = self.whitespaceRegex
+
+        # INPUT VALIDATION
+        if decoder is None:
+            decoder = self.parseDecoder
+
+        # PARSE IN PARALLEL
+        if self.jNumWorkers is not None and not self.jLean and self.jInternPool is None \
+           and len(self.jCont) >= self.parallelMinChars:
+            retVal = self.parse_json_array(key, start, ownerId)
+            if retVal is not None:
+                return retVal
+
+        # PARSE
+        index = wsRegex.match(self.jCont, index).end()
+        if "]" == self.jCont[index:index + 1]:
+            index += 1
+        else:
+            while index is not None:
+                elemStart = index
+                element, index = decoder.raw_decode(self.jCont, elemStart)
+                if self.jRefIndex is not None:
+                    self.jRefIndex.claim_nodes(key, element, ownerId, len(elemList))
+                elif self.jInternPool is not None:
+                    element = self.jInternPool.intern_value(element)
+                elemList.append(element)
+                spanList.append((elemStart, index))
+                index = wsRegex.match(self.jCont, index).end()
+                if "]" == self.jCont[index:index + 1]:
+                    index += 1
+                    break
+                elif "," != self.jCont[index:index + 1]:
+                    raise ValueError("Expected a comma at index {}".format(index))
+                index = wsRegex.match(self.jCont, index + 1).end()
+
+        # DONE
+        self.jElemSpanDict[key] = spanList
+        retVal = (elemList, index)
+        return retVal
+
+
+    def scan_json_elements(self, start):
+        '''
+            PURPOSE - Find the span of each element of an array of objects and arrays without
+                parsing them
+            INPUT
+                start - Index of the array's opening bracket in self.jCont
+            OUTPUT
+                On success, a tuple containing a list of (start, end) element spans and the index
+                    following the array
+                If an element isn't an object or array, None
+                On error, Exception
+            NOTES
+                Only brackets are visited in Python.  self.skipRegex skips everything else,
+                    including brackets inside strings.
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        spanList = []   # Spans of the array elements
+        depth = 0       # Bracket depth, relative to the array
+        pos = start     # Index of the current bracket
+        elemStart = 0   # Index of the current element
+        skipMatch = self.skipRegex.match
+        content = self.jCont
+        nextPos = 0     # Index of the next bracket
+
+        # SCAN
+        while True:
+            nextPos = skipMatch(content, pos).end()
+            # Between elements, only whitespace and commas are allowed
+            if 1 == depth and content[pos:nextPos].strip(" \t\n\r") not in ("", ","):
+                break
+            pos = nextPos
+            char = content[pos:pos + 1]
+            if "[" == char or "{" == char:
+                depth += 1
+                if 2 == depth:
+                    elemStart = pos
+            elif "]" == char or "}" == char:
+                depth -= 1
+                if 1 == depth:
+                    spanList.append((elemStart, pos + 1))
+                elif 0 == depth:
+                    retVal = (spanList, pos + 1)
+                    break
+            else:
+                raise ValueError("Unterminated array at index {}".format(start))
+            pos += 1
+
+        # DONE
+        return retVal
+
+
+    def parse_json_array(self, key, start, ownerId=None):
+        '''
+            PURPOSE - Parse a top-level array in a process pool, recording the span of each element
+            INPUT
+                key - Top-level key of the array
+                start - Index of the array's opening bracket in self.jCont
+                ownerId - "$id" of the top-level object, for self.jRefIndex
+            OUTPUT
+                On success, a tuple containing the parsed list and the index following the array
+                If a serial parse would be faster, None
+            NOTES
+                The elements are split into chunks of roughly equal size, parsed by
+                    parse_json_chunk(), and stitched back together in order
+                Falls back to serial (returns None) unless there are enough elements and none of
+                    them holds half the array.  Json.NET serializes each object in full the first
+                    time it's referenced, so one element often holds most of the data.
+                Values parsed in the pool aren't seen by build_node() so the index walks them
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        scanResult = None   # Result of scan_json_elements()
+        spanList = []       # Spans of the array elements
+        totalChars = 0      # Characters inside the array's elements
+        numChunks = 0       # Number of chunks to parse
+        chunkList = []      # (first element, last element) of each chunk
+        chunkStart = 0      # First element of the current chunk
+        chunkChars = 0      # Characters in the current chunk
+        elemList = []       # Parsed array
+
+        # SCAN
+        try:
+            scanResult = self.scan_json_elements(start)
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            scanResult = None
+
+        # INPUT VALIDATION
+        if scanResult is not None and 2 * self.jNumWorkers <= len(scanResult[0]):
+            spanList = scanResult[0]
+            totalChars = sum([ elemEnd - elemStart for elemStart, elemEnd in spanList ])
+            if 2 * max([ elemEnd - elemStart for elemStart, elemEnd in spanList ]) < totalChars:
+                # SPLIT INTO CHUNKS
+                numChunks = min(len(spanList), self.jNumWorkers * self.parallelChunksPerWorker)
+                for index, (elemStart, elemEnd) in enumerate(spanList):
+                    chunkChars += elemEnd - elemStart
+                    if chunkChars * numChunks >= totalChars or index == len(spanList) - 1:
+                        chunkList.append((chunkStart, index))
+                        chunkStart = index + 1
+                        chunkChars = 0
+
+                # PARSE
+                try:
+                    with ProcessPoolExecutor(max_workers=min(self.jNumWorkers, len(chunkList))) as executor:
+                        for chunk in executor.map(parse_json_chunk,
+                                                  [ self.jCont[spanList[first][0]:spanList[last][1]]
+                                                    for first, last in chunkList ]):
+                            elemList.extend(chunk)
+                except Exception as err:
+                    print(repr(err))  # DEBUGGING
+                    elemList = None
+
+                # STITCH
+                if elemList is not None and len(elemList) == len(spanList):
+                    self.jElemSpanDict[key] = spanList
+                    if self.jRefIndex is not None:
+                        self.jRefIndex.index_value(key, elemList, ownerId, elements=True)
+                    retVal = (elemList, scanResult[1])
+
+        # DONE
+        return retVal
+
+
+    def view_data(self, key):
+        '''
+            PURPOSE - Resolve a key to its data without copying values shared through self.jInternPool
+            INPUT
+                key - string representation of a key
+            OUTPUT
+                On success, the key's value
+                None if the key does not exist
+                On error, None
+            NOTES
+                The value must not be modified (see: get_data())
+                This method parses the json file if it hasn't been parsed yet
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # VERIFY FILE IS PARSED
+        if self.jDict is None and self.jSelective:
+            if isinstance(key, str) and len(key) > 0:
+                retVal = self.extract_data(key)
+        elif self.jDict is None:
+            self.parse_json_contents()
+
+        # INPUT VALIDATION
+        if self.jDict is None and self.jSelective:
+            pass
+        elif isinstance(key, str) and len(key) > 0 and self.jSuccess and isinstance(self.jDict, dict):
+            retVal = self.jDict.get(key)
+
+        # DONE
+        return retVal
+
+
+    def extract_data(self, key):
+        '''
+            PURPOSE - Parse one top-level value without parsing the rest of the json file
+            INPUT
+                key - string representation of a top-level key
+            OUTPUT
+                On success, the key's value
+                None if the key does not exist
+                On error, None
+            NOTES
+                Parsed values are cached in self.jPartDict until a full parse replaces them
+                Values parsed through self.jInternPool are shared (see: own_data())
+                self.jParseCache is not consulted since it only holds entire dictionaries
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        span = None  # (start, end) of the key's value in self.jCont
+
+        # INPUT VALIDATION
+        if not isinstance(key, str) or 0 >= len(key):
+            pass
+        elif self.jPartDict is not None and key in self.jPartDict.keys():
+            retVal = self.jPartDict[key]
+        elif self.scan_json_contents([ key ]) is True:
+            span = self.jSpanDict.get(key)
+            if span is not None:
+                try:
+                    if self.jInternPool is not None:
+                        retVal = self.jInternPool.intern_value(
+                            json.loads(self.jCont[span[0]:span[1]], object_pairs_hook = self.jInternPool.build_node))
+                    else:
+                        retVal = json.loads(self.jCont[span[0]:span[1]],
+                                            object_pairs_hook = self.lean_node if self.jLean else OrderedDict)
+                except Exception as err:
+                    print(repr(err))  # DEBUGGING
+                    self.jSuccess = False
+                    retVal = None
+                else:
+                    if self.jPartDict is None:
+                        self.jPartDict = OrderedDict()
+                    self.jPartDict[key] = retVal
+                    if self.jInternPool is not None:
+                        self.jSharedSet.add(key)
+
+        # DONE
+        return retVal
+
+
     def get_data(self, key):
         '''
             PURPOSE - Resolve a key to its data in the json dictionary
@@ -166,21 +878,32 @@ class JsonFile():
                 On error, None
             NOTES
                 This method parses the json file if it hasn't been parsed yet
+                Selective JsonFile objects only parse key (see: extract_data())
+                Values shared through self.jInternPool are copied first so callers may modify
+                    the value they get (see: own_data())
         '''
         # LOCAL VARIABLES
         retVal = None
 
         # VERIFY FILE IS PARSED
-        if self.jDict is None:
+        if self.jDict is None and self.jSelective:
+            if isinstance(key, str) and len(key) > 0:
+                retVal = self.extract_data(key)
+                if self.own_data(key):
+                    retVal = self.jDict[key] if self.jDict is not None else self.jPartDict[key]
+        elif self.jDict is None:
             self.parse_json_contents()
 
         # INPUT VALIDATION
-        if isinstance(key, str) and len(key) > 0 and self.jSuccess:
+        if self.jDict is None and self.jSelective:
+            pass
+        elif isinstance(key, str) and len(key) > 0 and self.jSuccess:
             if self.jDict:
                 try:
                     # print("ALL KEYS:\n{}".format(self.jDict.keys()))  # DEBUGGING
                     if key in self.jDict.keys():
                         try:
+                            self.own_data(key)
                             retVal = self.jDict[key]
                             # print("Key {} holds value:\t{}".format(key, retVal))  # DEBUGGING
                         except Exception as err:
@@ -214,12 +937,12 @@ class JsonFile():
         retVal = False
 
         # VERIFY FILE IS PARSED
-        if self.jDict is None:
+        if self.jDict is None and not self.jSelective:
             self.parse_json_contents()
 
         # INPUT VALIDATION
         if isinstance(key, str) and len(key) > 0 and self.jSuccess:
-            if self.get_data(key) is not None:
+            if self.view_data(key) is not None:
                 retVal = True
 
         # DONE
@@ -238,20 +961,77 @@ class JsonFile():
             NOTES
                 This method will fail if the key does not exist
                 This method parses the json file if it hasn't been parsed yet
+                Selective JsonFile objects defer the edit instead of parsing (see: self.jEditDict)
         '''
         # LOCAL VARIABLES
         retVal = False
 
         # VERIFY FILE IS PARSED
-        if self.jDict is None:
+        if self.jDict is None and not self.jSelective:
             self.parse_json_contents()
 
         # INPUT VALIDATION
         if isinstance(key, str) and len(key) > 0 and self.jSuccess:
             # Does the key exist?
-            if self.key_present(key):
+            if self.key_present(key) and self.jDict is None:
+                # Defer the edit
+                self.jPartDict[key] = newData
+                self.jSharedSet.discard(key)
+                if self.jEditDict is None:
+                    self.jEditDict = OrderedDict()
+                self.jEditDict[key] = newData
+                self.jChanged = True
+                retVal = True
+            elif self.key_present(key):
                 self.jDict[key] = newData
+                self.jSharedSet.discard(key)
                 self.jChanged = True
+                if self.jDirtyDict is not None:
+                    self.jDirtyDict[key] = None
+                self.update_ref_index(key)
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def mod_element(self, key, index, newData):
+        '''
+            PURPOSE - Modify one element of an existing top-level array in the json dictionary
+            INPUT
+                key - string representation of a key whose value is a list
+                index - Index of the element to modify
+                newData - Element's new data
+            OUTPUT
+                On succcess, True
+                On failure, False
+            NOTES
+                This method will fail if the key does not exist or the index is out of range
+                This method parses the json file if it hasn't been parsed yet
+                Only the modified elements of self.spanArrays are re-serialized by splice_json_contents()
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        dirtyVal = None  # Current value from self.jDirtyDict
+
+        # VERIFY FILE IS PARSED
+        if self.jDict is None:
+            self.parse_json_contents()
+
+        # INPUT VALIDATION
+        if isinstance(key, str) and len(key) > 0 and isinstance(index, int) and self.jSuccess:
+            # Does the element exist?
+            if self.key_present(key) and isinstance(self.jDict[key], list) \
+               and 0 <= index < len(self.jDict[key]):
+                self.own_data(key)
+                self.jDict[key][index] = newData
+                self.jChanged = True
+                self.update_ref_index(key, index)
+                if self.jDirtyDict is not None:
+                    dirtyVal = self.jDirtyDict.get(key, set())
+                    if dirtyVal is not None:
+                        dirtyVal.add(index)
+                    self.jDirtyDict[key] = dirtyVal
                 retVal = True
 
         # DONE
@@ -284,7 +1064,11 @@ class JsonFile():
             # Does the key exist?
             if not self.key_present(newKey):
                 self.jDict[newKey] = newData
+                self.jSharedSet.discard(newKey)
                 self.jChanged = True
+                if self.jDirtyDict is not None:
+                    self.jDirtyDict[newKey] = None
+                self.update_ref_index(newKey)
                 retVal = True
 
         # DONE
@@ -314,8 +1098,270 @@ class JsonFile():
         # INPUT VALIDATION
         if isinstance(oldKey, str) and len(oldKey) > 0 and self.jSuccess:
             tempVal = self.jDict.pop(oldKey, None)
+            self.jSharedSet.discard(oldKey)
             if tempVal is not None:
                 self.jChanged = True
+                self.jDirtyDict = None  # Deletions re-serialize the entire file
+                self.update_ref_index(oldKey)
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def own_data(self, key):
+        '''
+            PURPOSE - Replace a value shared through self.jInternPool with a private copy
+            INPUT
+                key - Top-level key
+            OUTPUT
+                If a copy was made, True
+                Otherwise, False
+            NOTES
+                Copy-on-write happens per top-level key, the first time get_data() hands the
+                    value out, since callers may modify what they get
+                Read-only callers can use view_data() to keep the value shared
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        valueDict = self.jDict if self.jDict is not None else self.jPartDict  # Dictionary holding key
+
+        # COPY
+        if key in self.jSharedSet and valueDict is not None and key in valueDict.keys():
+            valueDict[key] = self.jInternPool.thaw_value(valueDict[key])
+            self.jSharedSet.discard(key)
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def update_ref_index(self, key, index=None):
+        '''
+            PURPOSE - Reindex an edited top-level value in self.jRefIndex
+            INPUT
+                key - Top-level key that was modified, added, or deleted
+                index - Optional index of the modified element of key's array
+            OUTPUT
+                On success, True
+                Without an index, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INPUT VALIDATION
+        if self.jRefIndex is not None and self.jDict is not None:
+            # INVALIDATE THE OLD NODES
+            if index is None:
+                self.jRefIndex.remove_group(key)
+            else:
+                self.jRefIndex.remove_group(key, index)
+            # INDEX THE NEW NODES
+            if key in self.jDict.keys() and index is None:
+                self.jRefIndex.index_value(key, self.jDict[key], self.jRefIndex.iRootId, key in self.spanArrays)
+            elif key in self.jDict.keys():
+                self.jRefIndex.index_value(key, self.jDict[key][index], self.jRefIndex.iRootId, element=index)
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def resolve_ref(self, ref):
+        '''
+            PURPOSE - Resolve a "$ref" to the node with the matching "$id"
+            INPUT
+                ref - A { "$ref" : "2158" } node or the "$id" string it refers to
+            OUTPUT
+                On success, the referenced node
+                On failure, None
+            NOTES
+                This method parses the json file if it hasn't been parsed yet
+                Only JsonFile objects created with refIndex=True have an index
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # VERIFY FILE IS PARSED
+        if self.jDict is None and self.jRefIndex is not None:
+            self.parse_json_contents()
+
+        # RESOLVE
+        if self.jSuccess and self.jRefIndex is not None:
+            retVal = self.jRefIndex.resolve_ref(ref)
+
+        # DONE
+        return retVal
+
+
+    def find_referrers(self, refId):
+        '''
+            PURPOSE - List the nodes that reference a "$id"
+            INPUT
+                refId - "$id" string
+            OUTPUT
+                On success, a list of the "$id"s of the nodes holding a matching "$ref"
+                On failure, None
+            NOTES
+                This method parses the json file if it hasn't been parsed yet
+                Only JsonFile objects created with refIndex=True have an index
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # VERIFY FILE IS PARSED
+        if self.jDict is None and self.jRefIndex is not None:
+            self.parse_json_contents()
+
+        # FIND
+        if self.jSuccess and self.jRefIndex is not None:
+            retVal = self.jRefIndex.find_referrers(refId)
+
+        # DONE
+        return retVal
+
+
+    def renumber_ids(self):
+        '''
+            PURPOSE - Compact the "$id"s and rewrite every "$ref" after adding, removing, or
+                transplanting entities
+            OUTPUT
+                On success, a dictionary of { old "$id" : new "$id" } for every "$id" that changed
+                On failure, None
+            NOTES
+                This method parses the json file if it hasn't been parsed yet
+                Nothing is modified if any "$id" is duplicated or any "$ref" dangles
+                See: JsonRefIndex.renumber_ids()
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        refIndex = self.jRefIndex  # Index to renumber with
+
+        # VERIFY FILE IS PARSED
+        if self.jDict is None:
+            self.parse_json_contents()
+
+        # RENUMBER
+        if self.jSuccess and self.jDict is not None:
+            if refIndex is None:
+                refIndex = JsonRefIndex()
+            for key in list(self.jSharedSet):
+                self.own_data(key)
+            retVal = refIndex.renumber_ids(self.jDict)
+            if retVal:
+                self.jChanged = True
+                self.jDirtyDict = None  # Renumbering touches values throughout the file
+                self.rebuild_ref_index()
+
+        # DONE
+        return retVal
+
+
+    def splice_json_contents(self):
+        '''
+            PURPOSE - Update the raw contents with the modified values of the json dictionary
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Only the values in self.jDirtyDict are re-serialized.  The unchanged ranges of
+                    self.jCont are copied through and the spans are shifted to match.
+                If self.jDirtyDict is None the entire dictionary is re-serialized and the spans
+                    are discarded
+                A dictionary loaded from self.jParseCache reads and scans its raw contents here,
+                    without parsing them, so it can splice too
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        pieceList = []           # New contents, in order
+        newSpanDict = None       # New self.jSpanDict
+        newElemSpanDict = None   # New self.jElemSpanDict
+        pos = 0                  # Index in self.jCont of the first character not yet copied
+        delta = 0                # Difference between the old and new indices of the current position
+        newText = None           # Re-serialized value
+        elemSpanList = None      # New element spans for the current value
+        startDelta = 0           # Value of delta at the start of the current value
+        closing = 0              # Index of the top-level object's closing brace
+        separators = (',', ':')  # Json separators used by the save games
+
+        # INPUT VALIDATION
+        if self.jSuccess and self.jDict is not None:
+            try:
+                # SCAN THE RAW CONTENTS OF A CACHED DICTIONARY
+                if self.jCont is None and self.jDirtyDict is not None:
+                    if self.read_json_file() is not True or self.scan_json_contents() is not True:
+                        raise RuntimeError("Failed to scan the raw contents of {}".format(self.jName))
+                    if self.jElemSpanDict is None:
+                        self.jElemSpanDict = {}
+                # RE-SERIALIZE EVERYTHING
+                if self.jDirtyDict is None or self.jSpanDict is None or self.jScanPos is not None:
+                    self.jCont = json.dumps(self.jDict, separators=separators)
+                    self.jSpanDict = None
+                    self.jScanPos = None
+                    self.jElemSpanDict = None
+                    self.jDirtyDict = None
+                # SPLICE
+                else:
+                    newSpanDict = OrderedDict()
+                    newElemSpanDict = {}
+                    for key, span in self.jSpanDict.items():
+                        # Unchanged value
+                        if key not in self.jDirtyDict.keys():
+                            newSpanDict[key] = (span[0] + delta, span[1] + delta)
+                            if key in self.jElemSpanDict.keys():
+                                newElemSpanDict[key] = [ (elemSpan[0] + delta, elemSpan[1] + delta)
+                                                         for elemSpan in self.jElemSpanDict[key] ]
+                            continue
+                        # Modified elements
+                        if self.jDirtyDict[key] is not None and key in self.jElemSpanDict.keys() \
+                           and len(self.jElemSpanDict[key]) == len(self.jDict[key]):
+                            elemSpanList = []
+                            startDelta = delta
+                            for index, elemSpan in enumerate(self.jElemSpanDict[key]):
+                                if index in self.jDirtyDict[key]:
+                                    pieceList.append(self.jCont[pos:elemSpan[0]])
+                                    newText = json.dumps(self.jDict[key][index], separators=separators)
+                                    pieceList.append(newText)
+                                    elemSpanList.append((elemSpan[0] + delta, elemSpan[0] + delta + len(newText)))
+                                    delta += len(newText) - (elemSpan[1] - elemSpan[0])
+                                    pos = elemSpan[1]
+                                else:
+                                    elemSpanList.append((elemSpan[0] + delta, elemSpan[1] + delta))
+                            newSpanDict[key] = (span[0] + startDelta, span[1] + delta)
+                            newElemSpanDict[key] = elemSpanList
+                        # Modified value
+                        else:
+                            pieceList.append(self.jCont[pos:span[0]])
+                            newText = json.dumps(self.jDict[key], separators=separators)
+                            pieceList.append(newText)
+                            newSpanDict[key] = (span[0] + delta, span[0] + delta + len(newText))
+                            delta += len(newText) - (span[1] - span[0])
+                            pos = span[1]
+                    # Added values
+                    closing = self.jCont.rindex("}")
+                    for key in self.jDirtyDict.keys():
+                        if key not in self.jSpanDict.keys():
+                            pieceList.append(self.jCont[pos:closing])
+                            pos = closing
+                            if len(newSpanDict) > 0:
+                                pieceList.append(",")
+                                delta += 1
+                            newText = json.dumps(key) + ":"
+                            pieceList.append(newText)
+                            delta += len(newText)
+                            newText = json.dumps(self.jDict[key], separators=separators)
+                            pieceList.append(newText)
+                            newSpanDict[key] = (closing + delta, closing + delta + len(newText))
+                            delta += len(newText)
+                    pieceList.append(self.jCont[pos:])
+                    self.jCont = "".join(pieceList)
+                    self.jSpanDict = newSpanDict
+                    self.jElemSpanDict = newElemSpanDict
+                    self.jDirtyDict = OrderedDict()
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.jSuccess = False
+            else:
                 retVal = True
 
         # DONE
@@ -330,14 +1376,32 @@ class JsonFile():
                 On failure, False
             NOTES
                 No file I/O will take place unless data has been modified
+                In-memory JsonFile objects update self.jBuffer instead of the file
+                Only modified values are re-serialized (see: splice_json_contents())
         '''
         # LOCAL VARIABLES
         retVal = False
+
+        # UPDATE RAW CONTENTS
+        if self.jSuccess and self.jChanged and self.jDict is not None:
+            self.splice_json_contents()
         
         # INPUT VALIDATION
         if self.jSuccess:
+            # STREAM DEFERRED EDITS
+            if self.jChanged and self.jDict is None and self.jEditDict is not None:
+                retVal = self.rewrite_json_file()
+            # OVERWRITE BUFFER
+            elif self.jInMemory and self.jChanged and self.jDict is not None:
+                try:
+                    self.jBuffer = codecs.BOM_UTF8 + self.jCont.encode("utf-8")
+                except Exception as err:
+                    print(repr(err))  # DEBUGGING
+                    self.jSuccess = False
+                else:
+                    retVal = True
             # OVERWRITE FILE
-            if self.jChanged and self.jDict is not None:
+            elif self.jChanged and self.jDict is not None:
                 try:
                     ######## DO I NEED MORE ENCODING HERE?!?! ########
                     # with io.open(os.path.join(self.jPath, self.jName), "w") as outFile:
@@ -362,7 +1426,10 @@ class JsonFile():
                         # outFile.write(self.jCont)
 
                         # Attempt #? - Ordered Dictionary
-                        json.dump(self.jDict, outFile, separators=(',', ':'))
+                        # json.dump(self.jDict, outFile, separators=(',', ':'))
+
+                        # Splice modified values into the raw contents
+                        outFile.write(self.jCont)
 
                 except Exception as err:
                     print(repr(err))  # DEBUGGING
@@ -371,11 +1438,116 @@ class JsonFile():
                     retVal = True
             else:
                 retVal = True  # No change made but everything is good
+
+            # FORGET THE CACHE KEY
+            if retVal is True and self.jChanged:
+                self.jParseCache = None  # The cache key no longer matches the raw contents
+                self.jCacheKey = None
                 
         # DONE
         return retVal        
 
     
+    def rewrite_json_file(self, inStream=None, outStream=None):
+        '''
+            PURPOSE - Apply the deferred edits by streaming the raw file into a new one
+            INPUT
+                inStream - Optional binary stream of the raw contents (e.g., the original zip member)
+                outStream - Optional writable binary stream for the new contents (e.g., RawZipFile)
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Without streams, the file (or self.jBuffer) is rewritten and the deferred edits are
+                    cleared.  With streams, the caller calls reset_json_contents() once the new
+                    contents are safely stored.
+                Nothing is parsed into a dictionary (see: JsonEventReader.rewrite_events())
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        editDict = None     # { path tuple : new value } of the deferred edits
+        tmpFileName = None  # Write the new file here first
+        outBuffer = None    # New contents of an in-memory JsonFile
+
+        # INPUT VALIDATION
+        if not self.jSuccess or self.jEditDict is None:
+            pass
+        elif (inStream is None) != (outStream is None):
+            # print("JsonFile.rewrite_json_file():	Both streams are required")  # DEBUGGING
+            pass
+        else:
+            editDict = OrderedDict([ ((key,), value) for key, value in self.jEditDict.items() ])
+            try:
+                # CALLER'S STREAMS
+                if inStream is not None:
+                    retVal = JsonEventReader(inStream).rewrite_events(outStream, editDict)
+                # IN-MEMORY BUFFER
+                elif self.jInMemory:
+                    if self.jBuffer is None and self.jLoader is not None:
+                        self.jBuffer = self.jLoader()
+                    outBuffer = io.BytesIO()
+                    retVal = JsonEventReader(io.BytesIO(self.jBuffer)).rewrite_events(outBuffer, editDict)
+                    if retVal is True:
+                        self.jBuffer = outBuffer.getvalue()
+                        self.jLoader = None
+                # FILE
+                else:
+                    tmpFileName = os.path.join(self.jPath, self.jName) + ".tmp"
+                    with open(os.path.join(self.jPath, self.jName), "rb") as inFile:
+                        with open(tmpFileName, "wb") as outFile:
+                            retVal = JsonEventReader(inFile).rewrite_events(outFile, editDict)
+                    if retVal is True:
+                        os.replace(tmpFileName, os.path.join(self.jPath, self.jName))
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = False
+            finally:
+                if tmpFileName is not None and os.path.exists(tmpFileName):
+                    os.remove(tmpFileName)
+
+            # DONE
+            if retVal is not True:
+                self.jSuccess = False
+            elif inStream is None:
+                self.jEditDict = None
+                self.jCont = None
+                self.jSpanDict = None
+                self.jScanPos = None
+
+        # DONE
+        return retVal
+
+
+    def reset_json_contents(self):
+        '''
+            PURPOSE - Discard the raw contents and deferred edits once they've been written elsewhere
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Lazy in-memory JsonFile objects reread their raw contents from self.jLoader
+                Values already parsed by extract_data() are kept since they match the new contents
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        if self.jSuccess and self.jDict is None:
+            self.jEditDict = None
+            self.jChanged = False
+            self.jParseCache = None  # The cache key no longer matches the raw contents
+            self.jCacheKey = None
+            self.jCont = None
+            self.jSpanDict = None
+            self.jScanPos = None
+            if self.jLoader is not None:
+                self.jBuffer = None
+            retVal = True
+
+        # DONE
+        return retVal
+
+
     def close_json_file(self):
         '''
             PURPOSE - Clear out all class attributes without saving
@@ -393,6 +1565,25 @@ class JsonFile():
             self.jCont = None
             self.jDict = None
             self.jSuccess = True
+            self.jInMemory = False
+            self.jBuffer = None
+            self.jLoader = None
+            self.jSelective = False
+            self.jSpanDict = None
+            self.jScanPos = None
+            self.jPartDict = None
+            self.jElemSpanDict = None
+            self.jDirtyDict = None
+            self.jEditDict = None
+            self.jLean = False
+            self.jParseCache = None
+            self.jCacheKey = None
+            self.jNumWorkers = None
+            self.jInternPool = None
+            self.jSharedSet = set()
+            if self.jRefIndex is not None:
+                self.jRefIndex.close_ref_index()
+            self.jRefIndex = None
         except Exception as err:
             print(repr(err))  # DEBUGGING
             retVal = False
@@ -1,4 +1,7 @@
 from json_file_class import JsonFile
+import codecs
+import json
+import mmap
 import os
 import unittest
 
@@ -385,5 +388,98 @@ class Json_File_Class_Test_Special(Json_File_Class_Tests):
             self.assertTrue(test.get_data(key) == modThese[key])
 
 
+
+    def test_Special_07_Selective_Get_Without_Parse(self):
+        inFilename = os.path.join("Test_Files", "Json_File_Class_Test_Special07.json")
+        getThese = { "GameName" : "Yuhra Thorne", "QuickSaveNumber" : 0 }
+        self.create_file(inFilename, self.defFileContent)
+        test = JsonFile(inFilename, selective=True)
+        # Get without parse
+        for key in getThese.keys():
+            self.assertTrue(test.get_data(key) == getThese[key])
+        self.assertIsNone(test.jDict)
+        self.assertFalse(test.key_present("Missing Key"))
+        # Mod is deferred until the write
+        self.assertTrue(test.mod_data("QuickSaveNumber", 1))
+        self.assertTrue(test.get_data("QuickSaveNumber") == 1)
+        self.assertTrue(test.get_data("GameName") == getThese["GameName"])
+        self.assertIsNone(test.jDict)
+        self.assertTrue(test.write_json_file())
+        self.assertTrue(test.close_json_file())
+        test = JsonFile(inFilename)
+        self.assertTrue(test.get_data("QuickSaveNumber") == 1)
+        self.assertTrue(test.get_data("GameName") == getThese["GameName"])
+
+
+
+    def test_Special_08_Splice_Write(self):
+        inFilename = os.path.join("Test_Files", "Json_File_Class_Test_Special08.json")
+        self.create_file(inFilename, self.defFileContent)
+        test = JsonFile(inFilename)
+        self.assertTrue(test.parse_json_contents())
+        origCont = test.jCont
+        # Only the modified value is re-serialized
+        self.assertTrue(test.mod_data("QuickSaveNumber", 10))
+        self.assertTrue(test.write_json_file())
+        self.assertTrue(test.jCont == origCont.replace('"QuickSaveNumber":0', '"QuickSaveNumber":10'))
+        self.assertTrue(test.close_json_file())
+        test = JsonFile(inFilename)
+        self.assertTrue(test.get_data("QuickSaveNumber") == 10)
+
+
+    def test_Special_09_Lean_Parse(self):
+        inFilename = os.path.join("Test_Files", "Json_File_Class_Test_Special09.json")
+        self.create_file(inFilename, self.defFileContent)
+        default = JsonFile(inFilename)
+        self.assertTrue(default.parse_json_contents())
+        test = JsonFile(inFilename, lean=True)
+        self.assertTrue(test.parse_json_contents())
+        # Same data in the same order, without the raw contents
+        self.assertTrue(test.jDict == default.jDict)
+        self.assertTrue(list(test.jDict.keys()) == list(default.jDict.keys()))
+        self.assertTrue(test.jCont is None)
+        self.assertTrue(test.mod_data("QuickSaveNumber", 10))
+        self.assertTrue(test.write_json_file())
+        self.assertTrue(test.close_json_file())
+        test = JsonFile(inFilename)
+        self.assertTrue(test.get_data("QuickSaveNumber") == 10)
+        self.assertTrue(test.get_data("GameName") == default.get_data("GameName"))
+
+
+
+    def test_Special_10_Bytes_Like_Contents(self):
+        inFilename = os.path.join("Test_Files", "Json_File_Class_Test_Special10.json")
+        self.create_file(inFilename, self.defFileContent)
+        expected = JsonFile(inFilename)
+        self.assertTrue(expected.parse_json_contents())
+        rawData = self.defFileContent.lstrip("\ufeff").encode("utf-8")
+        # The BOM is optional and any bytes-like object will do
+        for contents in [ rawData, codecs.BOM_UTF8 + rawData, bytearray(rawData),
+                          memoryview(codecs.BOM_UTF8 + rawData) ]:
+            test = JsonFile(inFilename, contents)
+            self.assertTrue(test.read_json_file())
+            self.assertTrue(test.jCont == expected.jCont)
+        with open(inFilename, "rb") as inFile:
+            with mmap.mmap(inFile.fileno(), 0, access=mmap.ACCESS_READ) as inMap:
+                test = JsonFile(inFilename, inMap)
+                self.assertTrue(test.parse_json_contents())
+                self.assertTrue(test.jDict == expected.jDict)
+
+
+    def test_Special_11_Parallel_Parse(self):
+        elemList = [ { "$id" : str(num), "Text" : "]}[{\"" * num, "List" : [ num, [ {} ] ] } for num in range(2, 10) ]
+        contents = json.dumps({ "$id" : "1", "m_EntityData" : elemList, "Last" : [] }).encode("utf-8")
+        expected = JsonFile("party.json", contents)
+        self.assertTrue(expected.parse_json_contents())
+        test = JsonFile("party.json", contents, numWorkers=2)
+        test.parallelMinChars = 0
+        self.assertTrue(test.parse_json_contents())
+        self.assertTrue(test.jDict == expected.jDict)
+        self.assertTrue(test.jElemSpanDict == expected.jElemSpanDict)
+        # One dominant element falls back to a serial parse
+        self.assertTrue(test.parse_json_array("m_EntityData", test.jCont.index("[")) is not None)
+        test.jCont = test.jCont.replace('"$id": "9"', '"$id": "9", "Big": "{}"'.replace("{}", "x" * 10000))
+        self.assertTrue(test.parse_json_array("m_EntityData", test.jCont.index("[")) is None)
+
 if __name__ == "__main__":
     unittest.main(verbosity = 2, exit = False)
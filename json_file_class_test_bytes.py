@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from json_file_class import JsonFile
+import codecs
+import json
+import mmap
+import os
+import sys
+import timeit
+
+
+def read_stream_reader(jsonFile):
+    '''
+        PURPOSE - Read a json file the way JsonFile used to (codecs stream reader)
+    '''
+    with codecs.open(jsonFile, "r", "utf-8-sig") as inFile:
+        return inFile.read()
+
+
+def read_json_file(jsonFile):
+    '''
+        PURPOSE - Read a json file from disk using JsonFile.read_json_file()
+    '''
+    jsonFileObj = JsonFile(jsonFile)
+    jsonFileObj.read_json_file()
+    return jsonFileObj.jCont
+
+
+def read_bytes(rawData):
+    '''
+        PURPOSE - Read an in-memory json file from a bytes buffer (e.g., a zip member)
+    '''
+    jsonFileObj = JsonFile("party.json", rawData)
+    jsonFileObj.read_json_file()
+    return jsonFileObj.jCont
+
+
+def read_mmap(jsonFile):
+    '''
+        PURPOSE - Read an in-memory json file from a memory map
+    '''
+    with open(jsonFile, "rb") as inFile:
+        with mmap.mmap(inFile.fileno(), 0, access=mmap.ACCESS_READ) as inMap:
+            return read_bytes(inMap)
+
+
+def time_it(func, numRuns):
+    '''
+        PURPOSE - Best average time of func, in milliseconds
+    '''
+    return min(timeit.repeat(func, number=numRuns, repeat=5)) / numRuns * 1000
+
+
+def main():
+    # LOCAL VARIABLES
+    jsonFile = os.path.join(os.getcwd(), "Test_Files", "Linux", "party.json")
+    numRuns = 20   # Runs per timing
+    rawData = b""  # Raw contents of jsonFile
+
+    # OPTIONAL ARGUMENTS
+    if len(sys.argv) > 1:
+        jsonFile = sys.argv[1]
+    with open(jsonFile, "rb") as inFile:
+        rawData = inFile.read()
+
+    # VERIFY
+    if not read_stream_reader(jsonFile) == read_json_file(jsonFile) == read_bytes(rawData) == read_mmap(jsonFile):
+        raise RuntimeError("Decoded contents differ")
+
+    # REPORT
+    print("{} ({:,} bytes)".format(jsonFile, len(rawData)))
+    print("READ")
+    print("  codecs stream reader:\t{:8.3f} ms".format(time_it(lambda: read_stream_reader(jsonFile), numRuns)))
+    print("  read_json_file():    \t{:8.3f} ms".format(time_it(lambda: read_json_file(jsonFile), numRuns)))
+    print("  in-memory bytes:     \t{:8.3f} ms".format(time_it(lambda: read_bytes(rawData), numRuns)))
+    print("  in-memory mmap:      \t{:8.3f} ms".format(time_it(lambda: read_mmap(jsonFile), numRuns)))
+    print("READ AND PARSE")
+    print("  codecs + json.loads: \t{:8.3f} ms".format(time_it(lambda: json.loads(read_stream_reader(jsonFile),
+                                                                              object_pairs_hook=OrderedDict), 5)))
+    print("  parse_json_contents():\t{:8.3f} ms".format(time_it(lambda: JsonFile(jsonFile).parse_json_contents(), 5)))
+
+
+if __name__ == "__main__":
+    main()
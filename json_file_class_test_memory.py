@@ -0,0 +1,94 @@
+from json_file_class import JsonFile
+from json_intern_pool_class import JsonInternPool
+import gc
+import os
+import sys
+import tracemalloc
+
+
+def load_save(saveDir, lean, internPool=None):
+    '''
+        PURPOSE - Load and parse every json file of an unpacked save game
+        INPUT
+            saveDir - Directory holding the save game's json files
+            lean - Passed to JsonFile
+            internPool - Optional JsonInternPool passed to JsonFile
+        OUTPUT
+            List of parsed JsonFile objects
+    '''
+    # LOCAL VARIABLES
+    retVal = []
+    jsonFileObj = None  # Current JsonFile object
+
+    # LOAD
+    for jsonName in [ "header.json", "party.json", "player.json" ]:
+        jsonFileObj = JsonFile(os.path.join(saveDir, jsonName), lean=lean, internPool=internPool)
+        if jsonFileObj.parse_json_contents() is not True:
+            raise RuntimeError("Failed to parse {}".format(jsonName))
+        retVal.append(jsonFileObj)
+
+    # DONE
+    return retVal
+
+
+def measure_saves(saveDir, numSaves, lean, shared=False):
+    '''
+        PURPOSE - Measure the memory held by side-by-side copies of a save game
+        INPUT
+            saveDir - Directory holding the save game's json files
+            numSaves - Number of copies to hold at once
+            lean - Passed to JsonFile
+            shared - Optional; if True, all copies share one JsonInternPool
+        OUTPUT
+            Bytes held per loaded save
+    '''
+    # LOCAL VARIABLES
+    retVal = 0
+    saveList = []      # Loaded saves
+    baseline = 0       # Traced bytes before loading
+    internPool = None  # JsonInternPool shared by all copies
+
+    # MEASURE
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        if shared:
+            internPool = JsonInternPool()
+        for _ in range(numSaves):
+            saveList.append(load_save(saveDir, lean, internPool))
+        gc.collect()
+        retVal = (tracemalloc.get_traced_memory()[0] - baseline) // numSaves
+    finally:
+        tracemalloc.stop()
+
+    # DONE
+    return retVal
+
+
+def main():
+    # LOCAL VARIABLES
+    saveDir = os.path.join(os.getcwd(), "Test_Files", "Linux")
+    numSaves = 5       # Number of saves held side by side
+    defaultBytes = 0   # Bytes per save using the default parse
+    leanBytes = 0      # Bytes per save using the lean parse
+    sharedBytes = 0    # Bytes per save using a shared JsonInternPool
+
+    # OPTIONAL ARGUMENTS
+    if len(sys.argv) > 1:
+        numSaves = int(sys.argv[1])
+
+    # REPORT
+    defaultBytes = measure_saves(saveDir, numSaves, False)
+    leanBytes = measure_saves(saveDir, numSaves, True)
+    sharedBytes = measure_saves(saveDir, numSaves, False, shared=True)
+    print("Saves loaded side by side:\t{}".format(numSaves))
+    print("Default parse:\t{:>12,} bytes per save".format(defaultBytes))
+    print("Lean parse:\t{:>12,} bytes per save".format(leanBytes))
+    print("Savings:\t{:>12.1%}".format(1 - leanBytes / defaultBytes))
+    print("Shared parse:\t{:>12,} bytes per save".format(sharedBytes))
+    print("Savings:\t{:>12.1%}".format(1 - sharedBytes / defaultBytes))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from json_merkle_tree_class import JsonMerkleTree
 import codecs
 import io
 import json
@@ -252,6 +253,11 @@ def main():
     # print("Original Size: {}".format(len(remOrigContent)))
     # print("Broken Size:   {}".format(len(remBrknContent)))
 
+    # Attempt #6 - Merkle hashes
+    # Only walks the subtrees whose hashes differ, instead of rescanning braces
+    for path, change in JsonMerkleTree(origOrdDict).diff_trees(JsonMerkleTree(brknOrdDict)):
+        print("{}:\t{}".format(change.upper(), path))
+
     # BONUS ROUND
     # test1 = '"$id":"3466"'
     # test2 = '"$id":"3467"'
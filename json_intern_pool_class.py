@@ -0,0 +1,248 @@
+from collections import OrderedDict
+
+
+class JsonInternPool():
+    '''
+        PURPOSE - Share identical json subtrees between parsed json files (hash-consing)
+        USAGE
+            1. internPool = JsonInternPool()
+            2. jsonDict = json.loads(rawJson, object_pairs_hook=internPool.build_node)
+            3. [parse more json files with the same internPool]
+            4. privateValue = internPool.thaw_value(jsonDict["Kingdom"])
+            5. internPool.close_intern_pool()
+        NOTES
+            [X] internPool = JsonInternPool()                   # Instantiates a JsonInternPool object
+            [X] internPool.build_node(pairs)                    # object_pairs_hook that returns a shared object
+            [X] internPool.intern_value(value)                  # Shares a value the decoder built without the hook
+            [X] internPool.thaw_value(value)                    # Private, mutable deep copy of a shared value
+            [X] internPool.close_intern_pool()                  # Zeroizes all data
+            SHARING
+                Objects and arrays are looked up by their keys and the identity of their (already
+                    shared) children, so each node is hashed once, bottom-up, while parsing
+                Strings are shared too
+                Shared values must never be modified.  Copy them with thaw_value() first.
+                The pool keeps every shared value alive until close_intern_pool()
+    '''
+
+
+    def __init__(self, nodeHook=OrderedDict):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                nodeHook - Optional callable that builds a json object from its (key, value) pairs
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_intern_pool()
+        '''
+        # CLASS ATTRIBUTES
+        self.hNodeDict = {}        # Store the { structural hash : shared node } here
+        self.hCollisionDict = {}   # Store the { structural hash : [ more shared nodes ] } of hash collisions here
+        self.hStrDict = {}         # Store the { string : shared string } here
+        self.hNodeHook = nodeHook  # Builds each json object from its (key, value) pairs
+        self.hNumHits = 0          # Number of nodes replaced by a shared node
+
+
+    def build_node(self, pairs):
+        '''
+            PURPOSE - Build a json object and replace it with its shared copy (use as the json
+                object_pairs_hook)
+            INPUT
+                pairs - List of (key, value) pairs from the json decoder
+            OUTPUT
+                The shared json object
+            NOTES
+                The decoder builds objects bottom-up so child objects are already shared.  Arrays
+                    don't get a hook so they're shared here.
+        '''
+        # LOCAL VARIABLES
+        strDict = self.hStrDict  # Shared strings
+        sharedList = []          # (key, shared value) pairs
+
+        # SHARE THE VALUES
+        for key, value in pairs:
+            if isinstance(value, str):
+                value = strDict.setdefault(value, value)
+            elif isinstance(value, list):
+                value = self.intern_value(value)
+            sharedList.append((strDict.setdefault(key, key), value))
+
+        # DONE
+        return self.share_node(self.hNodeHook(sharedList))
+
+
+    def intern_value(self, value):
+        '''
+            PURPOSE - Replace a json value with its shared copy
+            INPUT
+                value - Json value whose objects were built by build_node()
+            OUTPUT
+                The shared value
+        '''
+        # LOCAL VARIABLES
+        retVal = value
+
+        # SHARE
+        if isinstance(value, str):
+            retVal = self.hStrDict.setdefault(value, value)
+        elif isinstance(value, list):
+            for index, entry in enumerate(value):
+                if isinstance(entry, (str, list)):
+                    value[index] = self.intern_value(entry)
+            retVal = self.share_node(value)
+
+        # DONE
+        return retVal
+
+
+    def share_node(self, node):
+        '''
+            PURPOSE - Look up the shared copy of an object or array whose children are shared
+            INPUT
+                node - Json object or array
+            OUTPUT
+                The shared copy of node (node itself if it's the first of its kind)
+        '''
+        # LOCAL VARIABLES
+        retVal = node
+        nodeHash = 0       # Structural hash of node
+        candidate = None   # Shared node with the same hash
+        bucketList = None  # More shared nodes with the same hash
+
+        # HASH
+        if isinstance(node, dict):
+            nodeHash = hash((tuple(node.keys()), tuple([ self.value_token(value) for value in node.values() ])))
+        else:
+            nodeHash = hash((None, tuple([ self.value_token(value) for value in node ])))
+
+        # LOOK UP
+        candidate = self.hNodeDict.get(nodeHash)
+        if candidate is None:
+            self.hNodeDict[nodeHash] = node
+        elif self.same_node(candidate, node):
+            retVal = candidate
+        else:
+            bucketList = self.hCollisionDict.setdefault(nodeHash, [])
+            for entry in bucketList:
+                if self.same_node(entry, node):
+                    retVal = entry
+                    break
+            else:
+                bucketList.append(node)
+        if retVal is not node:
+            self.hNumHits += 1
+
+        # DONE
+        return retVal
+
+
+    def value_token(self, value):
+        '''
+            PURPOSE - Stand-in for a shared child when hashing its parent
+            INPUT
+                value - Json value
+            OUTPUT
+                The identity of shared objects and arrays, or the (type, value) of anything else
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # TOKENIZE
+        if isinstance(value, (dict, list)):
+            retVal = id(value)
+        else:
+            retVal = (type(value), value)  # 1, 1.0, and True hash alike
+
+        # DONE
+        return retVal
+
+
+    def same_node(self, sharedNode, node):
+        '''
+            PURPOSE - Compare two objects or arrays whose children are shared
+            INPUT
+                sharedNode - Shared json object or array
+                node - New json object or array
+            OUTPUT
+                If they match, True
+                Otherwise, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        sharedValues = None  # Values of sharedNode
+        newValues = None     # Values of node
+
+        # INPUT VALIDATION
+        if type(sharedNode) is type(node) and len(sharedNode) == len(node):
+            if isinstance(node, dict):
+                if list(sharedNode.keys()) == list(node.keys()):
+                    sharedValues = sharedNode.values()
+                    newValues = node.values()
+            else:
+                sharedValues = sharedNode
+                newValues = node
+
+            # COMPARE
+            if newValues is not None:
+                retVal = True
+                for sharedValue, newValue in zip(sharedValues, newValues):
+                    if isinstance(newValue, (dict, list)):
+                        if sharedValue is not newValue:
+                            retVal = False
+                            break
+                    elif type(sharedValue) is not type(newValue) or sharedValue != newValue:
+                        retVal = False
+                        break
+
+        # DONE
+        return retVal
+
+
+    def thaw_value(self, value):
+        '''
+            PURPOSE - Copy a shared json value so it can be modified
+            INPUT
+                value - Shared json value
+            OUTPUT
+                A deep copy of every object and array in value
+            NOTES
+                Strings and numbers are immutable so they stay shared
+        '''
+        # LOCAL VARIABLES
+        retVal = value
+
+        # COPY
+        if isinstance(value, dict):
+            retVal = type(value)([ (key, self.thaw_value(entry) if isinstance(entry, (dict, list)) else entry)
+                                   for key, entry in value.items() ])
+        elif isinstance(value, list):
+            retVal = [ self.thaw_value(entry) if isinstance(entry, (dict, list)) else entry for entry in value ]
+
+        # DONE
+        return retVal
+
+
+    def close_intern_pool(self):
+        '''
+            PURPOSE - Clear out all class attributes
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        try:
+            self.hNodeDict = {}
+            self.hCollisionDict = {}
+            self.hStrDict = {}
+            self.hNodeHook = OrderedDict
+            self.hNumHits = 0
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = False
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
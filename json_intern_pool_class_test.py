@@ -0,0 +1,99 @@
+from json_file_class import JsonFile
+from json_intern_pool_class import JsonInternPool
+import json
+import os
+import unittest
+
+
+class Json_Intern_Pool_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.test = JsonInternPool()
+        with open(os.path.join("Test_Files", "Linux", "party.json"), "rb") as inFile:
+            self.rawParty = inFile.read()
+
+
+    def tearDown(self):
+        self.test.close_intern_pool()
+
+
+    def load_json(self, rawJson):
+        return json.loads(rawJson, object_pairs_hook=self.test.build_node)
+
+
+    def load_party(self):
+        jsonFileObj = JsonFile("party.json", lambda: self.rawParty, internPool=self.test)
+        self.assertTrue(jsonFileObj.parse_json_contents())
+        return jsonFileObj
+
+
+class Json_Intern_Pool_Class_Test_Normal(Json_Intern_Pool_Class_Tests):
+
+
+    def test_Normal_01_Shared_Subtrees(self):
+        firstDict = self.load_json('{"a":{"b":[1,2,{"c":"d"}]},"e":{"b":[1,2,{"c":"d"}]}}')
+        secondDict = self.load_json('{"f":{"b":[1,2,{"c":"d"}]}}')
+        self.assertIs(firstDict["a"], firstDict["e"])
+        self.assertIs(firstDict["a"], secondDict["f"])
+        self.assertEqual(secondDict, { "f": { "b": [ 1, 2, { "c": "d" } ] } })
+
+
+    def test_Normal_02_Thaw(self):
+        sharedDict = self.load_json('{"a":{"b":[1,{"c":"d"}]}}')
+        privateDict = self.test.thaw_value(sharedDict)
+        self.assertEqual(privateDict, sharedDict)
+        self.assertIsNot(privateDict["a"], sharedDict["a"])
+        self.assertIsNot(privateDict["a"]["b"][1], sharedDict["a"]["b"][1])
+        self.assertIs(type(privateDict["a"]), type(sharedDict["a"]))
+
+
+    def test_Normal_03_Copy_On_Write(self):
+        firstSave = self.load_party()
+        secondSave = self.load_party()
+        self.assertIs(firstSave.jDict["m_EntityData"], secondSave.jDict["m_EntityData"])
+        entityList = firstSave.get_data("m_EntityData")
+        entityList[0]["Edited"] = True
+        self.assertTrue(firstSave.mod_data("m_EntityData", entityList))
+        self.assertNotIn("Edited", secondSave.get_data("m_EntityData")[0])
+        self.assertTrue(secondSave.mod_element("m_EntityData", 1, { "Replaced": True }))
+        self.assertNotEqual(firstSave.get_data("m_EntityData")[1], { "Replaced": True })
+        self.assertEqual(json.loads(self.rawParty.decode("utf-8-sig"))["m_EntityData"][2],
+                         secondSave.get_data("m_EntityData")[2])
+
+
+    def test_Normal_04_Selective_View(self):
+        firstSave = JsonFile("party.json", lambda: self.rawParty, selective=True, internPool=self.test)
+        secondSave = JsonFile("party.json", lambda: self.rawParty, selective=True, internPool=self.test)
+        self.assertIs(firstSave.view_data("m_EntityData"), secondSave.view_data("m_EntityData"))
+        self.assertIsNot(firstSave.get_data("m_EntityData"), secondSave.view_data("m_EntityData"))
+        self.assertIs(firstSave.get_data("m_EntityData"), firstSave.view_data("m_EntityData"))
+
+
+class Json_Intern_Pool_Class_Test_Error(Json_Intern_Pool_Class_Tests):
+
+
+    def test_Error_01_Distinct_Scalars(self):
+        sharedDict = self.load_json('{"a":{"v":1},"b":{"v":1.0},"c":{"v":true},"d":{"v":1}}')
+        self.assertIsNot(sharedDict["a"], sharedDict["b"])
+        self.assertIsNot(sharedDict["a"], sharedDict["c"])
+        self.assertIs(sharedDict["a"], sharedDict["d"])
+        self.assertIs(type(sharedDict["c"]["v"]), bool)
+
+
+    def test_Error_02_Distinct_Containers(self):
+        sharedDict = self.load_json('{"a":{"v":[]},"b":{"v":{}},"c":{"w":[]},"d":[[1],[1.0]]}')
+        self.assertIsNot(sharedDict["a"], sharedDict["b"])
+        self.assertIsNot(sharedDict["a"], sharedDict["c"])
+        self.assertIsNot(sharedDict["d"][0], sharedDict["d"][1])
+
+
+    def test_Error_03_Ref_Index_Wins(self):
+        jsonFileObj = JsonFile("party.json", lambda: self.rawParty, refIndex=True, internPool=self.test)
+        self.assertIsNone(jsonFileObj.jInternPool)
+        self.assertTrue(jsonFileObj.parse_json_contents())
+        self.assertEqual(0, len(self.test.hNodeDict))
+
+
+if __name__ == "__main__":
+    unittest.main()
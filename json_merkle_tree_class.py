@@ -0,0 +1,392 @@
+from collections import OrderedDict
+import hashlib
+import json
+import zlib
+
+
+class JsonMerkleTree():
+    '''
+        PURPOSE - Hash every object and array of a parsed json file so two json files can be compared
+            by walking only the subtrees that differ
+        USAGE
+            1. oldTree = JsonMerkleTree(oldJsonDict)
+            2. newTree = JsonMerkleTree(newJsonDict)
+            3. oldTree.diff_trees(newTree)  # [ (("m_EntityData", 0, "Gold"), "changed") ]
+            4. blob = newTree.dump_tree()   # Persist blob (see: SaveCatalog.store_merkle_tree())
+            5. newTree.close_merkle_tree()
+        NOTES
+            [X] merkleTree = JsonMerkleTree(value)           # Instantiates a JsonMerkleTree object
+            [X] merkleTree.build_tree(value)                 # Hashes a json value bottom-up in one pass
+            [X] merkleTree.hash_scalar(value)                # Digest of a string, number, boolean, or null
+            [X] merkleTree.root_hash()                       # Hex digest of the whole json value
+            [X] merkleTree.get_node(path)                    # Node of the subtree at path
+            [X] merkleTree.diff_trees(otherTree)             # Lists the paths that differ in otherTree
+            [X] merkleTree.dump_tree(maxDepth)               # Serializes the top maxDepth levels
+            [X] merkleTree.load_tree(blob)                   # Deserializes dump_tree()
+            [X] merkleTree.close_merkle_tree()               # Zeroizes all data
+            NODES
+                Strings, numbers, booleans, and null are stored as their digest
+                Objects and arrays are stored as a tuple of (digest, OrderedDict or list of child nodes)
+                Objects are hashed in key order, so reordered keys are a change
+                Children deeper than the dump_tree() maxDepth are stored as bare digests.  Diffs
+                    report such subtrees whole since there's nothing below them to walk.
+            PATHS
+                A path is a tuple of the keys and array indices from the top-level value down
+                Arrays are compared index by index (see: JsonDiff to align entities)
+    '''
+    # CLASS ATTRIBUTES
+    hashFunc = hashlib.sha1                                 # Digest of each node
+    scalarEncoder = json.JSONEncoder(ensure_ascii=False)    # 1, 1.0, and true encode differently
+    persistDepth = 3                                        # Default levels kept by dump_tree()
+
+
+    def __init__(self, value=None):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                value - Optional json value to hash (see: build_tree())
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_merkle_tree()
+        '''
+        # CLASS ATTRIBUTES
+        self.mRoot = None  # Root node (see: NODES)
+
+        # INPUT VALIDATION
+        if value is not None:
+            self.build_tree(value)
+
+
+    def build_tree(self, value):
+        '''
+            PURPOSE - Hash a json value bottom-up in one pass
+            INPUT
+                value - Json value (e.g., a parsed json file)
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Iterative so deeply nested saves can't exhaust the recursion limit
+                A container that appears more than once (e.g., shared by JsonInternPool) is hashed once
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        stackList = [ (value, False) ]  # (container, children hashed?) left to walk, last in first out
+        nodeDict = {}          # { id(container) : node }
+        entry = None           # Current container
+        ready = False          # True if the current container's children are hashed
+        hasher = None          # Hash object of the current container
+        childDict = None       # Child nodes of the current object
+        childList = None       # Child nodes of the current array
+        childNode = None       # Node of the current child
+
+        # WALK
+        try:
+            if not isinstance(value, (dict, list)):
+                self.mRoot = self.hash_scalar(value)
+            else:
+                while stackList:
+                    entry, ready = stackList.pop()
+                    if not ready:
+                        # HASH CHILDREN BEFORE THEIR PARENTS
+                        if id(entry) not in nodeDict:
+                            nodeDict[id(entry)] = None
+                            stackList.append((entry, True))
+                            stackList.extend([ (child, False) for child in (entry.values() if isinstance(entry, dict)
+                                                                            else entry)
+                                               if isinstance(child, (dict, list)) and id(child) not in nodeDict ])
+                    elif isinstance(entry, dict):
+                        hasher = self.hashFunc(b"{")
+                        childDict = OrderedDict()
+                        for key, child in entry.items():
+                            if isinstance(child, (dict, list)):
+                                childNode = nodeDict[id(child)]
+                                hasher.update(childNode[0])
+                            else:
+                                childNode = self.hash_scalar(child)
+                                hasher.update(childNode)
+                            hasher.update(self.scalarEncoder.encode(key).encode("utf-8"))
+                            childDict[key] = childNode
+                        nodeDict[id(entry)] = (hasher.digest(), childDict)
+                    else:
+                        hasher = self.hashFunc(b"[")
+                        childList = []
+                        for child in entry:
+                            if isinstance(child, (dict, list)):
+                                childNode = nodeDict[id(child)]
+                                hasher.update(childNode[0])
+                            else:
+                                childNode = self.hash_scalar(child)
+                                hasher.update(childNode)
+                            childList.append(childNode)
+                        nodeDict[id(entry)] = (hasher.digest(), childList)
+                self.mRoot = nodeDict[id(value)]
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            self.mRoot = None
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def hash_scalar(self, value):
+        '''
+            PURPOSE - Hash a json string, number, boolean, or null
+            INPUT
+                value - Json scalar
+            OUTPUT
+                Digest as bytes
+        '''
+        return self.hashFunc(b"=" + self.scalarEncoder.encode(value).encode("utf-8")).digest()
+
+
+    def root_hash(self):
+        '''
+            PURPOSE - Summarize the entire json value
+            OUTPUT
+                On success, the hex digest of the root node
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if isinstance(self.mRoot, tuple):
+            retVal = self.mRoot[0].hex()
+        elif isinstance(self.mRoot, bytes):
+            retVal = self.mRoot.hex()
+
+        # DONE
+        return retVal
+
+
+    def get_node(self, path):
+        '''
+            PURPOSE - Find the node of a subtree
+            INPUT
+                path - Tuple of keys and array indices (see: PATHS)
+            OUTPUT
+                On success, the node
+                If the path doesn't exist, None
+        '''
+        # LOCAL VARIABLES
+        retVal = self.mRoot
+
+        # WALK
+        for step in path:
+            if not isinstance(retVal, tuple):
+                retVal = None
+            elif isinstance(retVal[1], dict):
+                retVal = retVal[1].get(step)
+            elif isinstance(step, int) and 0 <= step < len(retVal[1]):
+                retVal = retVal[1][step]
+            else:
+                retVal = None
+            if retVal is None:
+                break
+
+        # DONE
+        return retVal
+
+
+    def diff_trees(self, otherTree):
+        '''
+            PURPOSE - List what changed between this json value and another
+            INPUT
+                otherTree - JsonMerkleTree of the newer json value
+            OUTPUT
+                On success, list of (path, change) where change is "added", "removed", or "changed"
+                On failure, None
+            NOTES
+                Only subtrees whose digests differ are walked
+                A "changed" path is as deep as both trees go (see: NODES)
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        stackList = []    # (path, old node, new node) left to compare, last in first out
+        path = None       # Path of the current nodes
+        oldNode = None    # Current node of this tree
+        newNode = None    # Current node of otherTree
+        pendingList = []  # Differences of the current nodes' children
+
+        # INPUT VALIDATION
+        if isinstance(otherTree, JsonMerkleTree) and self.mRoot is not None and otherTree.mRoot is not None:
+            retVal = []
+            stackList.append(((), self.mRoot, otherTree.mRoot))
+
+            # COMPARE
+            while stackList:
+                path, oldNode, newNode = stackList.pop()
+                if self.node_digest(oldNode) == self.node_digest(newNode):
+                    continue
+                if not isinstance(oldNode, tuple) or not isinstance(newNode, tuple) \
+                   or type(oldNode[1]) is not type(newNode[1]):
+                    retVal.append((path, "changed"))
+                    continue
+                pendingList = []
+                if isinstance(oldNode[1], dict):
+                    if list(oldNode[1].keys()) != list(newNode[1].keys()) \
+                       and len(oldNode[1]) == len(newNode[1]) and set(oldNode[1].keys()) == set(newNode[1].keys()):
+                        retVal.append((path, "changed"))  # Same keys, different order
+                    for key, child in oldNode[1].items():
+                        if key in newNode[1]:
+                            pendingList.append((path + (key,), child, newNode[1][key]))
+                        else:
+                            retVal.append((path + (key,), "removed"))
+                    for key in newNode[1].keys():
+                        if key not in oldNode[1]:
+                            retVal.append((path + (key,), "added"))
+                else:
+                    for index, child in enumerate(oldNode[1][:len(newNode[1])]):
+                        pendingList.append((path + (index,), child, newNode[1][index]))
+                    for index in range(len(newNode[1]), len(oldNode[1])):
+                        retVal.append((path + (index,), "removed"))
+                    for index in range(len(oldNode[1]), len(newNode[1])):
+                        retVal.append((path + (index,), "added"))
+                stackList.extend(reversed(pendingList))
+
+        # DONE
+        return retVal
+
+
+    def node_digest(self, node):
+        '''
+            PURPOSE - Extract the digest of a node
+            INPUT
+                node - Node (see: NODES)
+            OUTPUT
+                Digest as bytes
+        '''
+        return node[0] if isinstance(node, tuple) else node
+
+
+    def dump_tree(self, maxDepth=None):
+        '''
+            PURPOSE - Serialize the top levels of the tree
+            INPUT
+                maxDepth - Optional number of levels below the root to keep (see: self.persistDepth)
+            OUTPUT
+                On success, zlib compressed bytes
+                On failure, None
+            NOTES
+                Deeper subtrees are kept as bare digests (see: NODES)
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if maxDepth is None:
+            maxDepth = self.persistDepth
+        if self.mRoot is not None and isinstance(maxDepth, int) and 0 <= maxDepth:
+            try:
+                retVal = zlib.compress(json.dumps(self.dump_node(self.mRoot, maxDepth),
+                                                  separators=(",", ":")).encode("utf-8"))
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = None
+
+        # DONE
+        return retVal
+
+
+    def dump_node(self, node, maxDepth):
+        '''
+            PURPOSE - Translate a node into json types for dump_tree()
+            INPUT
+                node - Node (see: NODES)
+                maxDepth - Number of levels below node to keep
+            OUTPUT
+                Hex digest, or a list of [ hex digest, object or list of children ]
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # TRANSLATE
+        if not isinstance(node, tuple):
+            retVal = node.hex()
+        elif 0 >= maxDepth:
+            retVal = node[0].hex()
+        elif isinstance(node[1], dict):
+            retVal = [ node[0].hex(), OrderedDict([ (key, self.dump_node(child, maxDepth - 1))
+                                                    for key, child in node[1].items() ]) ]
+        else:
+            retVal = [ node[0].hex(), [ self.dump_node(child, maxDepth - 1) for child in node[1] ] ]
+
+        # DONE
+        return retVal
+
+
+    def load_tree(self, blob):
+        '''
+            PURPOSE - Deserialize a tree saved by dump_tree()
+            INPUT
+                blob - Return value from dump_tree()
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INPUT VALIDATION
+        if isinstance(blob, (bytes, bytearray, memoryview)):
+            try:
+                self.mRoot = self.load_node(json.loads(zlib.decompress(blob).decode("utf-8"),
+                                                       object_pairs_hook=OrderedDict))
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.mRoot = None
+            else:
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def load_node(self, entry):
+        '''
+            PURPOSE - Translate a dump_node() entry back into a node
+            INPUT
+                entry - Return value from dump_node()
+            OUTPUT
+                Node (see: NODES)
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # TRANSLATE
+        if isinstance(entry, str):
+            retVal = bytes.fromhex(entry)
+        elif isinstance(entry[1], dict):
+            retVal = (bytes.fromhex(entry[0]), OrderedDict([ (key, self.load_node(child))
+                                                             for key, child in entry[1].items() ]))
+        else:
+            retVal = (bytes.fromhex(entry[0]), [ self.load_node(child) for child in entry[1] ])
+
+        # DONE
+        return retVal
+
+
+    def close_merkle_tree(self):
+        '''
+            PURPOSE - Clear out all class attributes
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        try:
+            self.mRoot = None
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = False
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
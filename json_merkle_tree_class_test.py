@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from json_intern_pool_class import JsonInternPool
+from json_merkle_tree_class import JsonMerkleTree
+import copy
+import json
+import os
+import unittest
+
+
+class Json_Merkle_Tree_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        with open(os.path.join("Test_Files", "Linux", "party.json"), "rb") as inFile:
+            self.rawParty = inFile.read().decode("utf-8-sig")
+        self.oldDict = json.loads(self.rawParty, object_pairs_hook=OrderedDict)
+        self.newDict = copy.deepcopy(self.oldDict)
+        self.test = JsonMerkleTree(self.oldDict)
+
+
+    def tearDown(self):
+        self.test.close_merkle_tree()
+
+
+class Json_Merkle_Tree_Class_Test_Normal(Json_Merkle_Tree_Class_Tests):
+
+
+    def test_Normal_01_Identical(self):
+        self.assertEqual(self.test.root_hash(), JsonMerkleTree(self.newDict).root_hash())
+        self.assertEqual(self.test.diff_trees(JsonMerkleTree(self.newDict)), [])
+        sharedDict = json.loads(self.rawParty, object_pairs_hook=JsonInternPool().build_node)
+        self.assertEqual(self.test.root_hash(), JsonMerkleTree(sharedDict).root_hash())
+
+
+    def test_Normal_02_Diff(self):
+        self.newDict["m_EntityData"][0]["Edited"] = True
+        firstKey = list(self.newDict["m_EntityData"][1].keys())[0]
+        self.newDict["m_EntityData"][1][firstKey] = "Edited"
+        self.newDict["m_EntityData"].pop()
+        self.assertEqual(self.test.diff_trees(JsonMerkleTree(self.newDict)),
+                         [ (("m_EntityData", len(self.newDict["m_EntityData"])), "removed"),
+                           (("m_EntityData", 0, "Edited"), "added"),
+                           (("m_EntityData", 1, firstKey), "changed") ])
+
+
+    def test_Normal_03_Dump_Load(self):
+        self.newDict["m_EntityData"][0]["Edited"] = True
+        newTree = JsonMerkleTree(self.newDict)
+        for maxDepth in range(4):
+            loadTree = JsonMerkleTree()
+            self.assertTrue(loadTree.load_tree(self.test.dump_tree(maxDepth)))
+            self.assertEqual(loadTree.root_hash(), self.test.root_hash())
+            self.assertEqual(loadTree.diff_trees(newTree),
+                             [ (("m_EntityData", 0, "Edited")[:maxDepth], "added" if 3 == maxDepth else "changed") ])
+
+
+class Json_Merkle_Tree_Class_Test_Error(Json_Merkle_Tree_Class_Tests):
+
+
+    def test_Error_01_Distinct_Values(self):
+        self.assertNotEqual(JsonMerkleTree([ 1 ]).root_hash(), JsonMerkleTree([ 1.0 ]).root_hash())
+        self.assertNotEqual(JsonMerkleTree([ 1 ]).root_hash(), JsonMerkleTree([ True ]).root_hash())
+        self.assertNotEqual(JsonMerkleTree({ "a" : [] }).root_hash(), JsonMerkleTree({ "a" : {} }).root_hash())
+        self.assertNotEqual(JsonMerkleTree([ "a", "b" ]).root_hash(), JsonMerkleTree([ "ab" ]).root_hash())
+        self.assertEqual(JsonMerkleTree(OrderedDict([ ("a", 1), ("b", 2) ])).diff_trees(
+                         JsonMerkleTree(OrderedDict([ ("b", 2), ("a", 1) ]))), [ ((), "changed") ])
+
+
+    def test_Error_02_Bad_Input(self):
+        self.assertIsNone(self.test.diff_trees(None))
+        self.assertIsNone(self.test.diff_trees(JsonMerkleTree()))
+        self.assertFalse(JsonMerkleTree().load_tree(b"bogus"))
+        self.assertIsNone(JsonMerkleTree().dump_tree())
+        self.assertIsNone(self.test.get_node(("m_EntityData", "bogus")))
+
+
+if __name__ == "__main__":
+    unittest.main()
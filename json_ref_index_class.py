@@ -0,0 +1,506 @@
+from collections import OrderedDict
+
+
+class JsonRefIndex():
+    '''
+        PURPOSE - Index the Json.NET "$id"/"$ref" references of a parsed json file
+        USAGE
+            1. refIndex = JsonRefIndex()
+            2. jsonDict = json.loads(rawJson, object_pairs_hook=refIndex.build_node)
+            3. refIndex.claim_nodes(group, jsonDict)
+            4. node = refIndex.resolve_ref({ "$ref" : "2158" })
+            5. refIndex.close_ref_index()
+        NOTES
+            [X] refIndex = JsonRefIndex()                       # Instantiates a JsonRefIndex object
+            [X] refIndex.build_node(pairs)                      # object_pairs_hook that indexes while parsing
+            [X] refIndex.claim_nodes(group, value, ownerId)     # Files the nodes parsed since the last claim under group
+            [X] refIndex.add_root(node)                         # Indexes the top-level object
+            [X] refIndex.index_value(group, value, ownerId)     # Walks an edited value into the index
+            [X] refIndex.remove_group(group)                    # Invalidates the nodes of an edited value
+            [X] refIndex.resolve_ref(ref)                       # Resolves a "$ref" to its "$id" node in O(1)
+            [X] refIndex.find_referrers(refId)                  # Lists the "$id" of every node referencing refId
+            [X] refIndex.validate_refs(node)                    # Lists duplicate "$id"s and dangling "$ref"s
+            [X] refIndex.renumber_ids(node)                     # Compacts "$id"s and rewrites every "$ref"
+            [X] refIndex.reset_ref_index()                      # Empties the index before a new parse
+            [X] refIndex.close_ref_index()                      # Zeroizes all data
+            OWNERS
+                A "$ref" is owned by the nearest enclosing node with a "$id" (or None if there isn't
+                    one).  find_referrers() returns owners, so a reference from deep inside an entity
+                    is reported as a reference from the entity.
+            GROUPS
+                Nodes are filed under the (top-level key, array index or None) of the value they were
+                    parsed from so editing that value only invalidates its own nodes
+            RENUMBERING
+                validate_refs() and renumber_ids() walk the json tree they are given rather than
+                    the index, so they also work on trees parsed without one
+    '''
+
+
+    def __init__(self, nodeHook=OrderedDict):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                nodeHook - Optional callable that builds a json object from its (key, value) pairs
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_ref_index()
+        '''
+        # CLASS ATTRIBUTES
+        self.iIdDict = {}       # Store the { "$id" : node } of every indexed node here
+        self.iRefDict = {}      # Store the { referenced "$id" : { owner "$id" : count } } reverse edges here
+        self.iGroupDict = {}    # Store the { top-level key : { array index or None : (id list, edge list) } } here
+        self.iPendingDict = {}  # Store the { id(node) : [ referenced "$id" ] } of unowned references while parsing
+        self.iNewIdList = []    # "$id" of nodes parsed since the last claim_nodes()
+        self.iNewEdgeList = []  # (owner "$id", referenced "$id") edges parsed since the last claim_nodes()
+        self.iRootId = None     # "$id" of the top-level object, if any
+        self.iNodeHook = nodeHook  # Builds each json object from its (key, value) pairs
+
+
+    def build_node(self, pairs):
+        '''
+            PURPOSE - Build and index a json object (use as the json object_pairs_hook)
+            INPUT
+                pairs - List of (key, value) pairs from the json decoder
+            OUTPUT
+                The json object built by self.iNodeHook (an OrderedDict by default)
+            NOTES
+                The decoder builds nodes bottom-up, so references are carried up to the nearest
+                    enclosing "$id" node through self.iPendingDict
+        '''
+        # LOCAL VARIABLES
+        retVal = self.iNodeHook(pairs)
+        pendingList = []  # Unowned references inside this node
+        nodeId = None     # This node's "$id"
+
+        # COLLECT THE CHILDREN'S REFERENCES
+        for _, value in pairs:
+            if isinstance(value, dict):
+                if self.iPendingDict:
+                    pendingList.extend(self.iPendingDict.pop(id(value), ()))
+            elif isinstance(value, list):
+                self.collect_pending(value, pendingList)
+        if "$ref" in retVal:
+            pendingList.append(retVal["$ref"])
+
+        # INDEX THE NODE
+        nodeId = retVal.get("$id")
+        if nodeId is not None:
+            self.iIdDict[nodeId] = retVal
+            self.iNewIdList.append(nodeId)
+            for refId in pendingList:
+                self.iNewEdgeList.append((nodeId, refId))
+        elif pendingList:
+            self.iPendingDict[id(retVal)] = pendingList
+
+        # DONE
+        return retVal
+
+
+    def collect_pending(self, valueList, pendingList):
+        '''
+            PURPOSE - Collect the unowned references of the objects in a json array
+            INPUT
+                valueList - List parsed by the json decoder
+                pendingList - List to extend with the referenced "$id"s
+            OUTPUT - None
+        '''
+        # COLLECT
+        if self.iPendingDict:
+            for value in valueList:
+                if isinstance(value, dict):
+                    pendingList.extend(self.iPendingDict.pop(id(value), ()))
+                elif isinstance(value, list):
+                    self.collect_pending(value, pendingList)
+
+
+    def claim_nodes(self, group, value, ownerId=None, element=None):
+        '''
+            PURPOSE - File every node parsed since the last claim under a group
+            INPUT
+                group - Top-level key the value was parsed from
+                value - Value parsed by the json decoder using build_node()
+                ownerId - "$id" owning any unowned reference in value (e.g., the top-level "$id")
+                element - Optional array index of value within the top-level key's array
+            OUTPUT
+                On success, True
+        '''
+        # LOCAL VARIABLES
+        retVal = True
+        pendingList = []  # Unowned references in value
+
+        # ASSIGN UNOWNED REFERENCES
+        if isinstance(value, dict):
+            pendingList = self.iPendingDict.pop(id(value), [])
+        elif isinstance(value, list):
+            self.collect_pending(value, pendingList)
+        for refId in pendingList:
+            self.iNewEdgeList.append((ownerId, refId))
+
+        # FILE THE NODES
+        self.add_group(group, element, self.iNewIdList, self.iNewEdgeList)
+        self.iNewIdList = []
+        self.iNewEdgeList = []
+        self.iPendingDict = {}
+
+        # DONE
+        return retVal
+
+
+    def add_group(self, group, element, idList, edgeList):
+        '''
+            PURPOSE - File nodes and reverse edges under a group
+            INPUT
+                group - Top-level key
+                element - Array index within the top-level key's array, or None
+                idList - List of "$id"s
+                edgeList - List of (owner "$id", referenced "$id") edges
+            OUTPUT
+                On success, True
+        '''
+        # LOCAL VARIABLES
+        retVal = True
+        ownerDict = None  # Reverse edges of one referenced "$id"
+
+        # FILE THE NODES
+        self.iGroupDict.setdefault(group, {})[element] = (idList, edgeList)
+        for ownerId, refId in edgeList:
+            ownerDict = self.iRefDict.setdefault(refId, {})
+            ownerDict[ownerId] = ownerDict.get(ownerId, 0) + 1
+
+        # DONE
+        return retVal
+
+
+    def add_root(self, node):
+        '''
+            PURPOSE - Index the top-level object
+            INPUT
+                node - Top-level dictionary
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INDEX
+        if isinstance(node, dict):
+            self.iRootId = node.get("$id")
+            if self.iRootId is not None:
+                self.iIdDict[self.iRootId] = node
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def index_value(self, group, value, ownerId=None, elements=False, element=None):
+        '''
+            PURPOSE - Walk an edited top-level value into the index
+            INPUT
+                group - Top-level key of value
+                value - New value
+                ownerId - "$id" owning any unowned reference in value (e.g., the top-level "$id")
+                elements - If True and value is a list, file each element separately
+                element - Optional array index of value within the top-level key's array
+            OUTPUT
+                On success, True
+            NOTES
+                Call remove_group() for the old value first
+        '''
+        # LOCAL VARIABLES
+        retVal = True
+        idList = []    # "$id"s found in the walk
+        edgeList = []  # Edges found in the walk
+
+        # WALK
+        if elements and isinstance(value, list):
+            for index, entry in enumerate(value):
+                idList = []
+                edgeList = []
+                self.walk_value(entry, ownerId, idList, edgeList)
+                self.add_group(group, index, idList, edgeList)
+        else:
+            self.walk_value(value, ownerId, idList, edgeList)
+            self.add_group(group, element, idList, edgeList)
+
+        # DONE
+        return retVal
+
+
+    def walk_value(self, value, ownerId, idList, edgeList):
+        '''
+            PURPOSE - Recursively index the nodes of a value
+            INPUT
+                value - Json value
+                ownerId - "$id" of the nearest enclosing "$id" node
+                idList - List to extend with the "$id"s found
+                edgeList - List to extend with the edges found
+            OUTPUT - None
+        '''
+        # WALK
+        if isinstance(value, dict):
+            if "$id" in value:
+                ownerId = value["$id"]
+                self.iIdDict[ownerId] = value
+                idList.append(ownerId)
+            if "$ref" in value:
+                edgeList.append((ownerId, value["$ref"]))
+            for entry in value.values():
+                if isinstance(entry, (dict, list)):
+                    self.walk_value(entry, ownerId, idList, edgeList)
+        elif isinstance(value, list):
+            for entry in value:
+                if isinstance(entry, (dict, list)):
+                    self.walk_value(entry, ownerId, idList, edgeList)
+
+
+    def remove_group(self, group, element=False):
+        '''
+            PURPOSE - Invalidate the nodes of an edited value
+            INPUT
+                group - Top-level key
+                element - Array index to invalidate, or False for every node filed under group
+            OUTPUT
+                On success, True
+                If nothing was filed under group, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        elementDict = self.iGroupDict.get(group)  # { element : (id list, edge list) }
+        removeList = []    # Elements to remove
+        ownerDict = None   # Reverse edges of one referenced "$id"
+
+        # INPUT VALIDATION
+        if elementDict is not None:
+            if element is False:
+                removeList = list(elementDict.keys())
+            elif element in elementDict.keys():
+                removeList = [ element ]
+
+            # REMOVE
+            for entry in removeList:
+                idList, edgeList = elementDict.pop(entry)
+                for nodeId in idList:
+                    self.iIdDict.pop(nodeId, None)
+                for ownerId, refId in edgeList:
+                    ownerDict = self.iRefDict.get(refId)
+                    if ownerDict is not None and ownerId in ownerDict.keys():
+                        ownerDict[ownerId] -= 1
+                        if 0 >= ownerDict[ownerId]:
+                            del ownerDict[ownerId]
+                        if not ownerDict:
+                            del self.iRefDict[refId]
+                retVal = True
+            if not elementDict:
+                del self.iGroupDict[group]
+
+        # DONE
+        return retVal
+
+
+    def resolve_ref(self, ref):
+        '''
+            PURPOSE - Resolve a reference to the node it refers to
+            INPUT
+                ref - A { "$ref" : "2158" } node or the "$id" string it refers to
+            OUTPUT
+                On success, the node with the matching "$id"
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # RESOLVE
+        if isinstance(ref, dict):
+            ref = ref.get("$ref")
+        if isinstance(ref, str):
+            retVal = self.iIdDict.get(ref)
+
+        # DONE
+        return retVal
+
+
+    def find_referrers(self, refId):
+        '''
+            PURPOSE - List the nodes that reference a "$id"
+            INPUT
+                refId - "$id" string
+            OUTPUT
+                List of owner "$id"s (None for references outside any "$id" node), in no particular order
+        '''
+        # LOCAL VARIABLES
+        retVal = []
+
+        # FIND
+        if isinstance(refId, str):
+            retVal = list(self.iRefDict.get(refId, {}).keys())
+
+        # DONE
+        return retVal
+
+
+    def collect_nodes(self, value, idList, refList):
+        '''
+            PURPOSE - Collect every "$id" and "$ref" node of a json tree in document order
+            INPUT
+                value - Json value
+                idList - List to extend with the "$id" nodes
+                refList - List to extend with the "$ref" nodes
+            OUTPUT - None
+            NOTES
+                Iterative so deeply nested saves can't exhaust the recursion limit
+        '''
+        # LOCAL VARIABLES
+        stackList = [ value ]  # Values left to walk, last in first out
+        entry = None           # Current value
+
+        # WALK
+        while stackList:
+            entry = stackList.pop()
+            if isinstance(entry, dict):
+                if "$id" in entry:
+                    idList.append(entry)
+                if "$ref" in entry:
+                    refList.append(entry)
+                stackList.extend(reversed([ child for child in entry.values() if isinstance(child, (dict, list)) ]))
+            elif isinstance(entry, list):
+                stackList.extend(reversed([ child for child in entry if isinstance(child, (dict, list)) ]))
+
+
+    def validate_refs(self, value):
+        '''
+            PURPOSE - Find the duplicate "$id"s and dangling "$ref"s in a json tree
+            INPUT
+                value - Json value (e.g., a parsed json file)
+            OUTPUT
+                A tuple of (list of duplicate "$id"s, list of dangling "$ref"s), in document order
+                    (two empty lists means every reference is valid)
+        '''
+        # LOCAL VARIABLES
+        idList = []        # "$id" nodes
+        refList = []       # "$ref" nodes
+        idSet = set()      # "$id"s seen
+        dupList = []       # Duplicate "$id"s
+        danglingList = []  # "$ref"s without a matching "$id"
+
+        # VALIDATE
+        self.collect_nodes(value, idList, refList)
+        for node in idList:
+            if node["$id"] in idSet:
+                dupList.append(node["$id"])
+            else:
+                idSet.add(node["$id"])
+        for node in refList:
+            if node["$ref"] not in idSet:
+                danglingList.append(node["$ref"])
+
+        # DONE
+        return (dupList, danglingList)
+
+
+    def renumber_ids(self, value, start=1):
+        '''
+            PURPOSE - Compact the "$id"s of a json tree and rewrite every "$ref" to match
+            INPUT
+                value - Json value (e.g., a parsed json file)
+                start - First "$id" number
+            OUTPUT
+                On success, a dictionary of { old "$id" : new "$id" } for every "$id" that changed
+                On failure, None
+            NOTES
+                "$id"s are renumbered in document order, the order Json.NET assigns them
+                Nothing is modified unless every "$id" is unique and every "$ref" resolves
+                One walk plus one pass over the collected nodes keeps this linear in the size of
+                    the tree
+                Indexes built before renumbering are stale afterwards
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        idList = []    # "$id" nodes
+        refList = []   # "$ref" nodes
+        mapDict = {}   # { old "$id" : new "$id" }
+        success = True # Set this to False on a duplicate "$id" or a dangling "$ref"
+
+        # INPUT VALIDATION
+        if not isinstance(start, int) or isinstance(start, bool) or 0 > start:
+            print("Invalid starting $id: {}".format(start))  # DEBUGGING
+        else:
+            # BUILD THE MAPPING TABLE
+            self.collect_nodes(value, idList, refList)
+            for newNum, node in enumerate(idList, start):
+                if node["$id"] in mapDict.keys():
+                    print("Duplicate $id: {}".format(node["$id"]))  # DEBUGGING
+                    success = False
+                    break
+                mapDict[node["$id"]] = str(newNum)
+
+            # VALIDATE
+            if success:
+                for node in refList:
+                    if node["$ref"] not in mapDict.keys():
+                        print("Dangling $ref: {}".format(node["$ref"]))  # DEBUGGING
+                        success = False
+                        break
+
+            # REWRITE
+            if success:
+                for node in idList:
+                    node["$id"] = mapDict[node["$id"]]
+                for node in refList:
+                    node["$ref"] = mapDict[node["$ref"]]
+                retVal = { oldId : newId for oldId, newId in mapDict.items() if oldId != newId }
+
+        # DONE
+        return retVal
+
+
+    def reset_ref_index(self):
+        '''
+            PURPOSE - Empty the index before parsing or indexing a new tree
+            OUTPUT
+                On success, True
+            NOTES
+                Unlike close_ref_index(), this keeps self.iNodeHook
+        '''
+        # RESET
+        self.iIdDict = {}
+        self.iRefDict = {}
+        self.iGroupDict = {}
+        self.iPendingDict = {}
+        self.iNewIdList = []
+        self.iNewEdgeList = []
+        self.iRootId = None
+
+        # DONE
+        return True
+
+
+    def close_ref_index(self):
+        '''
+            PURPOSE - Clear out all class attributes
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        try:
+            self.iIdDict = {}
+            self.iRefDict = {}
+            self.iGroupDict = {}
+            self.iPendingDict = {}
+            self.iNewIdList = []
+            self.iNewEdgeList = []
+            self.iRootId = None
+            self.iNodeHook = OrderedDict
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = False
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
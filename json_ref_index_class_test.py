@@ -0,0 +1,121 @@
+from json_file_class import JsonFile
+from json_ref_index_class import JsonRefIndex
+from collections import Counter
+import json
+import os
+import unittest
+
+
+class Json_Ref_Index_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.test = JsonRefIndex()
+
+
+    def tearDown(self):
+        self.test.close_ref_index()
+
+
+    def edge_counts(self, refIndex):
+        retVal = Counter()
+        for refId, ownerDict in refIndex.iRefDict.items():
+            for ownerId, count in ownerDict.items():
+                retVal[(ownerId, refId)] += count
+        return retVal
+
+
+    def brute_force(self, jsonDict):
+        idList = []
+        edgeList = []
+        JsonRefIndex().walk_value(jsonDict, None, idList, edgeList)
+        return set(idList), Counter(edgeList)
+
+
+class Json_Ref_Index_Class_Test_Normal(Json_Ref_Index_Class_Tests):
+
+
+    def test_Normal_01_Build_While_Parsing(self):
+        jsonDict = json.loads('{"$id":"1","a":{"$id":"2","b":[{"c":{"$ref":"3"}}]},"d":{"$id":"3","e":{"$ref":"2"}}}',
+                              object_pairs_hook=self.test.build_node)
+        self.test.claim_nodes(None, jsonDict)
+        self.test.add_root(jsonDict)
+        self.assertIs(self.test.resolve_ref({ "$ref" : "3" }), jsonDict["d"])
+        self.assertIs(self.test.resolve_ref("1"), jsonDict)
+        self.assertEqual(self.test.find_referrers("3"), [ "2" ])
+        self.assertEqual(self.test.find_referrers("2"), [ "3" ])
+
+
+    def test_Normal_02_Json_File_Index(self):
+        for filename in [ "header.json", "party.json", "player.json" ]:
+            jsonFile = JsonFile(os.path.join("Test_Files", "Linux", filename), refIndex=True)
+            self.assertTrue(jsonFile.parse_json_contents())
+            idSet, edgeCounter = self.brute_force(jsonFile.jDict)
+            self.assertEqual(set(jsonFile.jRefIndex.iIdDict.keys()), idSet)
+            self.assertEqual(self.edge_counts(jsonFile.jRefIndex), edgeCounter)
+            jsonFile.close_json_file()
+
+
+    def test_Normal_03_Invalidate_On_Edit(self):
+        jsonFile = JsonFile(os.path.join("Test_Files", "Linux", "header.json"), refIndex=True)
+        self.assertEqual(jsonFile.find_referrers("6"), [ "9" ])
+        self.assertIsNotNone(jsonFile.resolve_ref("9"))
+        self.assertTrue(jsonFile.mod_data("PartyPortraits", [ { "$id" : "10", "Pet" : { "$ref" : "2" } } ]))
+        self.assertIsNone(jsonFile.resolve_ref("9"))
+        self.assertEqual(jsonFile.find_referrers("6"), [])
+        self.assertEqual(jsonFile.find_referrers("2"), [ "10" ])
+        idSet, edgeCounter = self.brute_force(jsonFile.jDict)
+        self.assertEqual(set(jsonFile.jRefIndex.iIdDict.keys()), idSet)
+        self.assertEqual(self.edge_counts(jsonFile.jRefIndex), edgeCounter)
+        jsonFile.close_json_file()
+
+
+    def test_Normal_04_Renumber(self):
+        jsonDict = json.loads('{"$id":"1","a":[{"$id":"5","b":{"$ref":"9"}},{"$id":"9","c":{"$ref":"5"}}],"d":{"$ref":"1"}}')
+        self.assertEqual(self.test.renumber_ids(jsonDict), { "5" : "2", "9" : "3" })
+        self.assertEqual(json.dumps(jsonDict, separators=(",", ":")),
+                         '{"$id":"1","a":[{"$id":"2","b":{"$ref":"3"}},{"$id":"3","c":{"$ref":"2"}}],"d":{"$ref":"1"}}')
+        self.assertEqual(self.test.validate_refs(jsonDict), ([], []))
+        self.assertEqual(self.test.renumber_ids(jsonDict), {})
+
+
+    def test_Normal_05_Json_File_Renumber(self):
+        jsonFile = JsonFile(os.path.join("Test_Files", "Linux", "header.json"), refIndex=True)
+        self.assertTrue(jsonFile.parse_json_contents())
+        self.assertEqual(jsonFile.renumber_ids(), {})
+        self.assertTrue(jsonFile.add_data("Extra", { "$id" : "100", "Portrait" : { "$ref" : "6" } }))
+        self.assertEqual(jsonFile.renumber_ids(), { "100" : "10" })
+        self.assertEqual(sorted(jsonFile.find_referrers("6")), [ "10", "9" ])
+        self.assertIs(jsonFile.resolve_ref("10"), jsonFile.get_data("Extra"))
+        jsonFile.close_json_file()
+
+
+class Json_Ref_Index_Class_Test_Error(Json_Ref_Index_Class_Tests):
+
+
+    def test_Error_01_Unknown_Refs(self):
+        self.assertIsNone(self.test.resolve_ref({ "$ref" : "404" }))
+        self.assertIsNone(self.test.resolve_ref(None))
+        self.assertEqual(self.test.find_referrers("404"), [])
+        self.assertFalse(self.test.remove_group("missing"))
+
+
+    def test_Error_03_Renumber_Invalid(self):
+        jsonDict = json.loads('{"$id":"1","a":{"$id":"3","b":{"$ref":"4"}}}')
+        self.assertEqual(self.test.validate_refs(jsonDict), ([], [ "4" ]))
+        self.assertIsNone(self.test.renumber_ids(jsonDict))
+        self.assertEqual(jsonDict["a"]["$id"], "3")
+        jsonDict = json.loads('{"$id":"1","a":{"$id":"1"}}')
+        self.assertEqual(self.test.validate_refs(jsonDict), ([ "1" ], []))
+        self.assertIsNone(self.test.renumber_ids(jsonDict))
+        self.assertIsNone(self.test.renumber_ids(jsonDict, start=-1))
+
+
+    def test_Error_02_No_Index(self):
+        jsonFile = JsonFile(os.path.join("Test_Files", "Linux", "header.json"))
+        self.assertIsNone(jsonFile.resolve_ref("1"))
+        self.assertIsNone(jsonFile.find_referrers("1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
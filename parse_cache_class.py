@@ -0,0 +1,229 @@
+from baron_builder_imports import parseCacheBytes
+import os
+import pickle
+import re
+
+
+class ParseCache():
+    '''
+        PURPOSE - Keep parsed json files on disk so reopening an unchanged save game skips the
+            decompression and the json parse
+        USAGE
+            1. parseCache = ParseCache(os.path.join("Baron_Builder", "Cache"))
+            2. jsonDict = parseCache.load_tree("party.json", zFileInfo.CRC, zFileInfo.file_size)
+            3. [on a miss, parse the json file]
+            4. parseCache.store_tree("party.json", zFileInfo.CRC, zFileInfo.file_size, jsonDict)
+        NOTES
+            [X] parseCache = ParseCache(cacheDir)                       # Instantiates a ParseCache object
+            [X] parseCache.load_tree(member, crc, size)                 # Unpickles a cached json file
+            [X] parseCache.store_tree(member, crc, size, tree)          # Pickles a parsed json file
+            [X] parseCache.evict_trees()                                # Deletes the least recently used entries
+            [X] parseCache.clear_cache()                                # Deletes every entry
+            [X] parseCache.cache_path(member, crc, size)                # Filename of an entry
+            Entries are keyed by the zip member's name, CRC32, and uncompressed size (see: ZipInfo)
+                so a changed member never matches its stale entry.  Stale entries age out.
+            Entries are evicted, least recently used first, once they total more than maxBytes.
+                Every hit refreshes the entry's modification time.
+    '''
+    # CLASS ATTRIBUTES
+    cacheExt = ".pkl"                          # File extension of the cache entries
+    unsafeRegex = re.compile(r'[^0-9A-Za-z._-]')  # Characters not allowed in an entry's filename
+
+
+    def __init__(self, cacheDir, maxBytes=parseCacheBytes):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                cacheDir - Relative or absolute path of the cache directory, created on first use
+                maxBytes - Largest total size of the cache entries
+            OUTPUT - None
+        '''
+        # CLASS ATTRIBUTES
+        self.pCacheDir = None  # Directory holding the cache entries
+        self.pMaxBytes = 0     # Largest total size of the cache entries
+        self.pSuccess = False  # Set this to False if anything fails
+
+        # INPUT VALIDATION
+        if not isinstance(cacheDir, str):
+            # print("ParseCache ctor:\tcacheDir is not a string")  # DEBUGGING
+            pass
+        elif len(cacheDir) <= 0:
+            # print("ParseCache ctor:\tcacheDir is empty")  # DEBUGGING
+            pass
+        elif os.path.exists(cacheDir) and not os.path.isdir(cacheDir):
+            # print("ParseCache ctor:\t{} is not a directory".format(cacheDir))  # DEBUGGING
+            pass
+        elif not isinstance(maxBytes, int) or isinstance(maxBytes, bool) or 0 > maxBytes:
+            # print("ParseCache ctor:\tmaxBytes is invalid")  # DEBUGGING
+            pass
+        else:
+            self.pCacheDir = cacheDir
+            self.pMaxBytes = maxBytes
+            self.pSuccess = True
+
+
+    def cache_path(self, member, crc, size):
+        '''
+            PURPOSE - Translate a cache key into the filename of its entry
+            INPUT
+                member - Name of the zip member (e.g., "party.json")
+                crc - CRC32 of the zip member's uncompressed contents
+                size - Uncompressed size of the zip member
+            OUTPUT
+                On success, the absolute filename of the entry
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if not self.pSuccess:
+            pass
+        elif not isinstance(member, str) or 0 >= len(member):
+            pass
+        elif not isinstance(crc, int) or not isinstance(size, int):
+            pass
+        else:
+            retVal = os.path.join(self.pCacheDir, "{}_{:08x}_{}{}".format(self.unsafeRegex.sub("_", member),
+                                                                          crc & 0xFFFFFFFF, size, self.cacheExt))
+
+        # DONE
+        return retVal
+
+
+    def load_tree(self, member, crc, size):
+        '''
+            PURPOSE - Read a parsed json file from the cache
+            INPUT
+                member - Name of the zip member (e.g., "party.json")
+                crc - CRC32 of the zip member's uncompressed contents
+                size - Uncompressed size of the zip member
+            OUTPUT
+                On a hit, the parsed json file
+                On a miss, None
+            NOTES
+                Unreadable entries are deleted and treated as a miss
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        entryFile = self.cache_path(member, crc, size)  # Filename of the entry
+
+        # INPUT VALIDATION
+        if entryFile is not None and os.path.isfile(entryFile):
+            # READ THE ENTRY
+            try:
+                with open(entryFile, "rb") as inFile:
+                    retVal = pickle.load(inFile)
+                os.utime(entryFile, None)  # Most recently used
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = None
+                try:
+                    os.remove(entryFile)
+                except OSError:
+                    pass
+
+        # DONE
+        return retVal
+
+
+    def store_tree(self, member, crc, size, tree):
+        '''
+            PURPOSE - Write a parsed json file to the cache
+            INPUT
+                member - Name of the zip member (e.g., "party.json")
+                crc - CRC32 of the zip member's uncompressed contents
+                size - Uncompressed size of the zip member
+                tree - The zip member's parsed json contents
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Call this before modifying tree
+                Entries are written atomically and then the cache is trimmed (see: evict_trees())
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        entryFile = self.cache_path(member, crc, size)  # Filename of the entry
+
+        # INPUT VALIDATION
+        if entryFile is not None and tree is not None:
+            # WRITE THE ENTRY
+            try:
+                if not os.path.isdir(self.pCacheDir):
+                    os.makedirs(self.pCacheDir)
+                with open(entryFile + ".tmp", "wb") as outFile:
+                    pickle.dump(tree, outFile, pickle.HIGHEST_PROTOCOL)
+                os.replace(entryFile + ".tmp", entryFile)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.pSuccess = False
+            else:
+                retVal = self.evict_trees()
+            finally:
+                if os.path.exists(entryFile + ".tmp"):
+                    os.remove(entryFile + ".tmp")
+
+        # DONE
+        return retVal
+
+
+    def evict_trees(self):
+        '''
+            PURPOSE - Delete the least recently used entries until the cache fits in maxBytes
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        entryList = []  # (modification time, size, filename) of each entry
+        totalBytes = 0  # Total size of the entries
+        entryStat = None  # os.stat() of one entry
+
+        # INPUT VALIDATION
+        if self.pSuccess and os.path.isdir(self.pCacheDir):
+            try:
+                # FIND THE ENTRIES
+                for entryName in os.listdir(self.pCacheDir):
+                    if entryName.endswith(self.cacheExt):
+                        entryStat = os.stat(os.path.join(self.pCacheDir, entryName))
+                        entryList.append((entryStat.st_mtime, entryStat.st_size, entryName))
+                        totalBytes += entryStat.st_size
+                # EVICT
+                entryList.sort()
+                for _, entrySize, entryName in entryList:
+                    if totalBytes <= self.pMaxBytes:
+                        break
+                    os.remove(os.path.join(self.pCacheDir, entryName))
+                    totalBytes -= entrySize
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+            else:
+                retVal = True
+        elif self.pSuccess:
+            retVal = True  # Nothing cached yet
+
+        # DONE
+        return retVal
+
+
+    def clear_cache(self):
+        '''
+            PURPOSE - Delete every cache entry
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        maxBytes = self.pMaxBytes  # Restore this afterwards
+
+        # CLEAR
+        if self.pSuccess:
+            self.pMaxBytes = 0
+            retVal = self.evict_trees()
+            self.pMaxBytes = maxBytes
+
+        # DONE
+        return retVal
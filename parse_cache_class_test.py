@@ -0,0 +1,128 @@
+from json_file_class import JsonFile
+from parse_cache_class import ParseCache
+from zks_file_class import ZksFile
+import os
+import tempfile
+import unittest
+import zipfile
+import zlib
+
+
+class Parse_Cache_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.cacheDir = os.path.join(self.tempDir.name, "Cache")
+        self.test = ParseCache(self.cacheDir)
+
+
+    def tearDown(self):
+        ZksFile.parseCache = None
+        self.tempDir.cleanup()
+
+
+    def read_file(self, filename):
+        with open(os.path.join("Test_Files", "Linux", filename), "rb") as inFile:
+            return inFile.read()
+
+
+class Parse_Cache_Class_Test_Normal(Parse_Cache_Class_Tests):
+
+
+    def test_Normal_01_Round_Trip(self):
+        tree = { "$id" : "1", "Money" : 23156, "List" : [ 1, 2.5, None ] }
+        self.assertIsNone(self.test.load_tree("player.json", 1234, 56))
+        self.assertTrue(self.test.store_tree("player.json", 1234, 56, tree))
+        self.assertEqual(self.test.load_tree("player.json", 1234, 56), tree)
+        # A changed CRC or size never matches the stale entry
+        self.assertIsNone(self.test.load_tree("player.json", 4321, 56))
+        self.assertIsNone(self.test.load_tree("player.json", 1234, 65))
+        self.assertTrue(self.test.clear_cache())
+        self.assertIsNone(self.test.load_tree("player.json", 1234, 56))
+
+
+    def test_Normal_02_LRU_Eviction(self):
+        tree = { "Data" : "x" * 1000 }
+        for entryNum in range(3):
+            self.assertTrue(self.test.store_tree("party.json", entryNum, 1000, tree))
+            os.utime(self.test.cache_path("party.json", entryNum, 1000), (entryNum, entryNum))
+        entrySize = os.path.getsize(self.test.cache_path("party.json", 0, 1000))
+        # Using the oldest entry makes the middle entry the least recently used
+        self.assertIsNotNone(self.test.load_tree("party.json", 0, 1000))
+        self.test.pMaxBytes = 2 * entrySize
+        self.assertTrue(self.test.evict_trees())
+        self.assertIsNotNone(self.test.load_tree("party.json", 0, 1000))
+        self.assertIsNone(self.test.load_tree("party.json", 1, 1000))
+        self.assertIsNotNone(self.test.load_tree("party.json", 2, 1000))
+
+
+    def test_Normal_03_Json_File_Cache(self):
+        rawData = self.read_file("party.json")
+        cacheKey = ("party.json", zlib.crc32(rawData), len(rawData))
+        jsonFile = JsonFile("party.json", rawData, parseCache=self.test, cacheKey=cacheKey)
+        self.assertTrue(jsonFile.parse_json_contents())
+        expected = jsonFile.jDict
+        # A full parse loads the cached dictionary without reading the raw contents
+        readList = []
+        jsonFile = JsonFile("party.json", lambda: readList.append(1) or rawData, selective=True,
+                            parseCache=self.test, cacheKey=cacheKey)
+        self.assertTrue(jsonFile.parse_json_contents())
+        self.assertEqual(jsonFile.jDict, expected)
+        self.assertIsNone(jsonFile.jCont)
+        self.assertEqual(readList, [])
+        # Edits splice into the raw contents and don't change the cache
+        self.assertTrue(jsonFile.mod_data("SceneName", "Edited"))
+        self.assertTrue(jsonFile.write_json_file())
+        self.assertEqual(readList, [ 1 ])
+        self.assertEqual(jsonFile.jBuffer, rawData.replace(b'"SceneName":"' + expected["SceneName"].encode("utf-8") + b'"',
+                                                           b'"SceneName":"Edited"', 1))
+        self.assertEqual(self.test.load_tree(*cacheKey), expected)
+
+
+    def test_Normal_04_Zks_File_Streams_Edits(self):
+        saveFile = os.path.join(self.tempDir.name, "Manual_1.zks")
+        with zipfile.ZipFile(saveFile, "w", zipfile.ZIP_DEFLATED) as outZipFile:
+            for jsonName in [ "header.json", "party.json", "player.json" ]:
+                outZipFile.write(os.path.join("Test_Files", "Linux", jsonName), jsonName)
+        ZksFile.parseCache = self.test
+        saveGame = ZksFile(saveFile)
+        self.assertTrue(saveGame.unpack_to_memory())
+        saveGame.load_data()
+        money = saveGame.zPlayFile.get_data("Money")
+        self.assertTrue(saveGame.zPlayFile.mod_data("Money", money + 1))
+        # The edit is deferred and streamed instead of parsing player.json
+        self.assertIsNone(saveGame.zPlayFile.jDict)
+        self.assertEqual(dict(saveGame.zPlayFile.jEditDict), { "Money" : money + 1 })
+        self.assertTrue(saveGame.update_zks())
+        saveGame.close_zks()
+        rawData = self.read_file("player.json")
+        with zipfile.ZipFile(saveFile, "r") as inZipFile:
+            self.assertEqual(inZipFile.read("player.json"), rawData.replace(b'"Money":' + str(money).encode("ascii"),
+                                                                            b'"Money":' + str(money + 1).encode("ascii"), 1))
+        # Nothing was parsed in full, so nothing was cached
+        self.assertIsNone(self.test.load_tree("player.json", zlib.crc32(rawData), len(rawData)))
+
+
+class Parse_Cache_Class_Test_Error(Parse_Cache_Class_Tests):
+
+
+    def test_Error_01_Bad_Cache_Dir(self):
+        self.assertFalse(ParseCache(None).pSuccess)
+        self.assertFalse(ParseCache("").pSuccess)
+        self.assertFalse(ParseCache(os.path.join("Test_Files", "Linux", "party.json")).pSuccess)
+        self.assertFalse(ParseCache(self.cacheDir, maxBytes=-1).pSuccess)
+        self.assertIsNone(ParseCache(None).load_tree("party.json", 0, 0))
+        self.assertFalse(ParseCache(None).store_tree("party.json", 0, 0, {}))
+
+
+    def test_Error_02_Corrupt_Entry(self):
+        self.assertTrue(self.test.store_tree("party.json", 1, 2, { "$id" : "1" }))
+        with open(self.test.cache_path("party.json", 1, 2), "wb") as outFile:
+            outFile.write(b"not a pickle")
+        self.assertIsNone(self.test.load_tree("party.json", 1, 2))
+        self.assertFalse(os.path.exists(self.test.cache_path("party.json", 1, 2)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,549 @@
+from baron_builder_compression import compress_member, member_compressor
+# ZipFile compress_type macros
+from zipfile import ZIP_LZMA      # (requires lzma)
+import os
+import struct
+import zipfile
+import zlib
+
+
+class RawZipFile():
+    '''
+        PURPOSE - Assemble a zip file from raw (already compressed) file data
+        USAGE
+            1. rawZip = RawZipFile("save_game_42.zks.tmp")
+            2. rawZip.open_zip_file()
+            3. [add files using copy_member, add_member, add_raw_member, or start_member/write/finish_member]
+            4. rawZip.close_zip_file()
+        NOTES
+            [X] rawZip = RawZipFile("new.zip")                  # Instantiates a RawZipFile object
+            [X] rawZip.open_zip_file()                          # Opens the new zip file for writing
+            [X] rawZip.read_raw_member(inFile, zFileInfo)       # Reads a file's compressed bytes from an open zip file
+            [X] rawZip.copy_member(inFile, zFileInfo)           # Copies a file's compressed bytes verbatim
+            [X] rawZip.add_member(zFileInfo, data)              # Compresses data and adds it as a file
+            [X] rawZip.add_raw_member(zFileInfo, raw, crc, sz)  # Adds precompressed data as a file
+            [X] rawZip.start_member(zFileInfo)                  # Starts a file whose contents are streamed in
+            [X] rawZip.write(data)                              # Compresses and writes data to the started file
+            [X] rawZip.finish_member()                          # Finishes the started file
+            [X] rawZip.build_member_info(zFileInfo, ctype)      # Copies a ZipInfo for a file being written
+            [X] rawZip.close_zip_file()                         # Writes the central directory and closes the file
+            The files written here are byte-for-byte what zipfile.ZipFile.open(zFileInfo, "w")
+                would write for the same data, date_time, and compression
+    '''
+    # CLASS ATTRIBUTES
+    flagLzmaEos = 0x02         # ZipInfo.flag_bits bit for an LZMA end-of-stream marker
+    flagUtf8Name = 0x800       # ZipInfo.flag_bits bit for a UTF-8 encoded filename
+    zip64ExtraId = 0x0001      # Extra field header ID for zip64 sizes and offsets
+
+
+    def __init__(self, filename):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                filename - String representation of a relative or absolute filename to create
+            OUTPUT - None
+            NOTES
+                self.rInfoList remains available after close_zip_file()
+        '''
+        # CLASS ATTRIBUTES
+        self.rFileName = None  # Filename of the new zip file
+        self.rFile = None      # File object of the new zip file
+        self.rInfoList = []    # ZipInfo objects, in archive order, of the files written so far
+        self.rSuccess = False  # Set this to False if anything fails
+        self.rMember = None    # ZipInfo object of the file started by start_member()
+        self.rCompressor = None  # Compressor object of the started file
+        self.rCrc = 0          # Running CRC32 of the started file
+
+        # INPUT VALIDATION
+        if not isinstance(filename, str):
+            # print("RawZipFile ctor:\tfilename is not a string")  # DEBUGGING
+            pass
+        elif len(filename) <= 0:
+            # print("RawZipFile ctor:\tfilename is empty")  # DEBUGGING
+            pass
+        elif os.path.isdir(filename):
+            # print("RawZipFile ctor:\t{} is a directory".format(filename))  # DEBUGGING
+            pass
+        else:
+            self.rFileName = filename
+            self.rSuccess = True
+
+
+    def open_zip_file(self):
+        '''
+            PURPOSE - Open the new zip file for writing
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                An existing file will be overwritten
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INPUT VALIDATION
+        if self.rSuccess and self.rFile is None:
+            try:
+                self.rFile = open(self.rFileName, "wb")
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+            else:
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def read_raw_member(self, inFile, zFileInfo):
+        '''
+            PURPOSE - Read the compressed bytes of a file from an existing zip file
+            INPUT
+                inFile - File object, opened in binary mode, of an existing zip file
+                zFileInfo - ZipInfo object, from that zip file, of the file to read
+            OUTPUT
+                On success, the compressed bytes
+                On error, Exception
+            NOTES
+                Nothing is decompressed
+        '''
+        # LOCAL VARIABLES
+        retVal = b""
+        fileHeader = None  # Unpacked local file header
+
+        # INPUT VALIDATION
+        if not isinstance(zFileInfo, zipfile.ZipInfo):
+            raise TypeError('File info is of type "{}" instead of ZipInfo'.format(type(zFileInfo)))
+
+        # READ THE FILE
+        inFile.seek(zFileInfo.header_offset)
+        fileHeader = inFile.read(zipfile.sizeFileHeader)
+        if len(fileHeader) != zipfile.sizeFileHeader:
+            raise zipfile.BadZipFile("Truncated file header for {}".format(zFileInfo.filename))
+        fileHeader = struct.unpack(zipfile.structFileHeader, fileHeader)
+        if fileHeader[0] != zipfile.stringFileHeader:
+            raise zipfile.BadZipFile("Bad magic number for {}".format(zFileInfo.filename))
+        # Skip the filename and extra field
+        inFile.seek(fileHeader[10] + fileHeader[11], os.SEEK_CUR)
+        retVal = inFile.read(zFileInfo.compress_size)
+        if len(retVal) != zFileInfo.compress_size:
+            raise zipfile.BadZipFile("Truncated file data for {}".format(zFileInfo.filename))
+
+        # DONE
+        return retVal
+
+
+    def copy_member(self, inFile, zFileInfo):
+        '''
+            PURPOSE - Copy a file's compressed bytes from an existing zip file into the new zip file
+            INPUT
+                inFile - File object, opened in binary mode, of an existing zip file
+                zFileInfo - ZipInfo object, from that zip file, of the file to copy
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                The original CRC, sizes, and compression type are reused
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # COPY THE FILE
+        if self.rSuccess:
+            try:
+                retVal = self.add_raw_member(zFileInfo, self.read_raw_member(inFile, zFileInfo),
+                                             zFileInfo.CRC, zFileInfo.file_size,
+                                             flagBits=zFileInfo.flag_bits & self.flagLzmaEos)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+                retVal = False
+
+        # DONE
+        return retVal
+
+
+    def add_member(self, zFileInfo, data, compressType=None, compressLevel=None):
+        '''
+            PURPOSE - Compress data and add it to the new zip file
+            INPUT
+                zFileInfo - ZipInfo object describing the file (filename, date_time, etc)
+                data - Bytes holding the uncompressed contents of the file
+                compressType - Optional ZipFile compress_type macro, defaults to zFileInfo.compress_type
+                compressLevel - Optional compression level (see: compress_member())
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        crc = 0       # CRC32 of data
+        rawData = b""  # Compressed data
+
+        # COMPRESS THE FILE
+        if self.rSuccess:
+            try:
+                if compressType is None:
+                    compressType = zFileInfo.compress_type
+                crc, rawData = compress_member(data, compressType, compressLevel)
+                retVal = self.add_raw_member(zFileInfo, rawData, crc, len(data), compressType)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+                retVal = False
+
+        # DONE
+        return retVal
+
+
+    def add_raw_member(self, zFileInfo, rawData, crc, fileSize, compressType=None, flagBits=None):
+        '''
+            PURPOSE - Add precompressed data to the new zip file
+            INPUT
+                zFileInfo - ZipInfo object describing the file (filename, date_time, etc)
+                rawData - Bytes holding the compressed contents of the file
+                crc - CRC32 of the uncompressed contents
+                fileSize - Size of the uncompressed contents
+                compressType - Optional ZipFile compress_type macro, defaults to zFileInfo.compress_type
+                flagBits - Optional ZipInfo.flag_bits describing rawData, defaults to what zipfile
+                    would set for compressType
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                zFileInfo is not modified.  A copy is stored in self.rInfoList.
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        newInfo = None  # New ZipInfo object for the file being written
+        zip64 = False   # Set this to True if the file needs zip64 extensions
+
+        # INPUT VALIDATION
+        if not self.rSuccess or self.rFile is None:
+            pass
+        elif not isinstance(zFileInfo, zipfile.ZipInfo):
+            raise TypeError('File info is of type "{}" instead of ZipInfo'.format(type(zFileInfo)))
+        elif not isinstance(rawData, (bytes, bytearray)):
+            raise TypeError('Raw data is of type "{}" instead of bytes'.format(type(rawData)))
+        else:
+            # BUILD THE FILE INFO
+            newInfo = self.build_member_info(zFileInfo, compressType, flagBits)
+            newInfo.CRC = crc
+            newInfo.file_size = fileSize
+            newInfo.compress_size = len(rawData)
+
+            # WRITE THE FILE
+            try:
+                zip64 = newInfo.file_size * 1.05 > zipfile.ZIP64_LIMIT
+                newInfo.header_offset = self.rFile.tell()
+                self.rFile.write(newInfo.FileHeader(zip64))
+                self.rFile.write(rawData)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+            else:
+                self.rInfoList.append(newInfo)
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def build_member_info(self, zFileInfo, compressType=None, flagBits=None):
+        '''
+            PURPOSE - Copy a ZipInfo object for a file being written to the new zip file
+            INPUT
+                zFileInfo - ZipInfo object describing the file (filename, date_time, etc)
+                compressType - Optional ZipFile compress_type macro, defaults to zFileInfo.compress_type
+                flagBits - Optional ZipInfo.flag_bits, defaults to what zipfile would set for compressType
+            OUTPUT
+                A new ZipInfo object without the CRC and sizes
+        '''
+        # LOCAL VARIABLES
+        retVal = zipfile.ZipInfo(zFileInfo.filename, zFileInfo.date_time)
+
+        # BUILD THE FILE INFO
+        retVal.compress_type = zFileInfo.compress_type if compressType is None else compressType
+        retVal.comment = zFileInfo.comment
+        retVal.extra = self.strip_zip64_extra(zFileInfo.extra)
+        retVal.create_system = zFileInfo.create_system
+        retVal.create_version = zFileInfo.create_version
+        retVal.extract_version = zFileInfo.extract_version
+        retVal.internal_attr = zFileInfo.internal_attr
+        retVal.external_attr = zFileInfo.external_attr
+        if not retVal.external_attr:
+            retVal.external_attr = 0o600 << 16  # permissions: ?rw-------
+        if flagBits is not None:
+            retVal.flag_bits = flagBits
+        else:
+            retVal.flag_bits = 0x00
+            if ZIP_LZMA == retVal.compress_type:
+                retVal.flag_bits |= self.flagLzmaEos
+
+        # DONE
+        return retVal
+
+
+    def start_member(self, zFileInfo, compressType=None, compressLevel=None):
+        '''
+            PURPOSE - Start a file in the new zip file whose contents will be streamed in by write()
+            INPUT
+                zFileInfo - ZipInfo object describing the file (filename, date_time, etc)
+                compressType - Optional ZipFile compress_type macro, defaults to zFileInfo.compress_type
+                compressLevel - Optional compression level (see: compress_member())
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                The local file header is rewritten by finish_member() once the CRC and sizes are known
+                Streamed files can't use zip64 extensions
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        header = b""  # Bytes that start the compressed data
+
+        # INPUT VALIDATION
+        if not self.rSuccess or self.rFile is None or self.rMember is not None:
+            pass
+        elif not isinstance(zFileInfo, zipfile.ZipInfo):
+            raise TypeError('File info is of type "{}" instead of ZipInfo'.format(type(zFileInfo)))
+        else:
+            try:
+                self.rMember = self.build_member_info(zFileInfo, compressType)
+                header, self.rCompressor = member_compressor(self.rMember.compress_type, compressLevel)
+                self.rCrc = 0
+                self.rMember.CRC = 0
+                self.rMember.file_size = 0
+                self.rMember.compress_size = len(header)
+                self.rMember.header_offset = self.rFile.tell()
+                self.rFile.write(self.rMember.FileHeader(False))
+                self.rFile.write(header)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+            else:
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def write(self, data):
+        '''
+            PURPOSE - Compress and write part of the contents of the file started by start_member()
+            INPUT
+                data - Bytes holding the next part of the uncompressed contents
+            OUTPUT
+                On success, the number of bytes consumed
+                On error, Exception
+            NOTES
+                This lets a RawZipFile object be used as a writable binary stream
+        '''
+        # LOCAL VARIABLES
+        retVal = 0
+        rawData = data  # Compressed data
+
+        # INPUT VALIDATION
+        if self.rMember is None:
+            raise ValueError("No file has been started")
+
+        # WRITE
+        self.rCrc = zlib.crc32(data, self.rCrc)
+        if self.rCompressor is not None:
+            rawData = self.rCompressor.compress(data)
+        self.rFile.write(rawData)
+        self.rMember.file_size += len(data)
+        self.rMember.compress_size += len(rawData)
+        retVal = len(data)
+
+        # DONE
+        return retVal
+
+
+    def finish_member(self):
+        '''
+            PURPOSE - Finish the file started by start_member()
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                The file's local header is rewritten in place with its CRC and sizes
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        rawData = b""  # Remaining compressed data
+        endOffset = 0  # Offset of the end of the file
+
+        # INPUT VALIDATION
+        if self.rSuccess and self.rMember is not None:
+            try:
+                if self.rCompressor is not None:
+                    rawData = self.rCompressor.flush()
+                    self.rFile.write(rawData)
+                    self.rMember.compress_size += len(rawData)
+                self.rMember.CRC = self.rCrc & 0xffffffff
+                if self.rMember.file_size > zipfile.ZIP64_LIMIT or self.rMember.compress_size > zipfile.ZIP64_LIMIT:
+                    raise zipfile.LargeZipFile("Streamed file {} is too large".format(self.rMember.filename))
+                endOffset = self.rFile.tell()
+                self.rFile.seek(self.rMember.header_offset)
+                self.rFile.write(self.rMember.FileHeader(False))
+                self.rFile.seek(endOffset)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+            else:
+                self.rInfoList.append(self.rMember)
+                retVal = True
+        self.rMember = None
+        self.rCompressor = None
+        self.rCrc = 0
+
+        # DONE
+        return retVal
+
+
+    def strip_zip64_extra(self, extra):
+        '''
+            PURPOSE - Remove any zip64 field from a ZipInfo.extra
+            INPUT
+                extra - Bytes from ZipInfo.extra
+            OUTPUT
+                The extra field bytes without the zip64 field
+            NOTES
+                Zip64 fields are recalculated when the file is written
+        '''
+        # LOCAL VARIABLES
+        retVal = b""
+        index = 0    # Current index into extra
+        fieldId = 0  # Extra field header ID
+        fieldLen = 0  # Extra field data length
+
+        # STRIP
+        while index + 4 <= len(extra):
+            fieldId, fieldLen = struct.unpack("<HH", extra[index:index + 4])
+            if fieldId != self.zip64ExtraId:
+                retVal = retVal + extra[index:index + 4 + fieldLen]
+            index += 4 + fieldLen
+
+        # DONE
+        return retVal
+
+
+    def close_zip_file(self):
+        '''
+            PURPOSE - Write the central directory and close the new zip file
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                The file is closed regardless of success
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        startDir = 0  # Offset of the central directory
+
+        # WRITE THE CENTRAL DIRECTORY
+        if self.rFile is not None:
+            try:
+                if self.rSuccess:
+                    startDir = self.rFile.tell()
+                    for zFileInfo in self.rInfoList:
+                        self.rFile.write(self.central_dir_entry(zFileInfo))
+                    self.rFile.write(self.end_record(startDir, self.rFile.tell() - startDir))
+                    retVal = True
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.rSuccess = False
+                retVal = False
+            finally:
+                self.rFile.close()
+                self.rFile = None
+
+        # DONE
+        return retVal
+
+
+    def central_dir_entry(self, zFileInfo):
+        '''
+            PURPOSE - Build the central directory entry for a file written to the new zip file
+            INPUT
+                zFileInfo - ZipInfo object from self.rInfoList
+            OUTPUT
+                The central directory entry as bytes
+        '''
+        # LOCAL VARIABLES
+        dt = zFileInfo.date_time
+        dosDate = (dt[0] - 1980) << 9 | dt[1] << 5 | dt[2]
+        dosTime = dt[3] << 11 | dt[4] << 5 | (dt[5] // 2)
+        extra = []                   # Zip64 values
+        extraData = zFileInfo.extra  # Extra field
+        minVersion = 0               # Minimum version needed to extract
+        fileSize = zFileInfo.file_size
+        compressSize = zFileInfo.compress_size
+        headerOffset = zFileInfo.header_offset
+        filename = b""               # Encoded filename
+        flagBits = zFileInfo.flag_bits
+
+        # ZIP64
+        if fileSize > zipfile.ZIP64_LIMIT or compressSize > zipfile.ZIP64_LIMIT:
+            extra.append(fileSize)
+            extra.append(compressSize)
+            fileSize = 0xffffffff
+            compressSize = 0xffffffff
+        if headerOffset > zipfile.ZIP64_LIMIT:
+            extra.append(headerOffset)
+            headerOffset = 0xffffffff
+        if extra:
+            extraData = struct.pack("<HH" + "Q" * len(extra), self.zip64ExtraId, 8 * len(extra), *extra) + extraData
+            minVersion = zipfile.ZIP64_VERSION
+
+        # VERSIONS
+        if zipfile.ZIP_BZIP2 == zFileInfo.compress_type:
+            minVersion = max(zipfile.BZIP2_VERSION, minVersion)
+        elif ZIP_LZMA == zFileInfo.compress_type:
+            minVersion = max(zipfile.LZMA_VERSION, minVersion)
+
+        # FILENAME
+        try:
+            filename = zFileInfo.filename.encode("ascii")
+        except UnicodeEncodeError:
+            filename = zFileInfo.filename.encode("utf-8")
+            flagBits |= self.flagUtf8Name
+
+        # DONE
+        return struct.pack(zipfile.structCentralDir, zipfile.stringCentralDir,
+                           max(minVersion, zFileInfo.create_version), zFileInfo.create_system,
+                           max(minVersion, zFileInfo.extract_version), zFileInfo.reserved,
+                           flagBits, zFileInfo.compress_type, dosTime, dosDate,
+                           zFileInfo.CRC, compressSize, fileSize,
+                           len(filename), len(extraData), len(zFileInfo.comment),
+                           0, zFileInfo.internal_attr, zFileInfo.external_attr,
+                           headerOffset) + filename + extraData + zFileInfo.comment
+
+
+    def end_record(self, startDir, sizeDir):
+        '''
+            PURPOSE - Build the end of central directory record(s)
+            INPUT
+                startDir - Offset of the central directory
+                sizeDir - Size of the central directory
+            OUTPUT
+                The end record(s) as bytes
+        '''
+        # LOCAL VARIABLES
+        retVal = b""
+        count = len(self.rInfoList)  # Number of files in the zip file
+
+        # ZIP64
+        if count > zipfile.ZIP_FILECOUNT_LIMIT or startDir > zipfile.ZIP64_LIMIT or sizeDir > zipfile.ZIP64_LIMIT:
+            retVal = struct.pack(zipfile.structEndArchive64, zipfile.stringEndArchive64,
+                                 44, 45, 45, 0, 0, count, count, sizeDir, startDir)
+            retVal = retVal + struct.pack(zipfile.structEndArchive64Locator, zipfile.stringEndArchive64Locator,
+                                          0, startDir + sizeDir, 1)
+            count = min(count, 0xFFFF)
+            sizeDir = min(sizeDir, 0xFFFFFFFF)
+            startDir = min(startDir, 0xFFFFFFFF)
+
+        # DONE
+        return retVal + struct.pack(zipfile.structEndArchive, zipfile.stringEndArchive,
+                                    0, 0, count, count, sizeDir, startDir, 0)
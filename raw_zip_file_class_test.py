@@ -0,0 +1,133 @@
+from baron_builder_compression import compress_members, select_compression
+from baron_builder_compression import PROFILE_FAST, PROFILE_BALANCED, PROFILE_MAX, PROFILE_AUTO
+from raw_zip_file_class import RawZipFile
+# ZipFile compress_type macros
+from zipfile import ZIP_STORED    # (no compression)
+from zipfile import ZIP_DEFLATED  # (requires zlib)
+from zipfile import ZIP_BZIP2     # (requires bz2)
+from zipfile import ZIP_LZMA      # (requires lzma)
+import os
+import tempfile
+import unittest
+import zipfile
+
+
+class Raw_Zip_File_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.memberDict = {}
+        for jsonName in [ "header.json", "player.json" ]:
+            with open(os.path.join("Test_Files", "Linux", jsonName), "rb") as inFile:
+                self.memberDict[jsonName] = inFile.read()
+
+
+    def tearDown(self):
+        self.tempDir.cleanup()
+
+
+    def make_zip(self, filename, compressType):
+        # Use zipfile to make a reference zip file
+        absFilename = os.path.join(self.tempDir.name, filename)
+        with zipfile.ZipFile(absFilename, "w") as outZipFile:
+            for memberName, data in self.memberDict.items():
+                zFileInfo = zipfile.ZipInfo(memberName, (2019, 1, 2, 3, 4, 6))
+                zFileInfo.compress_type = compressType
+                with outZipFile.open(zFileInfo, "w") as outFile:
+                    outFile.write(data)
+        return absFilename
+
+
+class Raw_Zip_File_Class_Test_Normal(Raw_Zip_File_Class_Tests):
+
+
+    def test_Normal_01_Add_Matches_Zipfile(self):
+        for compressType in [ ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA ]:
+            refFilename = self.make_zip("reference.zip", compressType)
+            newFilename = os.path.join(self.tempDir.name, "new.zip")
+            test = RawZipFile(newFilename)
+            self.assertTrue(test.open_zip_file())
+            with zipfile.ZipFile(refFilename, "r") as inZipFile:
+                for zFileInfo in inZipFile.infolist():
+                    self.assertTrue(test.add_member(zFileInfo, self.memberDict[zFileInfo.filename]))
+            self.assertTrue(test.close_zip_file())
+            with open(refFilename, "rb") as refFile, open(newFilename, "rb") as newFile:
+                self.assertEqual(refFile.read(), newFile.read())
+
+
+    def test_Normal_02_Copy_Keeps_Raw_Data(self):
+        refFilename = self.make_zip("reference.zip", ZIP_DEFLATED)
+        newFilename = os.path.join(self.tempDir.name, "copy.zip")
+        test = RawZipFile(newFilename)
+        self.assertTrue(test.open_zip_file())
+        with zipfile.ZipFile(refFilename, "r") as inZipFile, open(refFilename, "rb") as inFile:
+            for zFileInfo in inZipFile.infolist():
+                self.assertTrue(test.copy_member(inFile, zFileInfo))
+        self.assertTrue(test.close_zip_file())
+        with open(refFilename, "rb") as refFile, open(newFilename, "rb") as newFile:
+            self.assertEqual(refFile.read(), newFile.read())
+        with zipfile.ZipFile(newFilename, "r") as inZipFile:
+            self.assertIsNone(inZipFile.testzip())
+            for memberName, data in self.memberDict.items():
+                self.assertEqual(inZipFile.read(memberName), data)
+
+
+    def test_Normal_03_Parallel_Matches_Serial(self):
+        dataList = list(self.memberDict.values()) * 2
+        compressTypeList = [ ZIP_LZMA, ZIP_DEFLATED, ZIP_BZIP2, ZIP_STORED ]
+        self.assertEqual(compress_members(dataList, compressTypeList, numWorkers=1),
+                         compress_members(dataList, compressTypeList, numWorkers=2))
+
+
+    def test_Normal_04_Compression_Profiles(self):
+        header = self.memberDict["header.json"]
+        player = self.memberDict["player.json"]
+        self.assertEqual(select_compression("header.png", header, PROFILE_MAX), (ZIP_STORED, None))
+        self.assertEqual(select_compression("player.json", player, PROFILE_FAST)[0], ZIP_DEFLATED)
+        self.assertEqual(select_compression("header.json", header, PROFILE_BALANCED)[0], ZIP_DEFLATED)
+        self.assertEqual(select_compression("player.json", player, PROFILE_MAX)[0], ZIP_LZMA)
+        self.assertIn(select_compression("player.json", player, PROFILE_AUTO)[0], [ ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA ])
+
+
+
+    def test_Normal_05_Stream_Matches_Zipfile(self):
+        for compressType in [ ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA ]:
+            refFilename = self.make_zip("reference.zip", compressType)
+            newFilename = os.path.join(self.tempDir.name, "stream.zip")
+            test = RawZipFile(newFilename)
+            self.assertTrue(test.open_zip_file())
+            with zipfile.ZipFile(refFilename, "r") as inZipFile:
+                for zFileInfo in inZipFile.infolist():
+                    data = self.memberDict[zFileInfo.filename]
+                    self.assertTrue(test.start_member(zFileInfo))
+                    for index in range(0, len(data), 4096):
+                        test.write(data[index:index + 4096])
+                    self.assertTrue(test.finish_member())
+            self.assertTrue(test.close_zip_file())
+            with open(refFilename, "rb") as refFile, open(newFilename, "rb") as newFile:
+                self.assertEqual(refFile.read(), newFile.read())
+
+
+class Raw_Zip_File_Class_Test_Error(Raw_Zip_File_Class_Tests):
+
+
+    def test_Error_01_Bad_Filename(self):
+        self.assertFalse(RawZipFile(None).rSuccess)
+        self.assertFalse(RawZipFile("").rSuccess)
+        self.assertFalse(RawZipFile(self.tempDir.name).rSuccess)
+
+
+    def test_Error_02_Not_Opened(self):
+        test = RawZipFile(os.path.join(self.tempDir.name, "unopened.zip"))
+        self.assertFalse(test.add_member(zipfile.ZipInfo("a.json"), b"{}"))
+        self.assertFalse(test.close_zip_file())
+
+
+    def test_Error_03_Bad_Profile(self):
+        with self.assertRaises(ValueError):
+            select_compression("header.json", self.memberDict["header.json"], "smallest")
+
+
+if __name__ == "__main__":
+    unittest.main()
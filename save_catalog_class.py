@@ -0,0 +1,545 @@
+from baron_builder_imports import TOP_DIR, ARCHIVE_DIR, BACKUP_DIR
+from baron_builder_imports import SAVE_GAME_EXT, BACKUP_EXT, ARCHIVE_EXT, MANIFEST_EXT
+from baron_builder_imports import catalogDb
+from backup_store_class import BackupStore
+from collections import OrderedDict
+from functools import partial
+from json_file_class import JsonFile
+from json_merkle_tree_class import JsonMerkleTree
+from zks_file_class import ZksFile
+import os
+import sqlite3
+import struct
+import zipfile
+import zlib
+
+
+class SaveCatalog():
+    '''
+        PURPOSE - Keep a persistent index of every save game, backup, backup manifest, and archive with its header
+            fields so menus don't have to open each file
+        USAGE
+            1. saveCatalog = SaveCatalog(saveGamePath)  # Pathfinder Kingmaker's "Saved Games" directory
+            2. saveCatalog.open_catalog()
+            3. saveCatalog.refresh_catalog()
+            4. saveCatalog.list_saves(ARCHIVE_EXT, gameName="Yuhra Thorne")
+            5. saveCatalog.close_catalog()
+        NOTES
+            [X] saveCatalog = SaveCatalog(saveGamePath)   # Instantiates a SaveCatalog object
+            [X] saveCatalog.open_catalog()                # Opens (or creates) the catalog database
+            [X] saveCatalog.refresh_catalog()             # Re-reads only new or modified save games
+            [X] saveCatalog.catalog_file(path, ext, st)   # Reads one save game into the catalog
+            [X] saveCatalog.list_saves(fileExt, ...)      # Sorted, filtered list of catalog entries
+            [X] saveCatalog.content_crc(memberList)       # CRC32 of a save game's file names, CRCs, and sizes
+            [X] saveCatalog.parse_game_time(gameTime)     # Translates "d.hh:mm:ss.fffffff" into seconds
+            [X] saveCatalog.store_merkle_tree(name, ...)  # Persists the JsonMerkleTree of a json file
+            [X] saveCatalog.load_merkle_tree(name, ...)   # Reads a persisted JsonMerkleTree
+            [X] saveCatalog.merkle_trees(filePath)        # JsonMerkleTrees of every json file in a save game
+            [X] saveCatalog.diff_saves(oldPath, newPath)  # Lists what changed between two save games
+            [X] saveCatalog.close_catalog()               # Closes the catalog database
+            The catalog is stored in saveGamePath/Baron_Builder (see: catalogDb)
+            A file is only re-read if its size or modification time changed
+            JsonMerkleTrees are keyed by the json file's name, CRC, and size rather than the save game,
+                so they never go stale and identical json files in different save games share one
+    '''
+    # CLASS ATTRIBUTES
+    # Column name : SQLite column definition
+    columnDict = OrderedDict([
+        ("filePath", "TEXT PRIMARY KEY"),   # Absolute filename
+        ("fileName", "TEXT NOT NULL"),      # Filename
+        ("fileExt", "TEXT NOT NULL"),       # File extension (e.g., SAVE_GAME_EXT)
+        ("fileSize", "INTEGER NOT NULL"),   # File size in bytes
+        ("fileMtime", "INTEGER NOT NULL"),  # File modification time in nanoseconds
+        ("contentCrc", "INTEGER"),          # See: content_crc()
+        ("Name", "TEXT"),                   # header.json fields (see: ZksFile.headerFields)
+        ("GameName", "TEXT"),
+        ("Area", "TEXT"),
+        ("SystemSaveTime", "TEXT"),
+        ("GameSaveTime", "TEXT"),
+        ("GameTotalTime", "TEXT"),
+        ("Type", "TEXT"),
+        ("gameSeconds", "REAL"),            # GameSaveTime in seconds
+        ("totalSeconds", "REAL"),           # GameTotalTime in seconds
+    ])
+    # Sort keys accepted by list_saves() : column to sort by
+    sortDict = { "game_time" : "gameSeconds", "play_time" : "totalSeconds", "mtime" : "fileMtime",
+                 "name" : "fileName", "size" : "fileSize" }
+
+
+    def __init__(self, saveGamePath):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                saveGamePath - Relative or absolute path to Pathfinder Kingmaker's "Saved Games" directory
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_catalog()
+        '''
+        # CLASS ATTRIBUTES
+        self.cSaveGamePath = None  # Pathfinder Kingmaker's "Saved Games" directory
+        self.cDbFile = None        # Absolute filename of the catalog database
+        self.cConn = None          # sqlite3.Connection to the catalog database
+        self.cSuccess = False      # Set this to False if anything fails
+        # { File extension : directory } cataloged by this object
+        self.cDirDict = None
+
+        # INPUT VALIDATION
+        if not isinstance(saveGamePath, str):
+            # print("SaveCatalog ctor:\tsaveGamePath is not a string")  # DEBUGGING
+            pass
+        elif len(saveGamePath) <= 0:
+            # print("SaveCatalog ctor:\tsaveGamePath is empty")  # DEBUGGING
+            pass
+        elif not os.path.isdir(saveGamePath):
+            # print("SaveCatalog ctor:\t{} is not a directory".format(saveGamePath))  # DEBUGGING
+            pass
+        else:
+            self.cSaveGamePath = os.path.abspath(saveGamePath)
+            self.cDbFile = os.path.join(self.cSaveGamePath, TOP_DIR, catalogDb)
+            self.cDirDict = OrderedDict([
+                (SAVE_GAME_EXT, self.cSaveGamePath),
+                (BACKUP_EXT, os.path.join(self.cSaveGamePath, TOP_DIR, BACKUP_DIR)),
+                (MANIFEST_EXT, os.path.join(self.cSaveGamePath, TOP_DIR, BACKUP_DIR)),
+                (ARCHIVE_EXT, os.path.join(self.cSaveGamePath, TOP_DIR, ARCHIVE_DIR)),
+            ])
+            self.cSuccess = True
+
+
+    def open_catalog(self):
+        '''
+            PURPOSE - Open the catalog database, creating it if necessary
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INPUT VALIDATION
+        if self.cSuccess and self.cConn is None:
+            # OPEN THE DATABASE
+            try:
+                if not os.path.isdir(os.path.dirname(self.cDbFile)):
+                    os.makedirs(os.path.dirname(self.cDbFile))
+                self.cConn = sqlite3.connect(self.cDbFile)
+                self.cConn.execute("CREATE TABLE IF NOT EXISTS saves ({})".format(
+                    ", ".join([ "{} {}".format(column, definition) for column, definition in self.columnDict.items() ])))
+                self.cConn.execute("CREATE INDEX IF NOT EXISTS savesGameName ON saves (fileExt, GameName)")
+                self.cConn.execute("CREATE INDEX IF NOT EXISTS savesArea ON saves (fileExt, Area)")
+                self.cConn.execute("CREATE INDEX IF NOT EXISTS savesGameSeconds ON saves (fileExt, gameSeconds)")
+                self.cConn.execute("CREATE TABLE IF NOT EXISTS merkle (memberName TEXT NOT NULL, memberCrc INTEGER NOT NULL, "
+                                   "memberSize INTEGER NOT NULL, tree BLOB NOT NULL, "
+                                   "PRIMARY KEY (memberName, memberCrc, memberSize))")
+                self.cConn.commit()
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.cSuccess = False
+                if self.cConn is not None:
+                    self.cConn.close()
+                    self.cConn = None
+            else:
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def refresh_catalog(self):
+        '''
+            PURPOSE - Bring the catalog up to date with the save game directories
+            OUTPUT
+                On success, number of files (re)cataloged
+                On failure, False
+            NOTES
+                Only files that are new, or whose size or modification time changed, are opened
+                Entries for files that no longer exist are removed
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        knownDict = {}    # { filePath : (fileSize, fileMtime) } already in the catalog
+        foundList = []    # Absolute filenames found in the save game directories
+        fileStat = None   # os.stat_result of a save game
+        numUpdated = 0    # Number of files (re)cataloged
+
+        # INPUT VALIDATION
+        if self.cSuccess and self.cConn is not None:
+            try:
+                # 1. Read the existing catalog
+                for filePath, fileSize, fileMtime in self.cConn.execute("SELECT filePath, fileSize, fileMtime FROM saves"):
+                    knownDict[filePath] = (fileSize, fileMtime)
+
+                # 2. Catalog new and modified files
+                for fileExt, fileDir in self.cDirDict.items():
+                    if not os.path.isdir(fileDir):
+                        continue
+                    for dirEntry in os.scandir(fileDir):
+                        if not dirEntry.name.endswith(fileExt) or not dirEntry.is_file():
+                            continue
+                        foundList.append(dirEntry.path)
+                        fileStat = dirEntry.stat()
+                        if knownDict.get(dirEntry.path) != (fileStat.st_size, fileStat.st_mtime_ns):
+                            self.catalog_file(dirEntry.path, fileExt, fileStat)
+                            numUpdated += 1
+
+                # 3. Remove missing files
+                for filePath in set(knownDict.keys()).difference(foundList):
+                    self.cConn.execute("DELETE FROM saves WHERE filePath = ?", (filePath,))
+                self.cConn.commit()
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.cConn.rollback()
+            else:
+                retVal = numUpdated
+
+        # DONE
+        return retVal
+
+
+    def catalog_file(self, filePath, fileExt, fileStat):
+        '''
+            PURPOSE - Read one save game into the catalog
+            INPUT
+                filePath - Absolute filename of the save game
+                fileExt - File extension of the save game
+                fileStat - os.stat_result of the save game
+            OUTPUT
+                On success, True
+                On failure, False
+                On error, Exception
+            NOTES
+                Backup manifests (see: BackupStore) are cataloged from the manifest alone
+                Files that can not be read are still cataloged, without a CRC or header fields,
+                    so they aren't re-read until they change
+                The caller is responsible for committing
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        rowDict = OrderedDict()  # { column : value } of the new row
+        headerDict = None        # Return value from ZksFile.read_header()
+        manifestDict = None      # Return value from BackupStore.read_manifest()
+
+        # READ THE FILE
+        for column in self.columnDict.keys():
+            rowDict[column] = None
+        rowDict["filePath"] = filePath
+        rowDict["fileName"] = os.path.basename(filePath)
+        rowDict["fileExt"] = fileExt
+        rowDict["fileSize"] = fileStat.st_size
+        rowDict["fileMtime"] = fileStat.st_mtime_ns
+        try:
+            if MANIFEST_EXT == fileExt:
+                manifestDict = BackupStore(os.path.dirname(filePath)).read_manifest(filePath)
+                if manifestDict is not None:
+                    rowDict["contentCrc"] = self.content_crc(manifestDict["Members"])
+                    headerDict = manifestDict["Header"]
+            else:
+                with zipfile.ZipFile(filePath, "r") as inZipFile:
+                    rowDict["contentCrc"] = self.content_crc(inZipFile.infolist())
+                headerDict = ZksFile(filePath).read_header()
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+        else:
+            if headerDict is not None:
+                rowDict.update(headerDict)
+                rowDict["gameSeconds"] = self.parse_game_time(headerDict["GameSaveTime"])
+                rowDict["totalSeconds"] = self.parse_game_time(headerDict["GameTotalTime"])
+                retVal = True
+
+        # UPDATE THE CATALOG
+        self.cConn.execute("INSERT OR REPLACE INTO saves ({}) VALUES ({})".format(
+            ", ".join(rowDict.keys()), ", ".join([ "?" ] * len(rowDict))), list(rowDict.values()))
+
+        # DONE
+        return retVal
+
+
+    def list_saves(self, fileExt=SAVE_GAME_EXT, gameName=None, area=None, sortBy="game_time", descending=True):
+        '''
+            PURPOSE - Provide a sorted, filtered list of cataloged save games
+            INPUT
+                fileExt - File extension, or list of file extensions, to list (e.g., ARCHIVE_EXT)
+                gameName - Optional character name (header.json GameName) to filter by
+                area - Optional area (header.json Area) to filter by
+                sortBy - One of self.sortDict's keys
+                descending - If True, the largest value is first
+            OUTPUT
+                On success, list of OrderedDicts of { column : value }
+                On failure, empty list
+                On bad input, None
+            NOTES
+                Call refresh_catalog() first to pick up changes on disk
+                Files are sorted by modification time when sortBy values are equal
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        query = "SELECT * FROM saves"                    # SQL query
+        paramList = []                                   # SQL query parameters
+        order = "DESC" if descending else "ASC"          # SQL sort order
+        cursor = None                                    # sqlite3.Cursor of the query
+
+        # INPUT VALIDATION
+        if not self.cSuccess or self.cConn is None:
+            retVal = []
+        elif not isinstance(fileExt, (str, list)):
+            pass
+        elif sortBy not in self.sortDict.keys():
+            pass
+        else:
+            # BUILD THE QUERY
+            if isinstance(fileExt, str):
+                fileExt = [ fileExt ]
+            query = query + " WHERE fileExt IN ({})".format(", ".join([ "?" ] * len(fileExt)))
+            paramList.extend(fileExt)
+            if gameName is not None:
+                query = query + " AND GameName = ?"
+                paramList.append(gameName)
+            if area is not None:
+                query = query + " AND Area = ?"
+                paramList.append(area)
+            query = query + " ORDER BY {0} IS NULL, {0} {1}, fileMtime {1}".format(self.sortDict[sortBy], order)
+
+            # RUN THE QUERY
+            try:
+                cursor = self.cConn.execute(query, paramList)
+                retVal = [ OrderedDict(zip([ column[0] for column in cursor.description ], row)) for row in cursor ]
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = []
+
+        # DONE
+        return retVal
+
+
+    def content_crc(self, memberList):
+        '''
+            PURPOSE - Summarize the contents of a save game without decompressing it
+            INPUT
+                memberList - ZipFile.infolist() of a save game, or BackupStore manifest "Members"
+            OUTPUT
+                CRC32 of every file's name, CRC, and size in the save game
+            NOTES
+                Two save games with the same content CRC almost certainly hold the same json files
+        '''
+        # LOCAL VARIABLES
+        retVal = 0
+
+        # CRC THE CENTRAL DIRECTORY
+        for member in memberList:
+            if isinstance(member, zipfile.ZipInfo):
+                member = { "Filename" : member.filename, "CRC" : member.CRC, "FileSize" : member.file_size }
+            retVal = zlib.crc32(member["Filename"].encode("utf-8"), retVal)
+            retVal = zlib.crc32(struct.pack("<IQ", member["CRC"], member["FileSize"]), retVal)
+
+        # DONE
+        return retVal & 0xffffffff
+
+
+    def parse_game_time(self, gameTime):
+        '''
+            PURPOSE - Translate a header.json time span into seconds
+            INPUT
+                gameTime - Time span formatted as "[days.]hours:minutes:seconds[.fraction]"
+            OUTPUT
+                On success, number of seconds as a float
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        days = 0           # Whole days in gameTime
+        clockList = []     # [ hours, minutes, seconds ] in gameTime
+
+        # PARSE
+        if isinstance(gameTime, str):
+            try:
+                clockList = gameTime.split(":")
+                if 3 == len(clockList):
+                    if "." in clockList[0]:
+                        days, clockList[0] = clockList[0].split(".")
+                    retVal = ((int(days) * 24 + int(clockList[0])) * 60 + int(clockList[1])) * 60 + float(clockList[2])
+            except ValueError:
+                retVal = None
+
+        # DONE
+        return retVal
+
+
+    def store_merkle_tree(self, memberName, memberCrc, memberSize, merkleTree):
+        '''
+            PURPOSE - Persist the JsonMerkleTree of a json file
+            INPUT
+                memberName - Name of the json file in the save game (e.g., "party.json")
+                memberCrc - CRC32 of the json file
+                memberSize - Uncompressed size of the json file
+                merkleTree - JsonMerkleTree of the json file
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Only the top levels are kept (see: JsonMerkleTree.dump_tree())
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        blob = None  # Return value from dump_tree()
+
+        # INPUT VALIDATION
+        if self.cSuccess and self.cConn is not None and isinstance(merkleTree, JsonMerkleTree):
+            blob = merkleTree.dump_tree()
+            if blob is not None:
+                try:
+                    self.cConn.execute("INSERT OR REPLACE INTO merkle (memberName, memberCrc, memberSize, tree) "
+                                       "VALUES (?, ?, ?, ?)", (memberName, memberCrc, memberSize, blob))
+                    self.cConn.commit()
+                except Exception as err:
+                    print(repr(err))  # DEBUGGING
+                    self.cConn.rollback()
+                else:
+                    retVal = True
+
+        # DONE
+        return retVal
+
+
+    def load_merkle_tree(self, memberName, memberCrc, memberSize):
+        '''
+            PURPOSE - Read a JsonMerkleTree persisted by store_merkle_tree()
+            INPUT
+                memberName - Name of the json file in the save game (e.g., "party.json")
+                memberCrc - CRC32 of the json file
+                memberSize - Uncompressed size of the json file
+            OUTPUT
+                On success, JsonMerkleTree
+                On a miss, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        row = None  # (tree,) read from the catalog
+
+        # INPUT VALIDATION
+        if self.cSuccess and self.cConn is not None:
+            try:
+                row = self.cConn.execute("SELECT tree FROM merkle WHERE memberName = ? AND memberCrc = ? "
+                                         "AND memberSize = ?", (memberName, memberCrc, memberSize)).fetchone()
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+            else:
+                if row is not None:
+                    retVal = JsonMerkleTree()
+                    if retVal.load_tree(row[0]) is not True:
+                        retVal = None
+
+        # DONE
+        return retVal
+
+
+    def merkle_trees(self, filePath):
+        '''
+            PURPOSE - Get the JsonMerkleTree of every json file in a save game
+            INPUT
+                filePath - Absolute filename of a save game
+            OUTPUT
+                On success, OrderedDict of { json filename : JsonMerkleTree }
+                On failure, None
+            NOTES
+                Json files without a persisted JsonMerkleTree are parsed, hashed, and persisted
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        merkleTree = None   # JsonMerkleTree of the current json file
+        jsonFileObj = None  # JsonFile of the current json file
+
+        # INPUT VALIDATION
+        if self.cSuccess and self.cConn is not None and isinstance(filePath, str):
+            try:
+                with zipfile.ZipFile(filePath, "r") as inZipFile:
+                    retVal = OrderedDict()
+                    for zFileInfo in inZipFile.infolist():
+                        if not zFileInfo.filename.endswith(".json"):
+                            continue
+                        merkleTree = self.load_merkle_tree(zFileInfo.filename, zFileInfo.CRC, zFileInfo.file_size)
+                        if merkleTree is None:
+                            jsonFileObj = JsonFile(zFileInfo.filename, partial(inZipFile.read, zFileInfo.filename))
+                            if jsonFileObj.parse_json_contents() is not True:
+                                raise ValueError("Unable to parse {}".format(zFileInfo.filename))
+                            merkleTree = JsonMerkleTree(jsonFileObj.jDict)
+                            jsonFileObj.close_json_file()
+                            self.store_merkle_tree(zFileInfo.filename, zFileInfo.CRC, zFileInfo.file_size, merkleTree)
+                            merkleTree.load_tree(merkleTree.dump_tree())  # Same depth as a persisted tree
+                        retVal[zFileInfo.filename] = merkleTree
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                retVal = None
+
+        # DONE
+        return retVal
+
+
+    def diff_saves(self, oldPath, newPath):
+        '''
+            PURPOSE - List what changed between two save games
+            INPUT
+                oldPath - Absolute filename of the older save game
+                newPath - Absolute filename of the newer save game
+            OUTPUT
+                On success, OrderedDict of { json filename : JsonMerkleTree.diff_trees() list }
+                    holding only the json files that differ
+                On failure, None
+            NOTES
+                Json files missing from one save game are reported as [ ((), "added") ] or
+                    [ ((), "removed") ]
+                Paths are as deep as the persisted JsonMerkleTrees (see: JsonMerkleTree.persistDepth)
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        oldTreeDict = self.merkle_trees(oldPath)  # { json filename : JsonMerkleTree } of oldPath
+        newTreeDict = None                         # { json filename : JsonMerkleTree } of newPath
+        diffList = None                            # Return value from diff_trees()
+
+        # INPUT VALIDATION
+        if oldTreeDict is not None:
+            newTreeDict = self.merkle_trees(newPath)
+        if newTreeDict is not None:
+            # COMPARE
+            retVal = OrderedDict()
+            for memberName, merkleTree in oldTreeDict.items():
+                if memberName not in newTreeDict:
+                    retVal[memberName] = [ ((), "removed") ]
+                else:
+                    diffList = merkleTree.diff_trees(newTreeDict[memberName])
+                    if diffList:
+                        retVal[memberName] = diffList
+            for memberName in newTreeDict.keys():
+                if memberName not in oldTreeDict:
+                    retVal[memberName] = [ ((), "added") ]
+
+        # DONE
+        return retVal
+
+
+    def close_catalog(self):
+        '''
+            PURPOSE - Close the catalog database
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # CLOSE THE DATABASE
+        if self.cConn is not None:
+            try:
+                self.cConn.close()
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+            else:
+                retVal = True
+
+        # ZERO THE ATTRIBUTES
+        self.cSaveGamePath = None
+        self.cDbFile = None
+        self.cConn = None
+        self.cSuccess = False
+        self.cDirDict = None
+
+        # DONE
+        return retVal
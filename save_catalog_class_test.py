@@ -0,0 +1,104 @@
+from baron_builder_imports import TOP_DIR, ARCHIVE_DIR, BACKUP_DIR
+from baron_builder_imports import SAVE_GAME_EXT, BACKUP_EXT, ARCHIVE_EXT
+from collections import OrderedDict
+from save_catalog_class import SaveCatalog
+import os
+import tempfile
+import unittest
+import zipfile
+
+
+class Save_Catalog_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.saveGamePath = self.tempDir.name
+        os.makedirs(os.path.join(self.saveGamePath, TOP_DIR, BACKUP_DIR))
+        os.makedirs(os.path.join(self.saveGamePath, TOP_DIR, ARCHIVE_DIR))
+        self.make_save(os.path.join(self.saveGamePath, "Manual_1" + SAVE_GAME_EXT))
+        self.make_save(os.path.join(self.saveGamePath, TOP_DIR, BACKUP_DIR, "Manual_2" + BACKUP_EXT))
+        self.make_save(os.path.join(self.saveGamePath, TOP_DIR, ARCHIVE_DIR, "Manual_3" + ARCHIVE_EXT))
+        self.test = SaveCatalog(self.saveGamePath)
+        self.assertTrue(self.test.open_catalog())
+
+
+    def tearDown(self):
+        self.test.close_catalog()
+        self.tempDir.cleanup()
+
+
+    def make_save(self, filename):
+        with zipfile.ZipFile(filename, "w") as outZipFile:
+            outZipFile.write(os.path.join("Test_Files", "Linux", "header.json"), "header.json")
+
+
+class Save_Catalog_Class_Test_Normal(Save_Catalog_Class_Tests):
+
+
+    def test_Normal_01_Refresh(self):
+        self.assertEqual(self.test.refresh_catalog(), 3)
+        self.assertEqual(self.test.refresh_catalog(), 0)
+        os.remove(os.path.join(self.saveGamePath, "Manual_1" + SAVE_GAME_EXT))
+        self.assertEqual(self.test.refresh_catalog(), 0)
+        self.assertEqual(self.test.list_saves(SAVE_GAME_EXT), [])
+
+
+    def test_Normal_02_List_Saves(self):
+        self.test.refresh_catalog()
+        entryList = self.test.list_saves(ARCHIVE_EXT, gameName="Yuhra Thorne")
+        self.assertEqual(len(entryList), 1)
+        self.assertEqual(entryList[0]["fileName"], "Manual_3" + ARCHIVE_EXT)
+        self.assertEqual(entryList[0]["Type"], "Manual")
+        self.assertEqual(entryList[0]["gameSeconds"], 472 * 86400 + 13 * 3600 + 54 * 60 + 43.769)
+        self.assertEqual(self.test.list_saves(BACKUP_EXT, gameName="Nobody"), [])
+
+
+    def test_Normal_03_Persistent(self):
+        self.test.refresh_catalog()
+        self.test.close_catalog()
+        self.test = SaveCatalog(self.saveGamePath)
+        self.assertTrue(self.test.open_catalog())
+        self.assertEqual(len(self.test.list_saves(BACKUP_EXT)), 1)
+        self.assertEqual(self.test.refresh_catalog(), 0)
+
+
+    def test_Normal_04_Diff_Saves(self):
+        oldPath = os.path.join(self.saveGamePath, "Manual_1" + SAVE_GAME_EXT)
+        newPath = os.path.join(self.saveGamePath, "Manual_4" + SAVE_GAME_EXT)
+        with open(os.path.join("Test_Files", "Linux", "header.json"), "rb") as inFile:
+            rawHeader = inFile.read()
+        with zipfile.ZipFile(newPath, "w") as outZipFile:
+            outZipFile.writestr("header.json", rawHeader.replace(b'"Type":"Manual"', b'"Type":"Auto"'))
+            outZipFile.write(os.path.join("Test_Files", "Linux", "party.json"), "party.json")
+        self.assertEqual(self.test.diff_saves(oldPath, newPath),
+                         OrderedDict([ ("header.json", [ (("Type",), "changed") ]), ("party.json", [ ((), "added") ]) ]))
+        self.assertEqual(self.test.diff_saves(oldPath, oldPath), OrderedDict())
+        self.test.close_catalog()
+        self.test = SaveCatalog(self.saveGamePath)
+        self.assertTrue(self.test.open_catalog())
+        self.assertIsNotNone(self.test.load_merkle_tree("party.json", zipfile.ZipFile(newPath).getinfo("party.json").CRC,
+                                                        os.path.getsize(os.path.join("Test_Files", "Linux", "party.json"))))
+
+
+class Save_Catalog_Class_Test_Error(Save_Catalog_Class_Tests):
+
+
+    def test_Error_01_Bad_Path(self):
+        self.assertFalse(SaveCatalog(None).cSuccess)
+        self.assertFalse(SaveCatalog("").cSuccess)
+        self.assertFalse(SaveCatalog(os.path.join(self.saveGamePath, "missing")).cSuccess)
+
+
+    def test_Error_02_Bad_Sort(self):
+        self.assertIsNone(self.test.list_saves(SAVE_GAME_EXT, sortBy="bogus"))
+
+
+    def test_Error_03_Bad_Diff(self):
+        self.assertIsNone(self.test.diff_saves(os.path.join(self.saveGamePath, "missing" + SAVE_GAME_EXT),
+                                               os.path.join(self.saveGamePath, "Manual_1" + SAVE_GAME_EXT)))
+        self.assertIsNone(self.test.load_merkle_tree("party.json", 0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,293 @@
+from collections import OrderedDict
+import codecs
+import json
+import os
+
+
+class SaveListIndex():
+    '''
+        PURPOSE - Hold a save game list json file (e.g., steam-saves-release.json, baron-builder-archive.json)
+            in memory so any number of changes cost one parse and one write
+        USAGE
+            1. saveListIndex = SaveListIndex(absSaveGameList)
+            2. saveListIndex.load_list()
+            3. saveListIndex.remove_entries([ "Manual_1.zks", "Manual_2.zks" ])
+            4. saveListIndex.flush_list()
+            5. saveListIndex.close_list_index()
+        NOTES
+            [X] saveListIndex = SaveListIndex(absSaveGameList)  # Instantiates a SaveListIndex object
+            [X] saveListIndex.load_list()                       # Reads and parses the save game list once
+            [X] saveListIndex.add_entries(entryList)            # Adds entries, or updates their versions
+            [X] saveListIndex.copy_entries(nameList)            # Finds entries, ignoring file extensions
+            [X] saveListIndex.remove_entries(nameList)          # Removes entries
+            [X] saveListIndex.bump_version(filename, version)   # Gives an entry a new version
+            [X] saveListIndex.flush_list()                      # Atomically writes all changes at once
+            [X] saveListIndex.close_list_index()                # Zeroizes all data
+            Entries are OrderedDicts of { "Filename" : filename, "Version" : version } kept in file order
+            The list's "Version" is raised to the highest entry version
+            Top-level keys other than "Version" and "Files" are written back unchanged
+            Nothing is written until flush_list()
+    '''
+
+
+    def __init__(self, absSaveGameList):
+        '''
+            PURPOSE - Class ctor
+            INPUT
+                absSaveGameList - Relative or absolute path to the json file storing the list of save games
+            OUTPUT - None
+            NOTES
+                New class attributes must be zeroed in close_list_index()
+        '''
+        # CLASS ATTRIBUTES
+        self.lPath = None        # Absolute filename of the save game list json file
+        self.lListDict = None    # Store the parsed top-level dictionary here
+        self.lEntryDict = None   # Store the { filename : entry } here, in file order
+        self.lVersion = 0        # "Version" of the save game list
+        self.lBom = b""          # Byte order mark the save game list was read with, if any
+        self.lChanged = False    # Set this to True if anything needs to be flushed
+        self.lSuccess = False    # Set this to False if anything fails
+
+        # INPUT VALIDATION
+        if not isinstance(absSaveGameList, str):
+            # print("SaveListIndex ctor:\tabsSaveGameList is not a string")  # DEBUGGING
+            pass
+        elif len(absSaveGameList) <= 0:
+            # print("SaveListIndex ctor:\tabsSaveGameList is empty")  # DEBUGGING
+            pass
+        elif not os.path.isfile(absSaveGameList):
+            # print("SaveListIndex ctor:\t{} is not a file".format(absSaveGameList))  # DEBUGGING
+            pass
+        else:
+            self.lPath = os.path.abspath(absSaveGameList)
+            self.lSuccess = True
+
+
+    def load_list(self):
+        '''
+            PURPOSE - Read and parse the save game list
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Unsaved changes are discarded
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        rawData = None   # Raw bytes of the save game list
+        listDict = None  # Parsed save game list
+
+        # INPUT VALIDATION
+        if self.lSuccess:
+            try:
+                with open(self.lPath, "rb") as inFile:
+                    rawData = inFile.read()
+                self.lBom = codecs.BOM_UTF8 if rawData.startswith(codecs.BOM_UTF8) else b""
+                listDict = json.loads(codecs.decode(rawData, "utf-8-sig"), object_pairs_hook=OrderedDict)
+                self.lVersion = listDict["Version"]
+                self.lEntryDict = OrderedDict([ (entry["Filename"], entry) for entry in listDict["Files"] ])
+                self.lListDict = listDict
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                self.lListDict = None
+                self.lEntryDict = None
+                self.lSuccess = False
+            else:
+                self.lChanged = False
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def add_entries(self, entryList):
+        '''
+            PURPOSE - Add entries to the save game list
+            INPUT
+                entryList - OrderedDict, or list of OrderedDicts, of { "Filename" : filename, "Version" : version }
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Entries already in the list only have their version updated
+                The caller is responsible for validating the entries (see: add_save_game_to_list())
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        oldEntry = None  # Entry already in the list
+
+        # INPUT VALIDATION
+        if isinstance(entryList, dict):
+            entryList = [ entryList ]
+        if self.lSuccess and self.lEntryDict is not None and isinstance(entryList, list):
+            # ADD
+            for entry in entryList:
+                oldEntry = self.lEntryDict.get(entry["Filename"])
+                if oldEntry is None:
+                    self.lEntryDict[entry["Filename"]] = entry
+                else:
+                    oldEntry["Version"] = entry["Version"]
+                self.lVersion = max(self.lVersion, entry["Version"])
+            self.lChanged = True
+            retVal = True
+
+        # DONE
+        return retVal
+
+
+    def copy_entries(self, nameList):
+        '''
+            PURPOSE - Find entries in the save game list, ignoring file extensions
+            INPUT
+                nameList - Filename, or list of filenames, with or without file extensions
+            OUTPUT
+                On success, list of matching entries in file order
+                On failure, None
+            NOTES
+                Matches the way check_filename_no_ext() compares filenames
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        nameSet = None  # Filenames without paths or file extensions
+
+        # INPUT VALIDATION
+        if isinstance(nameList, str):
+            nameList = [ nameList ]
+        if self.lSuccess and self.lEntryDict is not None and isinstance(nameList, list):
+            # FIND
+            nameSet = set([ os.path.splitext(os.path.basename(filename))[0] for filename in nameList ])
+            retVal = [ entry for filename, entry in self.lEntryDict.items()
+                       if os.path.splitext(os.path.basename(filename))[0] in nameSet ]
+
+        # DONE
+        return retVal
+
+
+    def remove_entries(self, nameList):
+        '''
+            PURPOSE - Remove entries from the save game list
+            INPUT
+                nameList - Filename, or list of filenames, to remove
+            OUTPUT
+                On success, list of removed entries in file order
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if isinstance(nameList, str):
+            nameList = [ nameList ]
+        if self.lSuccess and self.lEntryDict is not None and isinstance(nameList, list):
+            # REMOVE
+            nameList = set(nameList)
+            retVal = [ entry for filename, entry in self.lEntryDict.items() if filename in nameList ]
+            for entry in retVal:
+                del self.lEntryDict[entry["Filename"]]
+            if retVal:
+                self.lChanged = True
+
+        # DONE
+        return retVal
+
+
+    def bump_version(self, filename, version=None):
+        '''
+            PURPOSE - Give an entry a new version
+            INPUT
+                filename - Filename of the entry
+                version - Optional new version (defaults to one higher than the save game list's version)
+            OUTPUT
+                On success, the entry's new version
+                On failure, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if version is None:
+            version = self.lVersion + 1
+        if self.lSuccess and self.lEntryDict is not None and filename in self.lEntryDict \
+           and isinstance(version, int) and not isinstance(version, bool):
+            # BUMP
+            self.lEntryDict[filename]["Version"] = version
+            self.lVersion = max(self.lVersion, version)
+            self.lChanged = True
+            retVal = version
+
+        # DONE
+        return retVal
+
+
+    def flush_list(self):
+        '''
+            PURPOSE - Write all changes to the save game list at once
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                No file I/O will take place unless the list has changed
+                The new list is written to a temporary file that replaces the original so a failed
+                    write never leaves a truncated save game list
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        tmpFile = None  # Temporary filename
+        listDict = None  # Save game list to write
+
+        # INPUT VALIDATION
+        if not self.lSuccess or self.lEntryDict is None:
+            pass
+        elif not self.lChanged:
+            retVal = True
+        else:
+            # WRITE
+            tmpFile = self.lPath + ".tmp"
+            listDict = OrderedDict(self.lListDict)
+            listDict["Version"] = self.lVersion
+            listDict["Files"] = list(self.lEntryDict.values())
+            try:
+                with open(tmpFile, "wb") as outFile:
+                    outFile.write(self.lBom + json.dumps(listDict, separators=(",", ":")).encode("utf-8"))
+                    outFile.flush()
+                    os.fsync(outFile.fileno())
+                os.replace(tmpFile, self.lPath)
+            except Exception as err:
+                print(repr(err))  # DEBUGGING
+                if os.path.exists(tmpFile):
+                    os.remove(tmpFile)
+            else:
+                self.lChanged = False
+                retVal = True
+
+        # DONE
+        return retVal
+
+
+    def close_list_index(self):
+        '''
+            PURPOSE - Clear out all class attributes without flushing
+            OUTPUT
+                On success, True
+                On failure, False
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # RESET
+        try:
+            self.lPath = None
+            self.lListDict = None
+            self.lEntryDict = None
+            self.lVersion = 0
+            self.lBom = b""
+            self.lChanged = False
+            self.lSuccess = False
+        except Exception as err:
+            print(repr(err))  # DEBUGGING
+            retVal = False
+        else:
+            retVal = True
+
+        # DONE
+        return retVal
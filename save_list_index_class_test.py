@@ -0,0 +1,143 @@
+from baron_builder_file_mgmt import archive_files, start_storage_dir
+from baron_builder_imports import TOP_DIR, ARCHIVE_DIR, BACKUP_DIR, ARCHIVE_EXT, archGameJson, backGameJson
+from collections import OrderedDict
+from save_list_index_class import SaveListIndex
+from unittest import mock
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import zipfile
+
+
+class Save_List_Index_Class_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.listFile = os.path.join(self.tempDir.name, "steam-saves-release.json")
+        shutil.copyfile(os.path.join("Test_Files", "Linux", "steam-saves-release.json"), self.listFile)
+        with open(self.listFile, "rb") as inFile:
+            self.rawList = inFile.read()
+        self.listDict = json.loads(self.rawList.decode("utf-8-sig"), object_pairs_hook=OrderedDict)
+        self.test = SaveListIndex(self.listFile)
+        self.assertTrue(self.test.load_list())
+
+
+    def tearDown(self):
+        self.test.close_list_index()
+        self.tempDir.cleanup()
+
+
+    def read_list(self):
+        with open(self.listFile, "rb") as inFile:
+            return json.loads(inFile.read().decode("utf-8-sig"), object_pairs_hook=OrderedDict)
+
+
+class Save_List_Index_Class_Test_Normal(Save_List_Index_Class_Tests):
+
+
+    def test_Normal_01_Load(self):
+        self.assertEqual(self.test.lVersion, self.listDict["Version"])
+        self.assertEqual(list(self.test.lEntryDict.values()), self.listDict["Files"])
+        self.assertTrue(self.test.flush_list())
+        with open(self.listFile, "rb") as inFile:
+            self.assertEqual(inFile.read(), self.rawList)
+
+
+    def test_Normal_02_Add(self):
+        oldEntry = self.listDict["Files"][0]
+        newVersion = self.listDict["Version"] + 10
+        self.assertTrue(self.test.add_entries([ OrderedDict([ ("Filename", oldEntry["Filename"]), ("Version", 7) ]),
+                                                OrderedDict([ ("Filename", "New.zks"), ("Version", newVersion) ]) ]))
+        self.assertTrue(self.test.flush_list())
+        newDict = self.read_list()
+        self.assertEqual(newDict["Version"], newVersion)
+        self.assertEqual(len(newDict["Files"]), len(self.listDict["Files"]) + 1)
+        self.assertEqual(newDict["Files"][0]["Version"], 7)
+        self.assertEqual(newDict["Files"][-1]["Filename"], "New.zks")
+
+
+    def test_Normal_03_Copy_Remove(self):
+        nameList = [ entry["Filename"] for entry in self.listDict["Files"][:3] ]
+        copyList = self.test.copy_entries([ os.path.splitext(filename)[0] + ".bba" for filename in nameList ])
+        self.assertEqual(copyList, self.listDict["Files"][:3])
+        self.assertEqual(self.test.remove_entries(list(reversed(nameList))), self.listDict["Files"][:3])
+        self.assertEqual(self.test.remove_entries(nameList), [])
+        self.assertTrue(self.test.flush_list())
+        self.assertEqual(self.read_list()["Files"], self.listDict["Files"][3:])
+
+
+    def test_Normal_04_Batch(self):
+        for entry in self.listDict["Files"][:100]:
+            self.assertEqual(len(self.test.remove_entries(entry["Filename"])), 1)
+        self.assertEqual(self.test.bump_version(self.listDict["Files"][100]["Filename"]), self.listDict["Version"] + 1)
+        self.assertEqual(self.read_list(), self.listDict)
+        self.assertTrue(self.test.flush_list())
+        self.assertFalse(os.path.exists(self.listFile + ".tmp"))
+        newDict = self.read_list()
+        self.assertEqual(newDict["Version"], self.listDict["Version"] + 1)
+        self.assertEqual(len(newDict["Files"]), len(self.listDict["Files"]) - 100)
+        self.assertEqual(newDict["Files"][0]["Version"], self.listDict["Version"] + 1)
+
+
+    def test_Normal_05_Other_Keys(self):
+        with open(self.listFile, "w") as outFile:
+            outFile.write('{"Comment":"Kept","Version":3,"Files":[{"Filename":"Manual_1.zks","Version":3}],"Extra":[1]}')
+        self.assertTrue(self.test.load_list())
+        self.assertEqual(self.test.bump_version("Manual_1.zks"), 4)
+        self.assertTrue(self.test.flush_list())
+        with open(self.listFile, "r") as inFile:
+            self.assertEqual(inFile.read(), '{"Comment":"Kept","Version":4,"Files":[{"Filename":"Manual_1.zks","Version":4}],"Extra":[1]}')
+
+
+    def test_Normal_06_Archive_Files(self):
+        saveGamePath = os.path.join(self.tempDir.name, "saves")
+        archDir = os.path.join(saveGamePath, TOP_DIR, ARCHIVE_DIR)
+        nameList = [ entry["Filename"] for entry in self.listDict["Files"][:3] ]
+        os.makedirs(os.path.join(saveGamePath, TOP_DIR))
+        start_storage_dir(os.path.join(saveGamePath, TOP_DIR, BACKUP_DIR), backGameJson)
+        for filename in nameList:
+            with zipfile.ZipFile(os.path.join(saveGamePath, filename), "w", zipfile.ZIP_DEFLATED) as outZipFile:
+                for member in [ "header.json", "player.json" ]:
+                    outZipFile.write(os.path.join("Test_Files", "Linux", member), member)
+        with mock.patch.object(SaveListIndex, "load_list", autospec=True, side_effect=SaveListIndex.load_list) as loadMock, \
+             mock.patch.object(SaveListIndex, "flush_list", autospec=True, side_effect=SaveListIndex.flush_list) as flushMock:
+            self.assertTrue(archive_files(saveGamePath, [ os.path.join(saveGamePath, filename) for filename in nameList ],
+                                          archDir, srcJson=self.listFile, dstJson=os.path.join(archDir, archGameJson),
+                                          numWorkers=1))
+        self.assertEqual(loadMock.call_count, 2)
+        self.assertEqual(flushMock.call_count, 2)
+        self.assertEqual(self.read_list()["Files"], self.listDict["Files"][3:])
+        with open(os.path.join(archDir, archGameJson), "rb") as inFile:
+            self.assertEqual(json.loads(inFile.read().decode("utf-8-sig"))["Files"], self.listDict["Files"][:3])
+        for filename in nameList:
+            self.assertFalse(os.path.exists(os.path.join(saveGamePath, filename)))
+            self.assertTrue(os.path.isfile(os.path.join(archDir, os.path.splitext(filename)[0] + ARCHIVE_EXT)))
+
+
+class Save_List_Index_Class_Test_Error(Save_List_Index_Class_Tests):
+
+
+    def test_Error_01_Bad_Path(self):
+        for badPath in [ None, "", os.path.join(self.tempDir.name, "missing.json"), self.tempDir.name ]:
+            badIndex = SaveListIndex(badPath)
+            self.assertFalse(badIndex.lSuccess)
+            self.assertFalse(badIndex.load_list())
+            self.assertFalse(badIndex.flush_list())
+            self.assertIsNone(badIndex.remove_entries("Manual_1.zks"))
+
+
+    def test_Error_02_Bad_Contents(self):
+        with open(self.listFile, "w") as outFile:
+            outFile.write('{"Files":[]}')
+        badIndex = SaveListIndex(self.listFile)
+        self.assertFalse(badIndex.load_list())
+        self.assertIsNone(badIndex.copy_entries("Manual_1.zks"))
+        self.assertIsNone(self.test.bump_version("missing.zks"))
+        self.assertIsNone(self.test.bump_version(self.listDict["Files"][0]["Filename"], "1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,16 @@
+from baron_builder_compression import compress_members, select_compression
 from baron_builder_imports import SAVE_GAME_EXT, BACKUP_EXT, ARCHIVE_EXT
+from collections import OrderedDict
+from functools import partial
+from json_diff_class import JsonDiff
 from json_file_class import JsonFile
+from raw_zip_file_class import RawZipFile
 # ZipFile compress_type macros
 from zipfile import ZIP_STORED    # (no compression)
 from zipfile import ZIP_DEFLATED  # (requires zlib)
 from zipfile import ZIP_BZIP2     # (requires bz2)
 from zipfile import ZIP_LZMA      # (requires lzma)
+import codecs
 import json
 import os
 import shutil
@@ -25,32 +31,52 @@ class ZksFile():
                 6. saveGame.close_zks()
             USE CASE #2 - Archive existing .zks
                 1. saveGame = ZksFile("save_game_42.zks")
-                2. saveGame.unpack_file(os.path.join("Baron_Builder", "Working"))
-                3. saveGame.archive_file(os.path.join("Baron_Builder", "Archive"))
-                4. saveGame.close_zks()
+                2. saveGame.archive_file(os.path.join("Baron_Builder", "Archive"))
+                3. saveGame.close_zks()
             USE CASE #3 - Restoring archived .zks (see: .bba)
                 1. saveGame = ZksFile("save_game_42.bba")
-                2. saveGame.unpack_file(os.path.join("Baron_Builder", "Working"))
-                3. saveGame.unarchive_file(os.path.join(saveGameDir)  # Pathfinder Kingmaker's "Saved Games" directory
-                4. saveGame.close_zks()
+                2. saveGame.unarchive_file(os.path.join(saveGameDir)  # Pathfinder Kingmaker's "Saved Games" directory
+                3. saveGame.close_zks()
+            USE CASE #4 - Edit existing .zks without touching the working directory
+                1. saveGame = ZksFile("save_game_42.zks")
+                2. saveGame.unpack_to_memory()
+                3. saveGame.load_data()
+                4. [modify save game contents]
+                5. saveGame.update_zks()
+                6. saveGame.close_zks()
         NOTES
             ### SETUP ###
             [X] saveGame = ZksFile("save_game_42.zks")  # Instantiates a ZksFile object
             [X] saveGame.check_dir(verDir)              # Check for the existence of a directory
             [X] saveGame.make_dirs(newDir)              # Make a new directory(s)
             [X] saveGame.unpack_file(workDir)           # Unarchives the save file into a working directory
+            [X] saveGame.unpack_to_memory()             # Unarchives the save file into memory buffers instead
+            [X] saveGame.read_member(memberName)        # Decompresses one file from the save file on demand
+            [X] saveGame.cache_key(memberName)          # ParseCache key of one file in the save file
+            [X] saveGame.read_file_info(inZipFile)      # Stores the compression type of each file in the save file
             [X] saveGame.load_data()                    # Loads all of the supported json files into JsonFile objects
             [X] saveGame.load_json_file(jsonName)       # Instantiates a specific json object
+            [X] saveGame.set_json_file(jsonName, obj)   # Stores a specific json object
+            [X] saveGame.get_json_file(jsonName)        # Resolves a specific json object
             [X] saveGame.load_json_files()              # Instantiates all supported json objects
             [X] saveGame.save_json_files()              # Saves all supported json objects
+            [X] saveGame.save_json_file(jsonFileObj)    # Saves one json object unless repack_zks() will stream it
             [X] saveGame.close_json_files()             # Closes all supported json objects
             ### FEATURES ###
-            [X] saveGame.archive_file(archiveDir)       # Baron Builder F03 - Unpacks the file and repacks using better compression in archiveDir
-            [X] saveGame.unarchive_file(restoreDir)     # Baron Builder F12 - Unpacks the file and repacks using original compression in restoreDir
+            [X] saveGame.archive_file(archiveDir, n)    # Baron Builder F03 - Repacks the file using better compression in archiveDir
+            [X] saveGame.unarchive_file(restoreDir)     # Baron Builder F12 - Repacks the file using original compression in restoreDir
+            [X] saveGame.transcode_file(dstFile, ctype) # Streams each file into a new zip file using new compression
+            [X] saveGame.transcode_file_parallel(...)   # Compresses each file in a process pool then assembles the new zip file
+            [X] saveGame.transcode_file_info(zInfo, ct) # Describes a file as transcode_file() will write it
+            [X] saveGame.read_archive_comment(zInfo)    # Reads the original compression type of an archived file
+            [X] saveGame.read_header()                  # Decompresses only header.json and returns its summary fields
+            [X] saveGame.compare_zks(otherSave, deep)   # Compares two save files using only their central directories
+            [X] saveGame.same_zks(otherSave)            # True if two save files hold identical files
 
 
             ### TEAR DOWN ###
             [X] saveGame.update_zks()                   # Updates .zks file with modified json files
+            [X] saveGame.repack_zks()                   # Rewrites .zks file, recompressing only modified files
             [X] saveGame.close_zks()                    # Closes the .zks file
         JSON FILES SUPPORTED
             - header.json
@@ -59,6 +85,8 @@ class ZksFile():
             - statistic.json
             New json files to be supported must be added to the following locations:
                 - ZksFile.self.zSupportedJson
+                - ZksFile.self.set_json_file()
+                - ZksFile.self.get_json_file()
                 - ZksFile.self.save_json_files()
                 - ZksFile.self.close_json_files()
     '''
@@ -66,6 +94,15 @@ class ZksFile():
     saveGameExt = SAVE_GAME_EXT  # Pathfinder Kingmaker save game file extension
     backupExt = BACKUP_EXT       # Baron Builder file extension for backed up save games
     archiveExt = ARCHIVE_EXT     # Baron Builder file extension for archived save games
+    archiveCommentPrefix = b"compress_type="  # Archived files record their original compression type here
+    transcodeBufSize = 64 * 1024                # Bytes to copy at a time when transcoding a save game file
+    headerJson = "header.json"                  # Save game file holding the save game summary
+    selectiveJson = True                        # Parse top-level json keys on demand (see: JsonFile.extract_data())
+    leanJson = False                            # Parse json into compact dicts at the cost of splicing (see: JsonFile.lean_node())
+    parseCache = None                           # ParseCache shared by in-memory json files, if any (see: JsonFile)
+    internPool = None                           # JsonInternPool shared by all json files, if any (see: JsonFile)
+    # header.json fields returned by read_header()
+    headerFields = [ "Name", "GameName", "Area", "SystemSaveTime", "GameSaveTime", "GameTotalTime", "Type" ]
 
 
     def __init__(self, filename):
@@ -90,12 +127,15 @@ class ZksFile():
         # JSON Files Supported by the ZksFile class
         self.zSupportedJson = [ "header.json", "party.json", "player.json", "statistic.json" ]
         # Save Game File Extensions supported by ZksFile class
-        self.zSaveGameExts = [ self.saveGameExt, self.archiveExt ]
+        self.zSaveGameExts = [ self.saveGameExt, self.backupExt, self.archiveExt ]
         self.zHeadFile = None     # header.json JsonFile object
         self.zPartFile = None     # party.json JsonFile object
         self.zPlayFile = None     # player.json JsonFile object
         self.zStatFile = None     # statistic.json JsonFile object
         self.zFileDict = None     # Store the { filename : ZipInfo.compress_type } here during unpacking
+        self.zInfoList = None     # Store the original ZipInfo objects here, in archive order, during unpacking
+        self.zInMemory = False    # Set this to True if the save game was unpacked into memory
+        self.zMemberDict = None   # Store the { filename : raw bytes } here when unpacking into memory
 
         # LOCAL VARIABLES
         zNameSplit = []  # Store the result of os.path.splitext(self.zName) here
@@ -248,22 +288,7 @@ class ZksFile():
                     # print("Original File Name:\t{}".format(self.origFileName))  # DEBUGGING
                     with zipfile.ZipFile(self.origFileName, "r") as inZipFile:
                         # STORE THE FILE INFO
-                        self.zFileDict = {}
-                        for zFileInfo in inZipFile.infolist():
-                            if ZIP_STORED == zFileInfo.compress_type:
-                                self.zFileDict[zFileInfo.filename] = ZIP_STORED
-                            elif ZIP_LZMA == zFileInfo.compress_type:
-                                self.zFileDict[zFileInfo.filename] = ZIP_LZMA
-                            elif ZIP_DEFLATED == zFileInfo.compress_type:
-                                self.zFileDict[zFileInfo.filename] = ZIP_DEFLATED
-                            elif ZIP_BZIP2 == zFileInfo.compress_type:
-                                self.zFileDict[zFileInfo.filename] = ZIP_BZIP2
-                            else:
-                                print("Detected unknown ZipInfo.compress_type for {}".format(zFileInfo.filename))  # DEBUGGING
-                                retVal = False
-                                self.zSuccess = False
-                                break
-                            # print("{} was compressed with {}".format(zFileInfo.filename, self.zFileDict[zFileInfo.filename]))  # DEBUGGING
+                        retVal = self.read_file_info(inZipFile)
 
                         # EXTRACT THE FILES
                         if retVal is True and self.zSuccess is True:
@@ -279,15 +304,166 @@ class ZksFile():
         return retVal
 
 
-    def archive_file(self, archiveDir):
+    def unpack_to_memory(self, lazy=True):
+        '''
+            PURPOSE - Unpack a save game file into memory buffers instead of a working directory
+            INPUT
+                lazy - If True, only read the zip's central directory and decompress each file the
+                    first time it is needed
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTE
+                Nothing is written to disk.  The raw bytes of each file are stored in
+                    self.zMemberDict and update_zks() builds the new save game straight from them.
+                See read_member() for on demand access to a file's raw bytes
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # INPUT VALIDATION
+        if not self.zSuccess:
+            retVal = self.zSuccess
+        else:
+            # UNPACK THE FILE
+            try:
+                with zipfile.ZipFile(self.origFileName, "r") as inZipFile:
+                    # STORE THE FILE INFO
+                    retVal = self.read_file_info(inZipFile)
+
+                    # READ THE FILES
+                    if retVal is True and self.zSuccess is True:
+                        self.zMemberDict = {}
+                        if lazy is False:
+                            for zFileInfo in self.zInfoList:
+                                self.zMemberDict[zFileInfo.filename] = inZipFile.read(zFileInfo)
+            except Exception as err:
+                print("\n{}".format(repr(err)))
+                retVal = False
+                self.zSuccess = False
+            else:
+                if retVal is True:
+                    self.zInMemory = True
+
+        # DONE
+        return retVal
+
+
+    def read_member(self, memberName):
+        '''
+            PURPOSE - Resolve a file in an in-memory save game to its raw bytes
+            INPUT
+                memberName - Filename of a file in the save game
+            OUTPUT
+                On success, the raw bytes of memberName
+                On failure, None
+            NOTES
+                The file is only decompressed the first time it is requested
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if not self.zSuccess or not self.zInMemory:
+            pass
+        elif memberName not in self.zFileDict.keys():
+            # print("ZksFile.read_member():\t{} is not in the save game".format(memberName))  # DEBUGGING
+            pass
+        elif memberName in self.zMemberDict.keys():
+            retVal = self.zMemberDict[memberName]
+        else:
+            # READ THE FILE
+            try:
+                with zipfile.ZipFile(self.origFileName, "r") as inZipFile:
+                    retVal = inZipFile.read(memberName)
+            except Exception as err:
+                print("\n{}".format(repr(err)))
+                retVal = None
+                self.zSuccess = False
+            else:
+                self.zMemberDict[memberName] = retVal
+
+        # DONE
+        return retVal
+
+
+    def cache_key(self, memberName):
+        '''
+            PURPOSE - Build the ParseCache key of a file in an in-memory save game
+            INPUT
+                memberName - Filename of a file in the save game
+            OUTPUT
+                On success, a (member name, CRC32, uncompressed size) tuple
+                On failure, None
+            NOTES
+                Lean json files are cached separately since they are parsed into different types
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # INPUT VALIDATION
+        if self.zSuccess and self.zInMemory and self.zInfoList is not None:
+            for zFileInfo in self.zInfoList:
+                if zFileInfo.filename == memberName:
+                    retVal = (memberName + ".lean" if self.leanJson else memberName, zFileInfo.CRC, zFileInfo.file_size)
+                    break
+
+        # DONE
+        return retVal
+
+
+    def read_file_info(self, inZipFile):
+        '''
+            PURPOSE - Store the file info of an open save game file
+            INPUT
+                inZipFile - ZipFile object opened on self.origFileName
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Populates self.zFileDict and self.zInfoList
+        '''
+        # LOCAL VARIABLES
+        retVal = True
+
+        # STORE THE FILE INFO
+        self.zFileDict = {}
+        self.zInfoList = inZipFile.infolist()
+        for zFileInfo in self.zInfoList:
+            if ZIP_STORED == zFileInfo.compress_type:
+                self.zFileDict[zFileInfo.filename] = ZIP_STORED
+            elif ZIP_LZMA == zFileInfo.compress_type:
+                self.zFileDict[zFileInfo.filename] = ZIP_LZMA
+            elif ZIP_DEFLATED == zFileInfo.compress_type:
+                self.zFileDict[zFileInfo.filename] = ZIP_DEFLATED
+            elif ZIP_BZIP2 == zFileInfo.compress_type:
+                self.zFileDict[zFileInfo.filename] = ZIP_BZIP2
+            else:
+                print("Detected unknown ZipInfo.compress_type for {}".format(zFileInfo.filename))  # DEBUGGING
+                retVal = False
+                self.zSuccess = False
+                break
+            # print("{} was compressed with {}".format(zFileInfo.filename, self.zFileDict[zFileInfo.filename]))  # DEBUGGING
+
+        # DONE
+        return retVal
+
+
+    def archive_file(self, archiveDir, numWorkers=None, profile=None):
         '''
             PURPOSE - Repack a save game file into a archive directory using better compression
             INPUT
                 archiveDir - Absolute or relative path to make a new archive
+                numWorkers - Optional number of processes to compress with, defaults to one
+                profile - Optional compression profile (see: baron_builder_compression), defaults
+                    to ZIP_LZMA for every file
             OUTPUT
                 On success, True
                 On failure, False
                 On bad input, None
+            NOTES
+                The save game is transcoded straight into the archive (see: transcode_file())
+                Each file's original compression type is recorded so unarchive_file() can restore it
         '''
         # LOCAL VARIABLES
         retVal = None
@@ -299,40 +475,22 @@ class ZksFile():
             pass
         elif 0 >= len(archiveDir):
             pass
-        elif self.fullWorkPath is None:
-            print("self.fullWorkPath is None")  # DEBUGGING
-            retVal = False
-        elif os.path.exists(self.fullWorkPath) is False:
-            print("{} does not exist".format(self.fullWorkPath))  # DEBUGGING
-            retVal = False
-        elif os.path.isdir(self.fullWorkPath) is False:
-            print("{} is not a directory".format(self.fullWorkPath))  # DEBUGGING
-            retVal = False
-        elif not os.listdir(self.fullWorkPath):
-            print("{} is empty".format(self.fullWorkPath))  # DEBUGGING
-            retVal = False
+        elif numWorkers is not None and not isinstance(numWorkers, int):
+            pass
+        elif numWorkers is not None and numWorkers < 1:
+            pass
         else:
-            # UNPACK THE FILE
+            # REPACK THE FILE
             # 1. Setup Directories and Attributes
             retVal = self.make_dirs(archiveDir)
             self.fullArchFile = self.zModDir + self.archiveExt
 
-            try:
-                # 2. Get file list
-                for root, dirs, files in os.walk(self.fullWorkPath):
-                    rootDir = root
-                    dirsFound = dirs
-                    filesFound = files
-
-                # 3. Add those files to the working archive
-                with zipfile.ZipFile(os.path.join(archiveDir, self.fullArchFile), "w", compression=ZIP_LZMA) as outZipFile:
-                    for file in filesFound:
-                        outZipFile.write(os.path.join(rootDir, file), os.path.basename(file))
-            except Exception as err:
-                print("\n{}".format(repr(err)))  # DEBUGGING
-                retVal = False
-            else:
-                retVal = True
+            # 2. Transcode the save game into the archive
+            if retVal is True:
+                retVal = self.transcode_file(os.path.join(archiveDir, self.fullArchFile), ZIP_LZMA, numWorkers, profile)
+
+        # DONE
+        return retVal
 
 
     def unarchive_file(self, restoreDir):
@@ -344,6 +502,8 @@ class ZksFile():
                 On success, True
                 On failure, False
                 On bad input, None
+            NOTES
+                The archive is transcoded straight into restoreDir (see: transcode_file())
         '''
         # LOCAL VARIABLES
         retVal = None
@@ -355,20 +515,8 @@ class ZksFile():
             pass
         elif 0 >= len(restoreDir):
             pass
-        elif self.fullWorkPath is None:
-            print("self.fullWorkPath is None")  # DEBUGGING
-            retVal = False
-        elif os.path.exists(self.fullWorkPath) is False:
-            print("{} does not exist".format(self.fullWorkPath))  # DEBUGGING
-            retVal = False
-        elif os.path.isdir(self.fullWorkPath) is False:
-            print("{} is not a directory".format(self.fullWorkPath))  # DEBUGGING
-            retVal = False
-        elif not os.listdir(self.fullWorkPath):
-            print("{} is empty".format(self.fullWorkPath))  # DEBUGGING
-            retVal = False
         else:
-            # UNPACK THE FILE
+            # REPACK THE FILE
             # 1. Setup Directories and Attributes
             retVal = self.make_dirs(restoreDir)
             self.fullRestFile = self.zModDir + self.saveGameExt
@@ -376,24 +524,304 @@ class ZksFile():
             if os.path.exists(os.path.join(restoreDir, self.fullRestFile)) is True:
                 print("Unarchive file {} already exists in directory {}".format(self.fullRestFile, restoreDir))
                 retVal = False
+            elif retVal is True:
+                # 2. Transcode the archive into the restored save game
+                retVal = self.transcode_file(os.path.join(restoreDir, self.fullRestFile))
+
+        # DONE
+        return retVal
+
+
+    def transcode_file(self, dstFileName, compressType=None, numWorkers=None, profile=None):
+        '''
+            PURPOSE - Stream each file in the save game file into a new zip file, one file at a time
+            INPUT
+                dstFileName - Relative or absolute filename of the new zip file
+                compressType - ZipFile compress_type macro for the new zip file.  If None, each file
+                    is restored to the original compression type recorded when it was archived.
+                numWorkers - Optional number of processes to compress with.  If greater than 1,
+                    the files are compressed in parallel (see: transcode_file_parallel()).
+                profile - Optional compression profile that chooses each file's compression type
+                    and level in place of compressType (see: transcode_file_parallel())
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Nothing is unpacked to disk.  Each file is copied through a buffer of
+                    self.transcodeBufSize bytes.
+                When compressType is given, each file's current compression type is recorded in its
+                    ZipInfo.comment (see: self.archiveCommentPrefix)
+                If the save game has no recorded compression type for a file, ZIP_DEFLATED is used
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        newInfo = None       # ZipInfo object for a file in dstFileName
+
+        # TRANSCODE THE FILE
+        try:
+            with zipfile.ZipFile(self.origFileName, "r") as inZipFile:
+                retVal = self.read_file_info(inZipFile)
+                if retVal is not True:
+                    pass
+                elif (isinstance(numWorkers, int) and numWorkers > 1) or profile is not None:
+                    retVal = self.transcode_file_parallel(inZipFile, dstFileName, compressType, numWorkers, profile)
+                else:
+                    with zipfile.ZipFile(dstFileName, "w") as outZipFile:
+                        for zFileInfo in self.zInfoList:
+                            newInfo = self.transcode_file_info(zFileInfo, compressType)
+                            with inZipFile.open(zFileInfo, "r") as inFile:
+                                with outZipFile.open(newInfo, "w") as outFile:
+                                    shutil.copyfileobj(inFile, outFile, self.transcodeBufSize)
+        except Exception as err:
+            print("\n{}".format(repr(err)))  # DEBUGGING
+            retVal = False
+
+        if retVal is False and os.path.exists(dstFileName):
+            os.remove(dstFileName)
+
+        # DONE
+        return retVal
+
+
+    def transcode_file_parallel(self, inZipFile, dstFileName, compressType, numWorkers, profile=None):
+        '''
+            PURPOSE - Compress every file in the save game file in a process pool and assemble the
+                new zip file from the precompressed data
+            INPUT
+                inZipFile - ZipFile object, opened for reading, of self.origFileName
+                dstFileName - Relative or absolute filename of the new zip file
+                compressType - See: transcode_file()
+                numWorkers - Number of processes to compress with, None for one (see: compress_members())
+                profile - Optional compression profile (see: select_compression())
+            OUTPUT
+                On success, True
+                On failure, False
+                On error, Exception
+            NOTES
+                The new zip file is byte-for-byte what transcode_file() writes serially
+                Every file is decompressed into memory before compression starts
+                No data descriptors are needed since the sizes are known before each local header
+                    is written
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        newInfoList = []   # ZipInfo objects for the files in dstFileName
+        dataList = []      # Uncompressed contents of each file
+        levelList = []     # Compression level of each file
+        rawList = []       # (CRC32, compressed bytes) of each file
+        rawZipFile = None  # RawZipFile object of dstFileName
+        newInfo = None     # ZipInfo object for a file in dstFileName
+        compLevel = None   # Compression level of a file in dstFileName
+
+        # COMPRESS THE FILES
+        for zFileInfo in self.zInfoList:
+            newInfo = self.transcode_file_info(zFileInfo, compressType)
+            dataList.append(inZipFile.read(zFileInfo))
+            if profile is not None:
+                newInfo.compress_type, compLevel = select_compression(zFileInfo.filename, dataList[-1], profile)
+            newInfoList.append(newInfo)
+            levelList.append(compLevel)
+        rawList = compress_members(dataList, [ newInfo.compress_type for newInfo in newInfoList ],
+                                   levelList, 1 if numWorkers is None else numWorkers)
+
+        # ASSEMBLE THE ZIP FILE
+        rawZipFile = RawZipFile(dstFileName)
+        retVal = rawZipFile.open_zip_file()
+        if retVal is True:
+            for newInfo, (crc, rawData), data in zip(newInfoList, rawList, dataList):
+                retVal = rawZipFile.add_raw_member(newInfo, rawData, crc, len(data))
+                if retVal is not True:
+                    break
+            if rawZipFile.close_zip_file() is not True:
+                retVal = False
+
+        # DONE
+        return retVal
+
+
+    def transcode_file_info(self, zFileInfo, compressType):
+        '''
+            PURPOSE - Describe a file from the save game file as it will be written by transcode_file()
+            INPUT
+                zFileInfo - ZipInfo object of a file in self.origFileName
+                compressType - See: transcode_file()
+            OUTPUT
+                New ZipInfo object
+        '''
+        # LOCAL VARIABLES
+        retVal = zipfile.ZipInfo(zFileInfo.filename, zFileInfo.date_time)
+        newCompType = compressType  # Compression type of the new file
+
+        # DETERMINE THE COMPRESSION
+        if newCompType is None:
+            newCompType = self.read_archive_comment(zFileInfo)
+            if newCompType is None:
+                newCompType = ZIP_DEFLATED
+
+        # DESCRIBE THE NEW FILE
+        retVal.compress_type = newCompType
+        retVal.file_size = zFileInfo.file_size
+        retVal.external_attr = zFileInfo.external_attr
+        if compressType is not None:
+            retVal.comment = self.archiveCommentPrefix + str(zFileInfo.compress_type).encode("ascii")
+
+        # DONE
+        return retVal
+
+
+    def read_archive_comment(self, zFileInfo):
+        '''
+            PURPOSE - Translate an archived file's ZipInfo.comment into its original compression type
+            INPUT
+                zFileInfo - ZipInfo object of a file in an archived save game
+            OUTPUT
+                On success, the original ZipFile compress_type macro
+                If no compression type was recorded, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # PARSE THE COMMENT
+        if zFileInfo.comment.startswith(self.archiveCommentPrefix):
+            try:
+                retVal = int(zFileInfo.comment[len(self.archiveCommentPrefix):])
+            except ValueError:
+                retVal = None
             else:
-                try:
-                    # 2. Get file list
-                    for root, dirs, files in os.walk(self.fullWorkPath):
-                        rootDir = root
-                        dirsFound = dirs
-                        filesFound = files
-
-                    # 3. Add those files to the working archive
-                    with zipfile.ZipFile(os.path.join(restoreDir, self.fullRestFile), "w", compression=ZIP_DEFLATED) as outZipFile:
-                        for file in filesFound:
-                            outZipFile.write(os.path.join(rootDir, file), os.path.basename(file))
-                except Exception as err:
-                    print("\n{}".format(repr(err)))  # DEBUGGING
-                    retVal = False
+                if retVal not in [ ZIP_STORED, ZIP_DEFLATED, ZIP_BZIP2, ZIP_LZMA ]:
+                    retVal = None
+
+        # DONE
+        return retVal
+
+
+    def read_header(self):
+        '''
+            PURPOSE - Read the summary fields of a save game without unpacking it
+            OUTPUT
+                On success, OrderedDict of { header field : value } for each of self.headerFields
+                On failure, None
+            NOTES
+                Only header.json is decompressed.  Nothing is written to disk and no other
+                    attributes are modified.
+                Header fields missing from header.json are None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        rawHeader = None  # Raw bytes of header.json
+        headerDict = {}   # Parsed header.json
+
+        # INPUT VALIDATION
+        if self.zSuccess:
+            # READ THE HEADER
+            try:
+                if self.zInMemory is True:
+                    rawHeader = self.read_member(self.headerJson)
                 else:
-                    retVal = True
+                    with zipfile.ZipFile(self.origFileName, "r") as inZipFile:
+                        rawHeader = inZipFile.read(self.headerJson)
+                if rawHeader is not None:
+                    headerDict = json.loads(codecs.decode(rawHeader, "utf-8-sig"))
+            except Exception as err:
+                print("\n{}".format(repr(err)))  # DEBUGGING
+            else:
+                if isinstance(headerDict, dict) and rawHeader is not None:
+                    retVal = OrderedDict()
+                    for headerField in self.headerFields:
+                        retVal[headerField] = headerDict.get(headerField)
+
+        # DONE
+        return retVal
+
+
+    def compare_zks(self, otherSave, deep=False):
+        '''
+            PURPOSE - Compare two save game files using only their central directories
+            INPUT
+                otherSave - ZksFile object, or filename, of the save game file to compare against
+                deep - Optional; if True, supported json files whose contents differ are compared
+                    with JsonDiff
+            OUTPUT
+                On success, OrderedDict of { filename : change } for each file that differs, where
+                    change is one of:
+                    "added" - Only otherSave holds the file
+                    "removed" - Only this save game holds the file
+                    "changed" - The CRC32 or uncompressed size differ
+                    "recompressed" - Same contents, different compression type
+                    If deep is True, changed json files map to their list of JsonDiff records instead
+                On failure, None
+            NOTES
+                An OrderedDict that is empty, or only holds "recompressed" files, means the contents
+                    are identical (see: same_zks())
+                Nothing is decompressed unless deep is True, and then only the changed json files
+                Both files are compared as they are on disk, without any unsaved modifications
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+        otherFileName = otherSave  # Filename of otherSave
+        infoDict = None            # { filename : ZipInfo } of this save game file
+        otherInfoDict = None       # { filename : ZipInfo } of otherSave
+        otherInfo = None           # ZipInfo of the current file in otherSave
+        recordList = None          # Return value from JsonDiff.diff_json_files()
+
+        # INPUT VALIDATION
+        if isinstance(otherSave, ZksFile):
+            otherFileName = otherSave.origFileName
+        if self.zSuccess and isinstance(otherFileName, str):
+            # COMPARE THE CENTRAL DIRECTORIES
+            try:
+                with zipfile.ZipFile(self.origFileName, "r") as inZipFile, \
+                     zipfile.ZipFile(otherFileName, "r") as otherZipFile:
+                    infoDict = OrderedDict([ (zFileInfo.filename, zFileInfo) for zFileInfo in inZipFile.infolist() ])
+                    otherInfoDict = OrderedDict([ (zFileInfo.filename, zFileInfo) for zFileInfo in otherZipFile.infolist() ])
+                    retVal = OrderedDict()
+                    for fileName, zFileInfo in infoDict.items():
+                        otherInfo = otherInfoDict.get(fileName)
+                        if otherInfo is None:
+                            retVal[fileName] = "removed"
+                        elif (zFileInfo.CRC, zFileInfo.file_size) != (otherInfo.CRC, otherInfo.file_size):
+                            retVal[fileName] = "changed"
+                            if deep and fileName in self.zSupportedJson:
+                                # COMPARE THE CONTENTS
+                                recordList = JsonDiff().diff_json_files(
+                                    JsonFile(fileName, partial(inZipFile.read, fileName)),
+                                    JsonFile(fileName, partial(otherZipFile.read, fileName)))
+                                if recordList is not None:
+                                    retVal[fileName] = recordList
+                        elif zFileInfo.compress_type != otherInfo.compress_type:
+                            retVal[fileName] = "recompressed"
+                    for fileName in otherInfoDict.keys():
+                        if fileName not in infoDict:
+                            retVal[fileName] = "added"
+            except Exception as err:
+                print("\n{}".format(repr(err)))  # DEBUGGING
+                retVal = None
 
+        # DONE
+        return retVal
+
+
+    def same_zks(self, otherSave):
+        '''
+            PURPOSE - Determine if two save game files hold identical files (e.g., a backup and the live
+                save game) without decompressing either one
+            INPUT
+                otherSave - ZksFile object, or filename, of the save game file to compare against
+            OUTPUT
+                If every file has the same name, CRC32, and size, True
+                Otherwise, False
+            NOTES
+                Compression types are ignored so archived save games match their originals
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        changeDict = self.compare_zks(otherSave)  # Return value from compare_zks()
+
+        # COMPARE
+        if changeDict is not None:
+            retVal = all([ "recompressed" == change for change in changeDict.values() ])
+
+        # DONE
         return retVal
 
 
@@ -448,6 +876,20 @@ class ZksFile():
         elif 0 >= len(jsonName):
             # print("ZksFile.load_json_file():\tJson file name was empty")  # DEBUGGING
             pass
+        elif self.zInMemory and os.path.basename(jsonName) not in self.zFileDict.keys():
+            # print("ZksFile.load_json_file():\tJson file {} is not in the save game".format(jsonName))  # DEBUGGING
+            retVal = False
+        elif self.zInMemory:
+            baseJsonName = os.path.basename(jsonName)
+            if baseJsonName not in self.zSupportedJson:
+                print("ZksFile.load_json_file():\tJson file {} is not supported".format(jsonName))  # DEBUGGING
+                retVal = False
+            else:
+                retVal = self.set_json_file(baseJsonName, JsonFile(baseJsonName, partial(self.read_member, baseJsonName),
+                                                                   selective=self.selectiveJson, lean=self.leanJson,
+                                                                   parseCache=self.parseCache,
+                                                                   cacheKey=self.cache_key(baseJsonName),
+                                                                   internPool=self.internPool))
         elif not os.path.exists(jsonName):
             # print("ZksFile.load_json_file():\tJson file {} does not exist".format(jsonName))  # DEBUGGING
             retVal = False
@@ -466,25 +908,9 @@ class ZksFile():
                     print("ZksFile.load_json_file():\tJson file {} is not supported".format(jsonName))  # DEBUGGING
                     retVal = False
                 else:
-                    if "header.json" == baseJsonName:
-                        self.zHeadFile = JsonFile(os.path.join(self.fullWorkPath, baseJsonName))
-                        retVal = self.zHeadFile.jSuccess
-                        self.zSuccess = retVal
-                    elif "party.json" == baseJsonName:
-                        self.zPartFile = JsonFile(os.path.join(self.fullWorkPath, baseJsonName))
-                        retVal = self.zPartFile.jSuccess
-                        self.zSuccess = retVal
-                    elif "player.json" == baseJsonName:
-                        self.zPlayFile = JsonFile(os.path.join(self.fullWorkPath, baseJsonName))
-                        retVal = self.zPlayFile.jSuccess
-                        self.zSuccess = retVal
-                    elif "statistic.json" == baseJsonName:
-                        self.zStatFile = JsonFile(os.path.join(self.fullWorkPath, baseJsonName))
-                        retVal = self.zStatFile.jSuccess
-                        self.zSuccess = retVal
-                    else:
-                        raise RuntimeError("load_json_file() appears to be missing an implementation for a supported json file")  # DEBUGGING
-                        retVal = False
+                    retVal = self.set_json_file(baseJsonName, JsonFile(os.path.join(self.fullWorkPath, baseJsonName),
+                                                                       selective=self.selectiveJson, lean=self.leanJson,
+                                                                       internPool=self.internPool))
 
         # DONE
         if retVal is False:
@@ -495,6 +921,66 @@ class ZksFile():
         return retVal
 
 
+    def set_json_file(self, baseJsonName, jsonFileObj):
+        '''
+            PURPOSE - Store a JsonFile object in the attribute for its supported json file
+            INPUT
+                baseJsonName - Base filename of a supported json file
+                jsonFileObj - JsonFile object instantiated for baseJsonName
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTE:
+                see self.zSupportedJson for a list of supported json files
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # STORE THE OBJECT
+        if "header.json" == baseJsonName:
+            self.zHeadFile = jsonFileObj
+        elif "party.json" == baseJsonName:
+            self.zPartFile = jsonFileObj
+        elif "player.json" == baseJsonName:
+            self.zPlayFile = jsonFileObj
+        elif "statistic.json" == baseJsonName:
+            self.zStatFile = jsonFileObj
+        else:
+            raise RuntimeError("set_json_file() appears to be missing an implementation for a supported json file")  # DEBUGGING
+
+        retVal = jsonFileObj.jSuccess
+        self.zSuccess = retVal
+
+        # DONE
+        return retVal
+
+
+    def get_json_file(self, baseJsonName):
+        '''
+            PURPOSE - Resolve a supported json filename to its JsonFile object
+            INPUT
+                baseJsonName - Base filename of a supported json file
+            OUTPUT
+                On success, the JsonFile object (None if it hasn't been loaded)
+                If baseJsonName is not supported, None
+        '''
+        # LOCAL VARIABLES
+        retVal = None
+
+        # RESOLVE THE OBJECT
+        if "header.json" == baseJsonName:
+            retVal = self.zHeadFile
+        elif "party.json" == baseJsonName:
+            retVal = self.zPartFile
+        elif "player.json" == baseJsonName:
+            retVal = self.zPlayFile
+        elif "statistic.json" == baseJsonName:
+            retVal = self.zStatFile
+
+        # DONE
+        return retVal
+
+
     def load_json_files(self):
         '''
             PURPOSE - Instantiate JsonFile objects for all support json filename
@@ -513,6 +999,11 @@ class ZksFile():
         # INPUT VALIDATION
         if not self.zSuccess:
             retVal = self.zSuccess
+        elif self.zInMemory:
+            for jsonFileName in self.zSupportedJson:
+                retVal = self.load_json_file(jsonFileName)
+                if retVal is not True:
+                    break
         elif not os.path.isdir(self.fullWorkPath):
             print("\nThe save game does not appear to have been unpacked.")
             retVal = False
@@ -543,22 +1034,47 @@ class ZksFile():
         # INPUT VALIDATION
         if not self.zSuccess:
             retVal = self.zSuccess
-        elif not os.path.isdir(self.fullWorkPath):
+        elif not self.zInMemory and not os.path.isdir(self.fullWorkPath):
             print("\nThe save game does not appear to have been unpacked.")
             retVal = False
         else:
             # header.json
             if self.zHeadFile is not None:
-                retVal = self.zHeadFile.write_json_file()
+                retVal = self.save_json_file(self.zHeadFile)
             # party.json
             if retVal and self.zPartFile is not None:
-                retVal = self.zPartFile.write_json_file()
+                retVal = self.save_json_file(self.zPartFile)
             # player.json
             if retVal and self.zPlayFile is not None:
-                retVal = self.zPlayFile.write_json_file()
+                retVal = self.save_json_file(self.zPlayFile)
             # statistic.json
             if retVal and self.zStatFile is not None:
-                retVal = self.zStatFile.write_json_file()
+                retVal = self.save_json_file(self.zStatFile)
+
+        # DONE
+        return retVal
+
+
+    def save_json_file(self, jsonFileObj):
+        '''
+            PURPOSE - Save changes for one JsonFile object
+            INPUT
+                jsonFileObj - JsonFile object of a supported json file
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Deferred edits (see: JsonFile.jEditDict) of an in-memory save game are left for
+                    repack_zks() to stream from the original save game into the new one
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+
+        # SAVE
+        if self.zInMemory and jsonFileObj.jDict is None and jsonFileObj.jEditDict is not None:
+            retVal = True  # repack_zks() will stream the edits
+        else:
+            retVal = jsonFileObj.write_json_file()
 
         # DONE
         return retVal
@@ -623,12 +1139,11 @@ class ZksFile():
             OUTPUT
                 On success, True
                 On failure, False
+            NOTES
+                See repack_zks() for details on how the save game is rewritten
         '''
         # LOCAL VARIABLES
         retVal = False
-        rootDir = ""     # Root directory for os.walk(self.fullWorkPath)
-        dirsFound = []   # Directory list for os.walk(self.fullWorkPath)
-        filesFound = []  # List of all the files in this save game's specific working directory
 
         # INPUT VALIDATION
         if not self.zSuccess:
@@ -642,26 +1157,8 @@ class ZksFile():
                 print("\n{}".format(repr(err)))  # DEBUGGING
                 retVal = False
             else:
-                try:
-                    # 2. Get file list
-                    for root, dirs, files in os.walk(self.fullWorkPath):
-                        rootDir = root
-                        dirsFound = dirs
-                        filesFound = files
-
-                    # 3. Add those files to the working archive
-                    with zipfile.ZipFile(os.path.join(self.fullWorkPath, self.zName), "w") as outZipFile:
-                        for file in filesFound:
-                            outZipFile.write(os.path.join(rootDir, file), os.path.basename(file), self.zFileDict[file])
-
-                    # 4. Replace the old save game with the new
-                    os.remove(self.origFileName)
-                    shutil.move(os.path.join(self.fullWorkPath, self.zName), self.origFileName)
-                except Exception as err:
-                    print("\n{}".format(repr(err)))  # DEBUGGING
-                    retVal = False
-                else:
-                    retVal = True
+                # 2. Rebuild the save game from the original and the modified json files
+                retVal = self.repack_zks()
 
         # DONE
         if retVal is False:
@@ -670,6 +1167,92 @@ class ZksFile():
         return retVal
 
 
+    def repack_zks(self):
+        '''
+            PURPOSE - Rewrite the original save game .zks, recompressing only the modified json files
+            INPUT - None
+            OUTPUT
+                On success, True
+                On failure, False
+            NOTES
+                Called by update_zks() after the json files have been saved
+                Unmodified files are copied from the original save game without being decompressed,
+                    reusing their CRC and compressed size
+                If nothing was modified, nothing is written
+                The new save game is written next to the original and then moved over it
+                Deferred edits of an in-memory save game are applied while streaming the original
+                    file into the new save game, so the file is never parsed or held in memory twice
+        '''
+        # LOCAL VARIABLES
+        retVal = False
+        tmpFileName = self.origFileName + ".tmp"  # Write the new save game here first
+        jsonFileObj = None                        # JsonFile object for a given file, if any
+        dirtyDict = {}                            # { filename : new raw bytes } of modified json files
+        streamDict = {}                           # { filename : JsonFile object } of files with deferred edits
+        rawZipFile = None                         # RawZipFile object of the new save game
+
+        # FIND THE MODIFIED FILES
+        for baseJsonName in self.zSupportedJson:
+            jsonFileObj = self.get_json_file(baseJsonName)
+            if jsonFileObj is not None and jsonFileObj.jChanged is True:
+                if self.zInMemory and jsonFileObj.jDict is None and jsonFileObj.jEditDict is not None:
+                    streamDict[baseJsonName] = jsonFileObj
+                elif self.zInMemory:
+                    dirtyDict[baseJsonName] = jsonFileObj.jBuffer
+                    self.zMemberDict[baseJsonName] = jsonFileObj.jBuffer
+                else:
+                    with open(os.path.join(self.fullWorkPath, baseJsonName), "rb") as inFile:
+                        dirtyDict[baseJsonName] = inFile.read()
+
+        # REWRITE ORIGINAL SAVE GAME
+        if not dirtyDict and not streamDict:
+            retVal = True  # No change made but everything is good
+        else:
+            try:
+                # 1. Copy the unmodified files and compress the modified files into a new archive
+                rawZipFile = RawZipFile(tmpFileName)
+                retVal = rawZipFile.open_zip_file()
+                with open(self.origFileName, "rb") as inFile, zipfile.ZipFile(self.origFileName, "r") as inZipFile:
+                    for zFileInfo in self.zInfoList:
+                        if retVal is not True:
+                            break
+                        elif zFileInfo.filename in dirtyDict.keys():
+                            retVal = rawZipFile.add_member(zFileInfo, dirtyDict[zFileInfo.filename],
+                                                           self.zFileDict[zFileInfo.filename])
+                        elif zFileInfo.filename in streamDict.keys():
+                            retVal = rawZipFile.start_member(zFileInfo, self.zFileDict[zFileInfo.filename])
+                            if retVal is True:
+                                with inZipFile.open(zFileInfo) as inMember:
+                                    retVal = streamDict[zFileInfo.filename].rewrite_json_file(inMember, rawZipFile)
+                            if rawZipFile.finish_member() is not True:
+                                retVal = False
+                        else:
+                            retVal = rawZipFile.copy_member(inFile, zFileInfo)
+                if rawZipFile.close_zip_file() is not True:
+                    retVal = False
+
+                # 2. Replace the old save game with the new
+                if retVal is True:
+                    os.replace(tmpFileName, self.origFileName)
+            except Exception as err:
+                print("\n{}".format(repr(err)))  # DEBUGGING
+                retVal = False
+            else:
+                if retVal is True:
+                    self.zInfoList = rawZipFile.rInfoList
+                    for baseJsonName in dirtyDict.keys():
+                        self.get_json_file(baseJsonName).jChanged = False
+                    for baseJsonName in streamDict.keys():
+                        self.zMemberDict.pop(baseJsonName, None)
+                        streamDict[baseJsonName].reset_json_contents()
+            finally:
+                if os.path.exists(tmpFileName):
+                    os.remove(tmpFileName)
+
+        # DONE
+        return retVal
+
+
     def close_zks(self):
         '''
             PURPOSE - Clear out all class attributes without saving
@@ -695,6 +1278,10 @@ class ZksFile():
             self.zPartFile = None     # party.json JsonFile object
             self.zPlayFile = None     # player.json JsonFile object
             self.zStatFile = None     # statistic.json JsonFile object
+            self.zFileDict = None     # Store the { filename : ZipInfo.compress_type } here during unpacking
+            self.zInfoList = None     # Store the original ZipInfo objects here, in archive order, during unpacking
+            self.zInMemory = False    # Set this to True if the save game was unpacked into memory
+            self.zMemberDict = None   # Store the { filename : raw bytes } here when unpacking into memory
         except Exception as err:
             print("\n{}".format(repr(err)))  # DEBUGGING
             retVal = False
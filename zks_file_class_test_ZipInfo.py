@@ -1,3 +1,4 @@
+from zks_file_class import ZksFile
 import zipfile
 
 
@@ -214,6 +215,9 @@ def main():
     else:
         raise RuntimeError("Mismatch in list length")
 
+    # Same comparison, limited to the fields that matter (CRC32, sizes, and compression type)
+    print("compare_zks():\t{}".format(ZksFile(firstZipFile).compare_zks(secondZipFile)))
+
 
 
 if __name__ == "__main__":
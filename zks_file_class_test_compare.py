@@ -0,0 +1,233 @@
+from baron_builder_imports import TOP_DIR, WORKING_DIR
+from zks_file_class import ZksFile
+import json
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+import zipfile
+
+
+class Zks_File_Class_Compare_Tests(unittest.TestCase):
+
+
+    def setUp(self):
+        self.tempDir = tempfile.TemporaryDirectory()
+        self.saveFile = self.make_save("Manual_1.zks")
+        self.test = ZksFile(self.saveFile)
+
+
+    def tearDown(self):
+        self.test.close_zks()
+        self.tempDir.cleanup()
+
+
+    def make_save(self, filename, partySuffix=None, jsonList=None, compressLevel=None):
+        absFilename = os.path.join(self.tempDir.name, filename)
+        if jsonList is None:
+            jsonList = [ "header.json", "party.json", "player.json" ]
+        with zipfile.ZipFile(absFilename, "w", zipfile.ZIP_DEFLATED, compresslevel=compressLevel) as outZipFile:
+            for jsonName in jsonList:
+                with open(os.path.join("Test_Files", "Linux", jsonName), "rb") as inFile:
+                    rawData = inFile.read()
+                if "party.json" == jsonName and partySuffix is not None:
+                    rawData = rawData.replace(b'"m_GroupId":', partySuffix + b'"m_GroupId":', 1)
+                outZipFile.writestr(jsonName, rawData)
+        return absFilename
+
+
+    def read_raw_member(self, absFilename, memberName):
+        # Compressed bytes of memberName, located through the central directory
+        with zipfile.ZipFile(absFilename, "r") as inZipFile:
+            zFileInfo = inZipFile.getinfo(memberName)
+        with open(absFilename, "rb") as inFile:
+            inFile.seek(zFileInfo.header_offset)
+            nameLen, extraLen = struct.unpack("<HH", inFile.read(30)[26:30])
+            inFile.seek(nameLen + extraLen, os.SEEK_CUR)
+            return (zFileInfo.CRC, zFileInfo.compress_size, inFile.read(zFileInfo.compress_size))
+
+
+    def read_members(self, absFilename):
+        with zipfile.ZipFile(absFilename, "r") as inZipFile:
+            return [ (zFileInfo.filename, zFileInfo.compress_type, inZipFile.read(zFileInfo))
+                     for zFileInfo in inZipFile.infolist() ]
+
+
+class Zks_File_Class_Compare_Test_Normal(Zks_File_Class_Compare_Tests):
+
+
+    def test_Normal_01_Identical_Backup(self):
+        backupFile = os.path.join(self.tempDir.name, "Backup.zks")
+        shutil.copyfile(self.saveFile, backupFile)
+        self.assertEqual(self.test.compare_zks(backupFile), {})
+        self.assertTrue(self.test.same_zks(ZksFile(backupFile)))
+
+
+    def test_Normal_02_Recompressed(self):
+        archiveFile = os.path.join(self.tempDir.name, "Archive.bba")
+        self.assertTrue(self.test.transcode_file(archiveFile, zipfile.ZIP_LZMA))
+        self.assertEqual(set(self.test.compare_zks(archiveFile).values()), { "recompressed" })
+        self.assertTrue(self.test.same_zks(archiveFile))
+
+
+    def test_Normal_03_Changed(self):
+        otherFile = self.make_save("Manual_2.zks", b'"Edited":true,', [ "header.json", "party.json" ])
+        changeDict = self.test.compare_zks(otherFile)
+        self.assertEqual(changeDict["party.json"], "changed")
+        self.assertEqual(changeDict["player.json"], "removed")
+        self.assertNotIn("header.json", changeDict)
+        self.assertFalse(self.test.same_zks(otherFile))
+
+
+    def test_Normal_04_Deep(self):
+        otherFile = self.make_save("Manual_2.zks", b'"Edited":true,')
+        recordList = self.test.compare_zks(otherFile, deep=True)["party.json"]
+        self.assertEqual([ (record["path"][-1], record["change"]) for record in recordList ], [ ("Edited", "added") ])
+
+
+    def test_Normal_05_Lazy_Members(self):
+        self.assertTrue(self.test.unpack_to_memory(lazy=True))
+        self.assertEqual(self.test.zMemberDict, {})
+        self.test.load_data()
+        money = self.test.zPlayFile.get_data("Money")
+        self.assertTrue(self.test.zPlayFile.mod_data("Money", money + 1))
+        # Only player.json was decompressed
+        self.assertNotIn("party.json", self.test.zMemberDict.keys())
+        self.assertNotIn("header.json", self.test.zMemberDict.keys())
+        self.assertTrue(self.test.update_zks())
+        self.assertNotIn("party.json", self.test.zMemberDict.keys())
+        # Nothing was unpacked to a working directory
+        self.assertIsNone(self.test.fullWorkPath)
+        self.assertFalse(os.path.exists(os.path.join(TOP_DIR, WORKING_DIR, self.test.zModDir)))
+        self.assertEqual(os.listdir(self.tempDir.name), [ "Manual_1.zks" ])
+        with zipfile.ZipFile(self.saveFile, "r") as inZipFile:
+            self.assertIn(b'"Money":' + str(money + 1).encode("ascii"), inZipFile.read("player.json"))
+
+
+    def test_Normal_06_Raw_Copy(self):
+        # A level ZksFile would never pick, so recompressed files can't match by accident
+        self.test.close_zks()
+        self.saveFile = self.make_save("Manual_1.zks", compressLevel=1)
+        self.test = ZksFile(self.saveFile)
+        rawDict = dict([ (memberName, self.read_raw_member(self.saveFile, memberName))
+                         for memberName in [ "header.json", "party.json", "player.json" ] ])
+        self.assertTrue(self.test.unpack_to_memory())
+        self.test.load_data()
+        money = self.test.zPlayFile.get_data("Money")
+        self.assertTrue(self.test.zPlayFile.mod_data("Money", money + 1))
+        self.assertTrue(self.test.update_zks())
+        # Unmodified files were copied without being recompressed
+        self.assertEqual(self.read_raw_member(self.saveFile, "header.json"), rawDict["header.json"])
+        self.assertEqual(self.read_raw_member(self.saveFile, "party.json"), rawDict["party.json"])
+        self.assertNotEqual(self.read_raw_member(self.saveFile, "player.json"), rawDict["player.json"])
+
+
+    def test_Normal_07_No_Op_Update(self):
+        os.utime(self.saveFile, (1000000000, 1000000000))
+        with open(self.saveFile, "rb") as inFile:
+            rawData = inFile.read()
+        diskSave = ZksFile(self.saveFile)
+        try:
+            self.assertTrue(self.test.unpack_to_memory())
+            self.assertTrue(diskSave.unpack_file(self.tempDir.name))
+            for saveGame in [ self.test, diskSave ]:
+                saveGame.load_data()
+                self.assertTrue(saveGame.update_zks())
+                self.assertEqual(os.stat(self.saveFile).st_mtime, 1000000000)
+                with open(self.saveFile, "rb") as inFile:
+                    self.assertEqual(inFile.read(), rawData)
+        finally:
+            diskSave.close_zks()
+
+
+    def test_Normal_08_Archive_Round_Trip(self):
+        mixedFile = os.path.join(self.tempDir.name, "Manual_2.zks")
+        with zipfile.ZipFile(mixedFile, "w") as outZipFile:
+            for jsonName, compressType in [ ("header.json", zipfile.ZIP_STORED), ("party.json", zipfile.ZIP_DEFLATED),
+                                            ("player.json", zipfile.ZIP_STORED) ]:
+                outZipFile.write(os.path.join("Test_Files", "Linux", jsonName), jsonName, compressType)
+        archiveSave = ZksFile(mixedFile)
+        self.assertTrue(archiveSave.archive_file(os.path.join(self.tempDir.name, "Archive")))
+        archiveSave.close_zks()
+        archiveFile = os.path.join(self.tempDir.name, "Archive", "Manual_2.bba")
+        self.assertEqual(set([ member[1] for member in self.read_members(archiveFile) ]), { zipfile.ZIP_LZMA })
+        restoreSave = ZksFile(archiveFile)
+        self.assertTrue(restoreSave.unarchive_file(os.path.join(self.tempDir.name, "Restore")))
+        restoreSave.close_zks()
+        self.assertEqual(self.read_members(os.path.join(self.tempDir.name, "Restore", "Manual_2.zks")),
+                         self.read_members(mixedFile))
+
+
+    def test_Normal_09_Uncommented_Archive(self):
+        archiveFile = os.path.join(self.tempDir.name, "Manual_2.bba")
+        with zipfile.ZipFile(archiveFile, "w", zipfile.ZIP_LZMA) as outZipFile:
+            for jsonName in [ "header.json", "party.json", "player.json" ]:
+                outZipFile.write(os.path.join("Test_Files", "Linux", jsonName), jsonName)
+        restoreSave = ZksFile(archiveFile)
+        self.assertTrue(restoreSave.unarchive_file(os.path.join(self.tempDir.name, "Restore")))
+        restoreSave.close_zks()
+        # Files with no recorded compression type are restored with ZIP_DEFLATED
+        self.assertEqual(self.read_members(os.path.join(self.tempDir.name, "Restore", "Manual_2.zks")),
+                         self.read_members(self.saveFile))
+
+
+    def test_Normal_10_Parallel_Archive(self):
+        rawList = []
+        for numWorkers in [ 1, 4 ]:
+            archiveDir = os.path.join(self.tempDir.name, "Archive_{}".format(numWorkers))
+            self.assertTrue(self.test.archive_file(archiveDir, numWorkers=numWorkers))
+            with open(os.path.join(archiveDir, "Manual_1.bba"), "rb") as inFile:
+                rawList.append(inFile.read())
+        # The process pool and RawZipFile write exactly what the serial transcode writes
+        self.assertEqual(rawList[0], rawList[1])
+
+
+    def test_Normal_11_Read_Header(self):
+        with open(os.path.join("Test_Files", "Linux", "header.json"), "rb") as inFile:
+            headerDict = json.loads(inFile.read().decode("utf-8-sig"))
+        diskHeader = self.test.read_header()
+        self.assertEqual(list(diskHeader.keys()), ZksFile.headerFields)
+        for headerField in ZksFile.headerFields:
+            self.assertEqual(diskHeader[headerField], headerDict[headerField])
+        # Reading the header in memory only decompresses header.json
+        self.assertTrue(self.test.unpack_to_memory())
+        self.assertEqual(self.test.read_header(), diskHeader)
+        self.assertEqual(list(self.test.zMemberDict.keys()), [ "header.json" ])
+
+
+    def test_Normal_12_Header_Missing_Field(self):
+        with open(os.path.join("Test_Files", "Linux", "header.json"), "rb") as inFile:
+            headerDict = json.loads(inFile.read().decode("utf-8-sig"))
+        del headerDict["Area"]
+        otherFile = os.path.join(self.tempDir.name, "Manual_2.zks")
+        with zipfile.ZipFile(otherFile, "w", zipfile.ZIP_DEFLATED) as outZipFile:
+            outZipFile.writestr("header.json", json.dumps(headerDict))
+        otherSave = ZksFile(otherFile)
+        diskHeader = otherSave.read_header()
+        self.assertIsNone(diskHeader["Area"])
+        self.assertEqual(diskHeader["GameName"], headerDict["GameName"])
+        self.assertTrue(otherSave.unpack_to_memory())
+        self.assertEqual(otherSave.read_header(), diskHeader)
+        otherSave.close_zks()
+
+
+class Zks_File_Class_Compare_Test_Error(Zks_File_Class_Compare_Tests):
+
+
+    def test_Error_01_Bad_Other(self):
+        self.assertIsNone(self.test.compare_zks(os.path.join(self.tempDir.name, "missing.zks")))
+        self.assertIsNone(self.test.compare_zks(None))
+        self.assertFalse(self.test.same_zks(None))
+
+
+    def test_Error_02_No_Header(self):
+        otherSave = ZksFile(self.make_save("Manual_2.zks", jsonList=[ "party.json", "player.json" ]))
+        self.assertIsNone(otherSave.read_header())
+        self.assertTrue(otherSave.unpack_to_memory())
+        self.assertIsNone(otherSave.read_header())
+        otherSave.close_zks()
+
+
+if __name__ == "__main__":
+    unittest.main()